@@ -23,6 +23,7 @@ import numpy as np
 import rustworkx as rx
 
 from pennylane.measurements import MeasurementProcess
+from pennylane.utils import stable_hash
 from pennylane.resource import ResourcesOperation
 
 
@@ -228,7 +229,7 @@ class CircuitGraph:
         Returns:
             int: the hash of the serialized quantum circuit graph
         """
-        return hash(self.serialize())
+        return stable_hash(self.serialize())
 
     @property
     def observables_in_order(self):
@@ -52,6 +52,7 @@ In addition, various dataset types are provided
     DatasetList
     DatasetDict
     DatasetOperator
+    DatasetPauliSum
     DatasetNone
     DatasetMolecule
     DatasetSparseArray
@@ -70,6 +71,7 @@ can contain a range of object types, including:
 - any numeric type
 - :class:`~.qchem.Molecule`
 - most :class:`~.Operator` types
+- sums of Pauli words, such as :class:`~.PauliSentence`
 - ``list`` of any supported type
 - ``dict`` of any supported type, as long as the keys are strings
 
@@ -208,6 +210,7 @@ from .attributes import (
     DatasetMolecule,
     DatasetNone,
     DatasetOperator,
+    DatasetPauliSum,
     DatasetScalar,
     DatasetSparseArray,
     DatasetString,
@@ -238,6 +241,7 @@ __all__ = (
     "DatasetList",
     "DatasetDict",
     "DatasetOperator",
+    "DatasetPauliSum",
     "DatasetNone",
     "DatasetMolecule",
     "DatasetSparseArray",
@@ -19,7 +19,7 @@ from .json import DatasetJSON
 from .list import DatasetList
 from .molecule import DatasetMolecule
 from .none import DatasetNone
-from .operator import DatasetOperator
+from .operator import DatasetOperator, DatasetPauliSum
 from .scalar import DatasetScalar
 from .sparse_array import DatasetSparseArray
 from .string import DatasetString
@@ -32,6 +32,7 @@ __all__ = (
     "DatasetDict",
     "DatasetList",
     "DatasetOperator",
+    "DatasetPauliSum",
     "DatasetSparseArray",
     "DatasetMolecule",
     "DatasetNone",
@@ -14,5 +14,6 @@
 """Contains DatasetAttribute definitions for Pennylane operators."""
 
 from .operator import DatasetOperator
+from .pauli_sum import DatasetPauliSum
 
-__all__ = ("DatasetOperator",)
+__all__ = ("DatasetOperator", "DatasetPauliSum")
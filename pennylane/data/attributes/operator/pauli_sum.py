@@ -0,0 +1,251 @@
+# Copyright 2018-2024 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Contains a columnar DatasetAttribute definition for linear combinations of
+Pauli words."""
+
+import json
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Type, TypeVar, Union
+
+import numpy as np
+
+import pennylane as qml
+from pennylane.data.base.attribute import AttributeInfo, DatasetAttribute
+from pennylane.data.base.hdf5 import HDF5Array, HDF5Group
+from pennylane.operation import Tensor
+from pennylane.ops import Hamiltonian, Sum
+from pennylane.pauli import PauliSentence, PauliWord
+
+from ._wires import wires_to_json
+
+PauliSum = TypeVar("PauliSum", bound=Union[Hamiltonian, Sum, PauliSentence])
+
+_PAULI_CODES = {"I": 0, "X": 1, "Y": 2, "Z": 3}
+_PAULI_LABELS = ("I", "X", "Y", "Z")
+_PAULI_OP_CODES = {"Identity": 0, "PauliX": 1, "PauliY": 2, "PauliZ": 3}
+_PAULI_OPS = (qml.Identity, qml.PauliX, qml.PauliY, qml.PauliZ)
+
+
+class DatasetPauliSum(DatasetAttribute[HDF5Group, PauliSum, PauliSum]):
+    """``DatasetAttribute`` for linear combinations of Pauli words, i.e. ``PauliSentence``,
+    ``Sum`` operators with a Pauli representation, and ``Hamiltonian`` operators whose
+    observables are Pauli words.
+
+    Instead of one HDF5 object per term, the terms are stored in a few contiguous, chunked and
+    compressed datasets:
+
+        - ``coeffs``: the coefficient of each term
+        - ``term_offsets``: the terms are ``paulis[term_offsets[i]:term_offsets[i + 1]]``
+        - ``wire_indices``: the index in ``wire_labels`` of the wire each Pauli acts on
+        - ``paulis``: the Pauli acting on each wire, encoded as ``0, 1, 2, 3`` for ``I, X, Y, Z``
+
+    This makes saving and loading operators with many terms fast, and allows loading a subset of
+    the terms with :meth:`~.get_pauli_sentence`. ``PauliSentence`` and ``Sum`` values are stored
+    with this type by default. A ``Hamiltonian`` can be stored with this type by creating the
+    attribute explicitly:
+
+    >>> H = qml.Hamiltonian([0.5, -1.2], [qml.PauliX(0) @ qml.PauliZ(1), qml.PauliY(1)])
+    >>> dataset = qml.data.Dataset(hamiltonian=DatasetPauliSum(H))
+    >>> dataset.hamiltonian
+      (-1.2) [Y1]
+    + (0.5) [X0 Z1]
+    """
+
+    type_id = "pauli_sum"
+
+    def __post_init__(self, value: PauliSum) -> None:
+        super().__post_init__(value)
+        self.info["pauli_sum_class"] = type(value).__name__
+
+    @classmethod
+    def consumes_types(cls) -> Tuple[Type, ...]:
+        return (PauliSentence, Sum)
+
+    @property
+    def pauli_sum_class(self) -> Type[PauliSum]:
+        """Returns the class of operator that will be returned by the ``get_value()`` method."""
+        return self._supported_pauli_sum_dict()[self.info["pauli_sum_class"]]
+
+    @property
+    def num_terms(self) -> int:
+        """The number of terms in the stored operator."""
+        return self.bind["coeffs"].shape[0]
+
+    @property
+    def wire_labels(self) -> List:
+        """The labels of all the wires the stored operator acts on."""
+        return json.loads(self.bind["wire_labels"].asstr()[()])
+
+    def hdf5_to_value(self, bind: HDF5Group) -> PauliSum:
+        info = AttributeInfo(bind.attrs)
+        pauli_sum_class = self._supported_pauli_sum_dict()[info["pauli_sum_class"]]
+        coeffs, terms = self._read_terms(bind, slice(None))
+
+        if pauli_sum_class is PauliSentence:
+            return _to_pauli_sentence(coeffs, terms)
+        with qml.QueuingManager.stop_recording():
+            if pauli_sum_class is Sum:
+                sentence = _to_pauli_sentence(coeffs, terms)
+                op = sentence.operation()
+                if isinstance(op, Sum):
+                    return op
+                # sentences with a single term are converted to words or scalar products, and sums
+                # need at least two operands, hence the term is summed with a zero identity
+                zero = qml.s_prod(0.0, qml.Identity(wires=op.wires))
+                return Sum(op, zero, _pauli_rep=sentence)
+
+            observables = [_to_observable(term) for term in terms]
+            return Hamiltonian(coeffs, observables)
+
+    def value_to_hdf5(self, bind_parent: HDF5Group, key: str, value: PauliSum) -> HDF5Group:
+        if isinstance(value, Hamiltonian):
+            coeffs, terms = _hamiltonian_terms(value)
+        elif isinstance(value, PauliSentence):
+            coeffs, terms = list(value.values()), [term.items() for term in value]
+        elif isinstance(value, Sum) and value.pauli_rep is not None:
+            coeffs, terms = list(value.pauli_rep.values()), [
+                term.items() for term in value.pauli_rep
+            ]
+        else:
+            raise TypeError(
+                f"Serialization of '{type(value).__name__}' as a sum of Pauli words is not "
+                "supported."
+            )
+
+        wire_map = {}
+        term_offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+        wire_indices = []
+        paulis = []
+        for i, term in enumerate(terms):
+            for wire, pauli in term:
+                wire_indices.append(wire_map.setdefault(wire, len(wire_map)))
+                paulis.append(_PAULI_CODES[pauli])
+            term_offsets[i + 1] = len(paulis)
+
+        bind = bind_parent.create_group(key)
+        bind["wire_labels"] = wires_to_json(list(wire_map))
+        _create_dataset(bind, "coeffs", np.asarray(qml.math.unwrap(coeffs)))
+        _create_dataset(bind, "term_offsets", term_offsets)
+        _create_dataset(
+            bind,
+            "wire_indices",
+            np.asarray(wire_indices, dtype=np.min_scalar_type(max(len(wire_map) - 1, 0))),
+        )
+        _create_dataset(bind, "paulis", np.asarray(paulis, dtype=np.uint8))
+
+        return bind
+
+    def get_pauli_sentence(self, start: Optional[int] = None, stop: Optional[int] = None):
+        """Load the terms ``start`` to ``stop`` of the stored operator as a ``PauliSentence``,
+        without constructing any operators. Only the requested terms are read from the file.
+
+        Args:
+            start (int): index of the first term to load, defaults to the first term
+            stop (int): index after the last term to load, defaults to the number of terms
+
+        Returns:
+            PauliSentence: the sum of the requested terms
+
+        **Example**
+
+        >>> H = qml.Hamiltonian([0.5, -1.2, 0.3], [qml.PauliX(0), qml.PauliY(1), qml.PauliZ(2)])
+        >>> DatasetPauliSum(H).get_pauli_sentence(1)
+        -1.2 * Y(1)
+        + 0.3 * Z(2)
+        """
+        return _to_pauli_sentence(*self._read_terms(self.bind, slice(start, stop)))
+
+    @staticmethod
+    def _read_terms(bind: HDF5Group, terms: slice) -> Tuple[np.ndarray, List[List[Tuple]]]:
+        """Read the coefficients and the ``(wire, pauli)`` pairs of the terms in the slice
+        ``terms``."""
+        start, stop, _ = terms.indices(bind["coeffs"].shape[0])
+        stop = max(start, stop)
+
+        coeffs = _read_dataset(bind["coeffs"], start, stop)
+        term_offsets = _read_dataset(bind["term_offsets"], start, stop + 1)
+        first, last = int(term_offsets[0]), int(term_offsets[-1])
+
+        wire_labels = np.array(json.loads(bind["wire_labels"].asstr()[()]), dtype=object)
+        wires = wire_labels[_read_dataset(bind["wire_indices"], first, last)].tolist()
+        paulis = np.array(_PAULI_LABELS)[_read_dataset(bind["paulis"], first, last)].tolist()
+
+        term_offsets = (term_offsets - first).tolist()
+        terms = [
+            list(zip(wires[begin:end], paulis[begin:end]))
+            for begin, end in zip(term_offsets[:-1], term_offsets[1:])
+        ]
+        return coeffs, terms
+
+    @classmethod
+    @lru_cache(1)
+    def _supported_pauli_sum_dict(cls) -> Dict[str, Type[PauliSum]]:
+        """Returns a dict mapping the supported class names to the class."""
+        return {cls_.__name__: cls_ for cls_ in (Hamiltonian, Sum, PauliSentence)}
+
+
+def _hamiltonian_terms(value: Hamiltonian):
+    """Returns the coefficients and the ``(wire, pauli)`` pairs of the terms of a
+    ``Hamiltonian``. Identities are kept, so that the observables are restored exactly."""
+    coeffs, observables = value.terms()
+    terms = []
+    for obs in observables:
+        factors = obs.obs if isinstance(obs, Tensor) else [obs]
+        term = []
+        for factor in factors:
+            if factor.name not in _PAULI_OP_CODES:
+                raise TypeError(
+                    f"Serialization of a Hamiltonian with observable '{factor.name}' as a sum of "
+                    "Pauli words is not supported."
+                )
+            term.extend(
+                (wire, _PAULI_LABELS[_PAULI_OP_CODES[factor.name]]) for wire in factor.wires
+            )
+        terms.append(term)
+
+    return coeffs, terms
+
+
+def _to_pauli_sentence(coeffs: np.ndarray, terms: List[List[Tuple]]) -> PauliSentence:
+    """Sums the terms into a ``PauliSentence``. Repeated Pauli words are added together."""
+    sentence = PauliSentence()
+    for coeff, term in zip(coeffs.tolist(), terms):
+        word = PauliWord(dict(term))
+        sentence[word] = sentence[word] + coeff if word in sentence else coeff
+
+    return sentence
+
+
+def _to_observable(term: List[Tuple]):
+    """Constructs the observable with the ``(wire, pauli)`` pairs ``term``."""
+    factors = [_PAULI_OPS[_PAULI_CODES[pauli]](wire) for wire, pauli in term]
+    if not factors:
+        return qml.Identity(wires=[])
+    return factors[0] if len(factors) == 1 else Tensor(*factors)
+
+
+def _create_dataset(bind: HDF5Group, key: str, data: np.ndarray) -> None:
+    """Creates a chunked and compressed dataset. Empty arrays cannot be chunked, so they are
+    stored as is."""
+    if data.size:
+        bind.create_dataset(key, data=data, chunks=True, compression="gzip", shuffle=True)
+    else:
+        bind[key] = data
+
+
+def _read_dataset(dataset: HDF5Array, start: int, stop: int) -> np.ndarray:
+    """Reads ``dataset[start:stop]``, only touching the chunks that contain the slice."""
+    if stop <= start:
+        return np.zeros(0, dtype=dataset.dtype)
+    return dataset[start:stop]
@@ -16,10 +16,9 @@ This module contains the Clifford simulator using ``stim``.
 """
 
 from dataclasses import replace
-from functools import partial
+from functools import partial, reduce
 from numbers import Number
 from typing import Union, Tuple, Sequence
-import concurrent.futures
 import numpy as np
 
 import pennylane as qml
@@ -28,11 +27,22 @@ from pennylane.tape import QuantumTape, QuantumScript
 from pennylane.typing import Result, ResultBatch
 from pennylane.transforms import convert_to_numpy_parameters
 from pennylane.transforms.core import TransformProgram
-from pennylane.measurements import ExpectationMP, StateMP, DensityMatrixMP, PurityMP
+from pennylane.measurements import (
+    ExpectationMP,
+    StateMP,
+    DensityMatrixMP,
+    PurityMP,
+    SampleMP,
+    CountsMP,
+    VarianceMP,
+    ProbabilityMP,
+)
+from pennylane.wires import Wires
 from pennylane.devices.qubit.sampling import get_num_shots_and_executions
 
 from . import Device
 from .execution_config import ExecutionConfig, DefaultExecutionConfig
+from .worker_pool import WorkerPoolMixin
 
 from .default_qubit import accepted_sample_measurement
 
@@ -99,6 +109,10 @@ def observable_stopping_condition(obs: qml.operation.Operator) -> bool:
     return obs.name in _MEAS_OBSERVABLES
 
 
+_MEASURE_BASIS = {"X": "MX", "Y": "MY", "Z": "M"}
+"""The stim instructions measuring qubits in the eigenbasis of each Pauli operator."""
+
+
 def _import_stim():
     """Import stim."""
     try:
@@ -112,7 +126,7 @@ def _import_stim():
     return stim
 
 
-class DefaultClifford(Device):
+class DefaultClifford(WorkerPoolMixin, Device):
     r"""A PennyLane device for fast simulation of Clifford circuits using
     `stim <https://github.com/quantumlib/stim/>`_.
 
@@ -134,7 +148,8 @@ class DefaultClifford(Device):
         max_workers (int): A ``ProcessPoolExecutor`` executes tapes asynchronously
             using a pool of at most ``max_workers`` processes. If ``max_workers`` is ``None``,
             only the current process executes tapes. If you experience any
-            issue, try setting ``max_workers`` to ``None``.
+            issue, try setting ``max_workers`` to ``None``. The pool is started on the
+            first execution and reused until :meth:`~.close` is called.
 
     **Example:**
 
@@ -210,6 +225,30 @@ class DefaultClifford(Device):
         Maintaining and working with this tableau representation instead of the complete state vector
         makes the calculations of increasingly large Clifford circuits more efficient on this device.
 
+    .. details::
+        :title: Sampling with shots
+        :href: clifford-shots
+
+        With finite shots, the circuit is compiled once into a ``stim.Circuit``, and the samples
+        are drawn with the compiled sampler of stim. The observables of the measurements are split
+        into groups of qubit-wise commuting Pauli words, and all the shots of a group are sampled
+        at once by measuring its qubits in the eigenbasis of the words. Samples, counts and
+        probabilities, as well as the expectation values and variances of Pauli words,
+        Hamiltonians and sums of Pauli words are supported, also with shot vectors.
+
+        .. code-block:: python
+
+            dev = qml.device("default.clifford", shots=1000000)
+
+            @qml.qnode(dev)
+            def circuit():
+                qml.Hadamard(wires=[0])
+                qml.CNOT(wires=[0, 1])
+                return qml.expval(qml.PauliX(0) @ qml.PauliX(1)), qml.counts(wires=[0, 1])
+
+        >>> circuit()
+        (1.0, {'00': 500213, '11': 499787})
+
     .. details::
         :title: Tracking
         :href: clifford-tracking
@@ -255,9 +294,12 @@ class DefaultClifford(Device):
 
         self._tableau = tableau
 
+        # the seed as given, which identifies the samples of the device, e.g. in persistent caches
+        self._seed = seed
         seed = np.random.randint(0, high=10000000) if seed == "global" else seed
         self._rng = np.random.default_rng(seed)
         self._debugger = None
+        self._worker_pool = None
 
     def _setup_execution_config(self, execution_config: ExecutionConfig) -> ExecutionConfig:
         """This is a private helper for ``preprocess`` that sets up the execution config.
@@ -302,7 +344,6 @@ class DefaultClifford(Device):
 
         This device:
 
-        * Currently does not support finite shots
         * Currently does not intrinsically support parameter broadcasting
 
         """
@@ -347,16 +388,19 @@ class DefaultClifford(Device):
 
         max_workers = execution_config.device_options.get("max_workers", self._max_workers)
         if max_workers is None:
-            results = tuple(self.simulate(c, debugger=self._debugger) for c in circuits)
+            results = tuple(
+                self.simulate(c, seed=self._rng, debugger=self._debugger) for c in circuits
+            )
         else:
             vanilla_circuits = [convert_to_numpy_parameters(c) for c in circuits]
+            seeds = self._rng.integers(2**31 - 1, size=len(vanilla_circuits))
             _wrap_simulate = partial(self.simulate, debugger=None)
-            with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
-                exec_map = executor.map(_wrap_simulate, vanilla_circuits)
-                results = tuple(exec_map)
+            pool = self._get_worker_pool(max_workers)
+            exec_map = pool.map(_wrap_simulate, vanilla_circuits, seeds)
+            results = tuple(exec_map)
 
-            # reset _rng to mimic serial behavior - TODO: uncomment when using RNG
-            # self._rng = np.random.default_rng(self._rng.integers(2**31 - 1))
+            # reset _rng to mimic serial behavior
+            self._rng = np.random.default_rng(self._rng.integers(2**31 - 1))
 
         if self.tracker.active:
             self.tracker.update(batches=1)
@@ -364,7 +408,7 @@ class DefaultClifford(Device):
             for i, c in enumerate(circuits):
                 qpu_executions, shots = get_num_shots_and_executions(c)
                 res = np.array(results[i]) if isinstance(results[i], Number) else results[i]
-                if c.shots:  # pragma: no cover
+                if c.shots:
                     self.tracker.update(
                         simulations=1,
                         executions=qpu_executions,
@@ -387,12 +431,16 @@ class DefaultClifford(Device):
     def simulate(
         self,
         circuit: qml.tape.QuantumScript,
+        seed=None,
         debugger=None,
     ) -> Result:
         """Simulate a single quantum script.
 
         Args:
             circuit (QuantumTape): The single circuit to simulate
+            seed (Union[None, int, array_like[int], SeedSequence, BitGenerator, Generator]): A
+                seed-like parameter matching that of ``seed`` for ``numpy.random.default_rng``,
+                used to seed the samplers of circuits with finite shots
             debugger (_Debugger): The debugger to use
 
         Returns:
@@ -413,11 +461,6 @@ class DefaultClifford(Device):
         # Account for custom labelled wires
         circuit = circuit.map_to_standard_wires()
 
-        if circuit.shots:
-            raise NotImplementedError(
-                "default.clifford currently doesn't support computation with shots."
-            )
-
         # Build a stim circuit, tableau and simulator
         stim_ct = stim.Circuit()
         initial_tableau = stim.Tableau.from_circuit(stim_ct)
@@ -460,6 +503,18 @@ class DefaultClifford(Device):
                         flat_state = qml.math.flatten(state)
                         debugger.snapshots[op.tag or len(debugger.snapshots)] = flat_state
 
+        if circuit.shots:
+            if use_prep_ops:
+                # the op wires of the standard circuit are ``0, ..., n - 1``
+                prep_tableau = stim.Tableau.from_state_vector(
+                    qml.math.reshape(
+                        prep.state_vector(wire_order=range(len(circuit.op_wires))), (1, -1)
+                    )[0],
+                    endian="big",
+                )
+                stim_ct = prep_tableau.to_circuit() + stim_ct
+            return self.measure_statistical(circuit, stim_ct, seed=seed)
+
         tableau_simulator.do_circuit(stim_ct)
 
         global_phase = qml.GlobalPhase(qml.math.sum(op.data[0] for op in global_phase_ops))
@@ -508,6 +563,161 @@ class DefaultClifford(Device):
 
         return results[0] if len(results) == 1 else tuple(results)
 
+    # pylint:disable=too-many-branches
+    def measure_statistical(self, circuit, stim_circuit, seed=None):
+        """Given a circuit with finite shots, sample and return the measurement results.
+
+        The measurements are split into Pauli words, which are measured by groups of qubit-wise
+        commuting words. The circuit of every group is compiled once into a stim sampler, which
+        draws all the shots at once.
+
+        Args:
+            circuit (QuantumTape): the circuit, with standard wires
+            stim_circuit (stim.Circuit): the stim circuit preparing the final state
+            seed (Union[None, int, array_like[int], SeedSequence, BitGenerator, Generator]): A
+                seed-like parameter matching that of ``seed`` for ``numpy.random.default_rng``
+
+        Returns:
+            Union[TensorLike, tuple]: the measurement results, for every shot in the shot vector
+        """
+        rng = np.random.default_rng(seed)
+
+        # every measurement is described by the Pauli words it measures, as dictionaries of
+        # wires to "X", "Y" and "Z", which are sampled in groups of qubit-wise commuting words
+        groups = []
+        measured_words = []
+        for meas in circuit.measurements:
+            kind, coeffs, words = self._measured_pauli_words(meas, circuit)
+            # the words of a sum are sampled separately for expectation values only
+            units = [[word] for word in words] if isinstance(meas, ExpectationMP) else [words]
+            indices = []
+            for unit in units:
+                merged = {}
+                for word in unit:
+                    if not _qubit_wise_commute(merged, word):
+                        raise NotImplementedError(
+                            f"default.clifford doesn't support the {type(meas).__name__} of "
+                            "observables with terms that do not commute qubit-wise with shots."
+                        )
+                    merged.update(word)
+                for idx, group in enumerate(groups):
+                    if _qubit_wise_commute(group, merged):
+                        group.update(merged)
+                        break
+                else:
+                    idx = len(groups)
+                    groups.append(dict(merged))
+                indices.extend([idx] * len(unit))
+            measured_words.append((kind, coeffs, words, indices))
+
+        # sample every group, keeping the column of each measured wire
+        samples = []
+        total_shots = circuit.shots.total_shots
+        for group in groups:
+            sampler_circuit = stim_circuit.copy()
+            columns = {}
+            for basis, instruction in _MEASURE_BASIS.items():
+                targets = sorted(w for w, b in group.items() if b == basis)
+                if targets:
+                    sampler_circuit.append(instruction, targets)
+                    offset = len(columns)
+                    columns.update((w, offset + i) for i, w in enumerate(targets))
+            sampler = sampler_circuit.compile_sampler(seed=int(rng.integers(2**31 - 1)))
+            # bit packed samples are much faster to draw, and are transposed so that the bits
+            # of a measurement in every shot are read from a single contiguous row
+            packed = np.ascontiguousarray(sampler.sample(total_shots, bit_packed=True).T)
+            samples.append((packed, columns))
+
+        def _bits(idx, wires):
+            packed, columns = samples[idx]
+            return [(packed[columns[w] // 8] >> (columns[w] % 8)) & 1 for w in wires]
+
+        def _parity(idx, word):
+            # the eigenvalue of a Pauli word is given by the parity of its measured bits
+            return reduce(np.bitwise_xor, _bits(idx, word), np.zeros(total_shots, dtype=np.uint8))
+
+        shot_ranges = []
+        for shots in circuit.shots:
+            start = shot_ranges[-1][1] if shot_ranges else 0
+            shot_ranges.append((start, start + shots))
+
+        results = []
+        for meas, (kind, coeffs, words, indices) in zip(circuit.measurements, measured_words):
+            if kind == "basis":
+                wires = list(words[0])
+                bits = np.stack(_bits(indices[0], wires), axis=-1).astype(np.int64)
+                proxy, wires = _basis_proxy(meas, wires), Wires(wires)
+                res = [proxy.process_samples(bits, wires, r) for r in shot_ranges]
+            elif kind == "word":
+                parity = _parity(indices[0], words[0])[:, None].astype(np.int64)
+                proxy, wires = _word_proxy(meas, coeffs[0]), Wires(0)
+                res = [proxy.process_samples(parity, wires, r) for r in shot_ranges]
+            elif isinstance(meas, ExpectationMP):
+                means = np.zeros(len(shot_ranges))
+                for coeff, word, idx in zip(coeffs, words, indices):
+                    parity = _parity(idx, word)
+                    means += np.real(coeff) * np.array(
+                        [1 - 2 * np.mean(parity[slice(*r)]) for r in shot_ranges]
+                    )
+                res = list(means)
+            else:
+                values = np.zeros(total_shots)
+                for coeff, word, idx in zip(coeffs, words, indices):
+                    values += np.real(coeff) * (1 - 2 * _parity(idx, word).astype(np.float64))
+                res = [np.var(values[slice(*r)]) for r in shot_ranges]
+
+            results.append([r if isinstance(meas, CountsMP) else np.squeeze(r) for r in res])
+
+        results = [res[0] if len(res) == 1 else tuple(res) for res in zip(*results)]
+        return results[0] if len(results) == 1 else tuple(results)
+
+    @staticmethod
+    def _measured_pauli_words(meas, circuit):
+        """The Pauli words sampled to estimate a measurement with shots.
+
+        Returns:
+            str, list[float], list[dict]: the kind of measurement, which is ``"basis"`` for
+            samples in the computational basis, ``"word"`` for a Pauli word and ``"sum"`` for a
+            linear combination of Pauli words, the coefficients and the Pauli words
+        """
+        if not isinstance(meas, (ExpectationMP, VarianceMP, SampleMP, CountsMP, ProbabilityMP)):
+            raise NotImplementedError(
+                f"default.clifford doesn't support the {type(meas)} measurement with shots "
+                "at the moment."
+            )
+
+        if meas.obs is not None:
+            try:
+                sentence = qml.pauli.pauli_sentence(meas.obs)
+            except ValueError as e:
+                raise NotImplementedError(
+                    f"default.clifford doesn't support measurements of {meas.obs.name} with "
+                    "shots at the moment."
+                ) from e
+            coeffs = list(sentence.values())
+            words = [dict(word) for word in sentence]
+
+        if meas.obs is None or isinstance(meas, ProbabilityMP):
+            word = {w: "Z" for w in meas.wires or circuit.wires}
+            if meas.obs is not None:
+                # probabilities in the eigenbasis of a Pauli word
+                if len(words) != 1:
+                    raise NotImplementedError(
+                        "default.clifford doesn't support probabilities in the eigenbasis of "
+                        f"{meas.obs.name} with shots at the moment."
+                    )
+                word.update(words[0])
+            return "basis", [1.0], [word]
+
+        if len(words) == 1:
+            return "word", coeffs, words
+        if not isinstance(meas, (ExpectationMP, VarianceMP)):
+            raise NotImplementedError(
+                f"default.clifford doesn't support the {type(meas).__name__} of linear "
+                "combinations of Pauli words with shots at the moment."
+            )
+        return "sum", coeffs or [0.0], words or [{}]
+
     def _measure_state(self, tableau_simulator, circuit, global_phase):
         """Measure the state of the simualtor device."""
         if self._tableau:
@@ -574,3 +784,25 @@ class DefaultClifford(Device):
         raise NotImplementedError(
             f"default.clifford doesn't support expectation value calculation with {type(meas_op.obs)} at the moment."
         )
+
+
+def _qubit_wise_commute(word, other) -> bool:
+    """Whether two Pauli words, as dictionaries of wires to Pauli operators, commute qubit-wise."""
+    return all(other.get(w, p) == p for w, p in word.items())
+
+
+def _basis_proxy(meas, wires):
+    """A measurement processing the samples of ``wires``, measured in the eigenbasis of the
+    observable of ``meas``, like ``meas`` processes computational basis samples."""
+    if isinstance(meas, CountsMP):
+        return CountsMP(wires=wires, all_outcomes=meas.all_outcomes)
+    return type(meas)(wires=wires)
+
+
+def _word_proxy(meas, coeff=1.0):
+    """A measurement of ``coeff * PauliZ(0)`` processing the parities of the samples of a Pauli
+    word with coefficient ``coeff`` like ``meas`` processes the samples of its observable."""
+    obs = qml.PauliZ(0) if coeff == 1 else qml.s_prod(np.real(coeff), qml.PauliZ(0))
+    if isinstance(meas, CountsMP):
+        return CountsMP(obs=obs, all_outcomes=meas.all_outcomes)
+    return type(meas)(obs=obs)
@@ -47,7 +47,7 @@ tolerance = 1e-10
 
 
 class DefaultMixed(QubitDevice):
-    """Default qubit device for performing mixed-state computations in PennyLane.
+    r"""Default qubit device for performing mixed-state computations in PennyLane.
 
     .. warning::
 
@@ -73,6 +73,21 @@ class DefaultMixed(QubitDevice):
         readout_prob (None, int, float): Probability for adding readout error to the measurement
             outcomes of observables. Defaults to ``None`` if not specified, which means that the outcomes are
             without any readout error.
+        max_fused_wires (None, int): Maximal number of wires of the blocks of consecutive gates and
+            channels that are fused into a single operation before being applied to the state.
+            Defaults to ``2``. If ``None`` or ``0``, every operation is applied separately.
+
+    **Operation fusion**
+
+    Every operation applied to the state is a contraction of the whole density matrix, with
+    :math:`4^n` entries. To reduce the number of contractions, consecutive operations acting on at
+    most ``max_fused_wires`` wires in total are fused. The product of the matrices of a block of
+    gates is applied as a single gate, and a block containing channels is applied as the
+    composition of their superoperators
+    :math:`\mathcal{S}(\rho) = \sum_i K_i \rho K_i^\dagger`, whose size grows as
+    :math:`16^k` with the number of wires :math:`k` of the block. For instance, in a circuit with
+    depolarizing noise after every gate, a two-qubit gate and the channels following it are
+    applied in a single contraction.
     """
 
     name = "Default mixed-state qubit PennyLane plugin"
@@ -185,6 +200,7 @@ class DefaultMixed(QubitDevice):
         shots=None,
         analytic=None,
         readout_prob=None,
+        max_fused_wires=2,
     ):
         if isinstance(wires, int) and wires > 23:
             raise ValueError(
@@ -204,6 +220,7 @@ class DefaultMixed(QubitDevice):
         # call QubitDevice init
         super().__init__(wires, shots, r_dtype=r_dtype, c_dtype=c_dtype, analytic=analytic)
         self._debugger = None
+        self._max_fused_wires = max_fused_wires or 0
 
         # Create the initial state.
         self._state = self._create_basis_state(0)
@@ -619,14 +636,116 @@ class DefaultMixed(QubitDevice):
         if operation in diagonal_in_z_basis:
             self._apply_diagonal_unitary(matrices, wires)
         else:
-            num_op_wires = len(wires)
-            interface = qml.math.get_interface(self._state, *matrices)
-            # Use tensordot for Autograd and Numpy if there are more than 2 wires
-            # Use tensordot in any case for more than 7 wires, as einsum does not support this case
-            if (num_op_wires > 2 and interface in {"autograd", "numpy"}) or num_op_wires > 7:
-                self._apply_channel_tensordot(matrices, wires)
-            else:
-                self._apply_channel(matrices, wires)
+            self._apply_kraus(matrices, wires)
+
+    def _apply_kraus(self, kraus, wires):
+        """Applies a channel specified by a list of Kraus operators, with the contraction best
+        suited to its number of wires and to the interface.
+
+        Args:
+            kraus (list[array]): Kraus operators
+            wires (Wires): target wires
+        """
+        num_op_wires = len(wires)
+        interface = qml.math.get_interface(self._state, *kraus)
+        # Use tensordot for Autograd and Numpy if there are more than 2 wires
+        # Use tensordot in any case for more than 7 wires, as einsum does not support this case
+        if (num_op_wires > 2 and interface in {"autograd", "numpy"}) or num_op_wires > 7:
+            self._apply_channel_tensordot(kraus, wires)
+        else:
+            self._apply_channel(kraus, wires)
+
+    def _apply_superoperator(self, superop, wires):
+        r"""Apply a quantum channel specified by its superoperator to subsystems of the quantum
+        state.
+
+        Args:
+            superop (array): matrix of the superoperator, whose rows and columns are indexed by
+                the pairs of row and column indices of the output and input density matrices
+            wires (Wires): target wires
+        """
+        channel_wires = self.map_wires(wires)
+        num_ch_wires = len(channel_wires)
+        superop = qnp.cast(qnp.reshape(superop, [2] * (4 * num_ch_wires)), dtype=self.C_DTYPE)
+
+        # row and column indices of the quantum state affected by this operation
+        row_wires_list = channel_wires.tolist()
+        col_wires_list = [w + self.num_wires for w in row_wires_list]
+        state_axes = row_wires_list + col_wires_list
+
+        input_axes = list(range(2 * num_ch_wires, 4 * num_ch_wires))
+        state = qnp.tensordot(superop, self._state, axes=[input_axes, state_axes])
+
+        # the output row and column indices are moved from the beginning to their target locations
+        self._state = qnp.moveaxis(state, list(range(2 * num_ch_wires)), state_axes)
+
+    def _fuse_operations(self, operations):
+        """Split a list of operations into blocks of consecutive operations to be applied at once.
+
+        An operation joins the current block if the block then acts on at most
+        ``max_fused_wires`` wires. State preparations, snapshots and larger operations form
+        blocks of their own.
+
+        Args:
+            operations (list[.Operation]): operations to apply on the device
+
+        Returns:
+            list[tuple[list[.Operation], .Wires]]: the blocks of operations, with the wires they
+            act on
+        """
+        blocks = []
+        for operation in operations:
+            if operation.name == "Identity":
+                continue
+            wires = operation.wires
+            fusible = 0 < len(wires) <= self._max_fused_wires and not isinstance(
+                operation, (StatePrep, BasisState, QubitDensityMatrix, Snapshot)
+            )
+            if fusible and blocks and blocks[-1][2]:
+                block_wires = Wires.all_wires([blocks[-1][1], wires])
+                if len(block_wires) <= self._max_fused_wires:
+                    blocks[-1] = (blocks[-1][0] + [operation], block_wires, True)
+                    continue
+            blocks.append(([operation], wires, fusible))
+        return [(ops, wires) for ops, wires, _ in blocks]
+
+    def _apply_fused_operations(self, operations, wires):
+        """Applies a block of operations to the internal device state in a single contraction.
+
+        The product of the matrices of gates is applied as a single gate, and the composition of
+        the superoperators of the operations if the block contains channels.
+
+        Args:
+            operations (list[.Operation]): operations to apply, acting on at most ``wires``
+            wires (Wires): wires of the block
+        """
+        kraus_sets = []
+        for operation in operations:
+            matrices = (
+                operation.kraus_matrices()
+                if isinstance(operation, Channel)
+                else [operation.matrix()]
+            )
+            kraus_sets.append(
+                [qml.math.expand_matrix(k, operation.wires, wire_order=wires) for k in matrices]
+            )
+
+        if all(len(kraus) == 1 for kraus in kraus_sets):
+            unitary = kraus_sets[0][0]
+            for kraus in kraus_sets[1:]:
+                unitary = qnp.dot(kraus[0], unitary)
+            self._apply_kraus([unitary], wires)
+            return
+
+        superop = None
+        for kraus in kraus_sets:
+            kraus = qnp.stack(kraus)
+            dim = qnp.shape(kraus)[-1]
+            # S = sum_i K_i \otimes K_i^*, acting on the vectorized density matrix
+            new_superop = qnp.einsum("iab,icd->acbd", kraus, qnp.conj(kraus))
+            new_superop = qnp.reshape(new_superop, (dim**2, dim**2))
+            superop = new_superop if superop is None else qnp.dot(new_superop, superop)
+        self._apply_superoperator(superop, wires)
 
     # pylint: disable=arguments-differ
 
@@ -695,8 +814,11 @@ class DefaultMixed(QubitDevice):
                     f"on a {self.short_name} device."
                 )
 
-        for operation in operations:
-            self._apply_operation(operation)
+        for block, wires in self._fuse_operations(operations):
+            if len(block) == 1:
+                self._apply_operation(block[0])
+            else:
+                self._apply_fused_operations(block, wires)
 
         # store the pre-rotated state
         self._pre_rotated_state = self._state
@@ -19,7 +19,6 @@ from dataclasses import replace
 from functools import partial
 from numbers import Number
 from typing import Union, Callable, Tuple, Optional, Sequence
-import concurrent.futures
 import inspect
 import logging
 import numpy as np
@@ -44,8 +43,9 @@ from .preprocess import (
     no_sampling,
 )
 from .execution_config import ExecutionConfig, DefaultExecutionConfig
-from .qubit.simulate import simulate, get_final_state, measure_final_state
-from .qubit.sampling import get_num_shots_and_executions
+from .worker_pool import WorkerPoolMixin
+from .qubit.simulate import simulate, simulate_batch, get_final_state, measure_final_state
+from .qubit.sampling import SHOT_ALLOCATIONS, get_num_shots_and_executions
 from .qubit.adjoint_jacobian import adjoint_jacobian, adjoint_vjp, adjoint_jvp
 
 logger = logging.getLogger(__name__)
@@ -95,6 +95,12 @@ def stopping_condition(op: qml.operation.Operator) -> bool:
     return op.has_matrix
 
 
+def stopping_condition_trajectories(op: qml.operation.Operator) -> bool:
+    """Specify whether or not an Operator object is supported by the device when noise channels
+    are simulated with quantum trajectories."""
+    return isinstance(op, qml.operation.Channel) or stopping_condition(op)
+
+
 def stopping_condition_shots(op: qml.operation.Operator) -> bool:
     """Specify whether or not an Operator object is supported by the device with shots."""
     return isinstance(op, (Conditional, MidMeasureMP)) or stopping_condition(op)
@@ -206,7 +212,7 @@ def _add_adjoint_transforms(program: TransformProgram, device_vjp=False) -> None
     program.add_transform(validate_adjoint_trainable_params)
 
 
-class DefaultQubit(Device):
+class DefaultQubit(WorkerPoolMixin, Device):
     """A PennyLane device written in Python and capable of backpropagation derivatives.
 
     Args:
@@ -227,6 +233,20 @@ class DefaultQubit(Device):
             using a pool of at most ``max_workers`` processes. If ``max_workers`` is ``None``,
             only the current process executes tapes. If you experience any
             issue, say using JAX, TensorFlow, Torch, try setting ``max_workers`` to ``None``.
+            The pool is started on the first execution and reused until :meth:`~.close`
+            is called.
+        shot_allocation (str): How the shots are distributed when estimating the expectation
+            value of a ``Hamiltonian`` or ``Sum`` with shots. The Pauli words are always measured
+            in groups of qubit-wise commuting terms, with one set of samples per group. With
+            ``"uniform"`` (default), every group is sampled with the requested number of shots.
+            With ``"weighted"`` and ``"optimal"``, the same total number of shots is distributed
+            proportionally to the sum of the absolute values of the coefficients of each group,
+            or to the standard deviation of each group in the final state, which minimizes the
+            variance of the estimate.
+        num_trajectories (int): If provided, analytic circuits with noise channels are simulated
+            by averaging their measurements over ``num_trajectories`` quantum trajectories. See
+            the "Noisy circuits" section below. Default ``None``, in which case channels are not
+            supported.
 
     **Example:**
 
@@ -304,6 +324,42 @@ class DefaultQubit(Device):
         * ``jvps``: How many circuits are submitted to :meth:`~.compute_jvp` or :meth:`~.execute_and_compute_jvp`
 
 
+    .. details::
+        :title: Noisy circuits
+
+        With ``num_trajectories``, circuits with noise channels are simulated with quantum
+        trajectories, also known as the Monte Carlo wavefunction method. Every trajectory
+        evolves a state vector, to which a single Kraus operator of every channel is applied,
+        chosen with the probability of its outcome. The expectation values, variances,
+        probabilities and reduced density matrices are averaged over the trajectories, which
+        are simulated in batches along the leading axis of the state. The results are estimates,
+        whose errors decrease as ``1 / sqrt(num_trajectories)``, but the memory cost is
+        :math:`2^n` instead of the :math:`4^n` of ``default.mixed``, so that noisy circuits with
+        more than 20 qubits can be simulated.
+
+        .. code-block:: python
+
+            dev = qml.device("default.qubit", num_trajectories=10000, seed=42)
+
+            @qml.qnode(dev)
+            def circuit():
+                qml.Hadamard(0)
+                qml.AmplitudeDamping(0.2, wires=0)
+                return qml.expval(qml.PauliX(0))
+
+        >>> circuit()
+        0.8959179029849161
+
+        The standard errors of the estimates, which are the widths of their 68% confidence
+        intervals, are returned by :func:`~.devices.qubit.simulate_trajectories`:
+
+        >>> from pennylane.devices.qubit import simulate_trajectories
+        >>> tape = qml.tape.QuantumScript(
+        ...     [qml.Hadamard(0), qml.AmplitudeDamping(0.2, wires=0)], [qml.expval(qml.PauliX(0))]
+        ... )
+        >>> simulate_trajectories(tape, 10000, rng=42, return_std_errors=True)
+        (0.8959179029849161, 0.0029615916752100072)
+
     .. details::
         :title: Accelerate calculations with multiprocessing
 
@@ -330,6 +386,16 @@ class DefaultQubit(Device):
 
         where the last two are specific to the MKL and OpenBLAS libraries specifically.
 
+        If none of these variables are set, each worker process is limited to
+        ``os.cpu_count() // max_workers`` threads.
+
+        The worker processes are started on the first execution and are kept alive between
+        executions, so that the start-up cost is only paid once per optimization. They are shut
+        down with :meth:`~.close`, or when the device is used as a context manager:
+
+        >>> with DefaultQubit(max_workers=5) as dev:
+        ...     results = dev.execute(new_batch, execution_config=execution_config)
+
         .. warning::
 
             Multiprocessing may fail depending on your platform and environment (Python shell,
@@ -373,9 +439,23 @@ class DefaultQubit(Device):
         shots=None,
         seed="global",
         max_workers=None,
+        shot_allocation="uniform",
+        num_trajectories=None,
     ) -> None:
         super().__init__(wires=wires, shots=shots)
+        if shot_allocation not in SHOT_ALLOCATIONS:
+            raise ValueError(
+                f"Unknown shot allocation '{shot_allocation}'; expected one of {SHOT_ALLOCATIONS}."
+            )
+        if num_trajectories is not None and num_trajectories < 1:
+            raise ValueError(
+                f"The number of trajectories must be a positive integer, got {num_trajectories}."
+            )
         self._max_workers = max_workers
+        self._shot_allocation = shot_allocation
+        self._num_trajectories = num_trajectories
+        # the seed as given, which identifies the samples of the device, e.g. in persistent caches
+        self._seed = seed
         seed = np.random.randint(0, high=10000000) if seed == "global" else seed
         if qml.math.get_interface(seed) == "jax":
             self._prng_key = seed
@@ -384,6 +464,7 @@ class DefaultQubit(Device):
             self._prng_key = None
             self._rng = np.random.default_rng(seed)
         self._debugger = None
+        self._worker_pool = None
 
     def supports_derivatives(
         self,
@@ -462,7 +543,11 @@ class DefaultQubit(Device):
         transform_program.add_transform(mid_circuit_measurements, device=self)
         transform_program.add_transform(
             decompose,
-            stopping_condition=stopping_condition,
+            stopping_condition=(
+                stopping_condition
+                if self._num_trajectories is None
+                else stopping_condition_trajectories
+            ),
             stopping_condition_shots=stopping_condition_shots,
             name=self.name,
         )
@@ -549,29 +634,34 @@ class DefaultQubit(Device):
             else None
         )
         if max_workers is None:
-            results = tuple(
-                simulate(
-                    c,
-                    rng=self._rng,
-                    prng_key=self._prng_key,
-                    debugger=self._debugger,
-                    interface=interface,
-                    state_cache=self._state_cache,
-                )
-                for c in circuits
+            results = simulate_batch(
+                circuits,
+                rng=self._rng,
+                prng_key=self._prng_key,
+                debugger=self._debugger,
+                interface=interface,
+                state_cache=self._state_cache,
+                shot_allocation=self._shot_allocation,
+                num_trajectories=self._num_trajectories,
             )
         else:
             vanilla_circuits = [convert_to_numpy_parameters(c) for c in circuits]
             seeds = self._rng.integers(2**31 - 1, size=len(vanilla_circuits))
-            _wrap_simulate = partial(simulate, debugger=None, interface=interface)
-            with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
-                exec_map = executor.map(
-                    _wrap_simulate,
-                    vanilla_circuits,
-                    seeds,
-                    [self._prng_key] * len(vanilla_circuits),
-                )
-                results = tuple(exec_map)
+            _wrap_simulate = partial(
+                simulate,
+                debugger=None,
+                interface=interface,
+                shot_allocation=self._shot_allocation,
+                num_trajectories=self._num_trajectories,
+            )
+            pool = self._get_worker_pool(max_workers)
+            exec_map = pool.map(
+                _wrap_simulate,
+                vanilla_circuits,
+                seeds,
+                [self._prng_key] * len(vanilla_circuits),
+            )
+            results = tuple(exec_map)
 
             # reset _rng to mimic serial behavior
             self._rng = np.random.default_rng(self._rng.integers(2**31 - 1))
@@ -620,9 +710,9 @@ class DefaultQubit(Device):
             res = tuple(adjoint_jacobian(circuit) for circuit in circuits)
         else:
             vanilla_circuits = [convert_to_numpy_parameters(c) for c in circuits]
-            with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
-                exec_map = executor.map(adjoint_jacobian, vanilla_circuits)
-                res = tuple(exec_map)
+            pool = self._get_worker_pool(max_workers)
+            exec_map = pool.map(adjoint_jacobian, vanilla_circuits)
+            res = tuple(exec_map)
 
             # reset _rng to mimic serial behavior
             self._rng = np.random.default_rng(self._rng.integers(2**31 - 1))
@@ -661,15 +751,15 @@ class DefaultQubit(Device):
             vanilla_circuits = [convert_to_numpy_parameters(c) for c in circuits]
             seeds = self._rng.integers(2**31 - 1, size=len(vanilla_circuits))
 
-            with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
-                results = tuple(
-                    executor.map(
-                        _adjoint_jac_wrapper,
-                        vanilla_circuits,
-                        seeds,
-                        [self._prng_key] * len(vanilla_circuits),
-                    )
+            pool = self._get_worker_pool(max_workers)
+            results = tuple(
+                pool.map(
+                    _adjoint_jac_wrapper,
+                    vanilla_circuits,
+                    seeds,
+                    [self._prng_key] * len(vanilla_circuits),
                 )
+            )
 
             # reset _rng to mimic serial behavior
             self._rng = np.random.default_rng(self._rng.integers(2**31 - 1))
@@ -717,8 +807,8 @@ class DefaultQubit(Device):
             res = tuple(adjoint_jvp(circuit, tans) for circuit, tans in zip(circuits, tangents))
         else:
             vanilla_circuits = [convert_to_numpy_parameters(c) for c in circuits]
-            with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
-                res = tuple(executor.map(adjoint_jvp, vanilla_circuits, tangents))
+            pool = self._get_worker_pool(max_workers)
+            res = tuple(pool.map(adjoint_jvp, vanilla_circuits, tangents))
 
             # reset _rng to mimic serial behavior
             self._rng = np.random.default_rng(self._rng.integers(2**31 - 1))
@@ -757,16 +847,16 @@ class DefaultQubit(Device):
             vanilla_circuits = [convert_to_numpy_parameters(c) for c in circuits]
             seeds = self._rng.integers(2**31 - 1, size=len(vanilla_circuits))
 
-            with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
-                results = tuple(
-                    executor.map(
-                        _adjoint_jvp_wrapper,
-                        vanilla_circuits,
-                        tangents,
-                        seeds,
-                        [self._prng_key] * len(vanilla_circuits),
-                    )
+            pool = self._get_worker_pool(max_workers)
+            results = tuple(
+                pool.map(
+                    _adjoint_jvp_wrapper,
+                    vanilla_circuits,
+                    tangents,
+                    seeds,
+                    [self._prng_key] * len(vanilla_circuits),
                 )
+            )
 
             # reset _rng to mimic serial behavior
             self._rng = np.random.default_rng(self._rng.integers(2**31 - 1))
@@ -862,8 +952,8 @@ class DefaultQubit(Device):
             )
         else:
             vanilla_circuits = [convert_to_numpy_parameters(c) for c in circuits]
-            with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
-                res = tuple(executor.map(adjoint_vjp, vanilla_circuits, cotangents))
+            pool = self._get_worker_pool(max_workers)
+            res = tuple(pool.map(adjoint_vjp, vanilla_circuits, cotangents))
 
             # reset _rng to mimic serial behavior
             self._rng = np.random.default_rng(self._rng.integers(2**31 - 1))
@@ -902,16 +992,16 @@ class DefaultQubit(Device):
             vanilla_circuits = [convert_to_numpy_parameters(c) for c in circuits]
             seeds = self._rng.integers(2**31 - 1, size=len(vanilla_circuits))
 
-            with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
-                results = tuple(
-                    executor.map(
-                        _adjoint_vjp_wrapper,
-                        vanilla_circuits,
-                        cotangents,
-                        seeds,
-                        [self._prng_key] * len(vanilla_circuits),
-                    )
+            pool = self._get_worker_pool(max_workers)
+            results = tuple(
+                pool.map(
+                    _adjoint_vjp_wrapper,
+                    vanilla_circuits,
+                    cotangents,
+                    seeds,
+                    [self._prng_key] * len(vanilla_circuits),
                 )
+            )
 
             # reset _rng to mimic serial behavior
             self._rng = np.random.default_rng(self._rng.integers(2**31 - 1))
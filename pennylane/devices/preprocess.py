@@ -17,22 +17,26 @@ that they are supported for execution by a device."""
 # pylint: disable=protected-access, too-many-arguments
 
 import os
-from typing import Generator, Callable, Union, Sequence, Optional
+from typing import Generator, Callable, List, Union, Sequence, Optional
 from copy import copy
 import warnings
 
+import numpy as np
+
 import pennylane as qml
 from pennylane import Snapshot
 from pennylane.operation import Tensor, StatePrepBase
+from pennylane.ops.eigendecompositions import matrix_fingerprint
 from pennylane.measurements import (
     MeasurementProcess,
     StateMeasurement,
     SampleMeasurement,
 )
 from pennylane.typing import ResultBatch, Result
+from pennylane.utils import LRUCache
 from pennylane import DeviceError
 from pennylane import transform
-from pennylane.wires import WireError
+from pennylane.wires import WireError, Wires
 
 PostprocessingFn = Callable[[ResultBatch], Union[Result, ResultBatch]]
 
@@ -81,6 +85,390 @@ def _operator_decomposition_gen(
 #######################
 
 
+_MISSING = object()
+"""Marker of the keys that are not in a decomposition cache."""
+
+_SEEN = object()
+"""Marker of the keys of operators decomposed once, whose recipe is not inferred yet."""
+
+_UNCACHEABLE = object()
+"""Marker of the keys of operators whose decomposition cannot be stored as a recipe."""
+
+_NUM_PROBES = 3
+"""Number of random sets of parameters used to infer the parameters of a decomposition."""
+
+
+def _snap(value):
+    """Round a coefficient of a recipe to a multiple of ``1/8`` or ``pi/8`` if it is one up to
+    numerical errors, so that the rebound parameters are computed exactly."""
+    for unit in (1.0, np.pi):
+        multiple = np.round(value / unit * 8) * unit / 8
+        if abs(value - multiple) < 1e-9:
+            return float(multiple)
+    return float(value)
+
+
+def _recipe_source(value, probe_values, probe_inputs):
+    """Express a parameter of a decomposition in terms of the parameters of the decomposed operator.
+
+    Args:
+        value (array): the parameter in the decomposition of the operator with its actual parameters
+        probe_values (list[array]): the parameter in the decompositions with the random parameters
+        probe_inputs (list[list[array]]): the random parameters of the operator
+
+    Returns:
+        tuple or None: ``None`` if the parameter is constant, or the tuple
+        ``(param_index, element_index, a, b)`` if the parameter is ``a * x + b``, where ``x`` is
+        the element ``element_index`` of the parameter ``param_index`` of the operator
+
+    Raises:
+        ValueError: if the parameter cannot be expressed as an affine function of a single
+        parameter of the operator
+    """
+    if all(np.array_equal(v, probe_values[0]) for v in probe_values[1:]):
+        if np.allclose(value, probe_values[0]):
+            return None
+        raise ValueError("The parameter depends on the parameters in an unknown way.")
+
+    if np.ndim(probe_values[0]) or np.iscomplexobj(probe_values[0]):
+        # only parameters that are entire parameters of the operator are supported
+        for i, probe_input in enumerate(probe_inputs[0]):
+            if np.shape(probe_input) == np.shape(probe_values[0]) and all(
+                np.array_equal(v, inputs[i]) for v, inputs in zip(probe_values, probe_inputs)
+            ):
+                return i, (), 1.0, 0.0
+        raise ValueError("The parameter depends on the parameters in an unknown way.")
+
+    # fit y = a * x + b with the first two probes and check it with the other ones
+    x = [np.concatenate([np.ravel(p) for p in inputs]) for inputs in probe_inputs]
+    y = [float(v) for v in probe_values]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        a = (y[0] - y[1]) / (x[0] - x[1])
+        b = y[0] - a * x[0]
+        fits = np.all([np.isclose(a * x[k] + b, y[k]) for k in range(2, len(y))], axis=0)
+    if not np.any(fits):
+        raise ValueError("The parameter depends on the parameters in an unknown way.")
+
+    flat_index = int(np.argmax(fits))
+    offsets = np.cumsum([0] + [np.size(p) for p in probe_inputs[0]])
+    param_index = int(np.searchsorted(offsets, flat_index, side="right") - 1)
+    shape = np.shape(probe_inputs[0][param_index])
+    element_index = np.unravel_index(flat_index - offsets[param_index], shape) if shape else ()
+    return (
+        param_index,
+        tuple(int(i) for i in element_index),
+        _snap(a[flat_index]),
+        _snap(b[flat_index]),
+    )
+
+
+def _rebind_parameter(data, source):
+    """Compute a parameter of a decomposition from the parameters of the decomposed operator."""
+    param_index, element_index, a, b = source
+    x = data[param_index][element_index] if element_index else data[param_index]
+    if a == 1.0 and b == 0.0:
+        return x
+    return a * x + b if b else a * x
+
+
+def _hashable(value):
+    """Convert the lists contained in a value, such as the name of a :class:`~.Tensor`, to
+    tuples."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(v) for v in value)
+    return value
+
+
+def _structure(op):
+    """The name, wires and hyperparameters of an operator. The operators contained in the
+    hyperparameters, such as the base of a controlled operator, are replaced by their structure,
+    and by their exact parameters if these are not parameters of the operator itself."""
+    data_ids = {id(d) for d in op.data}
+
+    def fingerprint(value):
+        if isinstance(value, np.ndarray):
+            # the string of a large array only contains some of its entries
+            return matrix_fingerprint(value)
+        if not isinstance(value, qml.operation.Operator):
+            return str(value)
+        if all(id(d) in data_ids for d in value.data):
+            return _structure(value)
+        data = tuple(
+            id(d) if qml.math.is_abstract(d) else matrix_fingerprint(qml.math.unwrap(d))
+            for d in value.data
+        )
+        return _structure(value), data
+
+    hyperparameters = tuple((key, fingerprint(value)) for key, value in op.hyperparameters.items())
+    return _hashable(op.name), tuple(op.wires.tolist()), hyperparameters
+
+
+class _RecipeEntry:
+    """An operator of a recipe: a template operator, the positions of its wires in the wires of
+    the decomposed operator and the sources of its parameters."""
+
+    __slots__ = ("template", "template_wires", "wire_indices", "sources", "fast_copy")
+
+    def __init__(self, template, wire_indices, sources):
+        self.template = template
+        self.template_wires = template.wires.tolist()
+        self.wire_indices = wire_indices
+        self.sources = sources
+        # operators whose only wires are stored in ``_wires`` and with no representation depending
+        # on the parameters are copied with new parameters instead of being instantiated again
+        self.fast_copy = (
+            isinstance(template, qml.operation.Operation)
+            and not template.hyperparameters
+            and template._pauli_rep is None
+        )
+
+    def build(self, op, op_wires):
+        """Build the operator of the decomposition of ``op``, whose wires are ``op_wires``."""
+        template = self.template
+        wires = [op_wires[i] for i in self.wire_indices]
+        same_wires = wires == self.template_wires
+        if self.sources is None:
+            if same_wires:
+                return template
+            return template.map_wires(dict(zip(self.template_wires, wires)))
+
+        data = tuple(
+            template.data[i] if source is None else _rebind_parameter(op.data, source)
+            for i, source in enumerate(self.sources)
+        )
+        if self.fast_copy:
+            new_op = copy(template)
+            new_op.data = data
+            if not same_wires:
+                new_op._wires = Wires(wires)
+            return new_op
+        new_op = qml.ops.functions.bind_new_parameters(template, data)
+        if not same_wires:
+            new_op = new_op.map_wires(dict(zip(self.template_wires, wires)))
+        return new_op
+
+
+class DecompositionCache(LRUCache):
+    """A least recently used cache of the decompositions of operators into operators accepted by
+    a device.
+
+    The :func:`~.devices.preprocess.decompose` transform stores in the shared cache
+    ``qml.devices.preprocess.decomposition_cache`` a *recipe* of the decompositions of the
+    operators it expands, such as templates and multi-controlled gates. A recipe is made of the
+    decomposed operators acting on the wires ``0, 1, ...``, and of the parameters of these
+    operators as affine functions of the parameters of the decomposed operator. When an operator
+    of the same type, with the same hyperparameters and number of wires and with parameters of the
+    same shape is decomposed again with the same acceptance function, for example at the next step
+    of an optimization, its decomposition is obtained by rebinding the parameters and relabeling
+    the wires of the recipe.
+
+    The recipe of an operator with parameters is inferred the second time it is decomposed, by
+    decomposing it with random parameters. It is only stored if the decomposition has the same
+    structure for all parameters, and if the decomposition with the actual parameters is
+    reproduced. Operators with parameters that are not real floating point numbers, or that are
+    abstract, are always decomposed. The acceptance functions are assumed to only depend on the
+    operators they are called with.
+
+    Args:
+        maxsize (int): the maximal number of recipes stored in the cache
+
+    **Example**
+
+    >>> def accepted(obj):
+    ...     return obj.name in {"Hadamard", "SWAP", "ControlledPhaseShift"}
+    >>> cache = qml.devices.preprocess.DecompositionCache()
+    >>> ops = cache.decomposition(qml.QFT(wires=range(3)), accepted)
+    >>> cache.decomposition(qml.QFT(wires=["a", "b", "c"]), accepted)[:2]
+    [Hadamard(wires=['a']),
+    Controlled(PhaseShift(1.5707963267948966, wires=['a']), control_wires=['b'])]
+    >>> cache.cache_info()
+    CacheInfo(hits=1, misses=1, maxsize=1024, currsize=1)
+
+    The decompositions can be disabled by passing ``cache=None`` to
+    :func:`~.devices.preprocess.decompose`.
+    """
+
+    @staticmethod
+    def _key(op, acceptance_function, decomposer, max_expansion):
+        """The key of the recipe of an operator, or ``None`` if it cannot be cached."""
+        signature = []
+        for d in op.data:
+            if qml.math.is_abstract(d):
+                return None
+            signature.append(
+                (
+                    qml.math.get_interface(d),
+                    qml.math.shape(d),
+                    qml.math.get_dtype_name(d),
+                    qml.math.requires_grad(d),
+                )
+            )
+        if op.hyperparameters:
+            # the hyperparameters may contain wires, hence they are compared on the wires 0, 1, ...
+            with qml.QueuingManager.stop_recording():
+                local_op = qml.map_wires(op, dict(zip(op.wires, range(len(op.wires)))))
+            structure = _structure(local_op)
+        else:
+            structure = len(op.wires)
+        return (
+            type(op),
+            _hashable(op.name),
+            structure,
+            tuple(signature),
+            acceptance_function,
+            decomposer,
+            max_expansion,
+        )
+
+    def decomposition(
+        self,
+        op: qml.operation.Operator,
+        acceptance_function: Callable[[qml.operation.Operator], bool],
+        decomposer: Optional[
+            Callable[[qml.operation.Operator], Sequence[qml.operation.Operator]]
+        ] = None,
+        max_expansion: Optional[int] = None,
+        name: str = "device",
+    ) -> List[qml.operation.Operator]:
+        """Return the decomposition of an operator into accepted operators, using the stored
+        recipe if there is one.
+
+        Args:
+            op (.Operator): the operator to decompose
+            acceptance_function (Callable): a function from an operator to a boolean, which is
+                ``True`` if the operator is accepted
+            decomposer (Callable): an optional callable that takes an operator and returns its
+                decomposition. Defaults to ``op.decomposition()``.
+            max_expansion (int): The maximum depth of the expansion.
+            name (str): the name of the device to use in error messages
+
+        Returns:
+            list[.Operator]: the operators of the decomposition
+        """
+        try:
+            key = self._key(op, acceptance_function, decomposer, max_expansion)
+            hash(key)
+        except Exception:  # pylint: disable=broad-except
+            # operators whose structure cannot be fingerprinted are decomposed without the cache
+            key = None
+        entry = _MISSING
+        if key is not None:
+            with self._lock:
+                if key in self._entries:
+                    entry = self[key]
+
+        if isinstance(entry, list):
+            with self._lock:
+                self.hits += 1
+            op_wires = op.wires.tolist()
+            with qml.QueuingManager.stop_recording():
+                return [recipe_entry.build(op, op_wires) for recipe_entry in entry]
+
+        with self._lock:
+            self.misses += 1
+
+        if decomposer is None:
+
+            def decomposer(obj):
+                return obj.decomposition()
+
+        ops = list(
+            _operator_decomposition_gen(
+                op, acceptance_function, decomposer, max_expansion=max_expansion, name=name
+            )
+        )
+
+        if key is None or entry is _UNCACHEABLE:
+            return ops
+        if entry is _MISSING and op.data:
+            # the recipe of an operator with parameters is only inferred if the operator is
+            # decomposed a second time, as it requires decomposing it with other parameters
+            self[key] = _SEEN
+        else:
+            self[key] = self._learn(op, ops, acceptance_function, decomposer, max_expansion)
+        return ops
+
+    # pylint: disable=too-many-arguments
+    @staticmethod
+    def _learn(op, ops, acceptance_function, decomposer, max_expansion):
+        """Infer the recipe of the decomposition ``ops`` of an operator, or return
+        ``_UNCACHEABLE`` if it is not reproduced by a recipe."""
+
+        def decompose_with(params):
+            probe_op = qml.ops.functions.bind_new_parameters(op, params)
+            return list(
+                _operator_decomposition_gen(
+                    probe_op, acceptance_function, decomposer, max_expansion=max_expansion
+                )
+            )
+
+        def values(decomposed_op):
+            return [qml.math.toarray(qml.math.unwrap(d)) for d in decomposed_op.data]
+
+        try:
+            probe_inputs = []
+            probe_ops = []
+            if op.data:
+                inputs = [qml.math.toarray(qml.math.unwrap(d)) for d in op.data]
+                if any(i.dtype.kind != "f" for i in inputs):
+                    return _UNCACHEABLE
+                rng = np.random.default_rng(len(ops))
+                with qml.QueuingManager.stop_recording():
+                    for _ in range(_NUM_PROBES):
+                        # random values of both signs, away from zero
+                        params = [
+                            rng.uniform(0.1, np.pi, size=np.shape(i))
+                            * rng.choice([-1, 1], size=np.shape(i))
+                            for i in inputs
+                        ]
+                        params = [p if np.ndim(p) else float(p) for p in params]
+                        probe_inputs.append([np.asarray(p) for p in params])
+                        probe_ops.append(decompose_with(params))
+
+            recipe = []
+            for k, decomposed_op in enumerate(ops):
+                probes = [p[k] for p in probe_ops if len(p) == len(ops)]
+                if len(probes) != len(probe_ops) or any(
+                    type(p) is not type(decomposed_op)
+                    or p.wires != decomposed_op.wires
+                    or p._structure_hash() != decomposed_op._structure_hash()
+                    or len(p.data) != len(decomposed_op.data)
+                    for p in probes
+                ):
+                    return _UNCACHEABLE
+
+                wire_indices = [op.wires.index(w) for w in decomposed_op.wires]
+                sources = None
+                if decomposed_op.data and probes:
+                    probe_values = [values(p) for p in probes]
+                    sources = [
+                        _recipe_source(value, [v[i] for v in probe_values], probe_inputs)
+                        for i, value in enumerate(values(decomposed_op))
+                    ]
+                    if all(s is None for s in sources):
+                        sources = None
+                # the parameters of the templates do not depend on the actual parameters
+                template = probes[0] if probes else decomposed_op
+                recipe.append(_RecipeEntry(template, wire_indices, sources))
+
+            with qml.QueuingManager.stop_recording():
+                rebuilt = [entry.build(op, op.wires.tolist()) for entry in recipe]
+            if not all(
+                qml.equal(a, b, check_interface=False, check_trainability=False)
+                for a, b in zip(rebuilt, ops)
+            ):
+                return _UNCACHEABLE
+        except Exception:  # pylint: disable=broad-except
+            # the operator cannot be decomposed with other parameters, or its decomposition
+            # cannot be expressed as a recipe
+            return _UNCACHEABLE
+        return recipe
+
+
+decomposition_cache = DecompositionCache()
+"""DecompositionCache: the cache shared by the :func:`~.devices.preprocess.decompose` transforms."""
+
+
 @transform
 def no_sampling(
     tape: qml.tape.QuantumTape, name: str = "device"
@@ -260,6 +648,7 @@ def decompose(
     ] = None,
     max_expansion: Union[int, None] = None,
     name: str = "device",
+    cache: Optional[DecompositionCache] = decomposition_cache,
 ) -> (Sequence[qml.tape.QuantumTape], Callable):
     """Decompose operations until the stopping condition is met.
 
@@ -275,7 +664,11 @@ def decompose(
         decomposer (Callable): an optional callable that takes an operator and implements the relevant decomposition.
             If None, defaults to using a callable returning ``op.decomposition()`` for any :class:`~.Operator` .
         max_expansion (int): The maximum depth of the expansion.
-
+        name (str): the name of the device to use in error messages.
+        cache (DecompositionCache): the cache storing the recipes of the decompositions of the
+            operators, so that operators decomposed repeatedly are not decomposed from scratch.
+            Defaults to the shared ``qml.devices.preprocess.decomposition_cache``. If ``None``,
+            the operators are always decomposed.
 
     Returns:
         qnode (QNode) or quantum function (Callable) or tuple[List[QuantumTape], function]:
@@ -324,6 +717,7 @@ def decompose(
     RZ(1.5707963267948966, wires=[1])]
 
     """
+    custom_decomposer = decomposer
     if decomposer is None:
 
         def decomposer(op):
@@ -332,6 +726,19 @@ def decompose(
     if stopping_condition_shots is not None and tape.shots:
         stopping_condition = stopping_condition_shots
 
+    def expand(op):
+        if cache is None or stopping_condition(op) or max_expansion == 0:
+            return _operator_decomposition_gen(
+                op,
+                stopping_condition,
+                decomposer=decomposer,
+                max_expansion=max_expansion,
+                name=name,
+            )
+        return cache.decomposition(
+            op, stopping_condition, custom_decomposer, max_expansion=max_expansion, name=name
+        )
+
     if not all(stopping_condition(op) for op in tape.operations):
         try:
             # don't decompose initial operations if its StatePrepBase
@@ -340,15 +747,7 @@ def decompose(
             )
 
             new_ops = [
-                final_op
-                for op in tape.operations[bool(prep_op) :]
-                for final_op in _operator_decomposition_gen(
-                    op,
-                    stopping_condition,
-                    decomposer=decomposer,
-                    max_expansion=max_expansion,
-                    name=name,
-                )
+                final_op for op in tape.operations[bool(prep_op) :] for final_op in expand(op)
             ]
         except RecursionError as e:
             raise DeviceError(
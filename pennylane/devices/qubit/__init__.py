@@ -26,7 +26,10 @@ at your own discretion.
     measure
     measure_with_samples
     sample_state
+    sample_basis_indices
     simulate
+    simulate_batch
+    simulate_trajectories
     adjoint_jacobian
     adjoint_jvp
     adjoint_vjp
@@ -36,5 +39,6 @@ from .apply_operation import apply_operation
 from .adjoint_jacobian import adjoint_jacobian, adjoint_jvp, adjoint_vjp
 from .initialize_state import create_initial_state
 from .measure import measure
-from .sampling import sample_state, measure_with_samples
-from .simulate import simulate, get_final_state, measure_final_state
+from .sampling import sample_state, sample_basis_indices, measure_with_samples
+from .simulate import simulate, simulate_batch, get_final_state, measure_final_state
+from .trajectories import simulate_trajectories
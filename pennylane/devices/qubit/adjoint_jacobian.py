@@ -18,10 +18,12 @@ import numpy as np
 
 import pennylane as qml
 
-from pennylane.operation import operation_derivative
+from pennylane.operation import operation_derivative, GeneratorUndefinedError
+from pennylane.pauli.conversion import is_pauli_sentence, pauli_sentence
 from pennylane.tape import QuantumTape
 
 from .apply_operation import apply_operation
+from .pauli_kernels import apply_pauli_sentence
 from .simulate import get_final_state
 from .initialize_state import create_initial_state
 
@@ -35,6 +37,39 @@ def _dot_product_real(bra, ket, num_wires):
     return qml.math.real(qml.math.sum(qml.math.conj(bra) * ket, axis=sum_axes))
 
 
+def _apply_observable(obs, ket):
+    """Apply an observable to the final state, using its Pauli representation when available."""
+    if is_pauli_sentence(obs):
+        return apply_pauli_sentence(pauli_sentence(obs), ket)
+    return apply_operation(obs, ket)
+
+
+def _apply_derivative(op, ket):
+    r"""Apply the derivative of a single-parameter operation to the state preceding it.
+
+    Args:
+        op (Operation): an operation with a single parameter
+        ket (TensorLike): the state *after* ``op`` has been applied
+
+    Returns:
+        TensorLike: :math:`\frac{\partial U}{\partial x} U^{\dagger} |k\rangle`
+
+    For operations :math:`U(x) = e^{ixG}` with a generator :math:`G`, this is :math:`iG|k\rangle`.
+    The generator is applied without its matrix when it is a linear combination of Pauli words. Only
+    operations without a generator fall back to the dense matrix of the derivative.
+    """
+    try:
+        generator = op.generator()
+    except GeneratorUndefinedError:
+        d_op_matrix = operation_derivative(op)
+        ket = apply_operation(qml.adjoint(op), ket)
+        return apply_operation(qml.QubitUnitary(d_op_matrix, wires=op.wires), ket)
+
+    if is_pauli_sentence(generator):
+        return 1j * apply_pauli_sentence(pauli_sentence(generator), ket)
+    return 1j * apply_operation(generator, ket)
+
+
 def _adjoint_jacobian_state(tape: QuantumTape):
     """Calculate the full jacobian for a circuit that returns the state.
 
@@ -103,10 +138,11 @@ def adjoint_jacobian(tape: QuantumTape, state=None):
 
     ket = state if state is not None else get_final_state(tape)[0]
 
+    # the bras of all observables are stacked and evolved together as a batched state
     n_obs = len(tape.observables)
     bras = np.empty([n_obs] + [2] * len(tape.wires), dtype=np.complex128)
     for kk, obs in enumerate(tape.observables):
-        bras[kk, ...] = 2 * apply_operation(obs, ket)
+        bras[kk, ...] = 2 * _apply_observable(obs, ket)
 
     jac = np.zeros((len(tape.observables), len(tape.trainable_params)))
 
@@ -115,20 +151,18 @@ def adjoint_jacobian(tape: QuantumTape, state=None):
     for op in reversed(tape.operations[tape.num_preps :]):
         if isinstance(op, qml.Snapshot):
             continue
-        adj_op = qml.adjoint(op)
-        ket = apply_operation(adj_op, ket)
 
         if op.num_params == 1:
             if param_number in tape.trainable_params:
-                d_op_matrix = operation_derivative(op)
-                ket_temp = apply_operation(qml.QubitUnitary(d_op_matrix, wires=op.wires), ket)
+                ket_temp = _apply_derivative(op, ket)
                 jac[:, trainable_param_number] = _dot_product_real(bras, ket_temp, len(tape.wires))
 
                 trainable_param_number -= 1
             param_number -= 1
 
-        for kk in range(n_obs):
-            bras[kk, ...] = apply_operation(adj_op, bras[kk, ...])
+        adj_op = qml.adjoint(op)
+        ket = apply_operation(adj_op, ket)
+        bras = apply_operation(adj_op, bras, is_state_batched=True)
 
     # Post-process the Jacobian matrix for the new return
     jac = np.squeeze(jac)
@@ -180,7 +214,7 @@ def adjoint_jvp(tape: QuantumTape, tangents: Tuple[Number], state=None):
     n_obs = len(tape.observables)
     bras = np.empty([n_obs] + [2] * len(tape.wires), dtype=np.complex128)
     for i, obs in enumerate(tape.observables):
-        bras[i] = apply_operation(obs, ket)
+        bras[i] = _apply_observable(obs, ket)
 
     param_number = len(tape.get_parameters(trainable_only=False, operations_only=True)) - 1
     trainable_param_number = len(tape.trainable_params) - 1
@@ -188,15 +222,11 @@ def adjoint_jvp(tape: QuantumTape, tangents: Tuple[Number], state=None):
     tangents_out = np.zeros(n_obs)
 
     for op in reversed(tape.operations[tape.num_preps :]):
-        adj_op = qml.adjoint(op)
-        ket = apply_operation(adj_op, ket)
-
         if op.num_params == 1:
             if param_number in tape.trainable_params:
                 # don't do anything if the tangent is 0
                 if not np.allclose(tangents[trainable_param_number], 0):
-                    d_op_matrix = operation_derivative(op)
-                    ket_temp = apply_operation(qml.QubitUnitary(d_op_matrix, wires=op.wires), ket)
+                    ket_temp = _apply_derivative(op, ket)
 
                     tangents_out += (
                         2
@@ -207,8 +237,9 @@ def adjoint_jvp(tape: QuantumTape, tangents: Tuple[Number], state=None):
                 trainable_param_number -= 1
             param_number -= 1
 
-        for i in range(n_obs):
-            bras[i] = apply_operation(adj_op, bras[i])
+        adj_op = qml.adjoint(op)
+        ket = apply_operation(adj_op, ket)
+        bras = apply_operation(adj_op, bras, is_state_batched=True)
 
     if n_obs == 1:
         return np.array(tangents_out[0])
@@ -306,8 +337,7 @@ def _get_vjp_bras(tape, cotangents, ket):
 
     for kk, obs in enumerate(new_obs):
         if obs.pauli_rep is not None:
-            flat_bra = obs.pauli_rep.dot(ket.flatten(), wire_order=list(range(tape.num_wires)))
-            bras[kk] = 2 * flat_bra.reshape(ket.shape)
+            bras[kk] = 2 * apply_pauli_sentence(obs.pauli_rep, ket)
         else:
             bras[kk] = 2 * apply_operation(obs, ket)
 
@@ -389,13 +419,9 @@ def adjoint_vjp(tape: QuantumTape, cotangents: Tuple[Number], state=None):
     summing_axis = None if batch_size is None else tuple(range(1, np.ndim(bras)))
 
     for op in reversed(tape.operations[tape.num_preps :]):
-        adj_op = qml.adjoint(op)
-        ket = apply_operation(adj_op, ket)
-
         if op.num_params == 1:
             if param_number in tape.trainable_params:
-                d_op_matrix = operation_derivative(op)
-                ket_temp = apply_operation(qml.QubitUnitary(d_op_matrix, wires=op.wires), ket)
+                ket_temp = _apply_derivative(op, ket)
 
                 # Pad cotangent in with zeros for batch number with zero cotangents
                 cot_in = real_if_expval(np.sum(np.conj(bras) * ket_temp, axis=summing_axis))
@@ -406,6 +432,8 @@ def adjoint_vjp(tape: QuantumTape, cotangents: Tuple[Number], state=None):
                 trainable_param_number -= 1
             param_number -= 1
 
+        adj_op = qml.adjoint(op)
+        ket = apply_operation(adj_op, ket)
         bras = apply_operation(adj_op, bras, is_state_batched=bool(batch_size))
 
     return tuple(cotangents_in)
@@ -24,6 +24,8 @@ from pennylane import math
 from pennylane.measurements import MidMeasureMP
 from pennylane.ops import Conditional
 
+from .pauli_kernels import apply_exp_pauli_sentence
+
 SQRT2INV = 1 / math.sqrt(2)
 
 EINSUM_OP_WIRECOUNT_PERF_THRESHOLD = 3
@@ -437,6 +439,21 @@ def _apply_grover_without_matrix(state, op_wires, is_state_batched):
     return math.moveaxis(math.tensordot(collapsed, all_plus, axes=0), source, sum_axes) - state
 
 
+@apply_operation.register
+def apply_exp(op: qml.ops.Exp, state, is_state_batched: bool = False, debugger=None, **_):
+    """Apply the exponential of a sum of Pauli words on 9 or more wires with the action of its
+    matrix-free exponential on the state, and other exponentials with the default einsum/tensordot
+    choice of their matrices."""
+    if (
+        len(op.wires) < 9
+        or op.base.pauli_rep is None
+        or op.batch_size
+        or math.get_interface(state, *op.data) != "numpy"
+    ):
+        return _apply_operation_default(op, state, is_state_batched, debugger)
+    return apply_exp_pauli_sentence(op.base.pauli_rep, op.coeff, state, is_state_batched)
+
+
 @apply_operation.register
 def apply_snapshot(op: qml.Snapshot, state, is_state_batched: bool = False, debugger=None, **_):
     """Take a snapshot of the state"""
@@ -486,8 +503,9 @@ def apply_parametrized_evolution(
 def _evolve_state_vector_under_parametrized_evolution(
     operation: qml.pulse.ParametrizedEvolution, state, num_wires, is_state_batched
 ):
-    """Uses an odeint solver to compute the evolution of the input ``state`` under the given
-    ``ParametrizedEvolution`` operation.
+    """Uses an odeint solver, or the NumPy integrator selected by the ``method`` of the operation,
+    to compute the evolution of the input ``state`` under the given ``ParametrizedEvolution``
+    operation.
 
     Args:
         state (array[complex]): input state
@@ -501,18 +519,6 @@ def _evolve_state_vector_under_parametrized_evolution(
         TensorLike[complex]: output state
     """
 
-    try:
-        import jax
-        from jax.experimental.ode import odeint
-
-        from pennylane.pulse.parametrized_hamiltonian_pytree import ParametrizedHamiltonianPytree
-
-    except ImportError as e:  # pragma: no cover
-        raise ImportError(
-            "Module jax is required for the ``ParametrizedEvolution`` class. "
-            "You can install jax via: pip install jax"
-        ) from e
-
     if operation.data is None or operation.t is None:
         raise ValueError(
             "The parameters and the time window are required to execute a ParametrizedEvolution "
@@ -527,6 +533,42 @@ def _evolve_state_vector_under_parametrized_evolution(
         state = state.flatten()
         out_shape = [2] * num_wires
 
+    if operation.method == "odeint":
+        result = _odeint_state_vector(operation, state, num_wires)
+    else:
+        result = qml.pulse.integrators.integrate(
+            operation.H,
+            operation.data,
+            state,
+            operation.t,
+            method=operation.method,
+            num_steps=operation.odeint_kwargs.get("num_steps"),
+            dense=operation.dense,
+            wire_order=list(np.arange(num_wires)),
+        )
+    if operation.hyperparameters["return_intermediate"]:
+        return qml.math.reshape(result, [-1] + out_shape)
+    result = qml.math.reshape(result[-1], out_shape)
+    if is_state_batched:
+        return qml.math.moveaxis(result, -1, 0)
+    return result
+
+
+def _odeint_state_vector(operation: qml.pulse.ParametrizedEvolution, state, num_wires):
+    """Evolve the flattened ``state`` with the ``jax`` ODE solver, returning the states at all the
+    times of the operation."""
+    try:
+        import jax
+        from jax.experimental.ode import odeint
+
+        from pennylane.pulse.parametrized_hamiltonian_pytree import ParametrizedHamiltonianPytree
+
+    except ImportError as e:  # pragma: no cover
+        raise ImportError(
+            "Module jax is required for the ``ParametrizedEvolution`` class. "
+            "You can install jax via: pip install jax"
+        ) from e
+
     with jax.ensure_compile_time_eval():
         H_jax = ParametrizedHamiltonianPytree.from_hamiltonian(  # pragma: no cover
             operation.H,
@@ -538,10 +580,5 @@ def _evolve_state_vector_under_parametrized_evolution(
         """dy/dt = -i H(t) y"""
         return (-1j * H_jax(operation.data, t=t)) @ y
 
-    result = odeint(fun, state, operation.t, **operation.odeint_kwargs)
-    if operation.hyperparameters["return_intermediate"]:
-        return qml.math.reshape(result, [-1] + out_shape)
-    result = qml.math.reshape(result[-1], out_shape)
-    if is_state_batched:
-        return qml.math.moveaxis(result, -1, 0)
-    return result
+    odeint_kwargs = {k: v for k, v in operation.odeint_kwargs.items() if k != "method"}
+    return odeint(fun, state, operation.t, **odeint_kwargs)
@@ -31,6 +31,7 @@ from pennylane.typing import TensorLike
 from pennylane.wires import Wires
 
 from .apply_operation import apply_operation
+from .pauli_kernels import expval_pauli_sentence
 
 
 def flatten_state(state, num_wires):
@@ -76,7 +77,7 @@ def csr_dot_products(
     measurementprocess: ExpectationMP, state: TensorLike, is_state_batched: bool = False
 ) -> TensorLike:
     """Measure the expectation value of an observable using dot products between ``scipy.csr_matrix``
-    representations.
+    representations, or without any matrix if the observable is a sum of Pauli words.
 
     Args:
         measurementprocess (ExpectationMP): measurement process to apply to the state
@@ -86,19 +87,13 @@ def csr_dot_products(
     Returns:
         TensorLike: the result of the measurement
     """
-    total_wires = len(state.shape) - is_state_batched
-
     if is_pauli_sentence(measurementprocess.obs):
-        state = math.toarray(state)
-        if is_state_batched:
-            state = state.reshape(math.shape(state)[0], -1)
-        else:
-            state = state.reshape(1, -1)
-        bra = math.conj(state)
         ps = pauli_sentence(measurementprocess.obs)
-        new_ket = ps.dot(state, wire_order=list(range(total_wires)))
-        res = (bra * new_ket).sum(axis=1)
-    elif is_state_batched:
+        return expval_pauli_sentence(ps, state, is_state_batched=is_state_batched)
+
+    total_wires = len(state.shape) - is_state_batched
+
+    if is_state_batched:
         Hmat = measurementprocess.obs.sparse_matrix(wire_order=list(range(total_wires)))
         state = math.toarray(state).reshape(math.shape(state)[0], -1)
 
@@ -0,0 +1,260 @@
+# Copyright 2018-2024 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+r"""Matrix-free kernels applying sums of Pauli words to state vectors.
+
+A Pauli word maps the amplitude :math:`\psi(b)` of the basis state :math:`b` to
+:math:`c (-i)^{n_Y} (-1)^{z \cdot b} \psi(b \oplus x)`, where :math:`x` marks the wires with
+an :math:`X` or :math:`Y` factor, :math:`z` the wires with a :math:`Y` or :math:`Z` factor and
+:math:`n_Y` is the number of :math:`Y` factors. The words of a Pauli sentence with the same
+:math:`x` are grouped, such that each group is applied as a single permutation of the
+amplitudes, which flips the bits of :math:`x`, multiplied by the sum of the phases of its words.
+
+The state is viewed as a matrix whose rows are indexed by the first half of the wires and whose
+columns are indexed by the second half. The phases of a word are the outer product of its signs
+on the rows and on the columns, such that the phases of a group are computed by a matrix product
+of size (rows, words) x (words, columns), in blocks of rows that bound the memory usage.
+"""
+from functools import lru_cache
+
+import numpy as np
+from scipy.sparse.linalg import LinearOperator, expm_multiply
+
+from pennylane import math
+from pennylane.pauli import PauliSentence, PauliWord
+
+_MAX_BLOCK_AMPLITUDES = 2**14
+"""Maximal number of amplitudes of the blocks of the state multiplied by the phases at once."""
+
+
+def apply_pauli_sentence(ps: PauliSentence, state, is_state_batched: bool = False):
+    """Apply a Pauli sentence to a state vector without building its matrix.
+
+    Args:
+        ps (PauliSentence): the Pauli sentence to apply, whose wires are indices of the state
+        state (TensorLike): the state with shape ``[2] * num_wires``
+        is_state_batched (bool): whether the state has a leading batch dimension
+
+    Returns:
+        ndarray: the state after applying the Pauli sentence, with the shape of ``state``
+
+    **Example**
+
+    >>> ps = qml.pauli.PauliSentence({qml.pauli.PauliWord({0: "X", 1: "Z"}): 0.5})
+    >>> state = np.array([[1, 0], [0, 1]]) / np.sqrt(2)
+    >>> apply_pauli_sentence(ps, state)
+    array([[ 0.        +0.j, -0.35355339+0.j],
+           [ 0.35355339+0.j,  0.        +0.j]])
+    """
+    num_wires = math.ndim(state) - is_state_batched
+    return _PauliSentenceKernel(ps, num_wires).apply(state, is_state_batched)
+
+
+def expval_pauli_sentence(ps: PauliSentence, state, is_state_batched: bool = False):
+    """The expectation value of a Pauli sentence in a state vector, without building its matrix
+    or the state after applying it.
+
+    Args:
+        ps (PauliSentence): the Pauli sentence to measure, whose wires are indices of the state
+        state (TensorLike): the state with shape ``[2] * num_wires``
+        is_state_batched (bool): whether the state has a leading batch dimension
+
+    Returns:
+        ndarray: the real expectation value, with a leading batch dimension if the state is
+        batched
+    """
+    num_wires = math.ndim(state) - is_state_batched
+    return _PauliSentenceKernel(ps, num_wires).expval(state, is_state_batched)
+
+
+def apply_exp_pauli_sentence(ps: PauliSentence, coeff, state, is_state_batched: bool = False):
+    r"""Apply the exponential :math:`e^{c H}` of a Pauli sentence :math:`H` to a state vector,
+    using the action of the exponential of the matrix-free Pauli sentence on the state.
+
+    Args:
+        ps (PauliSentence): the Pauli sentence in the exponent, whose wires are indices of the state
+        coeff (complex): the scalar :math:`c` multiplying the Pauli sentence in the exponent
+        state (TensorLike): the state with shape ``[2] * num_wires``
+        is_state_batched (bool): whether the state has a leading batch dimension
+
+    Returns:
+        ndarray: the state after applying the exponential, with the shape of ``state``
+    """
+    num_wires = math.ndim(state) - is_state_batched
+    dim = 2**num_wires
+    coeff = complex(coeff)
+    # the adjoint is used to estimate the norm of the operator, the Pauli words being Hermitian
+    kernel = _PauliSentenceKernel(ps, num_wires)
+    adjoint_ps = PauliSentence({pw: np.conj(math.to_numpy(c)) for pw, c in ps.items()})
+    adjoint_kernel = _PauliSentenceKernel(adjoint_ps, num_wires)
+
+    def matmat(columns, kernel=kernel, coeff=coeff):
+        # the columns of the linear operator are the states of a batch
+        states = np.reshape(np.transpose(columns), (-1,) + (2,) * num_wires)
+        return np.transpose(np.reshape(kernel.apply(states, True), (-1, dim))) * coeff
+
+    def rmatmat(columns):
+        return matmat(columns, adjoint_kernel, np.conj(coeff))
+
+    operator = LinearOperator(
+        (dim, dim),
+        matvec=lambda v: matmat(np.reshape(v, (dim, 1))),
+        rmatvec=lambda v: rmatmat(np.reshape(v, (dim, 1))),
+        matmat=matmat,
+        rmatmat=rmatmat,
+        dtype=np.complex128,
+    )
+    # the trace of a Pauli sentence is the coefficient of the identity times the dimension
+    trace = coeff * dim * complex(math.to_numpy(ps.get(PauliWord({}), 0.0)))
+
+    columns = np.transpose(np.reshape(math.toarray(state), (-1, dim)))
+    new_columns = expm_multiply(operator, columns.astype(np.complex128), traceA=trace)
+    return np.reshape(np.transpose(new_columns), math.shape(state))
+
+
+class _PauliSentenceKernel:
+    """The Pauli words of a Pauli sentence grouped by the bits they flip, with the phases of every
+    group factored into signs on the rows and the columns of the state."""
+
+    def __init__(self, ps: PauliSentence, num_wires: int):
+        self.num_wires = num_wires
+        self.row_bits = num_wires // 2
+
+        bits = {wire: 1 << (num_wires - 1 - wire) for wire in range(num_wires)}
+        words = []
+        for pw, coeff in ps.items():
+            x, z, num_y = pauli_word_masks(pw, bits)
+            words.append((x, z, complex(math.to_numpy(coeff)) * (-1j) ** num_y))
+        self.groups = group_pauli_words(words, num_wires)
+
+    def _blocks(self, psi):
+        """Yields the indices of blocks of the state, in which the leading wires are fixed, with
+        the amplitudes of the states with flipped bits and the summed phases of every group.
+
+        Flipping the bits of the remaining wires reverses their axes, which is a view of the
+        state, while the bits of the fixed wires are flipped in the index of the block.
+        """
+        n = self.num_wires
+        fixed = 0
+        while fixed < self.row_bits and psi.shape[0] * 2 ** (n - fixed) > _MAX_BLOCK_AMPLITUDES:
+            fixed += 1
+        block_rows = 2 ** (self.row_bits - fixed)
+
+        for x, row_signs, col_signs in self.groups:
+            flips = tuple(
+                slice(None, None, -1) if x >> (n - 1 - w) & 1 else slice(None)
+                for w in range(fixed, n)
+            )
+            for prefix in range(2**fixed):
+                index = (slice(None),) + _bits(prefix, fixed)
+                flipped = psi[(slice(None),) + _bits(prefix ^ (x >> (n - fixed)), fixed) + flips]
+                rows = slice(prefix * block_rows, (prefix + 1) * block_rows)
+                phases = np.reshape(row_signs[:, rows].T @ col_signs, (2,) * (n - fixed))
+                yield index, flipped, phases
+
+    def _as_tensor(self, state, is_state_batched):
+        """Reshapes a possibly batched state into a batch of states."""
+        return np.reshape(math.toarray(state), (-1,) + (2,) * self.num_wires)
+
+    def apply(self, state, is_state_batched):
+        """Applies the Pauli sentence to a possibly batched state."""
+        psi = self._as_tensor(state, is_state_batched)
+        dtype = np.complex64 if psi.dtype in (np.float32, np.complex64) else np.complex128
+        result = np.zeros(psi.shape, dtype=dtype)
+        for index, flipped, phases in self._blocks(psi):
+            result[index] += phases.astype(dtype, copy=False) * flipped
+        return np.reshape(result, math.shape(state))
+
+    def expval(self, state, is_state_batched):
+        """The expectation value of the Pauli sentence in a possibly batched state."""
+        psi = self._as_tensor(state, is_state_batched)
+        result = np.zeros(psi.shape[0], dtype=np.complex128)
+        for index, flipped, phases in self._blocks(psi):
+            kets = phases * flipped
+            result += [np.vdot(bra, ket) for bra, ket in zip(psi[index], kets)]
+        result = np.real(result)
+        return result if is_state_batched else result[0]
+
+
+def pauli_word_masks(pw: PauliWord, bits):
+    """The bit masks of the wires of a Pauli word with an :math:`X` or :math:`Y` factor and with a
+    :math:`Y` or :math:`Z` factor, and its number of :math:`Y` factors.
+
+    Args:
+        pw (PauliWord): the Pauli word
+        bits (dict[Hashable, int]): the bit of every wire of the Pauli word
+
+    Returns:
+        tuple[int, int, int]: the bit masks ``x`` and ``z`` and the number of :math:`Y` factors
+    """
+    x, z, num_y = 0, 0, 0
+    for wire, pauli in pw.items():
+        if pauli in "XY":
+            x |= bits[wire]
+        if pauli in "YZ":
+            z |= bits[wire]
+        num_y += pauli == "Y"
+    return x, z, num_y
+
+
+def group_pauli_words(words, num_wires: int):
+    """Groups Pauli words by the bits they flip, and factors the phases of every group into signs
+    on the rows and on the columns of a state viewed as a matrix, whose rows are indexed by the
+    first ``num_wires // 2`` wires.
+
+    Args:
+        words (Iterable[tuple[int, int, complex]]): the bit masks ``x`` and ``z`` of the words,
+            see :func:`~.pauli_word_masks`, and their coefficients multiplied by
+            :math:`(-i)^{n_Y}`
+        num_wires (int): the number of wires
+
+    Returns:
+        list[tuple[int, ndarray, ndarray]]: the bits ``x`` flipped by every group, and the signs
+        of its words on the rows and on the columns, the latter multiplied by the phases of the
+        words. The phases of a group on the rows ``r`` are ``row_signs[:, r].T @ col_signs``.
+    """
+    row_bits = num_wires // 2
+    col_bits = num_wires - row_bits
+
+    by_flips = {}
+    for x, z, phase in words:
+        by_flips.setdefault(x, []).append((z, phase))
+
+    groups = []
+    for x, group in by_flips.items():
+        z = np.array([z for z, _ in group], dtype=np.int64)
+        phases = np.array([phase for _, phase in group], dtype=np.complex128)
+        row_signs = _signs(z >> col_bits, row_bits)
+        col_signs = _signs(z & (2**col_bits - 1), col_bits) * phases[:, None]
+        groups.append((x, row_signs, col_signs))
+    return groups
+
+
+def _bits(number, num_bits):
+    """The bits of a number, from the most significant one."""
+    return tuple(number >> (num_bits - 1 - k) & 1 for k in range(num_bits))
+
+
+def _signs(z, num_bits):
+    r"""The signs :math:`(-1)^{z \cdot b}` of several bit masks ``z`` for all bit strings ``b``
+    with ``num_bits`` bits, with shape ``(len(z), 2 ** num_bits)``."""
+    return 1.0 - 2.0 * _parities(num_bits)[np.arange(2**num_bits) & z[:, None]]
+
+
+@lru_cache(maxsize=4)
+def _parities(num_bits):
+    """The parities of the numbers of set bits of all bit strings with ``num_bits`` bits."""
+    parities = np.zeros(1, dtype=np.int8)
+    for _ in range(num_bits):
+        parities = np.concatenate([parities, 1 - parities])
+    return parities
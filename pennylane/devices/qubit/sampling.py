@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Functions to sample a state."""
+from functools import partial
 from typing import List, Union, Tuple
 
 import numpy as np
@@ -25,10 +26,20 @@ from pennylane.measurements import (
     ShadowExpvalMP,
     CountsMP,
 )
+from pennylane.measurements.measurements import _count_basis_indices
+from pennylane.pauli.grouping.sparse_colouring import insertion_labels, masked_parities
 from pennylane.typing import TensorLike
 from .apply_operation import apply_operation
 from .measure import flatten_state
 
+SHOT_ALLOCATIONS = ("uniform", "weighted", "optimal")
+"""The strategies to distribute shots among the groups of qubit-wise commuting terms of a
+Hamiltonian or Sum."""
+
+_STATE_BLOCK_SIZE = 2**22
+"""Maximal number of values of Pauli words on basis states evaluated at once when computing the
+exact variance of a sum of Pauli words."""
+
 
 def _group_measurements(mps: List[Union[SampleMeasurement, ClassicalShadowMP, ShadowExpvalMP]]):
     """
@@ -158,6 +169,7 @@ def measure_with_samples(
     is_state_batched: bool = False,
     rng=None,
     prng_key=None,
+    shot_allocation: str = "uniform",
 ) -> List[TensorLike]:
     """
     Returns the samples of the measurement process performed on the given state.
@@ -175,6 +187,13 @@ def measure_with_samples(
             If no value is provided, a default RNG will be used.
         prng_key (Optional[jax.random.PRNGKey]): An optional ``jax.random.PRNGKey``. This is
             the key to the JAX pseudo random number generator. Only for simulation using JAX.
+        shot_allocation (str): How the shots are distributed among the groups of qubit-wise
+            commuting Pauli words of ``Hamiltonian`` and ``Sum`` expectation values. With
+            ``"uniform"``, every group is sampled with ``shots``. Otherwise, ``shots`` times the
+            number of groups are distributed proportionally to the sum of the absolute values of
+            the coefficients of each group with ``"weighted"``, or to the standard deviation of
+            each group in the state with ``"optimal"``, which minimizes the variance of the
+            estimate.
 
     Returns:
         List[TensorLike[Any]]: Sample measurement results
@@ -185,9 +204,9 @@ def measure_with_samples(
     all_res = []
     for group in groups:
         if isinstance(group[0], ExpectationMP) and isinstance(group[0].obs, Hamiltonian):
-            measure_fn = _measure_hamiltonian_with_samples
+            measure_fn = partial(_measure_hamiltonian_with_samples, shot_allocation=shot_allocation)
         elif isinstance(group[0], ExpectationMP) and isinstance(group[0].obs, Sum):
-            measure_fn = _measure_sum_with_samples
+            measure_fn = partial(_measure_sum_with_samples, shot_allocation=shot_allocation)
         elif isinstance(group[0], (ClassicalShadowMP, ShadowExpvalMP)):
             measure_fn = _measure_classical_shadow
         else:
@@ -258,20 +277,32 @@ def _measure_with_samples_diagonalizing_gates(
 
         return tuple(processed)
 
-    # if there is a shot vector, build a list containing results for each shot entry
-    if shots.has_partitioned_shots:
-        processed_samples = []
-        for s in shots:
-            # currently we call sample_state for each shot entry, but it may be
-            # better to call sample_state just once with total_shots, then use
-            # the shot_range keyword argument
+    def _process_single_shot_indices(indices):
+        # the samples are only unpacked to one integer per wire if a measurement needs them
+        samples = None
+        processed = []
+        for mp in mps:
+            try:
+                res = mp.process_basis_indices(indices, wires)
+            except NotImplementedError:
+                if samples is None:
+                    samples = _unpack_basis_indices(indices, len(wires))
+                res = mp.process_samples(samples, wires)
+            if not isinstance(mp, CountsMP):
+                res = qml.math.squeeze(res)
+
+            processed.append(res)
+
+        return tuple(processed)
+
+    def _sample_single_shot(s):
+        if prng_key is not None:
             try:
                 samples = sample_state(
                     state,
                     shots=s,
                     is_state_batched=is_state_batched,
                     wires=wires,
-                    rng=rng,
                     prng_key=prng_key,
                 )
             except ValueError as e:
@@ -279,25 +310,27 @@ def _measure_with_samples_diagonalizing_gates(
                     raise e
                 samples = qml.math.full((s, len(wires)), 0)
 
-            processed_samples.append(_process_single_shot(samples))
+            return _process_single_shot(samples)
 
-        return tuple(zip(*processed_samples))
+        try:
+            indices = sample_basis_indices(
+                state, shots=s, is_state_batched=is_state_batched, wires=wires, rng=rng
+            )
+        except ValueError as e:
+            if str(e) != "probabilities contain NaN":
+                raise e
+            indices = np.zeros(s, dtype=np.int64)
 
-    try:
-        samples = sample_state(
-            state,
-            shots=shots.total_shots,
-            is_state_batched=is_state_batched,
-            wires=wires,
-            rng=rng,
-            prng_key=prng_key,
-        )
-    except ValueError as e:
-        if str(e) != "probabilities contain NaN":
-            raise e
-        samples = qml.math.full((shots.total_shots, len(wires)), 0)
+        return _process_single_shot_indices(indices)
+
+    # if there is a shot vector, build a list containing results for each shot entry
+    if shots.has_partitioned_shots:
+        # currently we sample for each shot entry, but it may be better to sample
+        # just once with total_shots, then use the shot_range keyword argument
+        processed_samples = [_sample_single_shot(s) for s in shots]
+        return tuple(zip(*processed_samples))
 
-    return _process_single_shot(samples)
+    return _sample_single_shot(shots.total_shots)
 
 
 def _measure_classical_shadow(
@@ -346,25 +379,23 @@ def _measure_hamiltonian_with_samples(
     is_state_batched: bool = False,
     rng=None,
     prng_key=None,
+    shot_allocation: str = "uniform",
 ):
     # the list contains only one element based on how we group measurements
     mp = mp[0]
-
-    # if the measurement process involves a Hamiltonian, measure each
-    # of the terms separately and sum
-    def _sum_for_single_shot(s):
-        results = measure_with_samples(
-            [ExpectationMP(t) for t in mp.obs.terms()[1]],
-            state,
-            s,
-            is_state_batched=is_state_batched,
-            rng=rng,
-            prng_key=prng_key,
-        )
-        return sum(c * res for c, res in zip(mp.obs.terms()[0], results))
-
-    unsqueezed_results = tuple(_sum_for_single_shot(type(shots)(s)) for s in shots)
-    return [unsqueezed_results] if shots.has_partitioned_shots else [unsqueezed_results[0]]
+    coeffs, ops = mp.obs.terms()
+
+    return _measure_terms_with_samples(
+        coeffs,
+        ops,
+        state,
+        shots,
+        is_state_batched=is_state_batched,
+        rng=rng,
+        prng_key=prng_key,
+        shot_allocation=shot_allocation,
+        grouping_indices=mp.obs.grouping_indices,
+    )
 
 
 def _measure_sum_with_samples(
@@ -374,27 +405,283 @@ def _measure_sum_with_samples(
     is_state_batched: bool = False,
     rng=None,
     prng_key=None,
+    shot_allocation: str = "uniform",
 ):
     # the list contains only one element based on how we group measurements
     mp = mp[0]
+    ops = list(mp.obs)
+
+    return _measure_terms_with_samples(
+        [1.0] * len(ops),
+        ops,
+        state,
+        shots,
+        is_state_batched=is_state_batched,
+        rng=rng,
+        prng_key=prng_key,
+        shot_allocation=shot_allocation,
+    )
+
+
+# pylint:disable = too-many-arguments
+def _measure_terms_with_samples(
+    coeffs,
+    ops,
+    state,
+    shots: Shots,
+    is_state_batched: bool = False,
+    rng=None,
+    prng_key=None,
+    shot_allocation: str = "uniform",
+    grouping_indices=None,
+):
+    """Measures the expectation value of a linear combination of observables.
+
+    The Pauli words are split into groups of qubit-wise commuting terms. For every group, the
+    state is rotated and sampled once, and the expectation values of all the terms are computed
+    from the parities of the same samples. Observables that are not Pauli words are measured
+    separately.
+    """
+    if prng_key is not None:
+        # measure each of the terms separately and sum
+        def _sum_for_single_shot(s):
+            results = measure_with_samples(
+                [ExpectationMP(t) for t in ops],
+                state,
+                s,
+                is_state_batched=is_state_batched,
+                rng=rng,
+                prng_key=prng_key,
+            )
+            return sum(c * res for c, res in zip(coeffs, results))
+
+        unsqueezed_results = tuple(_sum_for_single_shot(type(shots)(s)) for s in shots)
+        return [unsqueezed_results] if shots.has_partitioned_shots else [unsqueezed_results[0]]
+
+    words = [_pauli_word(op) for op in ops]
+    other_indices = [i for i, word in enumerate(words) if word is None]
+    term_coeffs = [c if word is None else c * word[1] for c, word in zip(coeffs, words)]
+    weights = np.abs(qml.math.unwrap(term_coeffs))
+    groups = _qwc_groups(ops, words, weights, grouping_indices)
+
+    num_wires = len(state.shape) - is_state_batched
+    masks = [
+        None if word is None else sum(1 << (num_wires - 1 - w) for w in word[0]) for word in words
+    ]
 
-    # if the measurement process involves a Sum, measure each
-    # of the terms separately and sum
     def _sum_for_single_shot(s):
-        results = measure_with_samples(
-            [ExpectationMP(t) for t in mp.obs],
+        results = []
+        group_expvals = _measure_qwc_groups(
+            [[words[i][0] for i in group] for group in groups],
+            [np.array([masks[i] for i in group], dtype=np.int64) for group in groups],
+            [qml.math.real(qml.math.unwrap([term_coeffs[i] for i in group])) for group in groups],
             state,
             s,
             is_state_batched=is_state_batched,
             rng=rng,
-            prng_key=prng_key,
+            shot_allocation=shot_allocation,
         )
+        for group, expvals in zip(groups, group_expvals):
+            results.extend(term_coeffs[i] * expval for i, expval in zip(group, expvals))
+
+        if other_indices:
+            other_results = measure_with_samples(
+                [ExpectationMP(ops[i]) for i in other_indices],
+                state,
+                Shots(s),
+                is_state_batched=is_state_batched,
+                rng=rng,
+            )
+            results.extend(coeffs[i] * res for i, res in zip(other_indices, other_results))
+
         return sum(results)
 
-    unsqueezed_results = tuple(_sum_for_single_shot(type(shots)(s)) for s in shots)
+    unsqueezed_results = tuple(_sum_for_single_shot(s) for s in shots)
     return [unsqueezed_results] if shots.has_partitioned_shots else [unsqueezed_results[0]]
 
 
+def _pauli_word(op):
+    """Returns a dictionary mapping wires to the Pauli operators acting on them, and the
+    coefficient, of an observable that is a single Pauli word, or ``None`` otherwise."""
+    if not qml.pauli.is_pauli_word(op):
+        return None
+    sentence = qml.pauli.pauli_sentence(op)
+    if len(sentence) != 1:
+        return None
+    word, coeff = next(iter(sentence.items()))
+    return dict(word), coeff
+
+
+def _qwc_groups(ops, words, weights, grouping_indices=None):
+    """Partitions the Pauli words among ``ops`` into groups of qubit-wise commuting terms with the
+    sorted insertion heuristic, in decreasing order of ``weights``. The ``grouping_indices`` of a
+    Hamiltonian are used if they form qubit-wise commuting groups of all the terms."""
+    pauli_indices = [i for i, word in enumerate(words) if word is not None]
+    if not pauli_indices:
+        return []
+
+    if grouping_indices is not None and len(pauli_indices) == len(ops):
+        groups = [list(group) for group in grouping_indices]
+        if all(_is_qwc([words[i][0] for i in group]) for group in groups):
+            return groups
+
+    if len(pauli_indices) == 1:
+        return [pauli_indices]
+
+    wire_indices = {}
+    for i in pauli_indices:
+        for w in words[i][0]:
+            wire_indices.setdefault(w, len(wire_indices))
+    num_wires = len(wire_indices)
+    binary_observables = np.zeros((len(pauli_indices), 2 * num_wires), dtype=np.int8)
+    for row, i in enumerate(pauli_indices):
+        for w, pauli in words[i][0].items():
+            binary_observables[row, wire_indices[w]] = pauli in "XY"
+            binary_observables[row, num_wires + wire_indices[w]] = pauli in "YZ"
+
+    order = sorted(range(len(pauli_indices)), key=lambda row: -weights[pauli_indices[row]])
+    labels = insertion_labels(binary_observables, "qwc", order)
+    groups = {}
+    for row in order:
+        groups.setdefault(labels[row], []).append(pauli_indices[row])
+    return [groups[label] for label in sorted(groups)]
+
+
+def _is_qwc(words):
+    """Whether or not Pauli words, given as dictionaries mapping wires to Pauli operators,
+    commute qubit-wise."""
+    paulis = {}
+    return all(paulis.setdefault(w, pauli) == pauli for word in words for w, pauli in word.items())
+
+
+def _measure_qwc_groups(
+    group_words,
+    group_masks,
+    group_coeffs,
+    state,
+    shots: int,
+    is_state_batched: bool = False,
+    rng=None,
+    shot_allocation: str = "uniform",
+):
+    """Estimates the expectation values of groups of qubit-wise commuting Pauli words, with one
+    set of samples per group.
+
+    Args:
+        group_words (list[list[dict]]): for every group, the Pauli words as dictionaries mapping
+            wires to Pauli operators
+        group_masks (list[array[int]]): for every group, the Pauli words as bit masks of the basis
+            state indices of the wires they act on
+        group_coeffs (list[array[float]]): for every group, the coefficients of the Pauli words,
+            used to distribute the shots among the groups
+        state (array[complex]): the state to sample from
+        shots (int): the number of shots per group; for non-uniform allocations, the total number
+            of shots is distributed among the groups
+        is_state_batched (bool): whether the state is batched or not
+        rng (Union[None, int, array_like[int], SeedSequence, BitGenerator, Generator]): A
+            seed-like parameter matching that of ``seed`` for ``numpy.random.default_rng``.
+        shot_allocation (str): one of ``"uniform"``, ``"weighted"`` and ``"optimal"``
+
+    Returns:
+        list[array[float]]: for every group, the estimated expectation values of the Pauli words
+    """
+    if shot_allocation not in SHOT_ALLOCATIONS:
+        raise ValueError(
+            f"Unknown shot allocation '{shot_allocation}'; expected one of {SHOT_ALLOCATIONS}."
+        )
+    rng = np.random.default_rng(rng)
+
+    def _rotate(words):
+        paulis = {}
+        for word in words:
+            paulis.update(word)
+        diagonalizing_gates = [
+            gate
+            for w, pauli in sorted(paulis.items())
+            for gate in getattr(qml, f"Pauli{pauli}")(w).diagonalizing_gates()
+        ]
+        rotated = state
+        for op in diagonalizing_gates:
+            rotated = apply_operation(op, rotated, is_state_batched=is_state_batched)
+        return rotated
+
+    if shot_allocation == "uniform":
+        group_shots = [shots] * len(group_words)
+    elif shot_allocation == "weighted":
+        group_shots = _allocate_shots(shots, [np.sum(np.abs(c)) for c in group_coeffs])
+    else:
+        std_devs = [
+            np.sqrt(_exact_variance(_rotate(words), masks, coeffs, is_state_batched))
+            for words, masks, coeffs in zip(group_words, group_masks, group_coeffs)
+        ]
+        group_shots = _allocate_shots(shots, std_devs)
+
+    group_expvals = []
+    for words, masks, num_shots in zip(group_words, group_masks, group_shots):
+        rotated = _rotate(words)
+        try:
+            indices = sample_basis_indices(
+                rotated, int(num_shots), is_state_batched=is_state_batched, rng=rng
+            )
+        except ValueError as e:
+            if str(e) != "probabilities contain NaN":
+                raise e
+            indices = np.zeros(int(num_shots), dtype=np.int64)
+
+        num_wires = len(rotated.shape) - is_state_batched
+        rows = indices.reshape(-1, indices.shape[-1])
+        expvals = []
+        for row in rows:
+            states, counts = _count_basis_indices(row, 2**num_wires)
+            expvals.append(_pauli_values(states, masks) @ counts / len(row))
+        # the batch dimension, if any, is the last dimension of the expectation values
+        expvals = np.stack(expvals, axis=-1)
+        group_expvals.append(expvals if is_state_batched else expvals[:, 0])
+
+    return group_expvals
+
+
+def _pauli_values(states, masks):
+    """Returns the eigenvalues ``(-1)**parity(state & mask)`` of the diagonalized Pauli words with
+    bit masks ``masks`` for the basis states with indices ``states``, as an array of shape
+    ``(len(masks), len(states))``."""
+    return 1 - 2 * masked_parities(states, masks).astype(np.int8)
+
+
+def _exact_variance(state, masks, coeffs, is_state_batched: bool = False):
+    """The variance of the sum of diagonalized Pauli words in a state, averaged over the batch
+    dimension."""
+    num_wires = len(state.shape) - is_state_batched
+    flat_state = flatten_state(state, num_wires)
+    probs = np.reshape(np.abs(flat_state) ** 2, (-1, 2**num_wires))
+
+    block = max(1, _STATE_BLOCK_SIZE // max(1, len(masks)))
+    means = np.zeros(len(probs))
+    squares = np.zeros(len(probs))
+    for start in range(0, 2**num_wires, block):
+        states = np.arange(start, min(start + block, 2**num_wires), dtype=np.int64)
+        values = coeffs @ _pauli_values(states, masks)
+        means += probs[:, states] @ values
+        squares += probs[:, states] @ values**2
+
+    return np.mean(np.maximum(squares - means**2, 0.0))
+
+
+def _allocate_shots(shots: int, weights):
+    """Distributes ``shots * len(weights)`` shots proportionally to ``weights``, rounding with the
+    largest remainder method. Every group gets at least one shot."""
+    weights = np.asarray(weights, dtype=float)
+    budget = shots * len(weights)
+    if not np.sum(weights) > 0:
+        return [shots] * len(weights)
+
+    exact = budget * weights / np.sum(weights)
+    allocation = np.floor(exact).astype(int)
+    remainder = budget - np.sum(allocation)
+    allocation[np.argsort(allocation - exact, kind="stable")[:remainder]] += 1
+    return np.maximum(allocation, 1).tolist()
+
+
 def sample_state(
     state,
     shots: int,
@@ -425,6 +712,41 @@ def sample_state(
             state, shots, prng_key, is_state_batched=is_state_batched, wires=wires
         )
 
+    total_indices = len(state.shape) - is_state_batched
+    num_wires = len(wires or range(total_indices))
+
+    samples = sample_basis_indices(
+        state, shots, is_state_batched=is_state_batched, wires=wires, rng=rng
+    )
+    return _unpack_basis_indices(samples, num_wires)
+
+
+def sample_basis_indices(
+    state,
+    shots: int,
+    is_state_batched: bool = False,
+    wires=None,
+    rng=None,
+) -> np.ndarray:
+    """
+    Returns a series of samples of a state, as the indices of the sampled computational basis
+    states. This uses one integer per shot, instead of one integer per shot and wire as
+    :func:`~.sample_state`.
+
+    Args:
+        state (array[complex]): A state vector to be sampled
+        shots (int): The number of samples to take
+        is_state_batched (bool): whether the state is batched or not
+        wires (Sequence[int]): The wires to sample
+        rng (Union[None, int, array_like[int], SeedSequence, BitGenerator, Generator]):
+            A seed-like parameter matching that of ``seed`` for ``numpy.random.default_rng``.
+            If no value is provided, a default RNG will be used
+
+    Returns:
+        ndarray[int]: Indices of the sampled basis states of the shape ``(shots,)``, or
+        ``(batch_size, shots)`` if the state is batched. The first wire is the most significant
+        bit of each index.
+    """
     rng = np.random.default_rng(rng)
 
     total_indices = len(state.shape) - is_state_batched
@@ -440,12 +762,14 @@ def sample_state(
 
     if is_state_batched:
         # rng.choice doesn't support broadcasting
-        samples = np.stack([rng.choice(basis_states, shots, p=p) for p in probs])
-    else:
-        samples = rng.choice(basis_states, shots, p=probs)
+        return np.stack([rng.choice(basis_states, shots, p=p) for p in probs])
+    return rng.choice(basis_states, shots, p=probs)
+
 
+def _unpack_basis_indices(indices, num_wires: int) -> np.ndarray:
+    """Converts indices of computational basis states to samples with one bit per wire."""
     powers_of_two = 1 << np.arange(num_wires, dtype=np.int64)[::-1]
-    states_sampled_base_ten = samples[..., None] & powers_of_two
+    states_sampled_base_ten = indices[..., None] & powers_of_two
     return (states_sampled_base_ten > 0).astype(np.int64)
 
 
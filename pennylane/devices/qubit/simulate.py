@@ -35,6 +35,7 @@ from .initialize_state import create_initial_state
 from .apply_operation import apply_operation
 from .measure import measure
 from .sampling import measure_with_samples
+from .trajectories import has_channels, simulate_trajectories
 
 
 INTERFACE_TO_LIKE = {
@@ -160,7 +161,9 @@ def get_final_state(circuit, debugger=None, interface=None, mid_measurements=Non
     return state, is_state_batched
 
 
-def measure_final_state(circuit, state, is_state_batched, rng=None, prng_key=None) -> Result:
+def measure_final_state(
+    circuit, state, is_state_batched, rng=None, prng_key=None, shot_allocation="uniform"
+) -> Result:
     """
     Perform the measurements required by the circuit on the provided state.
 
@@ -177,6 +180,9 @@ def measure_final_state(circuit, state, is_state_batched, rng=None, prng_key=Non
             the key to the JAX pseudo random number generator. Only for simulation using JAX.
             If None, the default ``sample_state`` function and a ``numpy.random.default_rng``
             will be for sampling.
+        shot_allocation (str): How the shots are distributed among the groups of qubit-wise
+            commuting terms of ``Hamiltonian`` and ``Sum`` expectation values. See
+            :func:`~.measure_with_samples`.
 
     Returns:
         Tuple[TensorLike]: The measurement results
@@ -204,6 +210,7 @@ def measure_final_state(circuit, state, is_state_batched, rng=None, prng_key=Non
         is_state_batched=is_state_batched,
         rng=rng,
         prng_key=prng_key,
+        shot_allocation=shot_allocation,
     )
 
     if len(circuit.measurements) == 1:
@@ -223,6 +230,8 @@ def simulate(
     debugger=None,
     interface=None,
     state_cache: Optional[dict] = None,
+    shot_allocation: str = "uniform",
+    num_trajectories: Optional[int] = None,
 ) -> Result:
     """Simulate a single quantum script.
 
@@ -239,6 +248,12 @@ def simulate(
         debugger (_Debugger): The debugger to use
         interface (str): The machine learning interface to create the initial state with
         state_cache=None (Optional[dict]): A dictionary mapping the hash of a circuit to the pre-rotated state. Used to pass the state between forward passes and vjp calculations.
+        shot_allocation (str): How the shots are distributed among the groups of qubit-wise
+            commuting terms of ``Hamiltonian`` and ``Sum`` expectation values. See
+            :func:`~.measure_with_samples`.
+        num_trajectories (int): If provided, circuits with noise channels are simulated by
+            averaging over this number of quantum trajectories. See
+            :func:`~.simulate_trajectories`.
 
     Returns:
         tuple(TensorLike): The results of the simulation
@@ -253,6 +268,10 @@ def simulate(
     tensor([0.68117888, 0.        , 0.31882112, 0.        ], requires_grad=True))
 
     """
+    if num_trajectories is not None and has_channels(circuit):
+        return simulate_trajectories(
+            circuit, num_trajectories, rng=rng, debugger=debugger, interface=interface
+        )
     if circuit.shots and has_mid_circuit_measurements(circuit):
         return simulate_native_mcm(
             circuit, rng=rng, prng_key=prng_key, debugger=debugger, interface=interface
@@ -260,7 +279,189 @@ def simulate(
     state, is_state_batched = get_final_state(circuit, debugger=debugger, interface=interface)
     if state_cache is not None:
         state_cache[circuit.hash] = state
-    return measure_final_state(circuit, state, is_state_batched, rng=rng, prng_key=prng_key)
+    return measure_final_state(
+        circuit,
+        state,
+        is_state_batched,
+        rng=rng,
+        prng_key=prng_key,
+        shot_allocation=shot_allocation,
+    )
+
+
+def simulate_batch(
+    circuits,
+    rng=None,
+    prng_key=None,
+    debugger=None,
+    interface=None,
+    state_cache: Optional[dict] = None,
+    shot_allocation: str = "uniform",
+    num_trajectories: Optional[int] = None,
+) -> tuple:
+    """Simulate a batch of quantum scripts, simulating the operations they share only once.
+
+    This is an internal function that will be called by the successor to ``default.qubit``.
+
+    The analytic circuits of the batch that act on the same wires are arranged in a trie, in which
+    circuits share a node as long as their operations are the same objects. This is the case for
+    the tapes generated by gradient transforms such as :func:`~.param_shift` and
+    :func:`~.finite_diff`, which only replace the shifted operations. The state after every
+    shared prefix of operations is computed once, and the simulation branches at the first
+    operation that differs. The trie is traversed depth first, and the largest branch is
+    simulated last so that its parent state can be released, which keeps the number of states in
+    memory small.
+
+    Circuits with shots, mid-circuit measurements, postselection or noise channels, and circuits
+    simulated with an active debugger, are simulated separately with :func:`~.simulate`.
+
+    Args:
+        circuits (Sequence[QuantumTape]): The circuits to simulate
+        rng (Union[None, int, array_like[int], SeedSequence, BitGenerator, Generator]): A
+            seed-like parameter matching that of ``seed`` for ``numpy.random.default_rng``.
+            If no value is provided, a default RNG will be used.
+        prng_key (Optional[jax.random.PRNGKey]): An optional ``jax.random.PRNGKey``. This is
+            the key to the JAX pseudo random number generator. If None, a random key will be
+            generated. Only for simulation using JAX.
+        debugger (_Debugger): The debugger to use
+        interface (str): The machine learning interface to create the initial state with
+        state_cache=None (Optional[dict]): A dictionary mapping the hash of a circuit to the
+            pre-rotated state. Used to pass the state between forward passes and vjp calculations.
+        shot_allocation (str): How the shots are distributed among the groups of qubit-wise
+            commuting terms of ``Hamiltonian`` and ``Sum`` expectation values. See
+            :func:`~.measure_with_samples`.
+        num_trajectories (int): If provided, circuits with noise channels are simulated by
+            averaging over this number of quantum trajectories. See
+            :func:`~.simulate_trajectories`.
+
+    Returns:
+        tuple(Result): The results of the simulation of every circuit
+
+    >>> tape = qml.tape.QuantumScript([qml.RX(0.1, 0), qml.RY(0.2, 0)], [qml.expval(qml.PauliZ(0))])
+    >>> tapes, _ = qml.gradients.param_shift(tape)
+    >>> simulate_batch(tapes)
+    (-0.09784339500725564, 0.09784339500725586, -0.1976768116540839, 0.1976768116540839)
+    """
+    results = [None] * len(circuits)
+    groups = {}
+    for i, circuit in enumerate(circuits):
+        if _can_share_prefixes(circuit, debugger):
+            groups.setdefault(_standard_op_wires(circuit), []).append(i)
+
+    for wires, indices in groups.items():
+        if len(indices) == 1:
+            continue
+        final_states = _final_states_with_shared_prefixes(
+            [circuits[i].operations for i in indices], wires, interface
+        )
+        for j, state, is_state_batched in final_states:
+            circuit = circuits[indices[j]]
+            for _ in range(len(circuit.wires) - len(wires)):
+                # pad the state with the measured wires that are not operated on, as in
+                # ``get_final_state``
+                state = qml.math.stack([state, qml.math.zeros_like(state)], axis=-1)
+            if state_cache is not None:
+                state_cache[circuit.hash] = state
+            results[indices[j]] = measure_final_state(circuit, state, is_state_batched)
+
+    return tuple(
+        (
+            simulate(
+                circuit,
+                rng=rng,
+                prng_key=prng_key,
+                debugger=debugger,
+                interface=interface,
+                state_cache=state_cache,
+                shot_allocation=shot_allocation,
+                num_trajectories=num_trajectories,
+            )
+            if res is None
+            else res
+        )
+        for circuit, res in zip(circuits, results)
+    )
+
+
+def _standard_op_wires(circuit) -> tuple:
+    """The operator wires of a circuit, in the order of the array indices they are mapped to by
+    :meth:`~.QuantumScript.map_to_standard_wires`."""
+    op_wires = qml.wires.Wires.all_wires(op.wires for op in circuit.operations)
+    meas_only_wires = set(circuit.wires) - set(op_wires)
+    num_op_wires = len(op_wires)
+    if set(op_wires) == set(range(num_op_wires)) and meas_only_wires == set(
+        range(num_op_wires, num_op_wires + len(meas_only_wires))
+    ):
+        return tuple(range(num_op_wires))
+    return tuple(op_wires.tolist())
+
+
+def _can_share_prefixes(circuit, debugger=None) -> bool:
+    """Whether or not the simulation of a circuit can be shared with other circuits."""
+    if circuit.shots or (debugger is not None and debugger.active):
+        return False
+    return not any(
+        isinstance(op, (MidMeasureMP, qml.ops.Conditional, qml.Projector, qml.operation.Channel))
+        for op in circuit.operations
+    )
+
+
+def _final_states_with_shared_prefixes(operations, wires, interface=None):
+    """Computes the final states of lists of operations acting on ``wires``, computing the state
+    after every shared prefix of operations once.
+
+    Args:
+        operations (list[list[Operator]]): the operations of every circuit
+        wires (tuple): the wires the operations act on, in the order of the standard wires
+        interface (str): The machine learning interface to create the initial state with
+
+    Yields:
+        tuple[int, TensorLike, bool]: the index of a list of operations, its final state, and
+        whether the state has a batch dimension
+    """
+    wire_map = {w: i for i, w in enumerate(wires)}
+    standard_wires = all(w == i for w, i in wire_map.items())
+    mapped_ops = {}
+
+    def _apply(op, state, is_state_batched, depth):
+        if not standard_wires:
+            # operations shared by several circuits are only mapped once
+            if id(op) not in mapped_ops:
+                mapped_ops[id(op)] = op.map_wires(wire_map)
+            op = mapped_ops[id(op)]
+        if depth == 0 and isinstance(op, qml.operation.StatePrepBase):
+            state = create_initial_state(range(len(wires)), op, like=INTERFACE_TO_LIKE[interface])
+            return state, op.batch_size is not None
+        state = apply_operation(op, state, is_state_batched=is_state_batched)
+        return state, is_state_batched or (op.batch_size is not None)
+
+    initial_state = create_initial_state(range(len(wires)), like=INTERFACE_TO_LIKE[interface])
+    # entries are the state after ``depth - 1`` operations, the operation at ``depth - 1``
+    # that remains to be applied, and the indices of the circuits sharing these operations
+    stack = [(initial_state, False, 0, None, list(range(len(operations))))]
+
+    while stack:
+        state, is_state_batched, depth, op, members = stack.pop()
+        if op is not None:
+            state, is_state_batched = _apply(op, state, is_state_batched, depth - 1)
+
+        if len(members) == 1:
+            (i,) = members
+            for d in range(depth, len(operations[i])):
+                state, is_state_batched = _apply(operations[i][d], state, is_state_batched, d)
+            yield i, state, is_state_batched
+            continue
+
+        branches = {}
+        for i in members:
+            if len(operations[i]) == depth:
+                yield i, state, is_state_batched
+            else:
+                branches.setdefault(id(operations[i][depth]), []).append(i)
+
+        # the largest branch is simulated last, so that ``state`` is released afterwards
+        for branch in sorted(branches.values(), key=len, reverse=True):
+            stack.append((state, is_state_batched, depth + 1, operations[branch[0]][depth], branch))
 
 
 # pylint: disable=too-many-arguments
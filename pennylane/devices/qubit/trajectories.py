@@ -0,0 +1,230 @@
+# Copyright 2018-2024 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Simulate noisy quantum scripts by averaging over quantum trajectories."""
+import numpy as np
+
+import pennylane as qml
+from pennylane.measurements import DensityMatrixMP, ExpectationMP, ProbabilityMP, VarianceMP
+from pennylane.typing import Result
+
+from .apply_operation import apply_operation
+from .initialize_state import create_initial_state
+from .measure import measure
+
+_MAX_AMPLITUDES = 2**22
+"""Maximal number of amplitudes of the trajectories simulated at once."""
+
+_TRAJECTORY_MEASUREMENTS = (ExpectationMP, VarianceMP, ProbabilityMP, DensityMatrixMP)
+"""The measurements that can be estimated from quantum trajectories."""
+
+
+def has_channels(circuit: qml.tape.QuantumScript) -> bool:
+    """Whether or not a circuit contains noise channels, which are simulated with trajectories."""
+    return any(isinstance(op, qml.operation.Channel) for op in circuit.operations)
+
+
+def simulate_trajectories(
+    circuit: qml.tape.QuantumScript,
+    num_trajectories: int,
+    rng=None,
+    debugger=None,
+    interface=None,
+    return_std_errors: bool = False,
+) -> Result:
+    """Simulate a noisy quantum script by averaging its measurements over quantum trajectories.
+
+    Every trajectory evolves a state vector, and a single Kraus operator of every channel is
+    applied to it, chosen with the probability of its outcome in the current state. The averages
+    of the expectation values, variances, probabilities and reduced density matrices over the
+    trajectories are unbiased estimates of their values in the mixed state, with a memory cost
+    of :math:`2^n` instead of :math:`4^n`. The trajectories are simulated in batches along the
+    leading axis of the state.
+
+    Args:
+        circuit (QuantumTape): The single circuit to simulate, without finite shots
+        num_trajectories (int): The number of trajectories to average over
+        rng (Union[None, int, array_like[int], SeedSequence, BitGenerator, Generator]): A
+            seed-like parameter matching that of ``seed`` for ``numpy.random.default_rng``.
+            If no value is provided, a default RNG will be used.
+        debugger (_Debugger): The debugger to use
+        interface (str): The machine learning interface to create the initial state with
+        return_std_errors (bool): Whether or not to also return the standard errors of the
+            estimates, which are the widths of their 68% confidence intervals
+
+    Returns:
+        Union[tuple(TensorLike), tuple(tuple(TensorLike), tuple(TensorLike))]: The estimated
+        results of the simulation, and their standard errors if ``return_std_errors`` is ``True``
+
+    >>> qs = qml.tape.QuantumScript(
+    ...     [qml.Hadamard(0), qml.AmplitudeDamping(0.2, wires=0)], [qml.expval(qml.PauliX(0))]
+    ... )
+    >>> simulate_trajectories(qs, 10000, rng=42, return_std_errors=True)
+    (0.8959179029849161, 0.0029615916752100072)
+    """
+    if circuit.shots:
+        raise qml.DeviceError(
+            "Noisy circuits can only be simulated analytically with trajectories."
+        )
+    for mp in circuit.measurements:
+        if not isinstance(mp, _TRAJECTORY_MEASUREMENTS):
+            raise qml.DeviceError(
+                f"Measurement {mp} is not supported for noisy circuits simulated with trajectories."
+            )
+
+    if circuit.batch_size is not None:
+        # the leading axis of the state holds the trajectories
+        tapes, fn = qml.transforms.broadcast_expand(circuit)
+        results = [
+            simulate_trajectories(
+                t, num_trajectories, rng, debugger, interface, return_std_errors=True
+            )
+            for t in tapes
+        ]
+        results, std_errors = (fn(list(r)) for r in zip(*results))
+        return (results, std_errors) if return_std_errors else results
+
+    circuit = circuit.map_to_standard_wires()
+    rng = np.random.default_rng(rng)
+    # pylint: disable=import-outside-toplevel
+    from .simulate import INTERFACE_TO_LIKE
+
+    like = INTERFACE_TO_LIKE[interface]
+
+    prep = None
+    if len(circuit) > 0 and isinstance(circuit[0], qml.operation.StatePrepBase):
+        prep = circuit[0]
+    initial_state = create_initial_state(range(circuit.num_wires), prep, like=like)
+
+    # the sums of the values of every measurement over the trajectories, and of their squares
+    sums, squares = None, None
+    batch_size = max(1, min(num_trajectories, _MAX_AMPLITUDES // 2**circuit.num_wires))
+    for start in range(0, num_trajectories, batch_size):
+        size = min(batch_size, num_trajectories - start)
+        state = qml.math.stack([initial_state] * size)
+        for op in circuit.operations[bool(prep) :]:
+            if isinstance(op, qml.operation.Channel):
+                state = _apply_kraus_branch(op, state, rng)
+            else:
+                state = apply_operation(op, state, is_state_batched=True, debugger=debugger)
+
+        values = [_trajectory_values(mp, state) for mp in circuit.measurements]
+        batch_sums = [qml.math.sum(v, axis=0) for v in values]
+        batch_squares = [np.sum(np.abs(qml.math.unwrap(v)) ** 2, axis=0) for v in values]
+        if sums is None:
+            sums, squares = batch_sums, batch_squares
+        else:
+            sums = [s + b for s, b in zip(sums, batch_sums)]
+            squares = [s + b for s, b in zip(squares, batch_squares)]
+
+    results, std_errors = [], []
+    for mp, total, total_squares in zip(circuit.measurements, sums, squares):
+        means = total / num_trajectories
+        # the variance of the estimates is the variance over the trajectories, divided by the
+        # number of trajectories
+        variances = total_squares / num_trajectories - np.abs(qml.math.unwrap(means)) ** 2
+        variances = np.maximum(variances, 0) / max(num_trajectories - 1, 1)
+        if isinstance(mp, VarianceMP):
+            # the mean of the second moments minus the square of the mean of the expectation
+            # values, whose error is estimated to first order in the error of the mean
+            second_moment, mean = means
+            results.append(second_moment - mean**2)
+            mean = qml.math.unwrap(mean)
+            std_errors.append(np.sqrt(max(variances[0] + 4 * mean**2 * variances[1], 0)))
+        else:
+            results.append(means)
+            std_errors.append(np.sqrt(variances))
+
+    results = results[0] if len(results) == 1 else tuple(results)
+    if return_std_errors:
+        std_errors = std_errors[0] if len(std_errors) == 1 else tuple(std_errors)
+        return results, std_errors
+    return results
+
+
+def _trajectory_values(mp, state):
+    """The values of a measurement in every trajectory, from which it is estimated as their mean.
+
+    For a variance, the second moment and the expectation value of the observable are stacked on
+    the last axis.
+    """
+    if isinstance(mp, VarianceMP):
+        mean = measure(qml.expval(mp.obs), state, is_state_batched=True)
+        variance = measure(mp, state, is_state_batched=True)
+        return qml.math.stack([variance + mean**2, mean], axis=-1)
+    return measure(mp, state, is_state_batched=True)
+
+
+def _apply_kraus_branch(channel, state, rng):
+    """Applies one Kraus operator of a channel to every trajectory of a batch of states, sampled
+    with the probability of its outcome, and normalizes the resulting states.
+
+    Args:
+        channel (Channel): the channel to apply
+        state (TensorLike): the states of the trajectories, with the trajectories on the first axis
+        rng (numpy.random.Generator): the generator sampling the Kraus operators
+
+    Returns:
+        TensorLike: the new states of the trajectories
+    """
+    kraus = qml.math.stack(channel.kraus_matrices())
+    numpy_kraus = qml.math.unwrap(kraus)
+    num_trajectories = qml.math.shape(state)[0]
+    num_wires = len(channel.wires)
+    axes = [w + 1 for w in channel.wires]
+    identity = np.eye(2**num_wires)
+
+    products = np.einsum("iba,ibc->iac", np.conj(numpy_kraus), numpy_kraus)
+    mixture = all(np.allclose(p, p[0, 0] * identity) for p in products)
+    psi, shape = None, None
+    if mixture:
+        # the Kraus operators of mixtures of unitaries are proportional to unitaries, and the
+        # probabilities of their outcomes do not depend on the state
+        probs = qml.math.real(qml.math.einsum("iab,iab->i", qml.math.conj(kraus), kraus))
+        probs = qml.math.stack([probs / 2**num_wires] * num_trajectories)
+    else:
+        # the probability of K_i is the expectation value of K_i^dagger K_i in the reduced
+        # density matrix of the channel wires
+        psi, shape = _channel_amplitudes(state, axes)
+        rho = qml.math.matmul(psi, qml.math.conj(qml.math.transpose(psi, (0, 2, 1))))
+        probs = qml.math.real(qml.math.einsum("iab,tbc,iac->ti", kraus, rho, qml.math.conj(kraus)))
+
+    numpy_probs = np.asarray(qml.math.unwrap(probs))
+    cumulative = np.cumsum(numpy_probs, axis=1)
+    draws = rng.random(num_trajectories) * cumulative[:, -1]
+    choices = np.minimum(np.sum(cumulative <= draws[:, None], axis=1), len(numpy_kraus) - 1)
+
+    if mixture and all(
+        np.allclose(numpy_kraus[c], numpy_kraus[c][0, 0] * identity) for c in set(choices)
+    ):
+        # the normalized operators only change the global phases of the trajectories
+        return state
+
+    if psi is None:
+        psi, shape = _channel_amplitudes(state, axes)
+    trajectories = np.arange(num_trajectories)
+    norms = qml.math.sqrt(probs[trajectories, choices])
+    matrices = qml.math.take(kraus, choices, axis=0) / qml.math.reshape(norms, (-1, 1, 1))
+    psi = qml.math.matmul(qml.math.cast_like(matrices, psi), psi)
+
+    psi = qml.math.reshape(psi, shape)
+    return qml.math.moveaxis(psi, range(1, num_wires + 1), axes)
+
+
+def _channel_amplitudes(state, axes):
+    """Reshapes the states of the trajectories into matrices with the amplitudes of the channel
+    wires on the rows, and returns them with the shape to restore afterwards."""
+    num_wires = len(axes)
+    psi = qml.math.moveaxis(state, axes, range(1, num_wires + 1))
+    shape = qml.math.shape(psi)
+    return qml.math.reshape(psi, (shape[0], 2**num_wires, -1)), shape
@@ -25,8 +25,11 @@ at your own discretion.
     create_initial_state
     apply_operation
     measure
+    measure_with_samples
+    sample_state
 """
 
 from .apply_operation import apply_operation
 from .initialize_state import create_initial_state
 from .measure import measure
+from .sampling import sample_state, measure_with_samples
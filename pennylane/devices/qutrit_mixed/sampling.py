@@ -0,0 +1,360 @@
+# Copyright 2018-2024 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Functions to sample a qutrit mixed state."""
+from typing import List
+
+import numpy as np
+
+import pennylane as qml
+from pennylane.ops import Sum, Hamiltonian
+from pennylane.measurements import (
+    SampleMeasurement,
+    Shots,
+    ExpectationMP,
+    CountsMP,
+    SampleMP,
+    ProbabilityMP,
+    VarianceMP,
+)
+from pennylane.typing import TensorLike
+from pennylane.wires import Wires
+
+from .apply_operation import apply_operation
+from .measure import calculate_probability
+from .utils import get_num_wires, QUDIT_DIM
+
+
+def _group_measurements(mps: List[SampleMeasurement]):
+    """Groups the measurements that can be processed from the same samples. Measurements in the
+    computational basis share a group, while every measurement with diagonalizing gates and every
+    ``Hamiltonian`` or ``Sum`` expectation value gets a group of its own.
+
+    Returns:
+        tuple[list[list[SampleMeasurement]], list[list[int]]]: the groups of measurements and the
+        positions of the measurements of each group in ``mps``
+    """
+    groups, indices = [], []
+    computational, computational_indices = [], []
+    for i, mp in enumerate(mps):
+        if isinstance(mp, ExpectationMP) and isinstance(mp.obs, (Hamiltonian, Sum)):
+            groups.append([mp])
+            indices.append([i])
+        elif mp.obs is None or not mp.diagonalizing_gates():
+            computational.append(mp)
+            computational_indices.append(i)
+        else:
+            groups.append([mp])
+            indices.append([i])
+
+    if computational:
+        groups.append(computational)
+        indices.append(computational_indices)
+
+    return groups, indices
+
+
+def _apply_diagonalizing_gates(
+    mps: List[SampleMeasurement], state: np.ndarray, is_state_batched: bool = False
+):
+    """Rotates the state into the eigenbasis of the observables of a group of measurements."""
+    diagonalizing_gates = mps[0].diagonalizing_gates() if len(mps) == 1 else []
+    for op in diagonalizing_gates:
+        state = apply_operation(op, state, is_state_batched=is_state_batched)
+
+    return state
+
+
+def _unpack_basis_indices(indices, num_wires: int) -> np.ndarray:
+    """Converts indices of computational basis states to samples with one trit per wire."""
+    powers_of_three = QUDIT_DIM ** np.arange(num_wires, dtype=np.int64)[::-1]
+    return indices[..., None] // powers_of_three % QUDIT_DIM
+
+
+def _marginal_basis_indices(samples, wire_order: Wires, wires: Wires):
+    """Converts samples with one trit per wire of ``wire_order`` to indices of the basis states
+    of ``wires``. All wires are used if ``wires`` is empty."""
+    if wires:
+        samples = samples[..., wire_order.indices(wires)]
+    num_wires = samples.shape[-1]
+    powers_of_three = QUDIT_DIM ** np.arange(num_wires, dtype=np.int64)[::-1]
+    return samples @ powers_of_three, num_wires
+
+
+def _process_counts(mp: CountsMP, indices, num_wires: int):
+    """Counts the occurrences of each outcome of a single execution."""
+    dim = QUDIT_DIM**num_wires
+    counts = np.bincount(indices, minlength=dim)
+
+    if mp.obs is None:
+        outcomes = range(dim) if mp.all_outcomes else np.flatnonzero(counts)
+        keys = [np.base_repr(i, QUDIT_DIM).zfill(num_wires) for i in outcomes]
+        return dict(zip(keys, counts[list(outcomes)].tolist()))
+
+    eigvals = qml.math.asarray(mp.eigvals())
+    outcome_counts = {}
+    if mp.all_outcomes:
+        outcome_counts = {eigval: 0 for eigval in eigvals.tolist()}
+    for eigval, count in zip(eigvals.tolist(), counts.tolist()):
+        if count:
+            outcome_counts[eigval] = outcome_counts.get(eigval, 0) + count
+    # sort the outcomes the same way as ``qml.counts`` does for qubits
+    return dict(sorted(outcome_counts.items()))
+
+
+def _process_samples(mp: SampleMeasurement, samples, wire_order: Wires):
+    """Computes the result of a measurement from samples with one trit per wire, of shape
+    ``(shots, num_wires)`` or ``(batch_size, shots, num_wires)``."""
+    if isinstance(mp, SampleMP) and mp.obs is None:
+        return samples[..., wire_order.indices(mp.wires)] if mp.wires else samples
+
+    indices, num_wires = _marginal_basis_indices(samples, wire_order, mp.wires)
+
+    if isinstance(mp, ProbabilityMP):
+        dim = QUDIT_DIM**num_wires
+        rows = indices.reshape(-1, indices.shape[-1])
+        probs = np.stack([np.bincount(row, minlength=dim) for row in rows]) / indices.shape[-1]
+        return probs.reshape((*indices.shape[:-1], dim))
+
+    if isinstance(mp, CountsMP):
+        if indices.ndim == 1:
+            return _process_counts(mp, indices, num_wires)
+        return [_process_counts(mp, row, num_wires) for row in indices]
+
+    eigvals = qml.math.asarray(mp.eigvals(), dtype="float64")
+    values = eigvals[indices]
+    if isinstance(mp, SampleMP):
+        return values
+    if isinstance(mp, ExpectationMP):
+        return np.mean(values, axis=-1)
+    if isinstance(mp, VarianceMP):
+        return np.var(values, axis=-1)
+
+    raise NotImplementedError(
+        f"{type(mp).__name__} is not supported when sampling a qutrit mixed state."
+    )
+
+
+def _measure_with_samples_diagonalizing_gates(
+    mps: List[SampleMeasurement],
+    state: np.ndarray,
+    shots: Shots,
+    is_state_batched: bool = False,
+    rng=None,
+):
+    """
+    Returns the results of a group of measurement processes sampled on the given state, after
+    rotating the state into their measurement basis with the diagonalizing gates.
+
+    All the shots of a shot vector are drawn at once, and every shot vector entry is processed
+    from its own slice of the samples.
+
+    Args:
+        mps (List[~.measurements.SampleMeasurement]): The sample measurements to perform
+        state (np.ndarray[complex]): The density matrix to sample from
+        shots (~.measurements.Shots): The number of samples to take
+        is_state_batched (bool): whether the state is batched or not
+        rng (Union[None, int, array_like[int], SeedSequence, BitGenerator, Generator]): A
+            seed-like parameter matching that of ``seed`` for ``numpy.random.default_rng``.
+            If no value is provided, a default RNG will be used.
+
+    Returns:
+        TensorLike[Any]: Sample measurement results
+    """
+    state = _apply_diagonalizing_gates(mps, state, is_state_batched)
+    wires = Wires(range(get_num_wires(state, is_state_batched)))
+
+    samples = sample_state(state, shots.total_shots, is_state_batched=is_state_batched, rng=rng)
+
+    def _process_single_shot(samples):
+        processed = []
+        for mp in mps:
+            res = _process_samples(mp, samples, wires)
+            if not isinstance(mp, CountsMP):
+                res = qml.math.squeeze(res)
+            processed.append(res)
+        return tuple(processed)
+
+    if shots.has_partitioned_shots:
+        processed_samples = []
+        start = 0
+        for s in shots:
+            processed_samples.append(_process_single_shot(samples[..., start : start + s, :]))
+            start += s
+        return tuple(zip(*processed_samples))
+
+    return _process_single_shot(samples)
+
+
+def _measure_sum_of_terms_with_samples(
+    mps: List[ExpectationMP],
+    state: np.ndarray,
+    shots: Shots,
+    is_state_batched: bool = False,
+    rng=None,
+):
+    """Estimates the expectation value of a ``Hamiltonian`` or ``Sum`` by sampling the state
+    in the eigenbasis of each of its terms."""
+    # the list contains only one element based on how we group measurements
+    mp = mps[0]
+    coeffs, ops = (
+        mp.obs.terms() if isinstance(mp.obs, Hamiltonian) else ([1.0] * len(mp.obs), mp.obs)
+    )
+    rng = np.random.default_rng(rng)
+
+    results = [
+        _measure_with_samples_diagonalizing_gates(
+            [ExpectationMP(op)], state, shots, is_state_batched=is_state_batched, rng=rng
+        )[0]
+        for op in ops
+    ]
+    if shots.has_partitioned_shots:
+        return [tuple(sum(c * r for c, r in zip(coeffs, res)) for res in zip(*results))]
+    return [sum(c * r for c, r in zip(coeffs, results))]
+
+
+def measure_with_samples(
+    mps: List[SampleMeasurement],
+    state: np.ndarray,
+    shots: Shots,
+    is_state_batched: bool = False,
+    rng=None,
+) -> List[TensorLike]:
+    """
+    Returns the samples of the measurement processes performed on the given qutrit density
+    matrix. This function assumes that the user-defined wire labels in the measurement processes
+    have already been mapped to integer wires used in the device.
+
+    Args:
+        mps (List[~.measurements.SampleMeasurement]): The sample measurements to perform
+        state (np.ndarray[complex]): The density matrix to sample from
+        shots (~.measurements.Shots): The number of samples to take
+        is_state_batched (bool): whether the state is batched or not
+        rng (Union[None, int, array_like[int], SeedSequence, BitGenerator, Generator]): A
+            seed-like parameter matching that of ``seed`` for ``numpy.random.default_rng``.
+            If no value is provided, a default RNG will be used.
+
+    Returns:
+        List[TensorLike[Any]]: Sample measurement results
+
+    **Example**
+
+    >>> state = qml.devices.qutrit_mixed.create_initial_state([0])
+    >>> state = qml.devices.qutrit_mixed.apply_operation(qml.THadamard(0), state)
+    >>> mps = [qml.expval(qml.GellMann(0, 3)), qml.counts(wires=0)]
+    >>> measure_with_samples(mps, state, qml.measurements.Shots(1000), rng=42)
+    (0.025, {'0': 346, '1': 321, '2': 333})
+    """
+    rng = np.random.default_rng(rng)
+    groups, indices = _group_measurements(mps)
+
+    all_res = []
+    for group in groups:
+        if isinstance(group[0], ExpectationMP) and isinstance(group[0].obs, (Hamiltonian, Sum)):
+            measure_fn = _measure_sum_of_terms_with_samples
+        else:
+            measure_fn = _measure_with_samples_diagonalizing_gates
+
+        all_res.extend(measure_fn(group, state, shots, is_state_batched=is_state_batched, rng=rng))
+
+    flat_indices = [_i for i in indices for _i in i]
+
+    # reorder results
+    sorted_res = tuple(
+        res for _, res in sorted(list(enumerate(all_res)), key=lambda r: flat_indices[r[0]])
+    )
+
+    # put the shot vector axis before the measurement axis
+    if shots.has_partitioned_shots:
+        sorted_res = tuple(zip(*sorted_res))
+
+    return sorted_res
+
+
+def sample_probs(probs, shots: int, rng=None) -> np.ndarray:
+    """
+    Draws the indices of basis states from one or several probability distributions.
+
+    The cumulative distributions of a batch of probabilities are offset by the index of their
+    row and flattened, so that the basis states of all executions are drawn with a single
+    ``np.searchsorted`` instead of one ``rng.choice`` call per execution.
+
+    Args:
+        probs (array[float]): The probabilities of the basis states, of shape ``(dim,)`` or
+            ``(batch_size, dim)``
+        shots (int): The number of samples to take
+        rng (Union[None, int, array_like[int], SeedSequence, BitGenerator, Generator]):
+            A seed-like parameter matching that of ``seed`` for ``numpy.random.default_rng``.
+            If no value is provided, a default RNG will be used
+
+    Returns:
+        ndarray[int]: Indices of the sampled basis states of the shape ``(shots,)``, or
+        ``(batch_size, shots)`` if the probabilities are batched
+    """
+    rng = np.random.default_rng(rng)
+    probs = np.asarray(probs, dtype=np.float64)
+    batch_shape, dim = probs.shape[:-1], probs.shape[-1]
+    probs = probs.reshape(-1, dim)
+
+    norms = np.sum(probs, axis=-1, keepdims=True)
+    if np.any(np.isnan(norms)):
+        raise ValueError("probabilities contain NaN")
+
+    rows = np.arange(len(probs))[:, None]
+    cdf = np.cumsum(probs / norms, axis=-1)
+    # guard against round-off in the last bin
+    cdf[:, -1] = 1.0
+
+    draws = rng.random((len(probs), shots)) + rows
+    indices = np.searchsorted((cdf + rows).ravel(), draws.ravel(), side="right")
+    indices = np.minimum(indices.reshape(draws.shape) - rows * dim, dim - 1)
+    return indices.reshape((*batch_shape, shots))
+
+
+def sample_state(
+    state,
+    shots: int,
+    is_state_batched: bool = False,
+    wires=None,
+    rng=None,
+) -> np.ndarray:
+    """
+    Returns a series of samples of a qutrit density matrix in the computational basis.
+
+    Args:
+        state (array[complex]): A density matrix to be sampled
+        shots (int): The number of samples to take
+        is_state_batched (bool): whether the state is batched or not
+        wires (Sequence[int]): The wires to sample
+        rng (Union[None, int, array_like[int], SeedSequence, BitGenerator, Generator]):
+            A seed-like parameter matching that of ``seed`` for ``numpy.random.default_rng``.
+            If no value is provided, a default RNG will be used
+
+    Returns:
+        ndarray[int]: Sample values of the shape ``(shots, num_wires)``, or
+        ``(batch_size, shots, num_wires)`` if the state is batched, with one trit per wire
+    """
+    num_wires = get_num_wires(state, is_state_batched)
+    wires_to_sample = Wires(wires or range(num_wires))
+    # ``calculate_probability`` keeps the marginal wires in the order of the state
+    sorted_wires = Wires(sorted(wires_to_sample))
+
+    with qml.queuing.QueuingManager.stop_recording():
+        mp = ProbabilityMP(wires=sorted_wires)
+    probs = calculate_probability(mp, state, is_state_batched=is_state_batched)
+
+    indices = sample_probs(qml.math.unwrap(probs), shots, rng=rng)
+    samples = _unpack_basis_indices(indices, len(sorted_wires))
+    if sorted_wires != wires_to_sample:
+        samples = samples[..., sorted_wires.indices(wires_to_sample)]
+    return samples
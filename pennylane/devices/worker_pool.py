@@ -0,0 +1,208 @@
+# Copyright 2018-2024 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Contains the :class:`WorkerPool`, a persistent process pool shared by the executions of a device.
+"""
+import concurrent.futures
+import os
+import weakref
+from typing import Callable, Optional
+
+THREAD_ENV_VARS = ("MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS", "OMP_NUM_THREADS")
+"""Environment variables controlling the number of threads used by each worker process, in the
+order in which they are inspected by :func:`~.validate_multiprocessing_workers`."""
+
+
+def threads_per_worker(max_workers: int) -> int:
+    """The number of threads each worker process of a pool with ``max_workers`` processes is pinned to.
+
+    If one of the ``MKL_NUM_THREADS``, ``OPENBLAS_NUM_THREADS`` or ``OMP_NUM_THREADS`` environment
+    variables is set, its value is used, just like :func:`~.validate_multiprocessing_workers` does.
+    Otherwise the logical cores are split evenly between the workers.
+
+    Args:
+        max_workers (int): the number of worker processes
+
+    Returns:
+        int: the number of threads per worker
+
+    >>> os.cpu_count()
+    8
+    >>> threads_per_worker(4)
+    2
+    """
+    for var in THREAD_ENV_VARS:
+        if os.getenv(var):
+            return int(os.getenv(var))
+    return max(1, (os.cpu_count() or 1) // max_workers)
+
+
+def _pin_worker_threads(num_threads: int) -> None:
+    """Initializer run once in every worker process to limit its number of threads."""
+    for var in THREAD_ENV_VARS:
+        os.environ[var] = str(num_threads)
+    try:  # pragma: no cover
+        # BLAS libraries inherited from a forked parent ignore the environment variables.
+        from threadpoolctl import threadpool_limits  # pylint: disable=import-outside-toplevel
+    except ImportError:  # pragma: no cover
+        return
+    threadpool_limits(limits=num_threads)  # pragma: no cover
+
+
+def _shutdown(executor: concurrent.futures.Executor) -> None:
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+class WorkerPool:
+    """A lazily created, long-lived pool of worker processes.
+
+    Devices such as :class:`~.DefaultQubit` hold onto a ``WorkerPool`` so that consecutive calls to
+    ``execute`` and the derivative methods reuse the same processes, instead of paying for starting
+    new processes and re-importing PennyLane on every call. The processes are only started on the
+    first call to :meth:`~.map`, and live until :meth:`~.close` is called, the pool is used as a
+    context manager, or the pool is garbage collected.
+
+    Args:
+        max_workers (int): the number of worker processes
+        num_threads (int): The number of threads each worker process is pinned to. Defaults to
+            :func:`~.threads_per_worker`, so that the pool does not oversubscribe the processor.
+
+    **Example**
+
+    >>> pool = WorkerPool(max_workers=2)
+    >>> list(pool.map(pow, [1, 2, 3], [2, 2, 2]))
+    [1, 4, 9]
+    >>> pool.close()
+
+    """
+
+    def __init__(self, max_workers: int, num_threads: Optional[int] = None):
+        self._max_workers = max_workers
+        self._num_threads = num_threads
+        self._executor = None
+        self._finalizer = None
+
+    def __repr__(self):
+        return f"<WorkerPool: max_workers={self.max_workers}, running={self.running}>"
+
+    @property
+    def max_workers(self) -> int:
+        """The number of worker processes."""
+        return self._max_workers
+
+    @property
+    def num_threads(self) -> int:
+        """The number of threads each worker process is pinned to."""
+        return self._num_threads or threads_per_worker(self._max_workers)
+
+    @property
+    def running(self) -> bool:
+        """Whether or not the worker processes have been started."""
+        return self._executor is not None
+
+    @property
+    def executor(self) -> concurrent.futures.ProcessPoolExecutor:
+        """The underlying executor, started on first access."""
+        if self._executor is None:
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                initializer=_pin_worker_threads,
+                initargs=(self.num_threads,),
+            )
+            self._finalizer = weakref.finalize(self, _shutdown, self._executor)
+        return self._executor
+
+    def chunksize(self, num_tasks: int) -> int:
+        """The number of tasks sent to a worker at once when mapping over ``num_tasks`` tasks.
+
+        Tasks are grouped so that every worker receives about four chunks, which amortizes the
+        inter-process communication for large batches while still balancing the load.
+        """
+        chunksize, extra = divmod(num_tasks, self._max_workers * 4)
+        return max(1, chunksize + bool(extra))
+
+    def map(self, fn: Callable, *iterables) -> list:
+        """Apply ``fn`` to every element of ``iterables`` in the worker processes.
+
+        Args:
+            fn (Callable): a picklable function
+            *iterables (Sequence): sequences of arguments of equal length
+
+        Returns:
+            list: the results, in the order of the inputs
+        """
+        iterables = [list(it) for it in iterables]
+        num_tasks = min((len(it) for it in iterables), default=0)
+        try:
+            return list(self.executor.map(fn, *iterables, chunksize=self.chunksize(num_tasks)))
+        except concurrent.futures.process.BrokenProcessPool:
+            # a worker died; start from scratch on the next call
+            self.close()
+            raise
+
+    def close(self) -> None:
+        """Shut down the worker processes. The pool is restarted if it is used again."""
+        if self._executor is not None:
+            self._finalizer.detach()
+            self._executor.shutdown(wait=True)
+            self._executor = None
+            self._finalizer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __getstate__(self):
+        # running processes cannot be copied or pickled; copies start their own pool when used
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        state["_finalizer"] = None
+        return state
+
+
+class WorkerPoolMixin:
+    """Mixin class for devices that execute tapes in a persistent :class:`~.WorkerPool`, such as
+    :class:`~.DefaultQubit` and :class:`~.DefaultClifford`. Provides the pool of the device, and
+    the ``close`` method and the context manager that shut its processes down.
+    """
+
+    _worker_pool: Optional[WorkerPool] = None
+
+    def _get_worker_pool(self, max_workers: int) -> WorkerPool:
+        """The persistent pool of worker processes with ``max_workers`` processes.
+
+        The pool is created on first use and reused by subsequent executions. It is replaced if
+        a different number of workers is requested through the execution config.
+        """
+        if self._worker_pool is None or self._worker_pool.max_workers != max_workers:
+            self.close()
+            self._worker_pool = WorkerPool(max_workers)
+        return self._worker_pool
+
+    def close(self) -> None:
+        """Shut down the worker processes used when ``max_workers`` is not ``None``.
+
+        The processes are started again if the device is used after being closed.
+        """
+        if self._worker_pool is not None:
+            self._worker_pool.close()
+            self._worker_pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -27,6 +27,7 @@ from .postprocessing import (
     mitigate_depolarizing_noise,
 )
 from .utils import (
+    EmbeddingKernel,
     kernel_matrix,
     square_kernel_matrix,
 )
@@ -15,10 +15,138 @@
 This file contains functionalities that simplify working with kernels.
 """
 from itertools import product
+
+import numpy as np
+
 import pennylane as qml
 
+_BLOCK_SIZE = 256
+"""int: the number of rows of the blocks of kernel values written to an ``out`` array."""
+
+
+class EmbeddingKernel:
+    r"""The fidelity kernel :math:`k(x_1, x_2) = |\langle\phi(x_1)|\phi(x_2)\rangle|^2` of a
+    quantum embedding :math:`|\phi(x)\rangle`.
+
+    The kernel can be called on pairs of datapoints like any other kernel. When it is passed to
+    :func:`~.kernels.kernel_matrix` or :func:`~.kernels.square_kernel_matrix`, the state of each
+    datapoint is simulated once, and the kernel matrix is computed from the overlaps of the
+    states, so that :math:`N` circuits are executed instead of :math:`N^2`.
+
+    Args:
+        embedding (callable): quantum function preparing the state :math:`|\phi(x)\rangle` of a
+            datapoint ``x``, passed as its only argument, from the zero state
+        wires (Iterable): the wires of the embedding
+        device (Device): device returning the states of the embedding. Defaults to a
+            ``"default.qubit"`` device on ``wires``.
+
+    **Example**
+
+    .. code-block:: python
+
+        def embedding(x):
+            qml.AngleEmbedding(x, wires=range(2))
+
+        kernel = qml.kernels.EmbeddingKernel(embedding, wires=range(2))
 
-def square_kernel_matrix(X, kernel, assume_normalized_kernel=False):
+    The kernel value of two datapoints is the overlap of their states:
+
+    >>> X = np.array([[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]])
+    >>> kernel(X[0], X[1])
+    tensor(0.98016591, requires_grad=True)
+
+    The kernel matrix of a dataset only requires the simulation of one state per datapoint.
+    If the embedding supports parameter broadcasting, the states can be simulated in batches:
+
+    >>> qml.kernels.square_kernel_matrix(X, kernel, batch_size=2)
+    tensor([[1.        , 0.98016591, 0.92261884],
+            [0.98016591, 1.        , 0.98016591],
+            [0.92261884, 0.98016591, 1.        ]], requires_grad=True)
+    """
+
+    def __init__(self, embedding, wires, device=None):
+        self.embedding = embedding
+        self.wires = qml.wires.Wires(wires)
+        if device is None:
+            device = qml.device("default.qubit", wires=self.wires)
+
+        def state(x):
+            embedding(x)
+            return qml.state()
+
+        self._state = qml.QNode(state, device)
+
+    def states(self, X, batch_size=None):
+        """The states of the embedding of the datapoints.
+
+        Args:
+            X (list[datapoint]): List of datapoints
+            batch_size (int): The number of states simulated at once with parameter broadcasting.
+                Defaults to ``None``, in which case each state is simulated separately.
+
+        Returns:
+            array[complex]: The states of the datapoints, stacked along the first axis.
+
+        Raises:
+            ValueError: if the embedding does not support parameter broadcasting
+        """
+        if batch_size is None:
+            return qml.math.stack([self._state(x) for x in X])
+
+        X = _as_array(X)
+        states = []
+        for start in range(0, qml.math.shape(X)[0], batch_size):
+            batch = self._state(X[start : start + batch_size])
+            if qml.math.ndim(batch) != 2:
+                raise ValueError(
+                    "The embedding must support parameter broadcasting to simulate the states "
+                    "in batches."
+                )
+            states.append(batch)
+        return qml.math.concatenate(states, axis=0)
+
+    def __call__(self, x1, x2):
+        return _overlaps(self._state(x1), self._state(x2))
+
+
+def _as_array(X):
+    """Stack a list of datapoints into an array, so that it can be indexed by arrays."""
+    return qml.math.stack(X) if isinstance(X, (list, tuple)) else X
+
+
+def _overlaps(states1, states2):
+    """The squared absolute values of the overlaps of the states of two sets of states."""
+    return qml.math.abs(qml.math.dot(qml.math.conj(states1), qml.math.transpose(states2))) ** 2
+
+
+def _kernel_batches(kernel, X1, X2, rows, cols, batch_size):
+    """Call the kernel on the pairs of datapoints ``(X1[rows[k]], X2[cols[k]])`` in batches of
+    at most ``batch_size`` pairs, using parameter broadcasting, and yield the slices of pairs
+    together with the kernel values."""
+    X1, X2 = _as_array(X1), _as_array(X2)
+    for start in range(0, len(rows), batch_size):
+        pairs = slice(start, start + batch_size)
+        values = kernel(
+            qml.math.take(X1, rows[pairs], axis=0), qml.math.take(X2, cols[pairs], axis=0)
+        )
+        if qml.math.shape(values) != (len(rows[pairs]),):
+            raise ValueError(
+                "The kernel must support parameter broadcasting and return one value per pair "
+                f"of datapoints to be called on batches of pairs. Expected {len(rows[pairs])} "
+                f"values, but got an array of shape {qml.math.shape(values)}."
+            )
+        yield pairs, values
+
+
+def _flush(out):
+    """Write the changes of a memory-mapped array to disk."""
+    if hasattr(out, "flush"):
+        out.flush()
+    return out
+
+
+# pylint: disable=too-many-arguments, too-many-return-statements
+def square_kernel_matrix(X, kernel, assume_normalized_kernel=False, batch_size=None, out=None):
     r"""Computes the square matrix of pairwise kernel values for a given dataset.
 
     Args:
@@ -28,6 +156,14 @@ def square_kernel_matrix(X, kernel, assume_normalized_kernel=False):
         assume_normalized_kernel (bool, optional): Assume that the kernel is normalized, in
             which case the diagonal of the kernel matrix is set to 1, avoiding unnecessary
             computations.
+        batch_size (int, optional): The number of pairs of datapoints passed at once to the
+            kernel, which then has to support parameter broadcasting and return one value per
+            pair. For an :class:`~.kernels.EmbeddingKernel`, the number of states simulated at
+            once instead. Defaults to ``None``, in which case the kernel is called on each pair.
+            Only the pairs of the upper triangle of the matrix are evaluated.
+        out (array, optional): Array of shape ``(N, N)`` in which the kernel matrix is written
+            block by block, such as a ``numpy.memmap`` for kernel matrices that do not fit in
+            memory. The kernel values are then not differentiable.
 
     Returns:
         array[float]: The square matrix of kernel values.
@@ -59,8 +195,50 @@ def square_kernel_matrix(X, kernel, assume_normalized_kernel=False):
     """
     N = qml.math.shape(X)[0]
     if assume_normalized_kernel and N == 1:
+        if out is not None:
+            out[0, 0] = 1
+            return _flush(out)
         return qml.math.eye(1, like=qml.math.get_interface(X))
 
+    if isinstance(kernel, EmbeddingKernel):
+        states = kernel.states(X, batch_size)
+        if out is None:
+            return _overlaps(states, states)
+        # Compute the blocks of the upper triangle, using symmetry of the kernel matrix
+        for i in range(0, N, _BLOCK_SIZE):
+            for j in range(i, N, _BLOCK_SIZE):
+                block = _overlaps(states[i : i + _BLOCK_SIZE], states[j : j + _BLOCK_SIZE])
+                out[i : i + _BLOCK_SIZE, j : j + _BLOCK_SIZE] = block
+                out[j : j + _BLOCK_SIZE, i : i + _BLOCK_SIZE] = qml.math.transpose(block)
+        return _flush(out)
+
+    if batch_size is not None:
+        # Only compute the kernel values of the upper triangle, using symmetry of the matrix
+        rows, cols = np.triu_indices(N, k=int(assume_normalized_kernel))
+        batches = _kernel_batches(kernel, X, X, rows, cols, batch_size)
+        if out is not None:
+            for pairs, values in batches:
+                out[rows[pairs], cols[pairs]] = values
+                out[cols[pairs], rows[pairs]] = values
+            if assume_normalized_kernel:
+                out[np.arange(N), np.arange(N)] = 1
+            return _flush(out)
+
+        values = qml.math.concatenate([values for _, values in batches], axis=0)
+        index = np.empty((N, N), dtype=int)
+        index[rows, cols] = index[cols, rows] = np.arange(len(rows))
+        if assume_normalized_kernel:
+            values = qml.math.concatenate([values, qml.math.ones_like(values[:1])], axis=0)
+            index[np.arange(N), np.arange(N)] = len(rows)
+        return qml.math.reshape(qml.math.take(values, index.reshape(-1), axis=0), (N, N))
+
+    if out is not None:
+        for i in range(N):
+            out[i, i] = 1 if assume_normalized_kernel else kernel(X[i], X[i])
+            for j in range(i + 1, N):
+                out[i, j] = out[j, i] = kernel(X[i], X[j])
+        return _flush(out)
+
     matrix = [None] * N**2
 
     # Compute all off-diagonal kernel values, using symmetry of the kernel matrix
@@ -85,13 +263,21 @@ def square_kernel_matrix(X, kernel, assume_normalized_kernel=False):
     return qml.math.moveaxis(qml.math.reshape(qml.math.stack(matrix), shape), -1, 0)
 
 
-def kernel_matrix(X1, X2, kernel):
+# pylint: disable=too-many-return-statements
+def kernel_matrix(X1, X2, kernel, batch_size=None, out=None):
     r"""Computes the matrix of pairwise kernel values for two given datasets.
 
     Args:
         X1 (list[datapoint]): List of datapoints (first argument)
         X2 (list[datapoint]): List of datapoints (second argument)
         kernel ((datapoint, datapoint) -> float): Kernel function that maps datapoints to kernel value.
+        batch_size (int, optional): The number of pairs of datapoints passed at once to the
+            kernel, which then has to support parameter broadcasting and return one value per
+            pair. For an :class:`~.kernels.EmbeddingKernel`, the number of states simulated at
+            once instead. Defaults to ``None``, in which case the kernel is called on each pair.
+        out (array, optional): Array of shape ``(N, M)`` in which the kernel matrix is written
+            block by block, such as a ``numpy.memmap`` for kernel matrices that do not fit in
+            memory. The kernel values are then not differentiable.
 
     Returns:
         array[float]: The matrix of kernel values.
@@ -125,10 +311,40 @@ def kernel_matrix(X1, X2, kernel):
 
     As we can see, for :math:`n` and :math:`m` datapoints in the first and second
     dataset respectively, the output matrix has the shape :math:`n\times m`.
+
+    Large kernel matrices can be written to a memory-mapped array, block by block:
+
+    >>> out = np.lib.format.open_memmap("kernel.npy", mode="w+", shape=(4, 3))
+    >>> _ = qml.kernels.kernel_matrix(X_train, X_test, kernel, out=out)
     """
     N = qml.math.shape(X1)[0]
     M = qml.math.shape(X2)[0]
 
+    if isinstance(kernel, EmbeddingKernel):
+        states1 = kernel.states(X1, batch_size)
+        states2 = states1 if X2 is X1 else kernel.states(X2, batch_size)
+        if out is None:
+            return _overlaps(states1, states2)
+        for i in range(0, N, _BLOCK_SIZE):
+            out[i : i + _BLOCK_SIZE] = _overlaps(states1[i : i + _BLOCK_SIZE], states2)
+        return _flush(out)
+
+    if batch_size is not None:
+        rows, cols = np.divmod(np.arange(N * M), M)
+        batches = _kernel_batches(kernel, X1, X2, rows, cols, batch_size)
+        if out is not None:
+            for pairs, values in batches:
+                out[rows[pairs], cols[pairs]] = values
+            return _flush(out)
+        values = qml.math.concatenate([values for _, values in batches], axis=0)
+        return qml.math.reshape(values, (N, M))
+
+    if out is not None:
+        for i, x in enumerate(X1):
+            for j, y in enumerate(X2):
+                out[i, j] = kernel(x, y)
+        return _flush(out)
+
     matrix = qml.math.stack([kernel(x, y) for x, y in product(X1, X2)])
 
     if qml.math.ndim(matrix[0]) == 0:
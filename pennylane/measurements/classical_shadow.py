@@ -23,6 +23,7 @@ import numpy as np
 
 import pennylane as qml
 from pennylane.operation import Operator
+from pennylane.utils import stable_hash
 from pennylane.wires import Wires
 
 from .measurements import MeasurementShapeError, MeasurementTransform, Shadow, ShadowExpval
@@ -245,7 +246,7 @@ class ClassicalShadowMP(MeasurementTransform):
             tuple(self.wires.tolist()),
         )
 
-        return hash(fingerprint)
+        return stable_hash(fingerprint)
 
     def process(self, tape, device):
         """
@@ -334,6 +335,66 @@ class ClassicalShadowMP(MeasurementTransform):
         Returns:
             tensor_like[int]: A tensor with shape ``(2, T, n)``, where the first row represents
             the measured bits and the second represents the recipes used.
+
+        .. note::
+
+            The measurement returns all the snapshots, which are thus stored in the output tensor
+            as the chunks of :meth:`~.process_state_in_chunks` are generated. To estimate
+            expectation values without storing the snapshots, pass the chunks to
+            :meth:`~.ClassicalShadow.expval_from_chunks` instead.
+        """
+        output = np.empty((2, shots, len(self.wires)), dtype=np.int8)
+        start = 0
+        for bits, recipes in self.process_state_in_chunks(state, wire_order, shots, rng=rng):
+            stop = start + len(bits)
+            output[0, start:stop] = bits
+            output[1, start:stop] = recipes
+            start = stop
+        return output
+
+    def process_state_in_chunks(
+        self,
+        state: Sequence[complex],
+        wire_order: Wires,
+        shots: int,
+        rng=None,
+        chunk_size: Optional[int] = None,
+        unique_recipes: Optional[bool] = None,
+    ):
+        """Generate the measured bits and recipes of the snapshots of the given quantum state in
+        chunks of consecutive snapshots.
+
+        The snapshots are sampled in batches whose collapsed states take at most
+        :math:`2^{22}` amplitudes in total, so that the memory used does not grow with the number
+        of shots. If the snapshots share few distinct recipes, the outcomes of the snapshots
+        measured with the same recipe are instead sampled at once, from the distribution of the
+        outcomes of the recipe.
+
+        Args:
+            state (Sequence[complex]): quantum state vector given as a rank-N tensor, where
+                each dim has size 2 and N is the number of wires.
+            wire_order (Wires): wires determining the subspace that ``state`` acts on
+            shots (int): The number of shots
+            rng (Union[None, int, array_like[int], SeedSequence, BitGenerator, Generator]): A
+                seed-like parameter matching that of ``seed`` for ``numpy.random.default_rng``.
+                If no value is provided, a default RNG will be used.
+            chunk_size (int): The maximal number of snapshots per chunk. Defaults to the number of
+                snapshots whose collapsed states fit in :math:`2^{22}` amplitudes.
+            unique_recipes (bool): Whether to sample the outcomes of every distinct recipe at once.
+                Defaults to ``None``, in which case this is done if the number of distinct recipes
+                times the number of measured wires is smaller than the number of shots.
+
+        Yields:
+            tuple[array[int], array[int]]: the bits and the recipes of the snapshots of a chunk,
+            with shape ``(chunk_size, n)``
+
+        **Example**
+
+        >>> state = np.array([1, 0, 0, 1]).reshape(2, 2) / np.sqrt(2)
+        >>> mp = qml.classical_shadow(wires=[0, 1], seed=1)
+        >>> chunks = mp.process_state_in_chunks(state, qml.wires.Wires([0, 1]), 1000, chunk_size=400)
+        >>> [bits.shape for bits, recipes in chunks]
+        [(400, 2), (400, 2), (200, 2)]
         """
         wire_map = {w: i for i, w in enumerate(wire_order)}
         mapped_wires = [wire_map[w] for w in self.wires]
@@ -347,86 +408,26 @@ class ClassicalShadowMP(MeasurementTransform):
 
         bit_rng = np.random.default_rng(rng)
 
-        obs_list = np.stack(
-            [
-                qml.PauliX.compute_matrix(),
-                qml.PauliY.compute_matrix(),
-                qml.PauliZ.compute_matrix(),
-            ]
-        )
-
-        # the diagonalizing matrices corresponding to the Pauli observables above
-        diag_list = np.stack(
-            [
-                qml.Hadamard.compute_matrix(),
-                qml.Hadamard.compute_matrix() @ qml.RZ.compute_matrix(-np.pi / 2),
-                qml.Identity.compute_matrix(),
-            ]
-        )
-        obs = obs_list[recipes]
-        diagonalizers = diag_list[recipes]
-
-        # There's a significant speedup if we use the following iterative
-        # process to perform the randomized Pauli measurements:
-        #   1. Randomly generate Pauli observables for all snapshots for
-        #      a single qubit (e.g. the first qubit).
-        #   2. Compute the expectation of each Pauli observable on the first
-        #      qubit by tracing out all other qubits.
-        #   3. Sample the first qubit based on each Pauli expectation.
-        #   4. For all snapshots, determine the collapsed state of the remaining
-        #      qubits based on the sample result.
-        #   4. Repeat iteratively until no qubits are remaining.
-        #
-        # Observe that after the first iteration, the second qubit will become the
-        # "first" qubit in the process. The advantage to this approach as opposed to
-        # simulataneously computing the Pauli expectations for each qubit is that
-        # the partial traces are computed over iteratively smaller subsystems, leading
-        # to a significant speed-up.
-
         # transpose the state so that the measured wires appear first
         unmeasured_wires = [i for i in range(num_dev_qubits) if i not in mapped_wires]
         transposed_state = np.transpose(state, axes=mapped_wires + unmeasured_wires)
 
-        outcomes = np.zeros((shots, n_qubits))
-        stacked_state = np.repeat(transposed_state[np.newaxis, ...], shots, axis=0)
+        if chunk_size is None:
+            chunk_size = max(1, _MAX_SNAPSHOT_AMPLITUDES // 2**num_dev_qubits)
 
-        for active_qubit in range(n_qubits):
-            # stacked_state loses a dimension each loop
+        unique, inverse = np.unique(recipes, axis=0, return_inverse=True)
+        if unique_recipes is None:
+            unique_recipes = len(unique) * n_qubits < shots
 
-            # trace out every qubit except the first
-            num_remaining_qubits = num_dev_qubits - active_qubit
-            conj_state_first_qubit = ABC[num_remaining_qubits]
-            stacked_dim = ABC[num_remaining_qubits + 1]
-
-            state_str = f"{stacked_dim}{ABC[:num_remaining_qubits]}"
-            conj_state_str = f"{stacked_dim}{conj_state_first_qubit}{ABC[1:num_remaining_qubits]}"
-            target_str = f"{stacked_dim}a{conj_state_first_qubit}"
-
-            first_qubit_state = np.einsum(
-                f"{state_str},{conj_state_str}->{target_str}",
-                stacked_state,
-                np.conj(stacked_state),
-            )
+        if unique_recipes:
+            bits = _sample_unique_recipes(transposed_state, unique, inverse.reshape(-1), bit_rng)
+            for start in range(0, shots, chunk_size):
+                yield bits[start : start + chunk_size], recipes[start : start + chunk_size]
+            return
 
-            # sample the observables on the first qubit
-            probs = (np.einsum("abc,acb->a", first_qubit_state, obs[:, active_qubit]) + 1) / 2
-            samples = bit_rng.random(size=probs.shape) > probs
-            outcomes[:, active_qubit] = samples
-
-            # collapse the state of the remaining qubits; the next qubit in line
-            # becomes the first qubit for the next iteration
-            rotated_state = np.einsum(
-                "ab...,acb->ac...", stacked_state, diagonalizers[:, active_qubit]
-            )
-            stacked_state = rotated_state[np.arange(shots), samples.astype(np.int8)]
-
-            # re-normalize the collapsed state
-            sum_indices = tuple(range(1, num_remaining_qubits))
-            state_squared = np.abs(stacked_state) ** 2
-            norms = np.sqrt(np.sum(state_squared, sum_indices, keepdims=True))
-            stacked_state /= norms
-
-        return np.stack([outcomes, recipes]).astype(np.int8)
+        for start in range(0, shots, chunk_size):
+            chunk_recipes = recipes[start : start + chunk_size]
+            yield _sample_snapshots(transposed_state, chunk_recipes, bit_rng), chunk_recipes
 
     @property
     def samples_computational_basis(self):
@@ -518,11 +519,13 @@ class ShadowExpvalMP(MeasurementTransform):
         Returns:
             float: The estimate of the expectation value.
         """
-        bits, recipes = qml.classical_shadow(
-            wires=self.wires, seed=self.seed
-        ).process_state_with_shots(state, wire_order, shots, rng=rng)
-        shadow = qml.shadows.ClassicalShadow(bits, recipes, wire_map=self.wires.tolist())
-        return shadow.expval(self.H, self.k)
+        # the snapshots are consumed as they are generated, without storing the whole shadow
+        chunks = qml.classical_shadow(wires=self.wires, seed=self.seed).process_state_in_chunks(
+            state, wire_order, shots, rng=rng
+        )
+        return qml.shadows.ClassicalShadow.expval_from_chunks(
+            chunks, shots, self.H, wire_map=self.wires.tolist(), k=self.k
+        )
 
     @property
     def samples_computational_basis(self):
@@ -569,3 +572,137 @@ class ShadowExpvalMP(MeasurementTransform):
             k=self.k,
             seed=self.seed,
         )
+
+
+_MAX_SNAPSHOT_AMPLITUDES = 2**22
+"""Maximal number of amplitudes of the collapsed states of the snapshots sampled at once."""
+
+_PAULI_MATRICES = np.array(
+    [[[0, 1], [1, 0]], [[0, -1j], [1j, 0]], [[1, 0], [0, -1]]], dtype=np.complex128
+)
+"""The matrices of PauliX, PauliY and PauliZ, the observables measured by the recipes."""
+
+# the diagonalizing matrices corresponding to the Pauli observables above, which are Hadamard,
+# Hadamard @ RZ(-pi / 2) and Identity
+_DIAGONALIZING_MATRICES = np.array(
+    [
+        [[1, 1], [1, -1]],
+        [
+            [np.exp(1j * np.pi / 4), np.exp(-1j * np.pi / 4)],
+            [np.exp(1j * np.pi / 4), -np.exp(-1j * np.pi / 4)],
+        ],
+        [[np.sqrt(2), 0], [0, np.sqrt(2)]],
+    ]
+) / np.sqrt(2)
+
+
+def _sample_snapshots(state, recipes, bit_rng):
+    """Sample the outcomes of the randomized Pauli measurements of a batch of snapshots.
+
+    Args:
+        state (array[complex]): the state vector, with the measured wires first
+        recipes (array[int]): the recipes of the snapshots, with shape ``(T, n)``
+        bit_rng (numpy.random.Generator): the generator of the outcomes
+
+    Returns:
+        array[int]: the measured bits, with shape ``(T, n)``
+    """
+    shots, n_qubits = recipes.shape
+    num_dev_qubits = len(state.shape)
+    obs = _PAULI_MATRICES[recipes]
+    diagonalizers = _DIAGONALIZING_MATRICES[recipes]
+
+    # There's a significant speedup if we use the following iterative
+    # process to perform the randomized Pauli measurements:
+    #   1. Randomly generate Pauli observables for all snapshots for
+    #      a single qubit (e.g. the first qubit).
+    #   2. Compute the expectation of each Pauli observable on the first
+    #      qubit by tracing out all other qubits.
+    #   3. Sample the first qubit based on each Pauli expectation.
+    #   4. For all snapshots, determine the collapsed state of the remaining
+    #      qubits based on the sample result.
+    #   4. Repeat iteratively until no qubits are remaining.
+    #
+    # Observe that after the first iteration, the second qubit will become the
+    # "first" qubit in the process. The advantage to this approach as opposed to
+    # simulataneously computing the Pauli expectations for each qubit is that
+    # the partial traces are computed over iteratively smaller subsystems, leading
+    # to a significant speed-up.
+
+    outcomes = np.zeros((shots, n_qubits), dtype=np.int8)
+    stacked_state = np.repeat(state[np.newaxis, ...], shots, axis=0)
+
+    for active_qubit in range(n_qubits):
+        # stacked_state loses a dimension each loop
+
+        # trace out every qubit except the first
+        num_remaining_qubits = num_dev_qubits - active_qubit
+        conj_state_first_qubit = ABC[num_remaining_qubits]
+        stacked_dim = ABC[num_remaining_qubits + 1]
+
+        state_str = f"{stacked_dim}{ABC[:num_remaining_qubits]}"
+        conj_state_str = f"{stacked_dim}{conj_state_first_qubit}{ABC[1:num_remaining_qubits]}"
+        target_str = f"{stacked_dim}a{conj_state_first_qubit}"
+
+        first_qubit_state = np.einsum(
+            f"{state_str},{conj_state_str}->{target_str}",
+            stacked_state,
+            np.conj(stacked_state),
+        )
+
+        # sample the observables on the first qubit
+        probs = (np.einsum("abc,acb->a", first_qubit_state, obs[:, active_qubit]) + 1) / 2
+        samples = bit_rng.random(size=probs.shape) > probs
+        outcomes[:, active_qubit] = samples
+
+        # collapse the state of the remaining qubits; the next qubit in line
+        # becomes the first qubit for the next iteration
+        rotated_state = np.einsum("ab...,acb->ac...", stacked_state, diagonalizers[:, active_qubit])
+        stacked_state = rotated_state[np.arange(shots), samples.astype(np.int8)]
+
+        # re-normalize the collapsed state
+        sum_indices = tuple(range(1, num_remaining_qubits))
+        state_squared = np.abs(stacked_state) ** 2
+        norms = np.sqrt(np.sum(state_squared, sum_indices, keepdims=True))
+        stacked_state /= norms
+
+    return outcomes
+
+
+def _sample_unique_recipes(state, unique, inverse, bit_rng):
+    """Sample the outcomes of the snapshots measured with every distinct recipe at once.
+
+    The state is rotated into the measurement basis of every distinct recipe, and the numbers of
+    snapshots with each outcome are drawn from a multinomial distribution, before being assigned
+    to the snapshots in a random order.
+
+    Args:
+        state (array[complex]): the state vector, with the measured wires first
+        unique (array[int]): the distinct recipes, with shape ``(U, n)``
+        inverse (array[int]): the index of the recipe of every snapshot in ``unique``
+        bit_rng (numpy.random.Generator): the generator of the outcomes
+
+    Returns:
+        array[int]: the measured bits, with shape ``(T, n)``
+    """
+    n_qubits = unique.shape[1]
+    outcomes = np.zeros((len(inverse), n_qubits), dtype=np.int8)
+    powers = 2 ** np.arange(n_qubits - 1, -1, -1)
+    unmeasured_axes = tuple(range(n_qubits, len(state.shape)))
+
+    for index, recipe in enumerate(unique):
+        snapshots = np.flatnonzero(inverse == index)
+        rotated_state = state
+        for qubit, pauli in enumerate(recipe):
+            if pauli != 2:
+                rotated_state = np.tensordot(
+                    _DIAGONALIZING_MATRICES[pauli], rotated_state, axes=[[1], [qubit]]
+                )
+                rotated_state = np.moveaxis(rotated_state, 0, qubit)
+
+        probs = np.sum(np.abs(rotated_state) ** 2, axis=unmeasured_axes).reshape(-1)
+        counts = bit_rng.multinomial(len(snapshots), probs / np.sum(probs))
+        samples = bit_rng.permutation(np.repeat(np.arange(len(probs)), counts))
+        outcomes[snapshots] = (samples[:, np.newaxis] // powers) % 2
+
+    return outcomes
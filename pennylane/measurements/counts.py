@@ -20,9 +20,16 @@ import numpy as np
 
 import pennylane as qml
 from pennylane.operation import Operator
+from pennylane.utils import stable_hash
 from pennylane.wires import Wires
 
-from .measurements import AllCounts, Counts, SampleMeasurement
+from .measurements import (
+    AllCounts,
+    Counts,
+    SampleMeasurement,
+    _count_basis_indices,
+    _marginal_basis_indices,
+)
 from .mid_measure import MeasurementValue
 
 
@@ -213,7 +220,7 @@ class CountsMP(SampleMeasurement):
             self.all_outcomes,
         )
 
-        return hash(fingerprint)
+        return stable_hash(fingerprint)
 
     @property
     def return_type(self):
@@ -243,6 +250,46 @@ class CountsMP(SampleMeasurement):
 
         return [self._samples_to_counts(bin_sample) for bin_sample in samples]
 
+    def process_basis_indices(self, indices, wire_order: Wires):
+        if self.mv is not None:
+            raise NotImplementedError
+
+        marginal, num_wires = _marginal_basis_indices(indices, wire_order, self.wires)
+
+        if self.obs is None:
+
+            def convert(x):
+                return f"{x:0{num_wires}b}"
+
+            outcomes = list(map(convert, range(2**num_wires))) if self.all_outcomes else []
+        else:
+            try:
+                eigvals = self.eigvals()
+            except qml.operation.EigvalsUndefinedError as e:
+                raise NotImplementedError from e
+            outcomes = eigvals if self.all_outcomes else []
+            if str(self.obs.name) in {"PauliX", "PauliY", "PauliZ", "Hadamard"}:
+                # consistent with the integer samples of these observables
+                eigvals = qml.math.cast(eigvals, int)
+
+        outcome_dicts = []
+        for row in marginal.reshape(-1, marginal.shape[-1]):
+            outcome_dict = {k: qml.math.int64(0) for k in outcomes}
+            states, _counts = _count_basis_indices(row, 2**num_wires)
+
+            if self.obs is None:
+                outcome_dict.update(zip(map(convert, states.tolist()), _counts))
+            else:
+                # basis states with the same eigenvalue are added together
+                values, inverse = np.unique(eigvals[states], return_inverse=True)
+                value_counts = np.zeros(len(values), dtype=_counts.dtype)
+                np.add.at(value_counts, inverse, _counts)
+                outcome_dict.update(zip(values, value_counts))
+
+            outcome_dicts.append(outcome_dict)
+
+        return outcome_dicts if marginal.ndim > 1 else outcome_dicts[0]
+
     def _samples_to_counts(self, samples):
         """Groups the samples into a dictionary showing number of occurrences for
         each possible outcome.
@@ -312,7 +359,7 @@ class CountsMP(SampleMeasurement):
             exp2 = 2 ** np.arange(num_wires - 1, -1, -1)
             samples = np.einsum("...i,i", samples, exp2)
             new_shape = samples.shape
-            samples = qml.math.cast_like(samples, qml.math.int8(0))
+            samples = qml.math.cast_like(samples, qml.math.int64(0))
             samples = list(map(convert, samples.ravel()))
             samples = np.array(samples).reshape(new_shape)
 
@@ -21,7 +21,13 @@ import pennylane as qml
 from pennylane.operation import Operator
 from pennylane.wires import Wires
 
-from .measurements import Expectation, SampleMeasurement, StateMeasurement
+from .measurements import (
+    Expectation,
+    SampleMeasurement,
+    StateMeasurement,
+    _marginal_basis_indices,
+    _mean_over_basis_indices,
+)
 from .mid_measure import MeasurementValue
 
 
@@ -125,6 +131,17 @@ class ExpectationMP(SampleMeasurement, StateMeasurement):
         # TODO: do we need to squeeze here? Maybe remove with new return types
         return qml.math.squeeze(qml.math.mean(samples, axis=axis))
 
+    def process_basis_indices(self, indices, wire_order: Wires):
+        if self.mv is not None:
+            raise NotImplementedError
+        try:
+            eigvals = qml.math.asarray(self.eigvals(), dtype="float64")
+        except qml.operation.EigvalsUndefinedError as e:
+            raise NotImplementedError from e
+
+        marginal, _ = _marginal_basis_indices(indices, wire_order, self.wires)
+        return _mean_over_basis_indices(marginal, eigvals)
+
     def process_state(self, state: Sequence[complex], wire_order: Wires):
         # This also covers statistics for mid-circuit measurements manipulated using
         # arithmetic operators
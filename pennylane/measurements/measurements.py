@@ -24,10 +24,17 @@ from abc import ABC, abstractmethod
 from enum import Enum
 from typing import Sequence, Tuple, Optional, Union
 
+import numpy as np
+
 import pennylane as qml
-from pennylane.operation import Operator, DecompositionUndefinedError, EigvalsUndefinedError
+from pennylane.operation import (
+    Operator,
+    DecompositionUndefinedError,
+    EigvalsUndefinedError,
+)
 from pennylane.pytrees import register_pytree
 from pennylane.typing import TensorLike
+from pennylane.utils import stable_hash
 from pennylane.wires import Wires
 
 from .shots import Shots
@@ -477,7 +484,7 @@ class MeasurementProcess(ABC):
             tuple(self.wires.tolist()),
         )
 
-        return hash(fingerprint)
+        return stable_hash(fingerprint)
 
     def simplify(self):
         """Reduce the depth of the observable to the minimum.
@@ -576,6 +583,66 @@ class SampleMeasurement(MeasurementProcess):
         """
         raise NotImplementedError
 
+    def process_basis_indices(self, indices, wire_order: Wires):
+        """Calculate the measurement given the indices of the sampled computational basis states.
+
+        This avoids unpacking the samples into an array with one integer per wire and shot, and is
+        used by the NumPy simulators instead of :meth:`~.process_samples` when it is implemented.
+
+        Args:
+            indices (array[int]): The sampled basis states of all the wires, with shape
+                ``(shots,)`` or ``(batch_size, shots)``. The first wire in ``wire_order`` is the
+                most significant bit of each index.
+            wire_order (Wires): the wire order used in producing the indices
+
+        Raises:
+            NotImplementedError: if the measurement cannot be computed from basis state indices,
+                e.g. because it is a measurement of mid-circuit measurement values
+        """
+        raise NotImplementedError
+
+
+def _marginal_basis_indices(indices, wire_order: Wires, wires: Wires):
+    """Converts indices of computational basis states of the wires ``wire_order`` to indices of
+    basis states of the wires ``wires``. All wires are kept if ``wires`` is empty.
+
+    Returns:
+        tuple[array[int], int]: the marginal indices and the number of wires they index
+    """
+    num_wires = len(wire_order)
+    wire_map = dict(zip(wire_order, range(num_wires)))
+    positions = [wire_map[w] for w in wires]
+    if not positions or positions == list(range(num_wires)):
+        return indices, num_wires
+
+    marginal = np.zeros_like(indices)
+    for p in positions:
+        marginal = (marginal << 1) | ((indices >> (num_wires - 1 - p)) & 1)
+    return marginal, len(positions)
+
+
+def _count_basis_indices(indices, dim: int):
+    """Returns the observed basis states and their number of occurrences, sorted by basis state,
+    for a one-dimensional array of basis state indices in ``range(dim)``."""
+    if dim <= len(indices):
+        counts = np.bincount(indices, minlength=dim)
+        states = np.flatnonzero(counts)
+        return states, counts[states]
+    return np.unique(indices, return_counts=True)
+
+
+def _mean_over_basis_indices(indices, values):
+    """Computes ``np.mean(values[indices], axis=-1)``. If there are more shots than basis states,
+    the occurrences of each basis state are counted instead of gathering one value per shot."""
+    dim, shots = len(values), indices.shape[-1]
+    if dim > shots:
+        return np.mean(values[indices], axis=-1)
+
+    rows = indices.reshape(-1, shots)
+    counts = np.stack([np.bincount(row, minlength=dim) for row in rows])
+    # indexing with an empty tuple returns a scalar instead of a zero-dimensional array
+    return (counts @ values / shots).reshape(indices.shape[:-1])[()]
+
 
 class StateMeasurement(MeasurementProcess):
     """State-based measurement process.
@@ -19,6 +19,7 @@ from typing import Generic, TypeVar, Optional
 import numpy as np
 
 import pennylane as qml
+from pennylane.utils import stable_hash
 from pennylane.wires import Wires
 
 from .measurements import MeasurementProcess, MidMeasure
@@ -273,7 +274,7 @@ class MidMeasureMP(MeasurementProcess):
             self.id,
         )
 
-        return hash(fingerprint)
+        return stable_hash(fingerprint)
 
     @property
     def data(self):
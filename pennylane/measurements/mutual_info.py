@@ -19,6 +19,7 @@ from copy import copy
 from typing import Sequence, Optional
 
 import pennylane as qml
+from pennylane.utils import stable_hash
 from pennylane.wires import Wires
 
 from .measurements import MutualInfo, StateMeasurement
@@ -126,7 +127,7 @@ class MutualInfoMP(StateMeasurement):
             self.log_base,
         )
 
-        return hash(fingerprint)
+        return stable_hash(fingerprint)
 
     @property
     def return_type(self):
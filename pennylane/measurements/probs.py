@@ -20,7 +20,12 @@ import numpy as np
 import pennylane as qml
 from pennylane.wires import Wires
 
-from .measurements import Probability, SampleMeasurement, StateMeasurement
+from .measurements import (
+    Probability,
+    SampleMeasurement,
+    StateMeasurement,
+    _marginal_basis_indices,
+)
 from .mid_measure import MeasurementValue
 
 
@@ -241,6 +246,18 @@ class ProbabilityMP(SampleMeasurement, StateMeasurement):
         # flatten and return probabilities
         return qml.math.reshape(prob, flat_shape)
 
+    def process_basis_indices(self, indices, wire_order: Wires):
+        if self.mv is not None:
+            raise NotImplementedError
+
+        marginal, num_wires = _marginal_basis_indices(indices, wire_order, self.wires)
+        shots = marginal.shape[-1]
+        prob = [
+            np.bincount(row, minlength=2**num_wires) / shots
+            for row in marginal.reshape(-1, shots)
+        ]
+        return np.reshape(prob, (*marginal.shape[:-1], 2**num_wires))
+
     def process_counts(self, counts: dict, wire_order: Wires) -> np.ndarray:
         wire_map = dict(zip(wire_order, range(len(wire_order))))
         mapped_wires = [wire_map[w] for w in self.wires]
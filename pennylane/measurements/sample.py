@@ -18,11 +18,18 @@ import functools
 import warnings
 from typing import Sequence, Tuple, Optional, Union
 
+import numpy as np
+
 import pennylane as qml
 from pennylane.operation import Operator
 from pennylane.wires import Wires
 
-from .measurements import MeasurementShapeError, Sample, SampleMeasurement
+from .measurements import (
+    MeasurementShapeError,
+    Sample,
+    SampleMeasurement,
+    _marginal_basis_indices,
+)
 from .mid_measure import MeasurementValue
 
 
@@ -241,3 +248,23 @@ class SampleMP(SampleMeasurement):
                 ) from e
 
         return samples if bin_size is None else samples.reshape((bin_size, -1))
+
+    def process_basis_indices(self, indices, wire_order: Wires):
+        if self.mv is not None:
+            raise NotImplementedError
+
+        if self.obs is None:
+            # unpack the bits of the requested wires only
+            wire_map = dict(zip(wire_order, range(len(wire_order))))
+            positions = [wire_map[w] for w in self.wires] or list(range(len(wire_order)))
+            shifts = len(wire_order) - 1 - np.array(positions, dtype=np.int64)
+            return (indices[..., None] >> shifts) & 1
+
+        marginal, _ = _marginal_basis_indices(indices, wire_order, self.wires)
+        if str(self.obs.name) in {"PauliX", "PauliY", "PauliZ", "Hadamard"}:
+            return 1 - 2 * marginal
+
+        try:
+            return self.eigvals()[marginal]
+        except qml.operation.EigvalsUndefinedError as e:
+            raise NotImplementedError from e
@@ -18,11 +18,19 @@ This module contains the qml.var measurement.
 import warnings
 from typing import Sequence, Tuple, Union
 
+import numpy as np
+
 import pennylane as qml
 from pennylane.operation import Operator
 from pennylane.wires import Wires
 
-from .measurements import SampleMeasurement, StateMeasurement, Variance
+from .measurements import (
+    SampleMeasurement,
+    StateMeasurement,
+    Variance,
+    _marginal_basis_indices,
+    _mean_over_basis_indices,
+)
 from .mid_measure import MeasurementValue
 
 
@@ -119,6 +127,19 @@ class VarianceMP(SampleMeasurement, StateMeasurement):
         # TODO: do we need to squeeze here? Maybe remove with new return types
         return qml.math.squeeze(qml.math.var(samples, axis=axis))
 
+    def process_basis_indices(self, indices, wire_order: Wires):
+        if self.mv is not None:
+            raise NotImplementedError
+        try:
+            eigvals = qml.math.asarray(self.eigvals(), dtype="float64")
+        except qml.operation.EigvalsUndefinedError as e:
+            raise NotImplementedError from e
+
+        marginal, _ = _marginal_basis_indices(indices, wire_order, self.wires)
+        mean = _mean_over_basis_indices(marginal, eigvals)
+        # the difference of the moments is clipped, as rounding errors can make it negative
+        return np.maximum(_mean_over_basis_indices(marginal, eigvals**2) - mean**2, 0.0)
+
     def process_state(self, state: Sequence[complex], wire_order: Wires):
         # This also covers statistics for mid-circuit measurements manipulated using
         # arithmetic operators
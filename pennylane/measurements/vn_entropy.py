@@ -18,6 +18,7 @@ This module contains the qml.vn_entropy measurement.
 from typing import Sequence, Optional
 
 import pennylane as qml
+from pennylane.utils import stable_hash
 from pennylane.wires import Wires
 
 from .measurements import StateMeasurement, VnEntropy
@@ -102,7 +103,7 @@ class VnEntropyMP(StateMeasurement):
         """int: returns an integer hash uniquely representing the measurement process"""
         fingerprint = (self.__class__.__name__, tuple(self.wires.tolist()), self.log_base)
 
-        return hash(fingerprint)
+        return stable_hash(fingerprint)
 
     @property
     def return_type(self):
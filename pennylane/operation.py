@@ -245,6 +245,7 @@ import abc
 import copy
 import functools
 import itertools
+import numbers
 import warnings
 from enum import IntEnum
 from typing import List
@@ -259,7 +260,7 @@ from pennylane.queuing import QueuingManager
 from pennylane.typing import TensorLike
 from pennylane.wires import Wires
 
-from .utils import pauli_eigs
+from .utils import pauli_eigs, stable_hash
 from .pytrees import register_pytree
 
 # =============================================================================
@@ -403,6 +404,27 @@ def _process_data(op):
     return str([id(d) if qml.math.is_abstract(d) else _mod_and_round(d, mod_val) for d in op.data])
 
 
+def _array_fingerprints(values, only_arrays=False):
+    """The fingerprints of the contents of the NumPy arrays among some values, which are compared
+    to detect arrays modified in place, with ``None`` for the other values.
+
+    Unless ``only_arrays`` is ``True``, ``None`` is returned if a value is neither a NumPy array nor
+    a number, such as a tensor of another framework, whose content is not fingerprinted.
+    """
+    fingerprints = []
+    for value in values:
+        if isinstance(value, np.ndarray):
+            # pylint: disable=import-outside-toplevel
+            from pennylane.ops.eigendecompositions import matrix_fingerprint
+
+            fingerprints.append(matrix_fingerprint(value))
+        elif only_arrays or isinstance(value, (numbers.Number, np.generic)):
+            fingerprints.append(None)
+        else:
+            return None
+    return tuple(fingerprints)
+
+
 class Operator(abc.ABC):
     r"""Base class representing quantum operators.
 
@@ -713,6 +735,9 @@ class Operator(abc.ABC):
         memo[id(self)] = copied_op
 
         for attribute, value in self.__dict__.items():
+            if attribute in ("_structure_hash_cache", "_data_hash_cache"):
+                # the memoized hashes refer to the attributes of the original operator
+                continue
             if attribute == "data":
                 # Shallow copy the list of parameters. We avoid a deep copy
                 # here, since PyTorch does not support deep copying of tensors
@@ -725,15 +750,48 @@ class Operator(abc.ABC):
 
     @property
     def hash(self):
-        """int: Integer hash that uniquely represents the operator."""
-        return hash(
-            (
-                str(self.name),
-                tuple(self.wires.tolist()),
-                str(self.hyperparameters.values()),
-                _process_data(self),
-            )
-        )
+        """int: Integer hash that uniquely represents the operator.
+
+        The hash is the same in every process. The hashes of the structure (name, wires and
+        hyperparameters) and of the data of the operator are memoized separately, and are only
+        recomputed when the corresponding attributes are replaced, e.g. by setting ``op.data``, or
+        when the content of a NumPy array among them is modified in place. The hash of data
+        containing tensors of other frameworks is not memoized.
+        """
+        return stable_hash((self._structure_hash(), self._data_hash()))
+
+    def _structure_hash(self):
+        """Memoized hash of the name, wires and hyperparameters of the operator."""
+        # pylint: disable=attribute-defined-outside-init
+        name, wires, hyperparameters = self.name, self.wires, self.hyperparameters
+        values = tuple(hyperparameters.values())
+        fingerprints = _array_fingerprints(values, only_arrays=True)
+        cached = getattr(self, "_structure_hash_cache", None)
+        if (
+            cached is None
+            or cached[0] != name
+            or cached[1] is not wires
+            or len(cached[2]) != len(values)
+            or any(a is not b for a, b in zip(cached[2], values))
+            or cached[3] != fingerprints
+        ):
+            fingerprint = (str(name), tuple(wires.tolist()), str(hyperparameters.values()))
+            cached = (name, wires, values, fingerprints, stable_hash(fingerprint))
+            self._structure_hash_cache = cached
+        return cached[4]
+
+    def _data_hash(self):
+        """Memoized hash of the data of the operator."""
+        # pylint: disable=attribute-defined-outside-init
+        data = self.data
+        fingerprints = _array_fingerprints(data)
+        if fingerprints is None:
+            return stable_hash(_process_data(self))
+        cached = getattr(self, "_data_hash_cache", None)
+        if cached is None or cached[0] is not data or cached[1] != fingerprints:
+            cached = (data, fingerprints, stable_hash(_process_data(self)))
+            self._data_hash_cache = cached
+        return cached[2]
 
     def __eq__(self, other):
         return qml.equal(self, other)
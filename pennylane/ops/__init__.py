@@ -24,6 +24,7 @@ from .qubit import *
 from .channel import *
 from .op_math import *
 from .qutrit import *
+from .eigendecompositions import EigenCache, eigen_cache, matrix_fingerprint
 
 from .cv import __all__ as _cv__all__
 from .cv import __ops__ as _cv__ops__
@@ -0,0 +1,147 @@
+# Copyright 2018-2024 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+This module contains the bounded cache of the eigendecompositions of observables.
+"""
+import hashlib
+from collections import namedtuple
+
+import numpy as np
+
+from pennylane.utils import LRUCache
+
+EigenCacheInfo = namedtuple(
+    "EigenCacheInfo", ["hits", "misses", "maxsize", "currsize", "maxbytes", "nbytes"]
+)
+"""Statistics of an :class:`~.EigenCache`, in the format of ``functools.lru_cache``."""
+
+
+def matrix_fingerprint(matrix) -> tuple:
+    """Return a hashable fingerprint of the content of a NumPy array.
+
+    The fingerprint consists of the shape, the data type and a 128-bit digest of the bytes of the
+    array, so that it is computed in a single pass over the array and its size does not depend
+    on the size of the array.
+
+    Args:
+        matrix (array): the array to fingerprint
+
+    Returns:
+        tuple: the fingerprint of the array
+
+    **Example**
+
+    >>> matrix_fingerprint(np.eye(2))
+    ((2, 2), '<f8', 'ff601933ad919586d3c0b8567bfb6b13')
+    """
+    matrix = np.ascontiguousarray(matrix)
+    digest = hashlib.blake2b(matrix.tobytes(), digest_size=16).hexdigest()
+    return matrix.shape, matrix.dtype.str, digest
+
+
+class EigenCache(LRUCache):
+    """A least recently used cache of eigendecompositions, bounded in number of entries and bytes.
+
+    The eigendecompositions of :class:`~.Hermitian`, :class:`~.THermitian` and composite operators
+    such as :class:`~.Sum` and :class:`~.Prod` are stored in the shared cache
+    ``qml.ops.eigen_cache``, so that the diagonalizing gates and eigenvalues of an observable
+    measured repeatedly are only computed once. When the number of stored eigendecompositions
+    exceeds ``maxsize``, or the size of their arrays exceeds ``maxbytes``, the least recently used
+    ones are discarded.
+
+    Args:
+        maxsize (int): the maximal number of eigendecompositions stored in the cache
+        maxbytes (int): the maximal number of bytes of the arrays stored in the cache
+
+    **Example**
+
+    >>> obs = qml.Hermitian(np.array([[1, 2], [2, -1]]), wires=0)
+    >>> qml.ops.eigen_cache.clear()
+    >>> _ = obs.eigvals(), obs.diagonalizing_gates()
+    >>> qml.ops.eigen_cache.cache_info()
+    EigenCacheInfo(hits=1, misses=1, maxsize=1024, currsize=1, maxbytes=268435456, nbytes=48)
+
+    The limits of the shared cache can be changed at any time:
+
+    >>> qml.ops.eigen_cache.maxsize = 100
+    """
+
+    def __init__(self, maxsize: int = 1024, maxbytes: int = 2**28):
+        super().__init__(maxsize)
+        self._sizes = {}
+        self._maxbytes = maxbytes
+        self.nbytes = 0
+
+    @property
+    def maxbytes(self) -> int:
+        """The maximal number of bytes of the arrays stored in the cache."""
+        return self._maxbytes
+
+    @maxbytes.setter
+    def maxbytes(self, value: int):
+        with self._lock:
+            self._maxbytes = value
+            self._evict()
+
+    def __setitem__(self, key, value: dict):
+        size = sum(np.asarray(array).nbytes for array in value.values())
+        with self._lock:
+            if key in self._entries:
+                del self._entries[key]
+                self._discard(key)
+            self._sizes[key] = size
+            self.nbytes += size
+            super().__setitem__(key, value)
+
+    def _exceeds_limits(self) -> bool:
+        return super()._exceeds_limits() or self.nbytes > self._maxbytes
+
+    def _discard(self, key):
+        self.nbytes -= self._sizes.pop(key)
+
+    def lookup(self, key, compute) -> dict:
+        """Return the eigendecomposition stored for a key, computing and storing it if missing.
+
+        Args:
+            key (Hashable): the key of the eigendecomposition, such as a :func:`~.matrix_fingerprint`
+            compute (Callable[[], tuple[array, array]]): function returning the eigenvalues and the
+                eigenvectors, only called if the key is missing
+
+        Returns:
+            dict[str, array]: dictionary containing the eigenvalues and the eigenvectors
+        """
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                return self[key]
+            self.misses += 1
+        w, U = compute()
+        value = {"eigvec": U, "eigval": w}
+        self[key] = value
+        return value
+
+    def clear(self):
+        """Discard every stored eigendecomposition and reset the statistics of the cache."""
+        with self._lock:
+            super().clear()
+            self._sizes.clear()
+            self.nbytes = 0
+
+    def cache_info(self) -> EigenCacheInfo:
+        """Return the numbers of hits and misses, and the current size and limits of the cache."""
+        return EigenCacheInfo(*super().cache_info(), self._maxbytes, self.nbytes)
+
+
+eigen_cache = EigenCache()
+"""EigenCache: the cache shared by the eigendecompositions of all observables."""
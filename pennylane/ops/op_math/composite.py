@@ -24,6 +24,8 @@ import numpy as np
 import pennylane as qml
 from pennylane import math
 from pennylane.operation import Operator, _UNSET_BATCH_SIZE
+from pennylane.utils import stable_hash
+from pennylane.ops.eigendecompositions import eigen_cache
 from pennylane.wires import Wires
 
 # pylint: disable=too-many-instance-attributes
@@ -50,7 +52,7 @@ class CompositeOp(Operator):
     def _unflatten(cls, data, metadata):
         return cls(*data)
 
-    _eigs = {}  # cache eigen vectors and values like in qml.Hermitian
+    _eigs = eigen_cache  # cache eigen vectors and values like in qml.Hermitian
 
     def __init__(
         self, *operands: Operator, id=None, _pauli_rep=None
@@ -121,6 +123,7 @@ class CompositeOp(Operator):
     @data.setter
     def data(self, new_data):
         """Set the data property"""
+        self._hash = None
         for op in self:
             op_num_params = op.num_params
             if op_num_params > 0:
@@ -227,14 +230,8 @@ class CompositeOp(Operator):
                 eigenvectors of the operator.
         """
         eigen_func = np.linalg.eigh if self.is_hermitian else np.linalg.eig
-
-        if self.hash not in self._eigs:
-            mat = self.matrix()
-            mat = math.to_numpy(mat)
-            w, U = eigen_func(mat)
-            self._eigs[self.hash] = {"eigvec": U, "eigval": w}
-
-        return self._eigs[self.hash]
+        key = (eigen_func.__name__, self.hash)
+        return self._eigs.lookup(key, lambda: eigen_func(math.to_numpy(self.matrix())))
 
     @property
     def has_diagonalizing_gates(self):
@@ -326,7 +323,7 @@ class CompositeOp(Operator):
     @property
     def hash(self):
         if self._hash is None:
-            self._hash = hash(
+            self._hash = stable_hash(
                 (str(self.name), str([factor.hash for factor in self._sort(self.operands)]))
             )
         return self._hash
@@ -28,6 +28,7 @@ import pennylane as qml
 from pennylane import operation
 from pennylane import math as qmlmath
 from pennylane.operation import Operator
+from pennylane.utils import stable_hash
 from pennylane.wires import Wires
 from pennylane.compiler import compiler
 
@@ -447,7 +448,7 @@ class Controlled(SymbolicOp):
                     for d in self.base.data
                 ]
             )
-            base_hash = hash(
+            base_hash = stable_hash(
                 (
                     str(self.base.name),
                     tuple(self.base.wires.tolist()),
@@ -456,7 +457,7 @@ class Controlled(SymbolicOp):
             )
         else:
             base_hash = self.base.hash
-        return hash(
+        return stable_hash(
             (
                 "Controlled",
                 base_hash,
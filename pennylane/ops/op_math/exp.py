@@ -33,6 +33,7 @@ from pennylane.operation import (
     Tensor,
 )
 from pennylane.ops.qubit import Hamiltonian
+from pennylane.utils import stable_hash
 from pennylane.wires import Wires
 
 from .sprod import SProd
@@ -193,7 +194,7 @@ class Exp(ScalarSymbolicOp, Operation):
 
     @property
     def hash(self):
-        return hash((str(self.name), self.base.hash, str(self.coeff)))
+        return stable_hash((str(self.name), self.base.hash, str(self.coeff)))
 
     @property
     def coeff(self):
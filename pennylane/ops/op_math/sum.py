@@ -22,6 +22,7 @@ from typing import List
 import pennylane as qml
 from pennylane import math
 from pennylane.operation import Operator, convert_to_opmath
+from pennylane.utils import stable_hash
 from pennylane.ops.qubit import Hamiltonian
 from pennylane.queuing import QueuingManager
 
@@ -161,8 +162,8 @@ class Sum(CompositeOp):
 
     @property
     def hash(self):
-        # Since addition is always commutative, we do not need to sort
-        return hash(("Sum", frozenset(o.hash for o in self.operands)))
+        # Since addition is always commutative, the order of the operands does not matter
+        return stable_hash(("Sum", tuple(sorted(frozenset(o.hash for o in self.operands)))))
 
     def __str__(self):
         """String representation of the PauliSentence."""
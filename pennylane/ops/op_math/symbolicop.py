@@ -21,6 +21,7 @@ import numpy as np
 
 import pennylane as qml
 from pennylane.operation import Operator, _UNSET_BATCH_SIZE
+from pennylane.utils import stable_hash
 from pennylane.queuing import QueuingManager
 
 
@@ -131,7 +132,7 @@ class SymbolicOp(Operator):
 
     @property
     def hash(self):
-        return hash(
+        return stable_hash(
             (
                 str(self.name),
                 self.base.hash,
@@ -200,7 +201,7 @@ class ScalarSymbolicOp(SymbolicOp):
 
     @property
     def hash(self):
-        return hash(
+        return stable_hash(
             (
                 str(self.name),
                 str(self.scalar),
@@ -24,6 +24,7 @@ import functools
 from typing import List
 import numpy as np
 import scipy
+from scipy.sparse.linalg import LinearOperator
 
 
 import pennylane as qml
@@ -60,6 +61,128 @@ def _compute_grouping_indices(observables, grouping_type="qwc", method="rlf"):
     return tuple(indices)
 
 
+_SPARSE_BUFFER_SIZE = 2**24
+"""Default memory in bytes of the blocks of matrix entries computed at once when assembling the
+sparse matrix of a Hamiltonian."""
+
+
+def _pauli_terms(H, wire_order):
+    r"""The Pauli words of a Hamiltonian as bit masks of the wires in ``wire_order``.
+
+    A Pauli word has a single non-zero entry :math:`(-i)^{n_Y} (-1)^{z \cdot b}` on the row
+    :math:`b`, in the column :math:`b \oplus x`, where :math:`x` marks the wires with an :math:`X`
+    or :math:`Y` factor, :math:`z` the wires with a :math:`Y` or :math:`Z` factor and :math:`n_Y`
+    is the number of :math:`Y` factors. Factors that are not Pauli operators are decomposed into
+    Pauli words first.
+
+    Returns:
+        dict[tuple[int, int, int], complex]: the coefficients of the words by ``(x, z, n_Y)``
+    """
+    # pylint: disable=import-outside-toplevel
+    from pennylane.devices.qubit.pauli_kernels import pauli_word_masks
+
+    num_wires = len(wire_order)
+    bits = {w: 1 << (num_wires - 1 - i) for i, w in enumerate(wire_order)}
+
+    terms = {}
+    for coeff, op in zip(qml.math.toarray(H.data), H.ops):
+        factors = []
+        for o in Tensor(op).obs:
+            if (ps := o.pauli_rep) is None:
+                ps = qml.pauli.pauli_decompose(
+                    o.matrix(), wire_order=o.wires, pauli=True, check_hermitian=False
+                )
+            factors.append(ps)
+
+        for pw, c in functools.reduce(lambda a, b: a @ b, factors).items():
+            x, z, num_y = pauli_word_masks(pw, bits)
+            key = (x, z, num_y % 4)
+            terms[key] = terms.get(key, 0) + coeff * complex(qml.math.to_numpy(c))
+
+    return terms
+
+
+def _pauli_groups(terms, num_wires, adjoint=False):
+    """Groups Pauli words by the columns of their non-zero entries, with the grouping of the
+    matrix-free Pauli kernels of ``default.qubit``.
+
+    Every group is returned as the bit mask ``x`` of its words, and the signs of its words on the
+    leading and trailing half of the bits of the rows, the latter multiplied by the phases and
+    coefficients of the words. The entries of the group on the rows with leading bits ``h`` are
+    then ``row_signs[:, h].T @ col_signs``.
+    """
+    # pylint: disable=import-outside-toplevel
+    from pennylane.devices.qubit.pauli_kernels import group_pauli_words
+
+    words = (
+        (x, z, (np.conj(coeff) if adjoint else coeff) * (-1j) ** num_y)
+        for (x, z, num_y), coeff in terms.items()
+    )
+    return group_pauli_words(words, num_wires)
+
+
+def _group_entries(row_signs, col_signs, block_size):
+    """Yields the first row and the entries of consecutive blocks of rows of a group of Pauli
+    words, with at most ``block_size`` entries per block."""
+    num_cols = col_signs.shape[1]
+    step = max(1, block_size // num_cols)
+    for start in range(0, row_signs.shape[1], step):
+        yield start * num_cols, (row_signs[:, start : start + step].T @ col_signs).ravel()
+
+
+def _pauli_groups_to_csr(groups, dim, dtype, block_size):
+    """Assembles the CSR matrix of groups of Pauli words. Every group has exactly one entry per
+    row, such that the indices and data are written directly into preallocated buffers."""
+    num_groups = len(groups)
+    if num_groups == 0:
+        return scipy.sparse.csr_matrix((dim, dim), dtype=dtype)
+
+    nnz = dim * num_groups
+    index_dtype = np.int32 if nnz < 2**31 else np.int64
+
+    indices = np.empty((dim, num_groups), dtype=index_dtype)
+    data = np.empty((dim, num_groups), dtype=dtype)
+    rows = np.arange(dim, dtype=index_dtype)
+    for g, (x, row_signs, col_signs) in enumerate(groups):
+        indices[:, g] = rows ^ x
+        for start, entries in _group_entries(row_signs, col_signs, block_size):
+            if not np.issubdtype(dtype, np.complexfloating):
+                entries = entries.real
+            data[start : start + len(entries), g] = entries
+
+    matrix = scipy.sparse.csr_matrix((dim, dim), dtype=dtype)
+    # Avoid checks and copies in __init__ by directly setting the attributes of an empty matrix
+    matrix.data, matrix.indices = data.ravel(), indices.ravel()
+    matrix.indptr = np.arange(0, nnz + 1, num_groups, dtype=index_dtype)
+    matrix.has_sorted_indices = False
+    matrix.sort_indices()
+    matrix.eliminate_zeros()
+    return matrix
+
+
+def _pauli_groups_to_linear_operator(groups, adjoint_groups, dim, dtype, block_size):
+    """A ``LinearOperator`` applying groups of Pauli words block by block, without storing their
+    matrix."""
+
+    def matmat(vectors, groups=groups):
+        vectors = np.reshape(vectors, (dim, -1))
+        result = np.zeros(vectors.shape, dtype=np.result_type(dtype, vectors.dtype))
+        for x, row_signs, col_signs in groups:
+            for start, entries in _group_entries(row_signs, col_signs, block_size):
+                rows = np.arange(start, start + len(entries))
+                result[rows] += entries[:, None] * vectors[rows ^ x]
+        return result
+
+    return LinearOperator(
+        (dim, dim),
+        matvec=lambda v: matmat(v)[:, 0],
+        rmatvec=lambda v: matmat(v, adjoint_groups)[:, 0],
+        matmat=matmat,
+        rmatmat=lambda v: matmat(v, adjoint_groups),
+        dtype=dtype,
+    )
+
+
 class Hamiltonian(Observable):
     r"""Operator representing a Hamiltonian.
 
@@ -355,16 +478,36 @@ class Hamiltonian(Observable):
                 self.ops, grouping_type=grouping_type, method=method
             )
 
-    def sparse_matrix(self, wire_order=None):
+    def sparse_matrix(self, wire_order=None, format="csr", dtype="complex128", buffer_size=None):
         r"""Computes the sparse matrix representation of a Hamiltonian in the computational basis.
 
+        The Pauli words of the Hamiltonian are grouped by the columns of their entries, which
+        only depend on the wires they flip. Every group has exactly one non-zero entry per row,
+        whose value is computed from bit masks of the wires of its words, such that the indices
+        and data of the matrix are written directly into preallocated buffers. Observables that
+        are not Pauli operators, including multi-qubit observables, are decomposed into Pauli
+        words first.
+
         Args:
             wire_order (Iterable): global wire order, must contain all wire labels from the operator's wires.
                 If not provided, the default order of the wires (self.wires) of the Hamiltonian is used.
+            format (str): the output format of the sparse matrix. All scipy sparse formats are
+                accepted. With ``"linear_operator"``, a ``scipy.sparse.linalg.LinearOperator`` that
+                computes the entries of the matrix on the fly is returned instead.
+            dtype (str or type): the data type of the matrix, e.g. ``"complex64"`` to halve its
+                memory. Real data types are only accepted if all the entries are real.
+            buffer_size (int or None): The maximum allowed memory in bytes to store the blocks of
+                entries that are computed at once. It defaults to ``2 ** 24`` bytes that make
+                16MB of memory.
 
         Returns:
-            csr_matrix: a sparse matrix in scipy Compressed Sparse Row (CSR) format with dimension
-            :math:`(2^n, 2^n)`, where :math:`n` is the number of wires
+            Union[csr_matrix, LinearOperator]: a sparse matrix in scipy Compressed Sparse Row (CSR)
+            format, or in the requested format, with dimension :math:`(2^n, 2^n)`, where :math:`n`
+            is the number of wires
+
+        Raises:
+            ValueError: if the wire order does not contain all the wires of the Hamiltonian, or if
+                a real data type is requested for a matrix with complex entries
 
         **Example:**
 
@@ -383,63 +526,37 @@ class Hamiltonian(Observable):
                [ 0.+0.j  , -1.+0.j  ,  0.+0.j  ,  0.-0.45j],
                [ 0.-0.45j,  0.+0.j  , -1.+0.j  ,  0.+0.j  ],
                [ 0.+0.j  ,  0.+0.45j,  0.+0.j  ,  1.+0.j  ]])
+
+        For large Hamiltonians, a linear operator avoids storing the matrix altogether:
+
+        >>> H.sparse_matrix(format="linear_operator") @ np.array([1, 0, 0, 0])
+        array([1.+0.j  , 0.+0.j  , 0.-0.45j, 0.+0.j  ])
         """
-        if wire_order is None:
-            wires = self.wires
-        else:
-            wires = wire_order
+        wires = self.wires if wire_order is None else Wires(wire_order)
+        if not wires.contains_wires(self.wires):
+            raise ValueError(
+                "Can't get the sparse matrix for the specified wire order because it "
+                f"does not contain all the Hamiltonian's wires {self.wires}"
+            )
         n = len(wires)
-        matrix = scipy.sparse.csr_matrix((2**n, 2**n), dtype="complex128")
-
-        coeffs = qml.math.toarray(self.data)
-
-        temp_mats = []
-        for coeff, op in zip(coeffs, self.ops):
-            obs = []
-            for o in qml.operation.Tensor(op).obs:
-                if len(o.wires) > 1:
-                    # todo: deal with operations created from multi-qubit operations such as Hermitian
-                    raise ValueError(
-                        f"Can only sparsify Hamiltonians whose constituent observables consist of "
-                        f"(tensor products of) single-qubit operators; got {op}."
-                    )
-                obs.append(o.matrix())
-
-            # Array to store the single-wire observables which will be Kronecker producted together
-            mat = []
-            # i_count tracks the number of consecutive single-wire identity matrices encountered
-            # in order to avoid unnecessary Kronecker products, since I_n x I_m = I_{n+m}
-            i_count = 0
-            for wire_lab in wires:
-                if wire_lab in op.wires:
-                    if i_count > 0:
-                        mat.append(scipy.sparse.eye(2**i_count, format="coo"))
-                    i_count = 0
-                    idx = op.wires.index(wire_lab)
-                    # obs is an array storing the single-wire observables which
-                    # make up the full Hamiltonian term
-                    sp_obs = scipy.sparse.coo_matrix(obs[idx])
-                    mat.append(sp_obs)
-                else:
-                    i_count += 1
-
-            if i_count > 0:
-                mat.append(scipy.sparse.eye(2**i_count, format="coo"))
-
-            red_mat = (
-                functools.reduce(lambda i, j: scipy.sparse.kron(i, j, format="coo"), mat) * coeff
+        dim = 2**n
+        dtype = np.dtype(dtype)
+        block_size = max(1, (buffer_size or _SPARSE_BUFFER_SIZE) // 16)
+
+        terms = _pauli_terms(self, wires)
+        groups = _pauli_groups(terms, n)
+        if not np.issubdtype(dtype, np.complexfloating) and any(
+            np.any(np.imag(col_signs)) for _, _, col_signs in groups
+        ):
+            raise ValueError(
+                f"The sparse matrix of the Hamiltonian has complex entries; got dtype {dtype}."
             )
 
-            temp_mats.append(red_mat.tocsr())
-            # Value of 100 arrived at empirically to balance time savings vs memory use. At this point
-            # the `temp_mats` are summed into the final result and the temporary storage array is
-            # cleared.
-            if (len(temp_mats) % 100) == 0:
-                matrix += sum(temp_mats)
-                temp_mats = []
+        if format == "linear_operator":
+            adjoint_groups = _pauli_groups(terms, n, adjoint=True)
+            return _pauli_groups_to_linear_operator(groups, adjoint_groups, dim, dtype, block_size)
 
-        matrix += sum(temp_mats)
-        return matrix
+        return _pauli_groups_to_csr(groups, dim, dtype, block_size).asformat(format)
 
     def simplify(self):
         r"""Simplifies the Hamiltonian by combining like-terms.
@@ -24,6 +24,7 @@ from scipy.sparse import csr_matrix
 
 import pennylane as qml
 from pennylane.operation import AnyWires, Observable, Operation
+from pennylane.ops.eigendecompositions import eigen_cache, matrix_fingerprint
 from pennylane.wires import Wires
 
 from .matrix_ops import QubitUnitary
@@ -66,7 +67,7 @@ class Hermitian(Observable):
 
     # Qubit case
     _num_basis_states = 2
-    _eigs = {}
+    _eigs = eigen_cache
 
     def __init__(self, A, wires, id=None):
         A = np.array(A) if isinstance(A, list) else A
@@ -143,12 +144,8 @@ class Hermitian(Observable):
         """
         Hmat = self.matrix()
         Hmat = qml.math.to_numpy(Hmat)
-        Hkey = tuple(Hmat.flatten().tolist())
-        if Hkey not in Hermitian._eigs:
-            w, U = np.linalg.eigh(Hmat)
-            Hermitian._eigs[Hkey] = {"eigvec": U, "eigval": w}
-
-        return Hermitian._eigs[Hkey]
+        Hkey = ("eigh", matrix_fingerprint(Hmat))
+        return Hermitian._eigs.lookup(Hkey, lambda: np.linalg.eigh(Hmat))
 
     def eigvals(self):
         """Return the eigenvalues of the specified Hermitian observable.
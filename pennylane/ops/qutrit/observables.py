@@ -18,6 +18,7 @@ import numpy as np
 
 import pennylane as qml  # pylint: disable=unused-import
 from pennylane.operation import Observable
+from pennylane.ops.eigendecompositions import eigen_cache, matrix_fingerprint
 from pennylane.ops.qubit import Hermitian
 from pennylane.ops.qutrit import QutritUnitary
 
@@ -69,7 +70,7 @@ class THermitian(Hermitian):
 
     # Qutrit case
     _num_basis_states = 3
-    _eigs = {}
+    _eigs = eigen_cache
 
     # This method is overridden to update the docstring.
     @staticmethod
@@ -112,12 +113,8 @@ class THermitian(Hermitian):
         """
         Hmat = self.matrix()
         Hmat = qml.math.to_numpy(Hmat)
-        Hkey = tuple(Hmat.flatten().tolist())
-        if Hkey not in THermitian._eigs:
-            w, U = np.linalg.eigh(Hmat)
-            THermitian._eigs[Hkey] = {"eigvec": U, "eigval": w}
-
-        return THermitian._eigs[Hkey]
+        Hkey = ("eigh", matrix_fingerprint(Hmat))
+        return THermitian._eigs.lookup(Hkey, lambda: np.linalg.eigh(Hmat))
 
     @staticmethod
     def compute_diagonalizing_gates(eigenvectors, wires):  # pylint: disable=arguments-differ
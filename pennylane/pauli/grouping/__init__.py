@@ -16,6 +16,6 @@ This subpackage defines functions and classes for Pauli-word partitioning
 functionality used in measurement optimization.
 """
 
-from . import graph_colouring
+from . import graph_colouring, sparse_colouring
 from .group_observables import group_observables, PauliGroupingStrategy
 from .optimize_measurements import optimize_measurements
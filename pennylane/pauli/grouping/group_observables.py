@@ -15,14 +15,13 @@
 This module contains the high-level Pauli-word-partitioning functionality used in measurement optimization.
 """
 
-from copy import copy
+from collections import defaultdict, deque
 
 import numpy as np
 import pennylane as qml
 
 from pennylane.ops import Prod, SProd
 from pennylane.pauli.utils import (
-    are_identical_pauli_words,
     binary_to_pauli,
     observables_to_binary_matrix,
     qwc_complement_adj_matrix,
@@ -30,10 +29,21 @@ from pennylane.pauli.utils import (
 from pennylane.wires import Wires
 
 from .graph_colouring import largest_first, recursive_largest_first
+from .sparse_colouring import complement_adj_sparse, dsatur, greedy_insertion, sorted_insertion
 
 
 GROUPING_TYPES = frozenset(["qwc", "commuting", "anticommuting"])
-GRAPH_COLOURING_METHODS = {"lf": largest_first, "rlf": recursive_largest_first}
+GRAPH_COLOURING_METHODS = {
+    "lf": largest_first,
+    "rlf": recursive_largest_first,
+    "dsatur": dsatur,
+    "si": sorted_insertion,
+    "greedy": greedy_insertion,
+}
+SPARSE_GRAPH_METHODS = frozenset(["dsatur"])
+"""Colouring methods that work with a sparse adjacency matrix of the complement graph."""
+INSERTION_METHODS = frozenset(["si", "greedy"])
+"""Colouring methods that insert Pauli words into partitions without constructing the graph."""
 
 
 class PauliGroupingStrategy:  # pylint: disable=too-many-instance-attributes
@@ -60,15 +70,20 @@ class PauliGroupingStrategy:  # pylint: disable=too-many-instance-attributes
             the Pauli words, can be ``'qwc'`` (qubit-wise commuting), ``'commuting'``, or
             ``'anticommuting'``.
         graph_colourer (str): the heuristic algorithm to employ for graph
-            colouring, can be ``'lf'`` (Largest First) or ``'rlf'`` (Recursive
-            Largest First)
+            colouring, can be ``'lf'`` (Largest First), ``'rlf'`` (Recursive
+            Largest First), ``'dsatur'`` (DSATUR on a sparse complement graph),
+            ``'si'`` (Sorted Insertion) or ``'greedy'`` (first-fit insertion in the
+            order of ``observables``)
+        weights (array[float]): weights of the Pauli words, typically the coefficients of a
+            Hamiltonian, used by ``'si'`` to insert the Pauli words with the largest absolute
+            weights first
 
     Raises:
         ValueError: if arguments specified for ``grouping_type`` or
             ``graph_colourer`` are not recognized
     """
 
-    def __init__(self, observables, grouping_type="qwc", graph_colourer="rlf"):
+    def __init__(self, observables, grouping_type="qwc", graph_colourer="rlf", weights=None):
         if grouping_type.lower() not in GROUPING_TYPES:
             raise ValueError(
                 f"Grouping type must be one of: {GROUPING_TYPES}, instead got {grouping_type}."
@@ -83,12 +98,15 @@ class PauliGroupingStrategy:  # pylint: disable=too-many-instance-attributes
             )
 
         self.graph_colourer = GRAPH_COLOURING_METHODS[graph_colourer.lower()]
+        self._method = graph_colourer.lower()
         self.observables = observables
+        self.weights = weights
         self._wire_map = None
         self._n_qubits = None
         self.binary_observables = None
         self.adj_matrix = None
         self.grouped_paulis = None
+        self.grouped_binary_paulis = None
 
     def binary_repr(self, n_qubits=None, wire_map=None):
         """Converts the list of Pauli words to a binary matrix.
@@ -164,14 +182,29 @@ class PauliGroupingStrategy:  # pylint: disable=too-many-instance-attributes
             list of Pauli word ``Observable`` instances
         """
 
-        if self.adj_matrix is None:
-            self.adj_matrix = self.complement_adj_matrix_for_operator()
+        if self.binary_observables is None:
+            self.binary_observables = self.binary_repr()
+
+        if self._method in INSERTION_METHODS:
+            kwargs = {"weights": self.weights} if self._method == "si" else {}
+            coloured_binary_paulis = self.graph_colourer(
+                self.binary_observables, self.grouping_type, **kwargs
+            )
+
+        else:
+            if self.adj_matrix is None:
+                self.adj_matrix = (
+                    complement_adj_sparse(self.binary_observables, self.grouping_type)
+                    if self._method in SPARSE_GRAPH_METHODS
+                    else self.complement_adj_matrix_for_operator()
+                )
 
-        coloured_binary_paulis = self.graph_colourer(self.binary_observables, self.adj_matrix)
+            coloured_binary_paulis = self.graph_colourer(self.binary_observables, self.adj_matrix)
 
+        self.grouped_binary_paulis = list(coloured_binary_paulis.values())
         self.grouped_paulis = [
             [binary_to_pauli(pauli_word, wire_map=self._wire_map) for pauli_word in grouping]
-            for grouping in coloured_binary_paulis.values()
+            for grouping in self.grouped_binary_paulis
         ]
 
         return self.grouped_paulis
@@ -194,7 +227,11 @@ def group_observables(observables, coefficients=None, grouping_type="qwc", metho
         grouping_type (str): The type of binary relation between Pauli words.
             Can be ``'qwc'``, ``'commuting'``, or ``'anticommuting'``.
         method (str): the graph coloring heuristic to use in solving minimum clique cover, which
-            can be ``'lf'`` (Largest First) or ``'rlf'`` (Recursive Largest First)
+            can be ``'lf'`` (Largest First), ``'rlf'`` (Recursive Largest First), ``'dsatur'``
+            (DSATUR), ``'si'`` (Sorted Insertion, ordered by the absolute values of
+            ``coefficients``) or ``'greedy'`` (first-fit insertion in the order of
+            ``observables``). The last three methods scale to Hamiltonians with many terms,
+            see the usage details below.
 
     Returns:
        tuple:
@@ -219,6 +256,30 @@ def group_observables(observables, coefficients=None, grouping_type="qwc", metho
      [PauliY(wires=[0])]]
     >>> coeffs_groupings
     [[0.97, 4.21], [1.43]]
+
+    .. details::
+        :title: Usage Details
+
+        The ``'lf'`` and ``'rlf'`` methods construct the dense adjacency matrix of the complement
+        graph, and ``'rlf'`` repeatedly slices it, with a runtime cubic in the number of
+        observables. For observables with many terms, the following methods compare Pauli words
+        using bitwise operations on packed binary representations instead:
+
+        * ``'dsatur'`` stores the complement graph as a sparse matrix and colours it with the
+          DSATUR heuristic, which usually finds as few groups as ``'rlf'``.
+        * ``'si'`` never constructs the graph, and inserts each observable into the first
+          compatible group, starting with the largest absolute coefficients.
+        * ``'greedy'`` never constructs the graph either, and inserts the observables in the order
+          in which they are given.
+
+        >>> obs = [qml.PauliZ(0), qml.PauliX(0) @ qml.PauliX(1), qml.PauliZ(1), qml.PauliX(1)]
+        >>> coeffs = [0.1, 0.5, 0.3, 0.2]
+        >>> obs_groupings, coeffs_groupings = group_observables(obs, coeffs, 'qwc', 'si')
+        >>> obs_groupings
+        [[PauliX(wires=[0]) @ PauliX(wires=[1]), PauliX(wires=[1])],
+         [PauliZ(wires=[1]), PauliZ(wires=[0])]]
+        >>> coeffs_groupings
+        [[0.5, 0.2], [0.3, 0.1]]
     """
 
     if coefficients is not None:
@@ -227,8 +288,12 @@ def group_observables(observables, coefficients=None, grouping_type="qwc", metho
                 "The coefficients list must be the same length as the observables list."
             )
 
+    weights = None
+    if coefficients is not None and method.lower() == "si":
+        weights = np.abs(np.asarray(qml.math.unwrap(coefficients)))
+
     pauli_grouping = PauliGroupingStrategy(
-        observables, grouping_type=grouping_type, graph_colourer=method
+        observables, grouping_type=grouping_type, graph_colourer=method, weights=weights
     )
 
     temp_opmath = not qml.operation.active_new_opmath() and any(
@@ -250,20 +315,14 @@ def group_observables(observables, coefficients=None, grouping_type="qwc", metho
         qml.math.cast_like([0] * len(g), coefficients) for g in partitioned_paulis
     ]
 
-    observables = copy(observables)
-    # we cannot delete elements from the coefficients tensor, so we
-    # use a proxy list memorising the indices for this logic
-    coeff_indices = list(range(qml.math.shape(coefficients)[0]))
-    for i, partition in enumerate(partitioned_paulis):  # pylint:disable=too-many-nested-blocks
-        indices = []
-        for pauli_word in partition:
-            # find index of this pauli word in remaining original observables,
-            for ind, observable in enumerate(observables):
-                if are_identical_pauli_words(pauli_word, observable):
-                    indices.append(coeff_indices[ind])
-                    observables.pop(ind)
-                    coeff_indices.pop(ind)
-                    break
+    # map the binary representation of each observable to its positions in the input list,
+    # so that repeated Pauli words are assigned their coefficients in order
+    coeff_indices = defaultdict(deque)
+    for ind, binary_word in enumerate(pauli_grouping.binary_observables):
+        coeff_indices[binary_word.tobytes()].append(ind)
+
+    for i, partition in enumerate(pauli_grouping.grouped_binary_paulis):
+        indices = [coeff_indices[binary_word.tobytes()].popleft() for binary_word in partition]
 
         # add a tensor of coefficients to the grouped coefficients
         partitioned_coeffs[i] = qml.math.take(coefficients, indices, axis=0)
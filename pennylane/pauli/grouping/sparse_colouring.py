@@ -0,0 +1,364 @@
+# Copyright 2018-2024 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+A module for colouring Pauli graphs with many vertices.
+
+The Pauli words are stored as packed symplectic bit arrays, so that the binary relation between
+two Pauli words is evaluated with a few bitwise operations on 64-bit integers. The complement
+graph is stored as a sparse matrix, and the colouring heuristics avoid the dense adjacency matrix
+slicing of :func:`~.largest_first` and :func:`~.recursive_largest_first`.
+"""
+import heapq
+
+import numpy as np
+from scipy import sparse
+
+_BLOCK_SIZE = 2**22
+"""Maximal number of packed words compared at once when building the complement graph."""
+
+
+def pack_binary_observables(binary_observables):
+    """Pack the X and Z components of Pauli words in the binary vector representation into
+    arrays of 64-bit integers.
+
+    Args:
+        binary_observables (array[int]): a matrix whose rows are the Pauli words in the binary
+            vector representation
+
+    Returns:
+        tuple[array[uint64], array[uint64]]: The packed X and Z components. Both arrays have
+        one row per Pauli word and one column per block of 64 qubits.
+
+    **Example**
+
+    >>> binary_observables = np.array([[1, 0, 1, 1], [0, 1, 0, 1]])
+    >>> pack_binary_observables(binary_observables)
+    (array([[1], [2]], dtype=uint64), array([[3], [2]], dtype=uint64))
+    """
+    binary_observables = np.asarray(binary_observables, dtype=bool)
+    n_terms, n_bits = np.shape(binary_observables)
+    n_qubits = n_bits // 2
+    n_words = max(1, -(-n_qubits // 64))
+
+    def _pack(bits):
+        padded = np.zeros((n_terms, 64 * n_words), dtype=bool)
+        padded[:, :n_qubits] = bits
+        return np.packbits(padded, axis=1, bitorder="little").view("<u8")
+
+    return _pack(binary_observables[:, :n_qubits]), _pack(binary_observables[:, n_qubits:])
+
+
+_BYTE_PARITIES = np.array([bin(i).count("1") % 2 for i in range(256)], dtype=bool)
+"""The parities of the numbers of set bits of all bytes."""
+
+
+def packed_parity(words, axis=-1):
+    """Parity of the number of set bits of 64-bit integers, across an axis.
+
+    Args:
+        words (array[uint64]): the packed bits
+        axis (int or None): the axis whose integers are combined, or ``None`` for the parities of
+            every integer
+
+    Returns:
+        array[bool]: whether the numbers of set bits are odd
+
+    **Example**
+
+    >>> packed_parity(np.array([[1, 3], [7, 0]], dtype=np.uint64))
+    array([ True,  True])
+    >>> packed_parity(np.array([1, 3], dtype=np.uint64), axis=None)
+    array([ True, False])
+    """
+    v = np.asarray(words, dtype=np.uint64)
+    if axis is not None:
+        v = np.bitwise_xor.reduce(v, axis=axis)
+    for shift in (32, 16, 8):
+        v = v ^ (v >> np.uint64(shift))
+    return _BYTE_PARITIES[(v & np.uint64(255)).astype(np.uint8)]
+
+
+def masked_parities(values, masks):
+    """Parities of the number of set bits of ``values & mask`` for every mask, such as the
+    eigenvalues ``(-1) ** parity`` of diagonal Pauli words on basis states.
+
+    The values are combined with the masks in blocks, so that the memory used does not exceed the
+    size of the output by more than a constant.
+
+    Args:
+        values (array[uint64]): the values, e.g. indices of basis states
+        masks (array[uint64]): the masks, e.g. the wires of diagonal Pauli words as bit masks
+
+    Returns:
+        array[bool]: the parities, with shape ``(len(masks), len(values))``
+
+    **Example**
+
+    >>> masked_parities(np.array([0, 1, 3], dtype=np.uint64), np.array([1, 3], dtype=np.uint64))
+    array([[False,  True,  True],
+           [False,  True, False]])
+    """
+    values = np.asarray(values, dtype=np.uint64)
+    masks = np.asarray(masks, dtype=np.uint64)
+    parities = np.empty((len(masks), len(values)), dtype=bool)
+    block = max(1, _BLOCK_SIZE // max(1, len(values)))
+    for start in range(0, len(masks), block):
+        stop = start + block
+        parities[start:stop] = packed_parity(masks[start:stop, None] & values[None, :], axis=None)
+    return parities
+
+
+def _complement_relation(x, z, other_x, other_z, grouping_type):
+    """Whether or not packed Pauli words are connected in the complement graph, i.e. whether they
+    can *not* be measured in the same partition. Broadcasts over all but the last axis."""
+    if grouping_type == "qwc":
+        overlap = (x | z) & (other_x | other_z) & ((x ^ other_x) | (z ^ other_z))
+        return np.any(overlap, axis=-1)
+
+    anticommuting = packed_parity((x & other_z) ^ (z & other_x))
+    if grouping_type == "commuting":
+        return anticommuting
+    return ~anticommuting
+
+
+def complement_adj_sparse(binary_observables, grouping_type="qwc"):
+    """Construct the adjacency matrix of the complement of the Pauli graph as a sparse matrix.
+
+    The binary relation is evaluated on packed symplectic bit arrays, one block of Pauli words at a
+    time, so that the memory used never exceeds the size of the sparse output by more than a
+    constant.
+
+    Args:
+        binary_observables (array[int]): a matrix whose rows are the Pauli words in the binary
+            vector representation
+        grouping_type (str): the binary relation defining the Pauli graph, can be ``'qwc'``,
+            ``'commuting'`` or ``'anticommuting'``
+
+    Returns:
+        scipy.sparse.csr_matrix: the symmetric adjacency matrix of the complement graph
+
+    **Example**
+
+    >>> binary_observables = np.array([[1, 0, 1, 0], [0, 1, 1, 1], [0, 0, 0, 1]])
+    >>> complement_adj_sparse(binary_observables, "qwc").toarray()
+    array([[0, 1, 0],
+           [1, 0, 1],
+           [0, 1, 0]], dtype=int8)
+    """
+    x, z = pack_binary_observables(binary_observables)
+    n_terms, n_words = x.shape
+    block = max(1, _BLOCK_SIZE // max(1, n_terms * n_words))
+
+    rows, cols = [], []
+    for start in range(0, n_terms, block):
+        stop = min(start + block, n_terms)
+        edges = _complement_relation(
+            x[start:stop, np.newaxis], z[start:stop, np.newaxis], x, z, grouping_type
+        )
+        # Pauli words are never connected to themselves
+        edges[np.arange(stop - start), np.arange(start, stop)] = False
+        block_rows, block_cols = np.nonzero(edges)
+        rows.append(block_rows + start)
+        cols.append(block_cols)
+
+    rows = np.concatenate(rows) if rows else np.zeros(0, dtype=int)
+    cols = np.concatenate(cols) if cols else np.zeros(0, dtype=int)
+    data = np.ones(len(rows), dtype=np.int8)
+    return sparse.csr_matrix((data, (rows, cols)), shape=(n_terms, n_terms))
+
+
+def dsatur(binary_observables, adj):
+    r"""Performs graph-colouring using the DSATUR heuristic, which colours the vertex with the
+    largest number of differently coloured neighbours first. Runtime is
+    :math:`O((V + E) \log V)` for a graph with :math:`V` vertices and :math:`E` edges.
+
+    Args:
+        binary_observables (array[int]): the set of Pauli words represented by a column matrix
+            of the Pauli words in binary vector represenation
+        adj (array[int] or scipy.sparse.spmatrix): the adjacency matrix of the Pauli graph
+
+    Returns:
+        dict(int, list[array[int]]): keys correspond to colours (labelled by integers) and values
+        are lists of Pauli words of the same colour in binary vector representation
+
+    **Example**
+
+    >>> binary_observables = np.array([[1., 1., 0.],
+    ... [1., 0., 0.],
+    ... [0., 0., 1.],
+    ... [1., 0., 1.]])
+    >>> adj = np.array([[0., 0., 1.],
+    ... [0., 0., 1.],
+    ... [1., 1., 0.]])
+    >>> dsatur(binary_observables, adj)
+    {1: [array([0., 0., 1.])], 2: [array([1., 1., 0.]), array([1., 0., 0.])]}
+    """
+    adj = sparse.csr_matrix(adj)
+    n_terms = adj.shape[0]
+    indptr, indices = adj.indptr, adj.indices
+    degrees = np.diff(indptr)
+
+    c_vec = np.zeros(n_terms, dtype=int)
+    neighbour_colours = [set() for _ in range(n_terms)]
+    # entries are (-saturation, -degree, vertex); outdated entries are skipped when popped
+    queue = [(0, -degrees[v], v) for v in range(n_terms)]
+    heapq.heapify(queue)
+
+    while queue:
+        saturation, _, v = heapq.heappop(queue)
+        if c_vec[v] or -saturation != len(neighbour_colours[v]):
+            continue
+
+        colour = 1
+        while colour in neighbour_colours[v]:
+            colour += 1
+        c_vec[v] = colour
+
+        for u in indices[indptr[v] : indptr[v + 1]]:
+            if not c_vec[u] and colour not in neighbour_colours[u]:
+                neighbour_colours[u].add(colour)
+                heapq.heappush(queue, (-len(neighbour_colours[u]), -degrees[u], u))
+
+    colours = {}
+    for v in np.argsort(c_vec, kind="stable"):
+        colours.setdefault(c_vec[v], []).append(binary_observables[v])
+    return colours
+
+
+def greedy_insertion(binary_observables, grouping_type="qwc", order=None):
+    """Partitions Pauli words by inserting them one at a time into the first compatible
+    partition, opening a new partition if there is none.
+
+    Pauli words are streamed in the given order and the Pauli graph is never constructed. For
+    qubit-wise commutativity, each partition is summarized by the single Pauli word it acts as on
+    every qubit, so that a Pauli word is compared with all partitions at once, using one bitwise
+    operation per partition and block of 64 qubits.
+
+    Args:
+        binary_observables (array[int]): the set of Pauli words represented by a column matrix
+            of the Pauli words in binary vector represenation
+        grouping_type (str): the binary relation between Pauli words of the same partition, can be
+            ``'qwc'``, ``'commuting'`` or ``'anticommuting'``
+        order (Sequence[int]): the order in which Pauli words are inserted; defaults to the order
+            of ``binary_observables``
+
+    Returns:
+        dict(int, list[array[int]]): keys correspond to colours (labelled by integers) and values
+        are lists of Pauli words of the same colour in binary vector representation
+
+    **Example**
+
+    >>> binary_observables = np.array([[1, 0, 0, 0], [0, 0, 1, 1], [1, 0, 0, 1]])
+    >>> greedy_insertion(binary_observables, "qwc")
+    {1: [array([1, 0, 0, 0]), array([1, 0, 0, 1])], 2: [array([0, 0, 1, 1])]}
+    """
+    order = range(len(binary_observables)) if order is None else order
+    labels = insertion_labels(binary_observables, grouping_type, order)
+
+    colours = {}
+    for i in order:
+        colours.setdefault(labels[i], []).append(binary_observables[i])
+    return dict(sorted(colours.items()))
+
+
+def insertion_labels(binary_observables, grouping_type="qwc", order=None):
+    """The colours assigned to Pauli words by :func:`~.greedy_insertion`, as an array of indices,
+    for callers that partition the indices of Pauli words rather than the words themselves.
+
+    Args:
+        binary_observables (array[int]): the set of Pauli words represented by a column matrix
+            of the Pauli words in binary vector represenation
+        grouping_type (str): the binary relation between Pauli words of the same partition, can be
+            ``'qwc'``, ``'commuting'`` or ``'anticommuting'``
+        order (Sequence[int]): the order in which Pauli words are inserted; defaults to the order
+            of ``binary_observables``
+
+    Returns:
+        array[int]: the colour, starting at 1, of every Pauli word
+
+    **Example**
+
+    >>> binary_observables = np.array([[1, 0, 0, 0], [0, 0, 1, 1], [1, 0, 0, 1]])
+    >>> insertion_labels(binary_observables, "qwc", order=[1, 0, 2])
+    array([2, 1, 2])
+    """
+    x, z = pack_binary_observables(binary_observables)
+    n_terms, n_words = x.shape
+    order = range(n_terms) if order is None else order
+
+    labels = np.zeros(n_terms, dtype=int)
+    n_colours = 0
+
+    if grouping_type == "qwc":
+        # the Pauli word obtained by combining all the Pauli words of a partition
+        group_x = np.zeros((n_terms, n_words), dtype=np.uint64)
+        group_z = np.zeros((n_terms, n_words), dtype=np.uint64)
+
+    placed = np.zeros(n_terms, dtype=int)  # placed[:n_placed] are the inserted Pauli words
+
+    for n_placed, i in enumerate(order):
+        if grouping_type == "qwc":
+            conflicts = _complement_relation(
+                x[i], z[i], group_x[:n_colours], group_z[:n_colours], "qwc"
+            )
+        else:
+            members = placed[:n_placed]
+            edges = _complement_relation(x[i], z[i], x[members], z[members], grouping_type)
+            conflicts = np.zeros(n_colours, dtype=bool)
+            conflicts[labels[members[edges]] - 1] = True
+
+        free = np.flatnonzero(~conflicts)
+        if len(free):
+            colour = free[0] + 1
+        else:
+            n_colours += 1
+            colour = n_colours
+
+        labels[i] = colour
+        placed[n_placed] = i
+        if grouping_type == "qwc":
+            group_x[colour - 1] |= x[i]
+            group_z[colour - 1] |= z[i]
+
+    return labels
+
+
+def sorted_insertion(binary_observables, grouping_type="qwc", weights=None):
+    """Partitions Pauli words using the sorted insertion heuristic of
+    `Crawford et al. (2021) <https://doi.org/10.22331/q-2021-01-20-385>`__.
+
+    Pauli words are inserted with :func:`~.greedy_insertion` in decreasing order of their weights,
+    typically the absolute values of the coefficients of a Hamiltonian, which tends to reduce the
+    variance of the estimated expectation value.
+
+    Args:
+        binary_observables (array[int]): the set of Pauli words represented by a column matrix
+            of the Pauli words in binary vector represenation
+        grouping_type (str): the binary relation between Pauli words of the same partition, can be
+            ``'qwc'``, ``'commuting'`` or ``'anticommuting'``
+        weights (array[float]): The weights of the Pauli words. If ``None``, the Pauli words are
+            inserted in order.
+
+    Returns:
+        dict(int, list[array[int]]): keys correspond to colours (labelled by integers) and values
+        are lists of Pauli words of the same colour in binary vector representation
+
+    **Example**
+
+    >>> binary_observables = np.array([[1, 0, 0, 0], [0, 0, 1, 1], [1, 0, 0, 1]])
+    >>> sorted_insertion(binary_observables, "qwc", weights=[0.1, 0.5, 0.2])
+    {1: [array([0, 0, 1, 1])], 2: [array([1, 0, 0, 1]), array([1, 0, 0, 0])]}
+    """
+    order = None if weights is None else np.argsort(-np.abs(weights), kind="stable")
+    return greedy_insertion(binary_observables, grouping_type, order=order)
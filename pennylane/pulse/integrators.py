@@ -0,0 +1,204 @@
+# Copyright 2018-2024 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+This module contains the NumPy integrators of the Schrodinger equation of a
+:class:`~.ParametrizedHamiltonian`, which :class:`~.ParametrizedEvolution` uses instead of the
+``jax`` ODE solver when the ``method`` keyword argument is ``"pwc"`` or ``"magnus"``.
+"""
+import numpy as np
+import scipy.sparse
+from scipy.sparse.linalg import expm_multiply
+
+import pennylane as qml
+from pennylane.operation import SparseMatrixUndefinedError
+from pennylane.ops.eigendecompositions import EigenCache, matrix_fingerprint
+
+from .hardware_hamiltonian import HardwareHamiltonian
+
+METHODS = ("pwc", "magnus")
+"""tuple[str]: the integration methods that do not require ``jax``."""
+
+DEFAULT_NUM_STEPS = 100
+"""int: the default number of steps between two consecutive times of the evolution."""
+
+# Gauss-Legendre nodes and weights of the fourth-order commutator-free Magnus integrator
+# with two exponentials, see Alvermann and Fehske, J. Comput. Phys. 230, 5930 (2011)
+_MAGNUS_NODES = (0.5 - np.sqrt(3) / 6, 0.5 + np.sqrt(3) / 6)
+_MAGNUS_WEIGHTS = ((3 - 2 * np.sqrt(3)) / 12, (3 + 2 * np.sqrt(3)) / 12)
+
+
+def _dense_matrix(op, wire_order):
+    """The dense matrix of an operator."""
+    return np.asarray(qml.matrix(op, wire_order=wire_order), dtype=complex)
+
+
+def _sparse_matrix(op, wire_order):
+    """The sparse matrix of an operator, computed from its dense matrix if needed."""
+    try:
+        return scipy.sparse.csr_matrix(op.sparse_matrix(wire_order=wire_order))
+    except SparseMatrixUndefinedError:
+        return scipy.sparse.csr_matrix(qml.matrix(op, wire_order=wire_order))
+
+
+class _HamiltonianMatrices:
+    """The matrices of the terms of a :class:`~.ParametrizedHamiltonian` with fixed parameters,
+    from which the matrix of the Hamiltonian at any time is assembled. The coefficient of the fixed
+    term, if any, is always the first coefficient and is equal to one."""
+
+    def __init__(self, H, params, dense, wire_order):
+        self.has_fixed = len(H.ops_fixed) > 0
+        ops = [H.H_fixed()] if self.has_fixed else []
+        ops.extend(H.ops_parametrized)
+        make_matrix = _dense_matrix if dense else _sparse_matrix
+        self.mats = [make_matrix(op, wire_order) for op in ops]
+
+        if isinstance(H, HardwareHamiltonian):
+            params = H.reorder_fn(params, H.coeffs_parametrized)
+        self.coeffs_parametrized = H.coeffs_parametrized
+        self.params = params
+
+    def coefficients(self, t):
+        """The coefficients of the terms at time ``t``."""
+        coeffs = [f(p, t) for f, p in zip(self.coeffs_parametrized, self.params)]
+        if self.has_fixed:
+            coeffs.insert(0, 1.0)
+        return np.array(coeffs, dtype=float)
+
+    def __call__(self, coeffs):
+        """The matrix of the Hamiltonian with the given coefficients."""
+        return sum(c * mat for c, mat in zip(coeffs, self.mats))
+
+
+class _Exponential:
+    """Applies :math:`\\exp(-i\\,\\Delta t\\,H)` to states for Hamiltonians :math:`H` with
+    constant coefficients.
+
+    Dense Hamiltonians are diagonalized, and their eigendecompositions are stored by coefficients,
+    so that segments of the evolution with the same coefficients only diagonalize the Hamiltonian
+    once. Sparse Hamiltonians are exponentiated on the states with
+    :func:`scipy.sparse.linalg.expm_multiply`, without computing the matrix exponential."""
+
+    def __init__(self, matrices, dense):
+        self.matrices = matrices
+        self.dense = dense
+        self.eigen_cache = EigenCache()
+
+    def __call__(self, coeffs, dt, y):
+        if not self.dense:
+            return expm_multiply(-1j * dt * self.matrices(coeffs), y)
+
+        eig = self.eigen_cache.lookup(
+            matrix_fingerprint(coeffs), lambda: np.linalg.eigh(self.matrices(coeffs))
+        )
+        phases = np.exp(-1j * dt * eig["eigval"]).reshape((-1,) + (1,) * (y.ndim - 1))
+        return eig["eigvec"] @ (phases * (eig["eigvec"].conj().T @ y))
+
+
+def _pwc_steps(matrices, exponential, y, t0, t1, num_steps):
+    """Evolve ``y`` from ``t0`` to ``t1``, keeping the Hamiltonian constant within each step, at
+    its value in the middle of the step. Consecutive steps with the same coefficients are merged
+    into a single exponential."""
+    dt = (t1 - t0) / num_steps
+    coeffs = [matrices.coefficients(t0 + (k + 0.5) * dt) for k in range(num_steps)]
+
+    start = 0
+    for k in range(1, num_steps + 1):
+        if k == num_steps or not np.array_equal(coeffs[k], coeffs[start]):
+            y = exponential(coeffs[start], (k - start) * dt, y)
+            start = k
+    return y
+
+
+def _magnus_steps(matrices, exponential, y, t0, t1, num_steps):
+    """Evolve ``y`` from ``t0`` to ``t1`` with the fourth-order commutator-free Magnus integrator,
+    which evaluates the Hamiltonian at the two Gauss-Legendre nodes of each step."""
+    dt = (t1 - t0) / num_steps
+    (c1, c2), (a1, a2) = _MAGNUS_NODES, _MAGNUS_WEIGHTS
+    for k in range(num_steps):
+        h1 = matrices.coefficients(t0 + (k + c1) * dt)
+        h2 = matrices.coefficients(t0 + (k + c2) * dt)
+        y = exponential(a2 * h1 + a1 * h2, dt, y)
+        y = exponential(a1 * h1 + a2 * h2, dt, y)
+    return y
+
+
+_STEPS = {"pwc": _pwc_steps, "magnus": _magnus_steps}
+
+
+# pylint: disable=too-many-arguments
+def integrate(H, params, y0, t, method="pwc", num_steps=None, dense=True, wire_order=None):
+    r"""Solve the Schrodinger equation :math:`\frac{d}{dt}y(t) = -i H(\{v_j\}, t) y(t)` of a
+    :class:`~.ParametrizedHamiltonian` with NumPy and SciPy.
+
+    The interval between two consecutive times of ``t`` is divided into ``num_steps`` steps of
+    equal duration, over which the evolution is approximated by exponentials of the Hamiltonian:
+
+    * ``"pwc"``: the Hamiltonian is constant within each step, at its value in the middle of the
+      step. This is exact for piecewise-constant coefficients that only change at the boundaries
+      of the steps, such as :func:`~.pwc` coefficients whose bins are made of whole steps, and
+      second-order accurate in the step duration otherwise. Consecutive steps with the same
+      coefficients are evolved with a single exponential.
+
+    * ``"magnus"``: the fourth-order commutator-free Magnus integrator, which applies two
+      exponentials of combinations of the Hamiltonian at the Gauss-Legendre nodes of each step.
+      It is suited to smooth coefficients.
+
+    Dense Hamiltonians are exponentiated with their eigendecomposition, which is computed once
+    for all the steps with the same coefficients, and sparse Hamiltonians with
+    :func:`scipy.sparse.linalg.expm_multiply`.
+
+    Args:
+        H (ParametrizedHamiltonian): the Hamiltonian to evolve
+        params (list): the parameters of the scalar-valued functions of the Hamiltonian
+        y0 (array): initial state, or matrix whose columns are initial states
+        t (array[float]): times at which the solution is returned, starting with the initial time
+        method (str): the integration method, ``"pwc"`` or ``"magnus"``
+        num_steps (int): the number of steps between two consecutive times of ``t``.
+            Defaults to 100.
+        dense (bool): whether the matrices of the Hamiltonian are dense or sparse
+        wire_order (Iterable): the wire order of the matrices of the Hamiltonian
+
+    Returns:
+        array[complex]: the solutions at the times of ``t``, stacked along the first axis
+
+    Raises:
+        ValueError: if the method or the number of steps is not supported
+
+    **Example**
+
+    >>> H = qml.pulse.ParametrizedHamiltonian([lambda p, t: p * t], [qml.PauliX(0)])
+    >>> y = integrate(H, [0.5], np.array([1, 0]), [0.0, 2.0], method="magnus")
+    >>> np.round(y[-1], 4)
+    array([0.5403+0.j    , 0.    -0.8415j])
+    """
+    if method not in METHODS:
+        raise ValueError(
+            f"The integration method {method} is not supported. The supported methods are "
+            f"'odeint', which requires jax, and {', '.join(repr(m) for m in METHODS)}."
+        )
+    num_steps = DEFAULT_NUM_STEPS if num_steps is None else num_steps
+    if not isinstance(num_steps, (int, np.integer)) or num_steps < 1:
+        raise ValueError(f"The number of steps must be a positive integer, got {num_steps}.")
+
+    matrices = _HamiltonianMatrices(H, params, dense, wire_order)
+    exponential = _Exponential(matrices, dense)
+    steps = _STEPS[method]
+
+    t = np.asarray(t, dtype=float)
+    y = np.asarray(y0, dtype=complex)
+    solutions = [y]
+    for t0, t1 in zip(t[:-1], t[1:]):
+        y = steps(matrices, exponential, y, t0, t1, num_steps)
+        solutions.append(y)
+    return np.stack(solutions)
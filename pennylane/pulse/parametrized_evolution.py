@@ -18,16 +18,21 @@
 This file contains the ``ParametrizedEvolution`` operator.
 """
 
+from types import BuiltinFunctionType, CodeType, ModuleType
 from typing import List, Union, Sequence
 import warnings
 
+import numpy as np
+
 import pennylane as qml
 from pennylane.operation import AnyWires, Operation
+from pennylane.utils import stable_hash
 from pennylane.typing import TensorLike
 from pennylane.ops import functions
 
 from .parametrized_hamiltonian import ParametrizedHamiltonian
 from .hardware_hamiltonian import HardwareHamiltonian
+from .integrators import METHODS, integrate
 
 has_jax = True
 try:
@@ -39,6 +44,90 @@ try:
 except ImportError as e:
     has_jax = False
 
+_MAX_FINGERPRINT_DEPTH = 4
+_PLAIN_TYPES = (type(None), bool, int, float, complex, str)
+
+
+def _code_fingerprint(code):
+    """The instructions, constants and names of a code object."""
+    consts = tuple(
+        _code_fingerprint(c) if isinstance(c, CodeType) else repr(c) for c in code.co_consts
+    )
+    return code.co_name, code.co_code, consts, code.co_names
+
+
+def _fingerprint(value, depth=0):
+    """A fingerprint of a value that is the same in every process, such as the code of a function
+    and the values of its closure and of the globals it refers to. Values that cannot be
+    fingerprinted, or that are nested too deeply, are identified by their ``id``, so that their
+    fingerprint is only valid in the current process."""
+    # pylint: disable=too-many-return-statements
+    if isinstance(value, _PLAIN_TYPES):
+        return repr(value)
+    if depth > _MAX_FINGERPRINT_DEPTH:
+        return ("id", id(value))
+    if isinstance(value, (list, tuple)):
+        return tuple(_fingerprint(v, depth + 1) for v in value)
+    if isinstance(value, qml.operation.Operator):
+        return value.hash
+    if isinstance(value, ModuleType):
+        return ("module", value.__name__)
+    if isinstance(value, (type, BuiltinFunctionType, np.ufunc)):
+        return (getattr(value, "__module__", None), getattr(value, "__qualname__", value.__name__))
+
+    code = getattr(value, "__code__", None)
+    if isinstance(code, CodeType):
+        closure = []
+        for cell in value.__closure__ or ():
+            try:
+                closure.append(_fingerprint(cell.cell_contents, depth + 1))
+            except ValueError:  # empty cell
+                closure.append(None)
+        global_values = getattr(value, "__globals__", {})
+        referenced_globals = tuple(
+            _fingerprint(global_values[name], depth + 1)
+            for name in code.co_names
+            if name in global_values
+        )
+        return (
+            getattr(value, "__module__", None),
+            value.__qualname__,
+            _code_fingerprint(code),
+            _fingerprint(value.__defaults__, depth + 1),
+            tuple(closure),
+            referenced_globals,
+        )
+
+    if hasattr(value, "shape") and hasattr(value, "dtype"):
+        # arrays and tensors of any interface
+        if qml.math.is_abstract(value):
+            return ("id", id(value))
+        array = np.asarray(qml.math.unwrap(value))
+        if array.dtype != object:
+            return str(array.dtype), array.shape, array.tobytes()
+
+    if hasattr(value, "__dict__"):
+        # instances of callable classes, such as the coefficients of hardware Hamiltonians
+        return (
+            type(value).__module__,
+            type(value).__qualname__,
+            tuple((k, _fingerprint(v, depth + 1)) for k, v in sorted(vars(value).items())),
+        )
+    return ("id", id(value))
+
+
+def _hamiltonian_fingerprint(H):
+    """A fingerprint of a :class:`~.ParametrizedHamiltonian` that is the same in every process,
+    made of the hashes of its operators and the fingerprints of its coefficients."""
+    return (
+        type(H).__qualname__,
+        tuple(op.hash for op in H.ops_fixed),
+        _fingerprint(H.coeffs_fixed),
+        tuple(op.hash for op in H.ops_parametrized),
+        _fingerprint(H.coeffs_parametrized),
+        _fingerprint(getattr(H, "reorder_fn", None)),
+    )
+
 
 class ParametrizedEvolution(Operation):
     r"""
@@ -58,6 +147,8 @@ class ParametrizedEvolution(Operation):
 
     Under the hood, it is using a numerical ordinary differential equation (ODE) solver. It requires ``jax``,
     and will not work with other machine learning frameworks typically encountered in PennyLane.
+    Alternatively, the evolution can be computed with NumPy and SciPy by integrators that do not
+    require ``jax``, selected with the ``method`` keyword argument (see below).
 
     Args:
         H (ParametrizedHamiltonian): Hamiltonian to evolve
@@ -82,6 +173,16 @@ class ParametrizedEvolution(Operation):
         mxstep (int, optional): maximum number of steps to take for each timepoint for the
             ODE solver. Defaults to ``jnp.inf``.
         hmax (float, optional): maximum step size allowed for the ODE solver. Defaults to ``jnp.inf``.
+        method (str, optional): The integration method. Defaults to ``"odeint"``, the adaptive
+            ``jax`` ODE solver, which is differentiable. The methods ``"pwc"`` and ``"magnus"``
+            use NumPy and SciPy instead and are not differentiable: ``"pwc"`` keeps the
+            Hamiltonian constant within each step, which is exact for piecewise-constant
+            coefficients that only change at the boundaries of the steps, and ``"magnus"`` is
+            the fourth-order commutator-free Magnus integrator, suited to smooth coefficients.
+            See :func:`~.pulse.integrators.integrate` for details.
+        num_steps (int, optional): The number of steps between two consecutive times of ``t``
+            for the ``"pwc"`` and ``"magnus"`` methods. Defaults to ``100``. It is not supported
+            by the ``"odeint"`` method, which chooses its steps adaptively.
         return_intermediate (bool): Whether or not the ``matrix`` method returns all intermediate
             solutions of the time evolution at the times provided in ``t = [t_0,...,t_f]``.
             If ``False`` (the default), only the matrix for the full time evolution is returned.
@@ -96,7 +197,9 @@ class ParametrizedEvolution(Operation):
             If ``True``, the *remaining* time evolution to :math:`t_f` is computed instead, returning
             :math:`\{U(t_0, t_f), U(t_1, t_f),\dots, U(t_{f-1}, t_f), U(t_f, t_f)\}`.
         dense (bool): Whether the evolution should use dense matrices. Per default, this is decided by
-            the number of wires, i.e. ``dense = len(wires) < 3``.
+            the number of wires, i.e. ``dense = len(wires) < 3``. The ``"pwc"`` and ``"magnus"``
+            methods diagonalize dense Hamiltonians, and apply the exponentials of sparse
+            Hamiltonians with :func:`scipy.sparse.linalg.expm_multiply`.
 
     .. warning::
         The :class:`~.ParametrizedHamiltonian` must be Hermitian at all times. This is not explicitly checked
@@ -359,6 +462,38 @@ class ParametrizedEvolution(Operation):
         True
         True
 
+        **Evolving without jax**
+
+        The ``"pwc"`` and ``"magnus"`` methods compute the evolution with NumPy and SciPy, with
+        a fixed number ``num_steps`` of steps between consecutive times of ``t``. For
+        piecewise-constant coefficients, the ``"pwc"`` method is exact if the coefficients only
+        change at the boundaries of the steps, and the eigendecomposition of the Hamiltonian
+        is only computed once for the steps with the same coefficients:
+
+        .. code-block:: python
+
+            def amplitude(p, t):
+                return p[min(int(len(p) * t), len(p) - 1)]
+
+            H = qml.PauliZ(0) @ qml.PauliZ(1) + amplitude * qml.PauliX(0)
+            dev = qml.device("default.qubit")
+
+            @qml.qnode(dev)
+            def circuit(params):
+                qml.evolve(H)(params, t=1.0, method="pwc", num_steps=4)
+                return qml.expval(qml.PauliZ(0))
+
+        >>> circuit([np.array([0.5, 1.0, 0.0, 1.0])])
+        0.5456797016371232
+
+        For smooth coefficients, the ``"magnus"`` method converges with the fourth power of the
+        duration of the steps:
+
+        >>> H = qml.PauliZ(0) @ qml.PauliZ(1) + (lambda p, t: p * np.sin(np.pi * t) ** 2) * qml.PauliX(0)
+        >>> ev = qml.evolve(H)([1.5], t=1.0, method="magnus", num_steps=20)
+        >>> ev.matrix()[0, 0]
+        (0.328033406712019-0.6975685136341718j)
+
     """
 
     _name = "ParametrizedEvolution"
@@ -382,6 +517,18 @@ class ParametrizedEvolution(Operation):
             raise ValueError(
                 "All operators inside the parametrized hamiltonian must have a matrix defined."
             )
+        method = odeint_kwargs.get("method", "odeint")
+        if method != "odeint" and method not in METHODS:
+            raise ValueError(
+                f"The integration method {method} is not supported. The supported methods are "
+                f"'odeint', which requires jax, and {', '.join(repr(m) for m in METHODS)}."
+            )
+        if method == "odeint" and "num_steps" in odeint_kwargs:
+            raise ValueError(
+                "The number of steps num_steps is only supported by the integration methods "
+                f"{', '.join(repr(m) for m in METHODS)}. The 'odeint' method chooses its steps "
+                "adaptively, see the keyword arguments atol, rtol, mxstep and hmax."
+            )
         self._has_matrix = params is not None and t is not None
         self.H = H
         self.odeint_kwargs = odeint_kwargs
@@ -414,14 +561,16 @@ class ParametrizedEvolution(Operation):
     def __call__(
         self, params, t, return_intermediate=None, complementary=None, dense=None, **odeint_kwargs
     ):
-        if not has_jax:
-            raise ImportError(
-                "Module jax is required for the ``ParametrizedEvolution`` class. "
-                "You can install jax via: pip install jax"
-            )
-        # Need to cast all elements inside params to `jnp.arrays` to make sure they are not cast
-        # to `np.arrays` inside `Operator.__init__`
-        params = [jnp.array(p) for p in params]
+        odeint_kwargs = {**self.odeint_kwargs, **odeint_kwargs}
+        if odeint_kwargs.get("method", "odeint") == "odeint":
+            if not has_jax:
+                raise ImportError(
+                    "Module jax is required for the ``ParametrizedEvolution`` class. "
+                    "You can install jax via: pip install jax"
+                )
+            # Need to cast all elements inside params to `jnp.arrays` to make sure they are not
+            # cast to `np.arrays` inside `Operator.__init__`
+            params = [jnp.array(p) for p in params]
         # Inherit return_intermediate and complementary from self if not provided.
         if return_intermediate is None:
             return_intermediate = self.hyperparameters["return_intermediate"]
@@ -429,7 +578,6 @@ class ParametrizedEvolution(Operation):
             complementary = self.hyperparameters["complementary"]
         if dense is None:
             dense = self.dense
-        odeint_kwargs = {**self.odeint_kwargs, **odeint_kwargs}
         if qml.QueuingManager.recording():
             qml.QueuingManager.remove(self)
 
@@ -444,6 +592,11 @@ class ParametrizedEvolution(Operation):
             **odeint_kwargs,
         )
 
+    @property
+    def method(self) -> str:
+        """str: The method used to integrate the Schrodinger equation."""
+        return self.odeint_kwargs.get("method", "odeint")
+
     def _check_time_batching(self):
         """Check whether the time argument is broadcasted/batched."""
         if not self.hyperparameters["return_intermediate"] or self.t is None:
@@ -460,14 +613,14 @@ class ParametrizedEvolution(Operation):
     @property
     def hash(self):
         """int: Integer hash that uniquely represents the operator."""
-        return hash(
+        return stable_hash(
             (
                 str(self.name),
                 tuple(self.wires.tolist()),
                 str(self.hyperparameters.values()),
                 str(self.t),
                 str(self.data),
-                self.H,
+                _hamiltonian_fingerprint(self.H),
                 str(self.odeint_kwargs.values()),
             )
         )
@@ -508,7 +661,7 @@ class ParametrizedEvolution(Operation):
 
     # pylint: disable=import-outside-toplevel
     def matrix(self, wire_order=None):
-        if not has_jax:
+        if not has_jax and self.method == "odeint":
             raise ImportError(
                 "Module jax is required for the ``ParametrizedEvolution`` class. "
                 "You can install jax via: pip install jax"
@@ -518,18 +671,31 @@ class ParametrizedEvolution(Operation):
                 "The parameters and the time window are required to compute the matrix. "
                 "You can update its values by calling the class: EV(params, t)."
             )
-        y0 = jnp.eye(2 ** len(self.wires), dtype=complex)
+        if self.method == "odeint":
+            y0 = jnp.eye(2 ** len(self.wires), dtype=complex)
 
-        with jax.ensure_compile_time_eval():
-            H_jax = ParametrizedHamiltonianPytree.from_hamiltonian(
-                self.H, dense=self.dense, wire_order=self.wires
-            )
+            with jax.ensure_compile_time_eval():
+                H_jax = ParametrizedHamiltonianPytree.from_hamiltonian(
+                    self.H, dense=self.dense, wire_order=self.wires
+                )
 
-        def fun(y, t):
-            """dy/dt = -i H(t) y"""
-            return (-1j * H_jax(self.data, t=t)) @ y
+            def fun(y, t):
+                """dy/dt = -i H(t) y"""
+                return (-1j * H_jax(self.data, t=t)) @ y
 
-        mat = odeint(fun, y0, self.t, **self.odeint_kwargs)
+            odeint_kwargs = {k: v for k, v in self.odeint_kwargs.items() if k != "method"}
+            mat = odeint(fun, y0, self.t, **odeint_kwargs)
+        else:
+            mat = integrate(
+                self.H,
+                self.data,
+                np.eye(2 ** len(self.wires), dtype=complex),
+                self.t,
+                method=self.method,
+                num_steps=self.odeint_kwargs.get("num_steps"),
+                dense=self.dense,
+                wire_order=self.wires,
+            )
         if self.hyperparameters["return_intermediate"] and self.hyperparameters["complementary"]:
             # Compute U(t_0, t_f)@U(t_0, t_i)^\dagger, where i indexes the first axis of mat
             mat = qml.math.tensordot(mat[-1], qml.math.conj(mat), axes=[[1], [-1]])
@@ -275,12 +275,42 @@ def attraction_matrix(basis_functions, charges, r):
     return attraction
 
 
-def repulsion_tensor(basis_functions):
+def _pair_index(i, j):
+    r"""Return the compound index :math:`ij = i(i+1)/2 + j`, with :math:`i \geq j`, of a pair of
+    indices. Works elementwise on arrays of indices."""
+    high, low = np.maximum(i, j), np.minimum(i, j)
+    return high * (high + 1) // 2 + low
+
+
+def _schwarz_bound(integral):
+    r"""Return the Schwarz bound :math:`\sqrt{|(ij|ij)|}` of an integral :math:`(ij|ij)`, computed
+    from its unwrapped value, or ``inf`` if its value cannot be unwrapped, e.g. when it is traced by
+    JAX, such that the integrals it bounds are not screened."""
+    if qml.math.is_abstract(integral):
+        return np.inf
+    try:
+        return np.sqrt(np.abs(qml.math.toarray(integral)))
+    except ValueError:
+        return np.inf
+
+
+def repulsion_tensor(basis_functions, screening=None, packed=False):
     r"""Return a function that computes the electron repulsion tensor for a given set of basis
     functions.
 
+    Only the integrals :math:`(ij|kl)` that are unique under the eight-fold permutational symmetry
+    of the tensor are computed. Integrals can be skipped using the Schwarz inequality
+    :math:`|(ij|kl)| \leq \sqrt{(ij|ij)(kl|kl)}` by setting a ``screening`` threshold.
+
     Args:
         basis_functions (list[~qchem.basis_set.BasisFunction]): basis functions
+        screening (float): Integrals whose Schwarz upper bound is smaller than this value are not
+            computed and set to zero. If ``None``, all integrals are computed.
+        packed (bool): If ``True``, the function returns the one-dimensional array of unique
+            integrals instead of the full tensor. The integral :math:`(ij|kl)` is stored at position
+            :math:`pq(pq + 1)/2 + rs` with the compound indices :math:`pq = i(i+1)/2 + j` and
+            :math:`rs = k(k+1)/2 + l`, where :math:`i \geq j`, :math:`k \geq l` and
+            :math:`pq \geq rs`.
 
     Returns:
         function: function that computes the electron repulsion tensor
@@ -298,6 +328,8 @@ def repulsion_tensor(basis_functions):
             [[0.56886144, 0.45590152], [0.45590152, 0.56886144]]],
            [[[0.56886144, 0.45590152], [0.45590152, 0.56886144]],
             [[0.65017747, 0.56886144],[0.56886144, 0.77460595]]]])
+    >>> repulsion_tensor(mol.basis_set, packed=True)(*args)
+    array([0.77460595, 0.56886144, 0.45590152, 0.65017747, 0.56886144, 0.77460595])
     """
 
     def repulsion(*args):
@@ -313,33 +345,36 @@ def repulsion_tensor(basis_functions):
             array[array[float]]: the electron repulsion tensor
         """
         n = len(basis_functions)
-        tensor = qml.math.zeros((n, n, n, n))
-        e_calc = qml.math.full((n, n, n, n), np.nan)
-
-        for (i, a), (j, b), (k, c), (l, d) in it.product(enumerate(basis_functions), repeat=4):
-            if qml.math.isnan(e_calc[(i, j, k, l)]):
-                args_abcd = []
-                if args:
-                    args_abcd.extend([arg[i], arg[j], arg[k], arg[l]] for arg in args)
-                integral = repulsion_integral(a, b, c, d, normalize=False)(*args_abcd)
-
-                permutations = [
-                    (i, j, k, l),
-                    (k, l, i, j),
-                    (j, i, l, k),
-                    (l, k, j, i),
-                    (j, i, k, l),
-                    (l, k, i, j),
-                    (i, j, l, k),
-                    (k, l, j, i),
-                ]
-
-                o = qml.math.zeros((n, n, n, n))
-                for perm in permutations:
-                    o[perm] = 1.0
-                    e_calc[perm] = 1.0
-                tensor = tensor + integral * o
-        return tensor
+        pairs = [(i, j) for i in range(n) for j in range(i + 1)]
+
+        def integral(i, j, k, l):
+            args_ijkl = []
+            if args:
+                args_ijkl.extend([arg[i], arg[j], arg[k], arg[l]] for arg in args)
+            a, b, c, d = (basis_functions[idx] for idx in (i, j, k, l))
+            return repulsion_integral(a, b, c, d, normalize=False)(*args_ijkl)
+
+        # the (ij|ij) integrals are needed for the Schwarz bounds of all the other integrals
+        diagonal = [integral(i, j, i, j) for i, j in pairs]
+        if screening is not None:
+            bounds = [_schwarz_bound(d) for d in diagonal]
+
+        integrals = []
+        for pq, (i, j) in enumerate(pairs):
+            for rs, (k, l) in enumerate(pairs[:pq]):
+                if screening is not None and bounds[pq] * bounds[rs] < screening:
+                    integrals.append(qml.math.zeros_like(diagonal[pq]))
+                else:
+                    integrals.append(integral(i, j, k, l))
+            integrals.append(diagonal[pq])
+
+        integrals = qml.math.stack(integrals)
+        if packed:
+            return integrals
+
+        # scatter the unique integrals into all the symmetry-equivalent entries at once
+        ij = _pair_index(*np.indices((n, n)))
+        return integrals[_pair_index(ij[:, :, np.newaxis, np.newaxis], ij)]
 
     return repulsion
 
@@ -96,7 +96,13 @@ array(1.9242)
 There are more options for post-processing classical shadows in :class:`ClassicalShadow`.
 """
 
-from .classical_shadow import ClassicalShadow, median_of_means, pauli_expval
+from .classical_shadow import (
+    ClassicalShadow,
+    median_of_means,
+    pauli_expval,
+    pauli_expvals,
+    pauli_expvals_from_chunks,
+)
 
 # allow aliasing in the module namespace
 from .transforms import shadow_state, shadow_expval
@@ -19,6 +19,11 @@ from string import ascii_letters as ABC
 
 import numpy as np
 import pennylane as qml
+from pennylane.pauli.grouping.sparse_colouring import pack_binary_observables, packed_parity
+
+_MAX_CHUNK_ENTRIES = 2**16
+"""Maximal number of pairs of snapshots and Pauli words matched at once, such that the
+intermediate arrays fit in the processor caches."""
 
 
 class ClassicalShadow:
@@ -228,42 +233,7 @@ class ClassicalShadow:
             (T, 2**n, 2**n),
         )
 
-    def _convert_to_pauli_words(self, observable):
-        """Given an observable, obtain a list of coefficients and Pauli words, the
-        sum of which is equal to the observable"""
-
-        num_wires = self.bits.shape[1]
-        obs_to_recipe_map = {"PauliX": 0, "PauliY": 1, "PauliZ": 2, "Identity": -1}
-
-        def pauli_list_to_word(obs):
-            word = [-1] * num_wires
-            for ob in obs:
-                if ob.name not in obs_to_recipe_map:
-                    raise ValueError("Observable must be a linear combination of Pauli observables")
-
-                word[self.wire_map.index(ob.wires[0])] = obs_to_recipe_map[ob.name]
-
-            return word
-
-        if isinstance(observable, (qml.PauliX, qml.PauliY, qml.PauliZ, qml.Identity)):
-            word = pauli_list_to_word([observable])
-            return [(1, word)]
-
-        if isinstance(observable, qml.operation.Tensor):
-            word = pauli_list_to_word(observable.obs)
-            return [(1, word)]
-
-        # TODO: cases for new operator arithmetic
-
-        if isinstance(observable, qml.Hamiltonian):
-            coeffs_and_words = []
-            for coeff, op in zip(observable.data, observable.ops):
-                coeffs_and_words.extend(
-                    [(coeff * c, w) for c, w in self._convert_to_pauli_words(op)]
-                )
-            return coeffs_and_words
-
-    def expval(self, H, k=1):
+    def expval(self, H, k=1, block_size=None):
         r"""Compute expectation value of an observable :math:`H`.
 
         The canonical way of computing expectation values is to simply average the expectation values for each local snapshot, :math:`\langle O \rangle = \sum_t \text{tr}(\rho^{(t)}O) / T`.
@@ -276,6 +246,8 @@ class ClassicalShadow:
         Args:
             H (qml.Observable): Observable to compute the expectation value
             k (int): Number of equal parts to split the shadow's measurements to compute the median of means. ``k=1`` (default) corresponds to simply taking the mean over all measurements.
+            block_size (int): The number of Pauli words matched against the snapshots at once, see :func:`~.pauli_expvals`.
+                By default, all Pauli words of the observables are matched at once.
 
         Returns:
             float: expectation value estimate.
@@ -306,14 +278,51 @@ class ClassicalShadow:
         >>> shadow.expval(H, k=1)
         array(1.9980000000000002)
         """
+        return self.expval_from_chunks(
+            [(self.bits, self.recipes)],
+            self.snapshots,
+            H,
+            wire_map=self.wire_map,
+            k=k,
+            block_size=block_size,
+        )
+
+    @staticmethod
+    def expval_from_chunks(chunks, snapshots, H, wire_map, k=1, block_size=None):
+        r"""Compute expectation values of observables from a stream of chunks of snapshots,
+        without storing the snapshots, see :meth:`~.expval`.
+
+        Args:
+            chunks (Iterable[tuple[tensor, tensor]]): the bits and recipes of consecutive
+                snapshots, e.g. generated by
+                :meth:`~.pennylane.measurements.ClassicalShadowMP.process_state_in_chunks`
+            snapshots (int): the total number of snapshots of the chunks
+            H (qml.Observable): Observable to compute the expectation value
+            wire_map (list[int]): list of the measured wires in the order that
+                they appear in the columns of the bits and recipes
+            k (int): Number of equal parts to split the shadow's measurements to compute the median of means. ``k=1`` (default) corresponds to simply taking the mean over all measurements.
+            block_size (int): The number of Pauli words matched against the snapshots at once, see :func:`~.pauli_expvals`.
+                By default, all Pauli words of the observables are matched at once.
+
+        Returns:
+            float: expectation value estimate.
+
+        **Example**
+
+        >>> state = np.array([1, 0, 0, 1]).reshape(2, 2) / np.sqrt(2)
+        >>> mp = qml.classical_shadow(wires=[0, 1], seed=1)
+        >>> chunks = mp.process_state_in_chunks(state, qml.wires.Wires([0, 1]), 1000, chunk_size=100)
+        >>> H = qml.PauliZ(0) @ qml.PauliZ(1)
+        >>> qml.ClassicalShadow.expval_from_chunks(chunks, 1000, H, wire_map=[0, 1])
+        array(0.999)
+        """
         if not isinstance(H, Iterable):
             H = [H]
 
-        coeffs_and_words = [self._convert_to_pauli_words(h) for h in H]
-        expvals = pauli_expval(
-            self.bits, self.recipes, np.array([word for cw in coeffs_and_words for _, word in cw])
-        )
-        expvals = median_of_means(expvals, k, axis=0)
+        coeffs_and_words = [_convert_to_pauli_words(h, wire_map) for h in H]
+        words = np.reshape([word for cw in coeffs_and_words for _, word in cw], (-1, len(wire_map)))
+
+        expvals = pauli_expvals_from_chunks(chunks, words, snapshots, k=k, block_size=block_size)
         expvals = expvals * np.array([coeff for cw in coeffs_and_words for coeff, _ in cw])
 
         start = 0
@@ -465,6 +474,46 @@ def median_of_means(arr, num_batches, axis=0):
     return np.median(means, axis=axis)
 
 
+def _convert_to_pauli_words(observable, wire_map):
+    """Given an observable, obtain a list of coefficients and Pauli words, the
+    sum of which is equal to the observable"""
+
+    num_wires = len(wire_map)
+    obs_to_recipe_map = {"PauliX": 0, "PauliY": 1, "PauliZ": 2, "Identity": -1}
+    wire_positions = {w: i for i, w in enumerate(wire_map)}
+
+    def pauli_list_to_word(obs):
+        word = [-1] * num_wires
+        for ob in obs:
+            if ob.name not in obs_to_recipe_map:
+                raise ValueError("Observable must be a linear combination of Pauli observables")
+
+            word[wire_positions[ob.wires[0]]] = obs_to_recipe_map[ob.name]
+
+        return word
+
+    if isinstance(observable, (qml.PauliX, qml.PauliY, qml.PauliZ, qml.Identity)):
+        word = pauli_list_to_word([observable])
+        return [(1, word)]
+
+    if isinstance(observable, qml.operation.Tensor):
+        word = pauli_list_to_word(observable.obs)
+        return [(1, word)]
+
+    # TODO: cases for new operator arithmetic
+
+    if isinstance(observable, qml.Hamiltonian):
+        coeffs_and_words = []
+        for coeff, op in zip(observable.data, observable.ops):
+            if isinstance(op, qml.operation.Tensor):
+                coeffs_and_words.append((coeff, pauli_list_to_word(op.obs)))
+            else:
+                coeffs_and_words.extend(
+                    [(coeff * c, w) for c, w in _convert_to_pauli_words(op, wire_map)]
+                )
+        return coeffs_and_words
+
+
 def pauli_expval(bits, recipes, word):
     r"""
     The approximate expectation value of a Pauli word given the bits and recipes
@@ -526,3 +575,149 @@ def pauli_expval(bits, recipes, word):
         np.logical_not(id_mask), axis=1
     )
     return qml.math.cast(expvals, np.float64)
+
+
+def pauli_expvals(bits, recipes, words, k=1, block_size=None):
+    r"""
+    The approximate expectation values of many Pauli words given the bits and recipes
+    from a classical shadow measurement, estimated with the median of means.
+
+    The recipes and bits of the snapshots, as well as the Pauli words, are packed into bit
+    arrays with one bit per qubit. A snapshot matches a Pauli word if its measured bases agree
+    with the word on the support of the word, and the parity of its bits on the support of the
+    word determines the sign of its contribution, see :func:`~.pauli_expval`. The Pauli words
+    are processed in blocks of ``block_size`` words and the snapshots in chunks, so that the
+    intermediate arrays stay bounded in size.
+
+    Args:
+        bits (tensor-like[int]): An array with shape ``(T, n)``, where ``T`` is the
+            number of snapshots and ``n`` is the number of measured qubits. Each
+            entry must be either ``0`` or ``1`` depending on the sample for the
+            corresponding snapshot and qubit.
+        recipes (tensor-like[int]): An array with shape ``(T, n)``. Each entry
+            must be either ``0``, ``1``, or ``2`` depending on the selected Pauli
+            measurement for the corresponding snapshot and qubit. ``0`` corresponds
+            to PauliX, ``1`` to PauliY, and ``2`` to PauliZ.
+        words (tensor-like[int]): An array with shape ``(b, n)``. Each entry must be
+            either ``0``, ``1``, ``2``, or ``-1`` depending on the Pauli observable
+            on each qubit.
+        k (int): The number of equal parts to split the snapshots into to compute the
+            median of means. ``k=1`` (default) corresponds to the mean over all snapshots.
+        block_size (int): The number of Pauli words matched against the snapshots at once.
+            By default, all Pauli words are matched at once.
+
+    Returns:
+        array[float]: An array with shape ``(b,)`` containing the estimated expectation value
+        of every Pauli word.
+
+    **Example**
+
+    >>> bits = np.array([[0, 1], [1, 1], [0, 0]])
+    >>> recipes = np.array([[2, 2], [2, 0], [2, 2]])
+    >>> words = np.array([[2, -1], [2, 2], [0, 2]])
+    >>> pauli_expvals(bits, recipes, words)
+    array([1., 0., 0.])
+    """
+    recipes = np.asarray(qml.math.unwrap(recipes))
+    words = np.reshape(np.asarray(qml.math.unwrap(words)), (-1, recipes.shape[1]))
+    return pauli_expvals_from_chunks(
+        [(bits, recipes)], words, len(recipes), k=k, block_size=block_size
+    )
+
+
+def pauli_expvals_from_chunks(chunks, words, snapshots, k=1, block_size=None):
+    r"""
+    The approximate expectation values of many Pauli words given a stream of chunks of bits and
+    recipes from a classical shadow measurement, estimated with the median of means, see
+    :func:`~.pauli_expvals`.
+
+    The chunks are consumed one at a time and are not stored, so that the snapshots of a classical
+    shadow, such as the ones generated by
+    :meth:`~.pennylane.measurements.ClassicalShadowMP.process_state_in_chunks`, never need to be
+    held in memory at once.
+
+    Args:
+        chunks (Iterable[tuple[tensor-like[int], tensor-like[int]]]): The bits and recipes of
+            consecutive snapshots, each with shape ``(T_i, n)``. See :func:`~.pauli_expvals` for
+            the entries of the bits and recipes.
+        words (tensor-like[int]): An array with shape ``(b, n)``. Each entry must be
+            either ``0``, ``1``, ``2``, or ``-1`` depending on the Pauli observable
+            on each qubit.
+        snapshots (int): The total number of snapshots ``T`` of the chunks, which determines the
+            parts of the median of means.
+        k (int): The number of equal parts to split the snapshots into to compute the
+            median of means. ``k=1`` (default) corresponds to the mean over all snapshots.
+        block_size (int): The number of Pauli words matched against the snapshots at once.
+            By default, all Pauli words are matched at once.
+
+    Returns:
+        array[float]: An array with shape ``(b,)`` containing the estimated expectation value
+        of every Pauli word.
+
+    **Example**
+
+    >>> bits = np.array([[0, 1], [1, 1], [0, 0]])
+    >>> recipes = np.array([[2, 2], [2, 0], [2, 2]])
+    >>> words = np.array([[2, -1], [2, 2], [0, 2]])
+    >>> chunks = [(bits[:2], recipes[:2]), (bits[2:], recipes[2:])]
+    >>> pauli_expvals_from_chunks(chunks, words, snapshots=3)
+    array([1., 0., 0.])
+    """
+    words = np.asarray(qml.math.unwrap(words))
+    T = snapshots
+    b = len(words)
+    block_size = max(1, b if block_size is None else block_size)
+
+    # the bases are encoded by whether they have an X and a Z component, such that a snapshot
+    # matches a Pauli word if both components agree on the support of the word
+    word_x, word_z = pack_binary_observables(np.hstack([(words == 0) | (words == 1), words >= 1]))
+    support, _ = pack_binary_observables(np.hstack([words != -1] * 2))
+    weights = 3.0 ** np.count_nonzero(words != -1, axis=1)
+
+    # the snapshots are processed in chunks to bound the size of the intermediate
+    # (snapshots, words) arrays, and the sums of the values of the words are
+    # accumulated for each of the k batches of the median of means
+    batch_size = int(np.ceil(T / k))
+    chunk_size = max(1, _MAX_CHUNK_ENTRIES // min(block_size, max(b, 1)))
+    sums = np.zeros((k, b))
+    offset = 0
+    for bits, recipes in chunks:
+        bits = np.asarray(qml.math.unwrap(bits))
+        recipes = np.asarray(qml.math.unwrap(recipes))
+        for first_snapshot in range(0, len(recipes), chunk_size):
+            chunk = slice(first_snapshot, first_snapshot + chunk_size)
+            values = _pauli_values(bits[chunk], recipes[chunk], word_x, word_z, support, block_size)
+
+            start, stop = offset, offset + len(values)
+            for batch in range(start // batch_size, (stop - 1) // batch_size + 1):
+                lower = max(batch * batch_size, start) - start
+                upper = min((batch + 1) * batch_size, stop) - start
+                sums[batch] += np.sum(values[lower:upper], axis=0)
+            offset = stop
+
+    if offset != T:
+        raise ValueError(f"The chunks contain {offset} snapshots, but {T} snapshots were expected.")
+
+    sizes = [max(min((batch + 1) * batch_size, T) - batch * batch_size, 0) for batch in range(k)]
+    means = sums / np.reshape(sizes, (k, 1))
+    return np.median(means, axis=0) * weights
+
+
+def _pauli_values(bits, recipes, word_x, word_z, support, block_size):
+    """The values of packed Pauli words in the snapshots with the given bits and recipes, with
+    shape ``(len(bits), len(support))``. The values are ``0`` if a snapshot does not match a word,
+    and the sign of the measured eigenvalue of the word otherwise."""
+    snapshot_x, snapshot_z = pack_binary_observables(np.hstack([recipes != 2, recipes != 0]))
+    packed_bits, _ = pack_binary_observables(np.hstack([bits == 1] * 2))
+
+    b = len(support)
+    values = np.empty((len(bits), b), dtype=np.int8)
+    for first in range(0, b, block_size):
+        block = slice(first, min(first + block_size, b))
+        mismatches = (snapshot_x[:, None] ^ word_x[None, block]) | (
+            snapshot_z[:, None] ^ word_z[None, block]
+        )
+        matches = ~np.any(mismatches & support[None, block], axis=2)
+        odd = packed_parity(packed_bits[:, None] & support[None, block])
+        values[:, block] = matches * (1 - 2 * odd.astype(np.int8))
+    return values
@@ -31,6 +31,7 @@ from pennylane.measurements import (
 )
 from pennylane.typing import TensorLike
 from pennylane.operation import Observable, Operator, Operation, _UNSET_BATCH_SIZE
+from pennylane.utils import stable_hash
 from pennylane.pytrees import register_pytree
 from pennylane.queuing import AnnotatedQueue, process_queue
 from pennylane.wires import Wires
@@ -212,13 +213,18 @@ class QuantumScript:
 
     @property
     def hash(self):
-        """int: returns an integer hash uniquely representing the quantum script"""
+        """int: returns an integer hash uniquely representing the quantum script
+
+        The hash is the same in every process, and is computed from the memoized hashes of the
+        operations and measurements, so that only the operators that were created or modified since
+        the last call are hashed again.
+        """
         fingerprint = []
         fingerprint.extend(op.hash for op in self.operations)
         fingerprint.extend(m.hash for m in self.measurements)
         fingerprint.extend(self.trainable_params)
         fingerprint.extend(self.shots)
-        return hash(tuple(fingerprint))
+        return stable_hash(tuple(fingerprint))
 
     def __iter__(self):
         """list[.Operator, .MeasurementProcess]: Return an iterator to the
@@ -18,6 +18,7 @@ from copy import copy
 import pennylane as qml
 
 from pennylane.operation import Operation
+from pennylane.utils import stable_hash
 from pennylane.wires import Wires
 from pennylane.ops.op_math.symbolicop import SymbolicOp
 
@@ -91,7 +92,7 @@ class ControlledSequence(SymbolicOp, Operation):
 
     @property
     def hash(self):
-        return hash(
+        return stable_hash(
             (
                 str(self.name),
                 self.control,
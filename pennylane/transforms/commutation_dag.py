@@ -14,7 +14,6 @@
 """
 A transform to obtain the commutation DAG of a quantum circuit.
 """
-import heapq
 from collections import OrderedDict
 from functools import partial
 from typing import Sequence, Callable
@@ -29,7 +28,7 @@ from pennylane.transforms import transform
 
 
 @partial(transform, is_informative=True)
-def commutation_dag(tape: QuantumTape) -> (Sequence[QuantumTape], Callable):
+def commutation_dag(tape: QuantumTape, lookback=None) -> (Sequence[QuantumTape], Callable):
     r"""Construct the pairwise-commutation DAG (directed acyclic graph) representation of a quantum circuit.
 
     In the DAG, each node represents a quantum operation, and edges represent
@@ -40,6 +39,11 @@ def commutation_dag(tape: QuantumTape) -> (Sequence[QuantumTape], Callable):
 
     Args:
         tape (QNode or QuantumTape or Callable): The quantum circuit.
+        lookback (int): If provided, the commutation of an operation is only checked with the
+            ``lookback`` previous operations of the circuit, and earlier operations sharing a wire
+            with it are assumed not to commute with it. This bounds the cost of the construction
+            for large circuits. Defaults to ``None``, in which case all previous operations are
+            considered.
 
     Returns:
         qnode (QNode) or quantum function (Callable) or tuple[List[QuantumTape], function]:
@@ -101,32 +105,52 @@ def commutation_dag(tape: QuantumTape) -> (Sequence[QuantumTape], Callable):
     def processing_fn(res):
         """Processing function that returns the circuit as a commutation DAG."""
         # Initialize DAG
-        dag = CommutationDAG(res[0])
+        dag = CommutationDAG(res[0], lookback=lookback)
         return dag
 
     return [tape], processing_fn
 
 
-def _merge_no_duplicates(*iterables):
-    """Merge K list without duplicate using python heapq ordered merging.
+def _ids_to_bits(ids):
+    """Encode a collection of node IDs as a bitset.
 
     Args:
-        *iterables: A list of k sorted lists.
+        ids (Iterable[int]): IDs of nodes in the DAG.
 
-    Yields:
-        Iterator: List from the merging of the k ones (without duplicates).
+    Returns:
+        int: Integer whose ``i``-th bit is set if ``i`` is one of the IDs.
     """
-    last = object()
-    for val in heapq.merge(*iterables):
-        if val != last:
-            last = val
-            yield val
+    bits = 0
+    for node_id in ids:
+        bits |= 1 << node_id
+    return bits
+
+
+def _bits_to_ids(bits):
+    """Decode a bitset into the sorted list of node IDs it contains.
+
+    Args:
+        bits (int): Integer whose ``i``-th bit is set if the node ``i`` is in the set.
+
+    Returns:
+        list[int]: Sorted IDs of the nodes in the set.
+    """
+    reversed_bits = bin(bits)[:1:-1]
+    ids = []
+    index = reversed_bits.find("1")
+    while index != -1:
+        ids.append(index)
+        index = reversed_bits.find("1", index + 1)
+    return ids
 
 
 class CommutationDAGNode:
     r"""Class to store information about a quantum operation in a node of the
     commutation DAG.
 
+    The successors and predecessors of the node are stored as bitsets and decoded into lists of
+    node IDs when they are accessed.
+
     Args:
         op (.Operation): PennyLane operation.
         wires (.Wires): Wires on which the operation acts on.
@@ -146,8 +170,8 @@ class CommutationDAGNode:
         "target_wires",
         "control_wires",
         "node_id",
-        "successors",
-        "predecessors",
+        "successor_bits",
+        "predecessor_bits",
         "reachable",
     ]
 
@@ -172,21 +196,47 @@ class CommutationDAGNode:
         """Wires: The control wires of the operation."""
         self.node_id = node_id
         """int: The ID of the operation in the DAG."""
-        self.successors = successors if successors is not None else []
-        """list(int): List of the node's successors."""
-        self.predecessors = predecessors if predecessors is not None else []
-        """list(int): List of the node's predecessors."""
+        self.successor_bits = _ids_to_bits(successors or [])
+        """int: Bitset of the node's successors."""
+        self.predecessor_bits = _ids_to_bits(predecessors or [])
+        """int: Bitset of the node's predecessors."""
         self.reachable = reachable
         """bool: Useful attribute to create the commutation DAG."""
 
+    @property
+    def successors(self):
+        """list(int): List of the node's successors."""
+        return _bits_to_ids(self.successor_bits)
+
+    @successors.setter
+    def successors(self, successors):
+        self.successor_bits = _ids_to_bits(successors)
+
+    @property
+    def predecessors(self):
+        """list(int): List of the node's predecessors."""
+        return _bits_to_ids(self.predecessor_bits)
+
+    @predecessors.setter
+    def predecessors(self, predecessors):
+        self.predecessor_bits = _ids_to_bits(predecessors)
+
 
 class CommutationDAG:
     r"""Class to represent a quantum circuit as a directed acyclic graph (DAG). This class is useful to build the
     commutation DAG and set up all nodes attributes. The construction of the DAG should be used through the
     transform :class:`qml.transforms.commutation_dag`.
 
+    A new operation is only compared with the previous operations that share a wire with it and
+    that are not already among its predecessors. The results of the commutation checks are
+    memoized for pairs of operations that only differ by a relabeling of their wires.
+
     Args:
         tape (.QuantumTape): PennyLane quantum tape representing a quantum circuit.
+        lookback (int): If provided, the commutation of a new operation is only checked with the
+            ``lookback`` previous operations of the circuit. Earlier operations that share a wire
+            with it are assumed not to commute with it, which can only add edges to the DAG.
+            Defaults to ``None``, in which case all previous operations are considered.
 
     **Reference:**
 
@@ -196,10 +246,18 @@ class CommutationDAG:
 
     """
 
-    def __init__(self, tape: QuantumTape):
+    def __init__(self, tape: QuantumTape, lookback=None):
+        if lookback is not None and lookback < 0:
+            raise ValueError(f"The lookback must be a non-negative integer, got {lookback}.")
+
         self.num_wires = len(tape.wires)
         self.node_id = -1
+        self.lookback = lookback
         self._multi_graph = nx.MultiDiGraph()
+        self._wire_bits = {}
+        self._local_hashes = []
+        self._commutation_cache = {}
+        self._successors_added = False
 
         consecutive_wires = Wires(range(len(tape.wires)))
         wires_map = OrderedDict(zip(tape.wires, consecutive_wires))
@@ -209,6 +267,7 @@ class CommutationDAG:
             self.add_node(operation)
 
         self._add_successors()
+        self._successors_added = True
 
         self.observables = [qml.map_wires(obs, wire_map=wires_map) for obs in tape.observables]
 
@@ -237,6 +296,10 @@ class CommutationDAG:
         self._add_node(new_node)
         self._update_edges()
 
+        if self._successors_added:
+            for pred_id in new_node.predecessors:
+                self.get_node(pred_id).successor_bits |= 1 << new_node.node_id
+
     def get_node(self, node_id):
         """Add the operation as a node in the DAG and updates the edges.
 
@@ -246,7 +309,7 @@ class CommutationDAG:
         Returns:
             CommutationDAGNOde: The node with the given id.
         """
-        return self._multi_graph.nodes(data="node")[node_id]
+        return self._multi_graph.nodes[node_id]["node"]
 
     def get_nodes(self):
         """Return iterable to loop through all the nodes in the DAG.
@@ -310,9 +373,7 @@ class CommutationDAG:
         Returns:
             list[int]: List of the predecessors of the given node.
         """
-        pred = list(nx.ancestors(self._multi_graph, node_id))
-        pred.sort()
-        return pred
+        return self.get_node(node_id).predecessors
 
     def direct_successors(self, node_id):
         """Return the direct successors of the given node.
@@ -336,9 +397,7 @@ class CommutationDAG:
         Returns:
             list[int]: List of the successors of the given node.
         """
-        succ = list(nx.descendants(self._multi_graph, node_id))
-        succ.sort()
-        return succ
+        return self.get_node(node_id).successors
 
     @property
     def graph(self):
@@ -390,42 +449,65 @@ class CommutationDAG:
         dot = to_pydot(draw_graph)
         dot.write_png(filename)
 
-    def _pred_update(self, node_id):
-        self.get_node(node_id).predecessors = []
-
-        for d_pred in self.direct_predecessors(node_id):
-            self.get_node(node_id).predecessors.append([d_pred])
-            self.get_node(node_id).predecessors.append(self.get_node(d_pred).predecessors)
-
-        self.get_node(node_id).predecessors = list(
-            _merge_no_duplicates(*self.get_node(node_id).predecessors)
-        )
-
     def _add_successors(self):
         for node_id in range(len(self._multi_graph) - 1, -1, -1):
-            direct_successors = self.direct_successors(node_id)
-
-            for d_succ in direct_successors:
-                self.get_node(node_id).successors.append([d_succ])
-                self.get_node(node_id).successors.append(self.get_node(d_succ).successors)
-
-            self.get_node(node_id).successors = list(
-                _merge_no_duplicates(*self.get_node(node_id).successors)
-            )
+            node = self.get_node(node_id)
+            for d_succ in self._multi_graph.succ[node_id]:
+                node.successor_bits |= (1 << d_succ) | self.get_node(d_succ).successor_bits
+
+    def _local_hash(self, node_id):
+        """Hash of the operation of a node with its wires relabeled as ``0, 1, ...``."""
+        while len(self._local_hashes) <= node_id:
+            node = self.get_node(len(self._local_hashes))
+            local_wires = dict(zip(node.wires, range(len(node.wires))))
+            with qml.QueuingManager.stop_recording():
+                self._local_hashes.append(qml.map_wires(node.op, local_wires).hash)
+        return self._local_hashes[node_id]
+
+    def _is_commuting(self, node_id_1, node_id_2):
+        """Memoized commutation check between the operations of two nodes.
+
+        The result of ``qml.is_commuting`` only depends on the operations up to a relabeling of
+        their wires, and on which wires they share. It is therefore cached with a key made of the
+        hashes of the operations acting on the wires ``0, 1, ...`` and of the positions of the
+        wires of the first operation in the wires of the second one.
+        """
+        node_1 = self.get_node(node_id_1)
+        node_2 = self.get_node(node_id_2)
+        positions = {w: i for i, w in enumerate(node_2.wires)}
+        key = (
+            self._local_hash(node_id_1),
+            self._local_hash(node_id_2),
+            tuple(positions.get(w, -1) for w in node_1.wires),
+        )
+        if key not in self._commutation_cache:
+            self._commutation_cache[key] = qml.is_commuting(node_1.op, node_2.op)
+        return self._commutation_cache[key]
 
     def _update_edges(self):
         max_node_id = len(self._multi_graph) - 1
-        max_node = self.get_node(max_node_id).op
+        max_node = self.get_node(max_node_id)
 
-        for current_node_id in range(0, max_node_id):
-            self.get_node(current_node_id).reachable = True
+        # Operations on disjoint wires commute, hence only the previous operations sharing a wire
+        # with the new one are candidates for an edge
+        candidates = 0
+        for wire in max_node.wires:
+            candidates |= self._wire_bits.get(wire, 0)
 
-        for prev_node_id in range(max_node_id - 1, -1, -1):
-            if self.get_node(prev_node_id).reachable and not qml.is_commuting(
-                self.get_node(prev_node_id).op, max_node
-            ):
+        while candidates:
+            prev_node_id = candidates.bit_length() - 1
+            candidates ^= 1 << prev_node_id
+
+            out_of_lookback = (
+                self.lookback is not None and max_node_id - prev_node_id > self.lookback
+            )
+            if out_of_lookback or not self._is_commuting(prev_node_id, max_node_id):
                 self.add_edge(prev_node_id, max_node_id)
-                self._pred_update(max_node_id)
-                list_predecessors = self.get_node(max_node_id).predecessors
-                for pred_id in list_predecessors:
-                    self.get_node(pred_id).reachable = False
+                max_node.predecessor_bits |= (1 << prev_node_id) | self.get_node(
+                    prev_node_id
+                ).predecessor_bits
+                # The predecessors of the new node are not reachable by pairwise commutation
+                candidates &= ~max_node.predecessor_bits
+
+        for wire in max_node.wires:
+            self._wire_bits[wire] = self._wire_bits.get(wire, 0) | (1 << max_node_id)
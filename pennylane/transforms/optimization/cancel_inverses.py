@@ -25,7 +25,7 @@ from pennylane.ops.qubit.attributes import (
     symmetric_over_all_wires,
     symmetric_over_control_wires,
 )
-from .optimization_utils import find_next_gate
+from .optimization_utils import LinkedCircuit
 
 
 def _ops_equal(op1, op2):
@@ -142,44 +142,38 @@ def cancel_inverses(tape: QuantumTape) -> (Sequence[QuantumTape], Callable):
         2: ──RX(1.00)──RX(2.00)─╰X─┤
 
     """
-    # Make a working copy of the list to traverse
-    list_copy = tape.operations.copy()
-    operations = []
-
-    while len(list_copy) > 0:
-        current_gate = list_copy[0]
-        list_copy.pop(0)
+    circuit = LinkedCircuit(tape.operations)
 
+    for node in circuit:
         # Find the next gate that acts on at least one of the same wires
-        next_gate_idx = find_next_gate(current_gate.wires, list_copy)
+        next_node = circuit.next_gate(node)
 
-        # If no such gate is found queue the operation and move on
-        if next_gate_idx is None:
-            operations.append(current_gate)
+        # If no such gate is found keep the operation and move on
+        if next_node is None:
             continue
 
-        # Otherwise, get the next gate
-        next_gate = list_copy[next_gate_idx]
+        current_gate, next_gate = node.op, next_node.op
 
         # If either of the two flags is true, we can potentially cancel the gates
         if _are_inverses(current_gate, next_gate):
             # If the wires are the same, then we can safely remove both
             if current_gate.wires == next_gate.wires:
-                list_copy.pop(next_gate_idx)
+                circuit.remove(node)
+                circuit.remove(next_node)
                 continue
             # If wires are not equal, there are two things that can happen.
             # 1. There is not full overlap in the wires; we cannot cancel
             if len(Wires.shared_wires([current_gate.wires, next_gate.wires])) != len(
                 current_gate.wires
             ):
-                operations.append(current_gate)
                 continue
 
             # 2. There is full overlap, but the wires are in a different order.
             # If the wires are in a different order, gates that are "symmetric"
             # over all wires (e.g., CZ), can be cancelled.
             if current_gate in symmetric_over_all_wires:
-                list_copy.pop(next_gate_idx)
+                circuit.remove(node)
+                circuit.remove(next_node)
                 continue
             # For other gates, as long as the control wires are the same, we can still
             # cancel (e.g., the Toffoli gate).
@@ -189,15 +183,15 @@ def cancel_inverses(tape: QuantumTape) -> (Sequence[QuantumTape], Callable):
                     len(Wires.shared_wires([current_gate.wires[:-1], next_gate.wires[:-1]]))
                     == len(current_gate.wires) - 1
                 ):
-                    list_copy.pop(next_gate_idx)
+                    circuit.remove(node)
+                    circuit.remove(next_node)
                     continue
-        # Apply gate any cases where
+        # Keep the gate in any cases where
         # - there is no wire symmetry
         # - the control wire symmetry does not apply because the control wires are not the same
         # - neither of the flags are_self_inverses and are_inverses are true
-        operations.append(current_gate)
-        continue
 
+    operations = circuit.operations
     new_tape = type(tape)(operations, tape.measurements, shots=tape.shots)
 
     def null_postprocessing(results):
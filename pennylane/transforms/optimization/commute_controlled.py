@@ -18,138 +18,94 @@ from pennylane.tape import QuantumTape
 from pennylane.transforms import transform
 from pennylane.wires import Wires
 
-from .optimization_utils import find_next_gate
+from .optimization_utils import LinkedCircuit
 
 
-def _commute_controlled_right(op_list):
+def _can_commute(current_gate, other_gate):
+    """Checks whether a single-qubit gate can be pushed through another gate acting on its
+    wire."""
+    # Only go ahead if information is available
+    if other_gate.basis is None:
+        return False
+
+    # If the other gate does not have control_wires defined, it is not
+    # controlled so we can't push through.
+    if len(other_gate.control_wires) == 0:
+        return False
+
+    shared_controls = Wires.shared_wires([Wires(current_gate.wires), other_gate.control_wires])
+
+    # Case 1: overlap is on the control wires. Only Z-type gates go through
+    if len(shared_controls) > 0:
+        return current_gate.basis == "Z"
+
+    # Case 2: since we know the gates overlap somewhere, and it's a
+    # single-qubit gate, if it wasn't on a control it's the target.
+    return current_gate.basis == other_gate.basis
+
+
+def _commute_controlled_right(circuit):
     """Push commuting single qubit gates to the right of controlled gates.
 
     Args:
-        op_list (list[Operation]): The initial list of operations.
+        circuit (LinkedCircuit): The circuit, which is modified in place.
 
     Returns:
-        list[Operation]: The modified list of operations with all single-qubit
-        gates as far right as possible.
+        LinkedCircuit: The modified circuit with all single-qubit gates as far right as possible.
     """
-    # We will go through the list backwards; whenever we find a single-qubit
-    # gate, we will extract it and push it through 2-qubit gates as far as
-    # possible to the right.
-    current_location = len(op_list) - 1
-
-    while current_location >= 0:
-        current_gate = op_list[current_location]
+    # We will go through the circuit backwards; whenever we find a single-qubit
+    # gate, we will push it through 2-qubit gates as far as possible to the right.
+    for node in reversed(circuit):
+        current_gate = node.op
 
         # We are looking only at the gates that can be pushed through
         # controls/targets; these are single-qubit gates with the basis
         # property specified.
         if current_gate.basis is None or len(current_gate.wires) != 1:
-            current_location -= 1
             continue
 
-        # Find the next gate that contains an overlapping wire
-        next_gate_idx = find_next_gate(current_gate.wires, op_list[current_location + 1 :])
-
-        new_location = current_location
-
-        # Loop as long as a valid next gate exists
-        while next_gate_idx is not None:
-            next_gate = op_list[new_location + next_gate_idx + 1]
-
-            # Only go ahead if information is available
-            if next_gate.basis is None:
-                break
-
-            # If the next gate does not have control_wires defined, it is not
-            # controlled so we can't push through.
-            if len(next_gate.control_wires) == 0:
-                break
-            shared_controls = Wires.shared_wires(
-                [Wires(current_gate.wires), next_gate.control_wires]
-            )
-
-            # Case 1: overlap is on the control wires. Only Z-type gates go through
-            if len(shared_controls) > 0:
-                if current_gate.basis == "Z":
-                    new_location += next_gate_idx + 1
-                else:
-                    break
-
-            # Case 2: since we know the gates overlap somewhere, and it's a
-            # single-qubit gate, if it wasn't on a control it's the target.
-            else:
-                if current_gate.basis == next_gate.basis:
-                    new_location += next_gate_idx + 1
-                else:
-                    break
-
-            next_gate_idx = find_next_gate(current_gate.wires, op_list[new_location + 1 :])
+        # Find the next gate that contains an overlapping wire, and push the gate through
+        # as long as possible
+        new_location = None
+        next_node = circuit.next_gate(node)
+        while next_node is not None and _can_commute(current_gate, next_node.op):
+            new_location = next_node
+            next_node = circuit.next_gate(new_location, current_gate.wires)
 
         # After we have gone as far as possible, move the gate to new location
-        op_list.insert(new_location + 1, current_gate)
-        op_list.pop(current_location)
-        current_location -= 1
+        if new_location is not None:
+            circuit.move_after(node, new_location)
 
-    return op_list
+    return circuit
 
 
-def _commute_controlled_left(op_list):
+def _commute_controlled_left(circuit):
     """Push commuting single qubit gates to the left of controlled gates.
 
     Args:
-        op_list (list[Operation]): The initial list of operations.
+        circuit (LinkedCircuit): The circuit, which is modified in place.
 
     Returns:
-        list[Operation]: The modified list of operations with all single-qubit
-        gates as far left as possible.
+        LinkedCircuit: The modified circuit with all single-qubit gates as far left as possible.
     """
-    # We will go through the list forwards; whenever we find a single-qubit
-    # gate, we will extract it and push it through 2-qubit gates as far as
-    # possible back to the left.
-    current_location = 0
-
-    while current_location < len(op_list):
-        current_gate = op_list[current_location]
+    # We will go through the circuit forwards; whenever we find a single-qubit
+    # gate, we will push it through 2-qubit gates as far as possible back to the left.
+    for node in circuit:
+        current_gate = node.op
 
         if current_gate.basis is None or len(current_gate.wires) != 1:
-            current_location += 1
             continue
 
-        # Pass a backwards copy of the list
-        prev_gate_idx = find_next_gate(current_gate.wires, op_list[:current_location][::-1])
-
-        new_location = current_location
-
-        while prev_gate_idx is not None:
-            prev_gate = op_list[new_location - prev_gate_idx - 1]
-
-            if prev_gate.basis is None:
-                break
-
-            if len(prev_gate.control_wires) == 0:
-                break
-            shared_controls = Wires.shared_wires(
-                [Wires(current_gate.wires), prev_gate.control_wires]
-            )
-
-            if len(shared_controls) > 0:
-                if current_gate.basis == "Z":
-                    new_location = new_location - prev_gate_idx - 1
-                else:
-                    break
-
-            else:
-                if current_gate.basis == prev_gate.basis:
-                    new_location = new_location - prev_gate_idx - 1
-                else:
-                    break
-
-            prev_gate_idx = find_next_gate(current_gate.wires, op_list[:new_location][::-1])
+        new_location = None
+        prev_node = circuit.previous_gate(node)
+        while prev_node is not None and _can_commute(current_gate, prev_node.op):
+            new_location = prev_node
+            prev_node = circuit.previous_gate(new_location, current_gate.wires)
 
-        op_list.pop(current_location)
-        op_list.insert(new_location, current_gate)
-        current_location += 1
+        if new_location is not None:
+            circuit.move_before(node, new_location)
 
-    return op_list
+    return circuit
 
 
 @transform
@@ -245,12 +201,13 @@ def commute_controlled(tape: QuantumTape, direction="right") -> (Sequence[Quantu
     if direction not in ("left", "right"):
         raise ValueError("Direction for commute_controlled must be 'left' or 'right'")
 
+    circuit = LinkedCircuit(tape.operations)
     if direction == "right":
-        op_list = _commute_controlled_right(tape.operations)
+        circuit = _commute_controlled_right(circuit)
     else:
-        op_list = _commute_controlled_left(tape.operations)
+        circuit = _commute_controlled_left(circuit)
 
-    new_tape = type(tape)(op_list, tape.measurements, shots=tape.shots)
+    new_tape = type(tape)(circuit.operations, tape.measurements, shots=tape.shots)
 
     def null_postprocessing(results):
         """A postprocesing function returned by a transform that only converts the batch of results
@@ -22,7 +22,7 @@ from pennylane.queuing import QueuingManager
 
 from pennylane.ops.qubit.attributes import composable_rotations
 from pennylane.ops.op_math import Adjoint
-from .optimization_utils import find_next_gate, fuse_rot_angles
+from .optimization_utils import LinkedCircuit, fuse_rot_angles
 
 
 @transform
@@ -118,46 +118,40 @@ def merge_rotations(
     """
     # Expand away adjoint ops
     expanded_tape = tape.expand(stop_at=lambda obj: not isinstance(obj, Adjoint))
-    list_copy = expanded_tape.operations
-    new_operations = []
-    while len(list_copy) > 0:
-        current_gate = list_copy[0]
+    circuit = LinkedCircuit(expanded_tape.operations)
+
+    for node in circuit:
+        current_gate = node.op
 
         # If a specific list of operations is specified, check and see if our
-        # op is in it, then try to merge. If not, queue and move on.
+        # op is in it, then try to merge. If not, keep it and move on.
         if include_gates is not None:
             if current_gate.name not in include_gates:
-                new_operations.append(current_gate)
-                list_copy.pop(0)
                 continue
 
         # Check if the rotation is composable; if it is not, move on.
         if not current_gate in composable_rotations:
-            new_operations.append(current_gate)
-            list_copy.pop(0)
             continue
 
         # Find the next gate that acts on the same wires
-        next_gate_idx = find_next_gate(current_gate.wires, list_copy[1:])
+        next_node = circuit.next_gate(node)
 
         # If no such gate is found (either there simply is none, or there are other gates
-        # "in the way", queue the operation and move on
-        if next_gate_idx is None:
-            new_operations.append(current_gate)
-            list_copy.pop(0)
+        # "in the way", keep the operation and move on
+        if next_node is None:
             continue
 
         # We need to use stack to get this to work and be differentiable in all interfaces
         cumulative_angles = stack(current_gate.parameters)
         interface = get_interface(cumulative_angles)
         # As long as there is a valid next gate, check if we can merge the angles
-        while next_gate_idx is not None:
+        while next_node is not None:
             # Get the next gate
-            next_gate = list_copy[next_gate_idx + 1]
+            next_gate = next_node.op
 
             # If next gate is of the same type, we can merge the angles
             if current_gate.name == next_gate.name and current_gate.wires == next_gate.wires:
-                list_copy.pop(next_gate_idx + 1)
+                circuit.remove(next_node)
                 # The Rot gate must be treated separately
                 if current_gate.name == "Rot":
                     if is_abstract(cumulative_angles):
@@ -184,26 +178,22 @@ def merge_rotations(
                 break
 
             # If we did merge, look now at the next gate
-            next_gate_idx = find_next_gate(current_gate.wires, list_copy[1:])
+            next_node = circuit.next_gate(node)
 
         # If we are tracing/jitting, don't perform any conditional checks and
         # apply the operation regardless of the angles. Otherwise, only apply if
         # the rotation angle is non-trivial.
-        if is_abstract(cumulative_angles):
+        if is_abstract(cumulative_angles) or not allclose(
+            cumulative_angles, zeros(len(cumulative_angles)), atol=atol, rtol=0
+        ):
             with QueuingManager.stop_recording():
-                new_operations.append(
-                    current_gate.__class__(*cumulative_angles, wires=current_gate.wires)
+                circuit.replace(
+                    node, current_gate.__class__(*cumulative_angles, wires=current_gate.wires)
                 )
         else:
-            if not allclose(cumulative_angles, zeros(len(cumulative_angles)), atol=atol, rtol=0):
-                with QueuingManager.stop_recording():
-                    new_operations.append(
-                        current_gate.__class__(*cumulative_angles, wires=current_gate.wires)
-                    )
-
-        # Remove the first gate from the working list
-        list_copy.pop(0)
+            circuit.remove(node)
 
+    new_operations = circuit.operations
     new_tape = type(tape)(new_operations, tape.measurements, shots=tape.shots)
 
     def null_postprocessing(results):
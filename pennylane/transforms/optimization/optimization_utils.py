@@ -47,6 +47,215 @@ def find_next_gate(wires, op_list):
     return next_gate_idx
 
 
+class _GateNode:
+    """An operation of a :class:`~.LinkedCircuit`, with links to its neighbours in the circuit
+    and on each of its wires."""
+
+    __slots__ = ("op", "label", "prev", "next", "wire_prev", "wire_next", "removed")
+
+    def __init__(self, op, label):
+        self.op = op
+        self.label = label
+        self.prev = None
+        self.next = None
+        self.wire_prev = {}
+        self.wire_next = {}
+        self.removed = False
+
+
+class LinkedCircuit:
+    """A sequence of operations in which every operation is linked to the previous and next
+    operations of the circuit, and to the previous and next operations acting on each of its
+    wires.
+
+    Finding the next or previous gate on some wires, removing or replacing a gate and moving a
+    gate along its wires take constant time, instead of a scan over the remaining operations as
+    with :func:`~.find_next_gate`. Every node carries a label that increases along the circuit,
+    such that the earliest of the next gates on several wires is found by comparing labels.
+
+    Args:
+        operations (Iterable[Operation]): the operations of the circuit, in order
+
+    **Example**
+
+    >>> circuit = LinkedCircuit([qml.Hadamard(0), qml.RX(0.1, 1), qml.CNOT([0, 1])])
+    >>> first = next(iter(circuit))
+    >>> circuit.next_gate(first).op
+    CNOT(wires=[0, 1])
+    >>> circuit.remove(first)
+    >>> circuit.operations
+    [RX(0.1, wires=[1]), CNOT(wires=[0, 1])]
+    """
+
+    _LABEL_GAP = 2**32
+
+    def __init__(self, operations):
+        self._head = None
+        self._tail = None
+        wire_tails = {}
+        for op in operations:
+            node = _GateNode(op, 0)
+            self._link_after(node, self._tail)
+            for wire in op.wires:
+                if (prev_node := wire_tails.get(wire)) is not None:
+                    prev_node.wire_next[wire] = node
+                    node.wire_prev[wire] = prev_node
+                wire_tails[wire] = node
+
+    @property
+    def operations(self):
+        """list[Operation]: the operations of the circuit, in order"""
+        return [node.op for node in self]
+
+    def __iter__(self):
+        """Iterates over the nodes of the circuit. The current node may be moved before the
+        following one is reached, and any node may be removed."""
+        node = self._head
+        while node is not None:
+            following = node.next
+            yield node
+            while following is not None and following.removed:
+                following = following.next
+            node = following
+
+    def __reversed__(self):
+        """Iterates over the nodes of the circuit in reverse order. The current node may be moved
+        after the preceding one is reached, and any node may be removed."""
+        node = self._tail
+        while node is not None:
+            preceding = node.prev
+            yield node
+            while preceding is not None and preceding.removed:
+                preceding = preceding.prev
+            node = preceding
+
+    def next_gate(self, node, wires=None):
+        """Finds the earliest node after ``node`` that acts on at least one of ``wires``.
+
+        Args:
+            node (_GateNode): the node to start from
+            wires (Wires or None): the wires to consider, by default those of ``node``, which
+                must all be wires of ``node``
+
+        Returns:
+            _GateNode or None: the next node, or ``None`` if there is no such node
+        """
+        wires = node.op.wires if wires is None else wires
+        candidates = [n for w in wires if (n := node.wire_next.get(w)) is not None]
+        return min(candidates, key=lambda n: n.label, default=None)
+
+    def previous_gate(self, node, wires=None):
+        """Finds the latest node before ``node`` that acts on at least one of ``wires``.
+
+        Args:
+            node (_GateNode): the node to start from
+            wires (Wires or None): the wires to consider, by default those of ``node``, which
+                must all be wires of ``node``
+
+        Returns:
+            _GateNode or None: the previous node, or ``None`` if there is no such node
+        """
+        wires = node.op.wires if wires is None else wires
+        candidates = [n for w in wires if (n := node.wire_prev.get(w)) is not None]
+        return max(candidates, key=lambda n: n.label, default=None)
+
+    def remove(self, node):
+        """Removes a node from the circuit. The removed node keeps its links to its former
+        neighbours in the circuit, such that iterations over the circuit can continue past it."""
+        self._unlink(node)
+        node.removed = True
+
+    @staticmethod
+    def replace(node, op):
+        """Replaces the operation of a node by an operation acting on the same wires."""
+        node.op = op
+
+    def move_after(self, node, target):
+        """Moves a node right after ``target``, in the circuit and on each of its wires, which
+        must all be wires of ``target``."""
+        self._unlink(node)
+        self._link_after(node, target)
+        for wire in node.op.wires:
+            following = target.wire_next.get(wire)
+            self._link_wire(target, node, wire)
+            self._link_wire(node, following, wire)
+
+    def move_before(self, node, target):
+        """Moves a node right before ``target``, in the circuit and on each of its wires, which
+        must all be wires of ``target``."""
+        self._unlink(node)
+        self._link_after(node, target.prev)
+        for wire in node.op.wires:
+            preceding = target.wire_prev.get(wire)
+            self._link_wire(preceding, node, wire)
+            self._link_wire(node, target, wire)
+
+    @staticmethod
+    def _link_wire(first, second, wire):
+        """Links two nodes on a wire, either of which may be ``None``."""
+        if first is not None:
+            if second is None:
+                first.wire_next.pop(wire, None)
+            else:
+                first.wire_next[wire] = second
+        if second is not None:
+            if first is None:
+                second.wire_prev.pop(wire, None)
+            else:
+                second.wire_prev[wire] = first
+
+    def _unlink(self, node):
+        """Removes a node from the circuit and from its wires, without changing its own links."""
+        if node.prev is None:
+            self._head = node.next
+        else:
+            node.prev.next = node.next
+        if node.next is None:
+            self._tail = node.prev
+        else:
+            node.next.prev = node.prev
+
+        for wire in node.op.wires:
+            preceding, following = node.wire_prev.get(wire), node.wire_next.get(wire)
+            if preceding is not None:
+                self._link_wire(preceding, following, wire)
+            elif following is not None:
+                following.wire_prev.pop(wire, None)
+
+    def _link_after(self, node, preceding):
+        """Inserts a node after ``preceding`` in the circuit, or first if it is ``None``, with a
+        label between the labels of its new neighbours."""
+        following = self._head if preceding is None else preceding.next
+        node.prev, node.next = preceding, following
+        if preceding is None:
+            self._head = node
+        else:
+            preceding.next = node
+        if following is None:
+            self._tail = node
+        else:
+            following.prev = node
+
+        low = preceding.label if preceding is not None else None
+        high = following.label if following is not None else None
+        if low is None and high is None:
+            node.label = 0
+        elif high is None:
+            node.label = low + self._LABEL_GAP
+        elif low is None:
+            node.label = high - self._LABEL_GAP
+        elif high - low > 1:
+            node.label = (low + high) // 2
+        else:
+            self._relabel()
+
+    def _relabel(self):
+        """Spreads the labels of all nodes evenly, once there is no gap left between two of
+        them."""
+        for i, node in enumerate(self):
+            node.label = i * self._LABEL_GAP
+
+
 def _zyz_to_quat(angles):
     """Converts a set of Euler angles in ZYZ format to a quaternion."""
     qw = cos(angles[1] / 2) * cos(0.5 * (angles[0] + angles[2]))
@@ -21,7 +21,7 @@ from pennylane.ops.qubit import Rot
 from pennylane.math import allclose, stack, is_abstract
 from pennylane.queuing import QueuingManager
 
-from .optimization_utils import find_next_gate, fuse_rot_angles
+from .optimization_utils import LinkedCircuit, fuse_rot_angles
 
 
 @transform
@@ -97,50 +97,40 @@ def single_qubit_fusion(
         0: ──Rot(3.57, 2.09, 2.05)──┤ ⟨X⟩
 
     """
-    # Make a working copy of the list to traverse
-    list_copy = tape.operations.copy()
-    new_operations = []
-    while len(list_copy) > 0:
-        current_gate = list_copy[0]
+    circuit = LinkedCircuit(tape.operations)
 
-        # If the gate should be excluded, queue it and move on regardless
+    for node in circuit:
+        current_gate = node.op
+
+        # If the gate should be excluded, keep it and move on regardless
         # of fusion potential
         if exclude_gates is not None:
             if current_gate.name in exclude_gates:
-                new_operations.append(current_gate)
-                list_copy.pop(0)
                 continue
 
-        # Look for single_qubit_rot_angles; if not available, queue and move on.
+        # Look for single_qubit_rot_angles; if not available, keep it and move on.
         # If available, grab the angles and try to fuse.
         try:
             cumulative_angles = stack(current_gate.single_qubit_rot_angles())
         except (NotImplementedError, AttributeError):
-            new_operations.append(current_gate)
-            list_copy.pop(0)
             continue
 
         # Find the next gate that acts on the same wires
-        next_gate_idx = find_next_gate(current_gate.wires, list_copy[1:])
+        next_node = circuit.next_gate(node)
 
-        if next_gate_idx is None:
-            new_operations.append(current_gate)
-            list_copy.pop(0)
+        if next_node is None:
             continue
 
         # Before entering the loop, we check to make sure the next gate is not in the
         # exclusion list. If it is, we should apply the original gate as-is, and not the
         # Rot version (example in test test_single_qubit_fusion_exclude_gates).
         if exclude_gates is not None:
-            next_gate = list_copy[next_gate_idx + 1]
-            if next_gate.name in exclude_gates:
-                new_operations.append(current_gate)
-                list_copy.pop(0)
+            if next_node.op.name in exclude_gates:
                 continue
 
         # Loop as long as a valid next gate exists
-        while next_gate_idx is not None:
-            next_gate = list_copy[next_gate_idx + 1]
+        while next_node is not None:
+            next_gate = next_node.op
 
             # Check first if the next gate is in the exclusion list
             if exclude_gates is not None:
@@ -148,8 +138,8 @@ def single_qubit_fusion(
                     break
 
             # Try to extract the angles; since the Rot angles are implemented
-            # solely for single-qubit gates, and we used find_next_gate to obtain
-            # the gate in question, only valid single-qubit gates on the same
+            # solely for single-qubit gates, and we used the next gate on the wires
+            # of the current gate, only valid single-qubit gates on the same
             # wire as the current gate will be fused.
             try:
                 next_gate_angles = stack(next_gate.single_qubit_rot_angles())
@@ -158,29 +148,25 @@ def single_qubit_fusion(
 
             cumulative_angles = fuse_rot_angles(cumulative_angles, stack(next_gate_angles))
 
-            list_copy.pop(next_gate_idx + 1)
-            next_gate_idx = find_next_gate(current_gate.wires, list_copy[1:])
+            circuit.remove(next_node)
+            next_node = circuit.next_gate(node)
 
         # If we are tracing/jitting, don't perform any conditional checks and
         # apply the rotation regardless of the angles.
-        if is_abstract(cumulative_angles):
-            with QueuingManager.stop_recording():
-                new_operations.append(Rot(*cumulative_angles, wires=current_gate.wires))
         # If not tracing, check whether all angles are 0 (or equivalently, if the RY
         # angle is close to 0, and so is the sum of the RZ angles
+        if is_abstract(cumulative_angles) or not allclose(
+            stack([cumulative_angles[0] + cumulative_angles[2], cumulative_angles[1]]),
+            [0.0, 0.0],
+            atol=atol,
+            rtol=0,
+        ):
+            with QueuingManager.stop_recording():
+                circuit.replace(node, Rot(*cumulative_angles, wires=current_gate.wires))
         else:
-            if not allclose(
-                stack([cumulative_angles[0] + cumulative_angles[2], cumulative_angles[1]]),
-                [0.0, 0.0],
-                atol=atol,
-                rtol=0,
-            ):
-                with QueuingManager.stop_recording():
-                    new_operations.append(Rot(*cumulative_angles, wires=current_gate.wires))
-
-        # Remove the starting gate from the list
-        list_copy.pop(0)
+            circuit.remove(node)
 
+    new_operations = circuit.operations
     new_tape = type(tape)(new_operations, tape.measurements, shots=tape.shots)
 
     def null_postprocessing(results):
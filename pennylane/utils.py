@@ -16,10 +16,13 @@ This module contains utilities and auxiliary functions which are shared
 across the PennyLane submodules.
 """
 # pylint: disable=protected-access,too-many-branches
+from collections import OrderedDict, namedtuple
 from collections.abc import Iterable
 import functools
+import hashlib
 import inspect
 import numbers
+import threading
 
 
 import numpy as np
@@ -138,6 +141,117 @@ def _get_default_args(func):
     }
 
 
+def stable_hash(fingerprint):
+    """Integer hash of a fingerprint made of strings, numbers and tuples.
+
+    Unlike the built-in ``hash``, the result does not depend on the hash randomization of the
+    interpreter, so that the same fingerprint has the same hash in every process. It is used
+    for the ``hash`` of operators, measurements and tapes.
+
+    Args:
+        fingerprint (tuple or str or int or float): the value to hash, whose ``repr`` must not
+            contain memory addresses
+
+    Returns:
+        int: a signed 64-bit integer hash of the fingerprint
+
+    **Example**
+
+    >>> stable_hash(("RX", (0,), "0.5"))
+    3046295540432575607
+    """
+    digest = hashlib.blake2b(repr(fingerprint).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little", signed=True)
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+"""Statistics of an :class:`~.LRUCache`, in the format of ``functools.lru_cache``."""
+
+
+class LRUCache:
+    """A thread-safe least recently used cache, bounded in number of entries.
+
+    It is the base of the caches shared by the PennyLane submodules, such as the cache of the
+    eigendecompositions of observables, ``qml.ops.eigen_cache``, and the cache of the
+    decompositions of operators, ``qml.devices.preprocess.decomposition_cache``. Subclasses can
+    bound the entries further by extending :meth:`_exceeds_limits`, and are notified of the
+    discarded entries by :meth:`_discard`.
+
+    Args:
+        maxsize (int): the maximal number of entries stored in the cache
+
+    **Example**
+
+    >>> cache = qml.utils.LRUCache(maxsize=2)
+    >>> cache["a"], cache["b"] = 1, 2
+    >>> _ = cache["a"]
+    >>> cache["c"] = 3
+    >>> "b" in cache
+    False
+    >>> cache.cache_info()
+    CacheInfo(hits=0, misses=0, maxsize=2, currsize=2)
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+        self._maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        """The maximal number of entries stored in the cache."""
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value: int):
+        with self._lock:
+            self._maxsize = value
+            self._evict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __getitem__(self, key):
+        with self._lock:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def _exceeds_limits(self) -> bool:
+        """Whether the cache holds more entries than its limits allow."""
+        return len(self._entries) > self._maxsize
+
+    def _discard(self, key):
+        """Called with the key of every entry removed from the cache, other than by :meth:`clear`."""
+
+    def _evict(self):
+        """Discard the least recently used entries until the cache is within its limits."""
+        while self._entries and self._exceeds_limits():
+            key, _ = self._entries.popitem(last=False)
+            self._discard(key)
+
+    def clear(self):
+        """Discard every entry and reset the statistics of the cache."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        """Return the numbers of hits and misses, and the current size and limit of the cache."""
+        return CacheInfo(self.hits, self.misses, self._maxsize, len(self._entries))
+
+
 @functools.lru_cache()
 def pauli_eigs(n):
     r"""Eigenvalues for :math:`A^{\otimes n}`, where :math:`A` is
@@ -24,6 +24,7 @@ Execution functions and utilities
 
     ~execute
     ~workflow.cache_execute
+    ~workflow.PersistentCache
     ~workflow.set_shots
     ~workflow.construct_batch
     ~workflow.get_transform_program
@@ -56,5 +57,6 @@ Jacobian Product Calculation
 """
 from .set_shots import set_shots
 from .execution import execute, cache_execute, SUPPORTED_INTERFACES, INTERFACE_MAP
+from .persistent_cache import PersistentCache
 from .qnode import QNode, qnode
 from .construct_batch import construct_batch, get_transform_program
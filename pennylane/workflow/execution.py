@@ -36,6 +36,7 @@ import pennylane as qml
 from pennylane.tape import QuantumTape
 from pennylane.typing import ResultBatch
 
+from .persistent_cache import PersistentCache
 from .set_shots import set_shots
 from .jacobian_products import (
     TransformJacobianProducts,
@@ -84,6 +85,8 @@ INTERFACE_MAP = {
 SUPPORTED_INTERFACES = list(INTERFACE_MAP)
 """list[str]: allowed interface strings"""
 
+_MISSING = object()
+
 
 def _adjoint_jacobian_expansion(
     tapes: Sequence[QuantumTape], grad_on_execution: bool, interface: str, max_expansion: int
@@ -261,6 +264,9 @@ def _make_inner_execute(
     else:
         device_execution = partial(device.execute, execution_config=execution_config)
 
+    if isinstance(cache, PersistentCache):
+        cache = cache.for_device(device, override_shots)
+
     cached_device_execution = qml.workflow.cache_execute(
         device_execution, cache, return_tuple=False
     )
@@ -308,7 +314,9 @@ def cache_execute(fn: Callable, cache, pass_kwargs=False, return_tuple=True, exp
             and it should return ``list[tensor_like]``, with the
             same length as the input ``tapes``.
         cache (None or dict or Cache or bool): The cache to use. If ``None``,
-            caching will not occur.
+            caching will not occur. If the cache has a ``tracker`` attribute, like the
+            :class:`~.PersistentCache`, the numbers of hits and misses of every batch are
+            reported to it as ``cache_hits`` and ``cache_misses``.
         pass_kwargs (bool): If ``True``, keyword arguments passed to the
             wrapped function will be passed directly to ``fn``. If ``False``,
             they will be ignored.
@@ -362,24 +370,28 @@ def cache_execute(fn: Callable, cache, pass_kwargs=False, return_tuple=True, exp
         execution_tapes = {}
         cached_results = {}
         hashes = {}
+        first_occurrences = {}
         repeated = {}
 
         for i, tape in enumerate(tapes):
             h = tape.hash
 
-            if h in hashes.values():
-                # Tape already exists within ``tapes``. Determine the
-                # index of the first occurrence of the tape, store this,
-                # and continue to the next iteration.
-                idx = list(hashes.keys())[list(hashes.values()).index(h)]
-                repeated[i] = idx
+            if h in first_occurrences:
+                # Tape already exists within ``tapes``. Store the index of
+                # the first occurrence of the tape, and continue to the
+                # next iteration.
+                repeated[i] = first_occurrences[h]
                 continue
 
             hashes[i] = h
+            first_occurrences[h] = i
 
-            if hashes[i] in cache:
+            # a single lookup, as the entries of a cache shared between processes can be
+            # evicted in between two lookups
+            cached_result = cache.get(hashes[i], _MISSING)
+            if cached_result is not _MISSING:
                 # Tape exists within the cache, store the cached result
-                cached_results[i] = cache[hashes[i]]
+                cached_results[i] = cached_result
                 if tape.shots and getattr(cache, "_persistent_cache", True):
                     warnings.warn(
                         "Cached execution with finite shots detected!\n"
@@ -395,6 +407,12 @@ def cache_execute(fn: Callable, cache, pass_kwargs=False, return_tuple=True, exp
                 # for execution via the execution function.
                 execution_tapes[i] = tape
 
+        tracker = getattr(cache, "tracker", None)
+        if tracker is not None and tracker.active:
+            # caches that report their statistics, e.g. the ``PersistentCache``
+            tracker.update(cache_hits=len(cached_results), cache_misses=len(execution_tapes))
+            tracker.record()
+
         # if there are no execution tapes, simply return!
         if not execution_tapes:
             if not repeated:
@@ -404,7 +422,7 @@ def cache_execute(fn: Callable, cache, pass_kwargs=False, return_tuple=True, exp
         else:
             # execute all unique tapes that do not exist in the cache
             # convert to list as new device interface returns a tuple
-            res = list(fn(tuple(execution_tapes.values()), **kwargs))
+            res = iter(fn(tuple(execution_tapes.values()), **kwargs))
 
         final_res = []
 
@@ -419,7 +437,7 @@ def cache_execute(fn: Callable, cache, pass_kwargs=False, return_tuple=True, exp
 
             else:
                 # insert evaluated results into the results vector
-                r = res.pop(0)
+                r = next(res)
                 final_res.append(r)
                 cache[hashes[i]] = r
 
@@ -471,6 +489,8 @@ def execute(
             determining the gradients of tapes
         cache (bool, dict, Cache): Whether to cache evaluations. This can result in
             a significant reduction in quantum evaluations during gradient computations.
+            A :class:`~.PersistentCache` stores the results in a file shared between
+            processes and sessions.
         cachesize (int): the size of the cache
         max_diff (int): If ``gradient_fn`` is a gradient transform, this option specifies
             the maximum number of derivatives to support. Increasing this value allows
@@ -795,6 +815,8 @@ def execute(
 
             # replace the backward gradient computation
             gradient_fn_with_shots = set_shots(device, override_shots)(device.gradients)
+            if isinstance(cache, PersistentCache):
+                cache = cache.for_device(device, override_shots, kind="gradients")
             cached_gradient_fn = qml.workflow.cache_execute(
                 gradient_fn_with_shots,
                 cache,
@@ -0,0 +1,307 @@
+# Copyright 2018-2024 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+This module contains the :class:`~.PersistentCache`, an execution cache stored in an SQLite
+database that can be shared between processes and sessions.
+"""
+import os
+import pickle
+import sqlite3
+import time
+import warnings
+from collections.abc import MutableMapping
+from typing import Optional
+
+import pennylane as qml
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    namespace TEXT NOT NULL,
+    key INTEGER NOT NULL,
+    value BLOB NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used);
+"""
+
+_MAX_CHECK_INTERVAL = 256
+"""Maximal number of results stored by a cache between two counts of the stored results."""
+
+_PLAIN_TYPES = (type(None), bool, int, float, complex, str)
+
+# attributes of devices of the new device API that do not determine the results of executions, or
+# that are already part of the namespace of their results
+_STATE_ATTRIBUTES = frozenset(
+    {
+        "tracker",
+        "_shots",
+        "_wires",
+        "_rng",
+        "_prng_key",
+        "_debugger",
+        "_worker_pool",
+        "_max_workers",
+        "_state_cache",
+    }
+)
+
+_MISSING = object()
+
+
+def _is_plain(value):
+    """Whether a value is a number, a string, ``None`` or a tuple of these."""
+    if isinstance(value, tuple):
+        return all(_is_plain(v) for v in value)
+    return isinstance(value, _PLAIN_TYPES)
+
+
+def _device_options(device):
+    """The options of a device of the new device API, such as its seed or its shot allocation,
+    as a sorted tuple of names and values, or ``None`` if an option is not a number, a string or a
+    tuple of these, and hence cannot identify the results of the device."""
+    options = []
+    for name, value in vars(device).items():
+        if name in _STATE_ATTRIBUTES:
+            continue
+        if not _is_plain(value):
+            return None
+        options.append((name, value))
+    return tuple(sorted(options))
+
+
+class PersistentCache(MutableMapping):
+    """An execution cache stored in an SQLite database file.
+
+    Results are stored on disk, keyed by the hash of the executed tapes, which is the same in every
+    process. The same file can therefore be used by several processes at once, and results
+    computed in a previous session are reused. The results are pickled, so only open cache files
+    from trusted sources.
+
+    When the cache is used to execute tapes on a device, the entries are stored under a namespace
+    identifying the device and the PennyLane version, so that results obtained on different
+    devices are never mixed. The number of cache hits and misses of every batch of tapes is
+    reported to the :class:`~.Tracker` of the device, as ``cache_hits`` and ``cache_misses``.
+
+    Args:
+        path (str): path of the database file, which is created if it does not exist
+        maxsize (int): The maximum number of stored results. When it is exceeded, the least
+            recently used results are evicted. If ``None``, the size of the cache is not bounded.
+            The stored results are only counted every ``maxsize // 16`` insertions, at most every
+            256, and enough results are then evicted for the next ones to fit.
+        timeout (float): how long to wait, in seconds, for other processes to release the
+            database before raising an error
+        namespace (str): the namespace of the entries accessed with this cache
+
+    **Example**
+
+    >>> dev = qml.device("default.qubit", wires=2)
+    >>> cache = qml.workflow.PersistentCache("results.db", maxsize=10000)
+    >>> @qml.qnode(dev, cache=cache)
+    ... def circuit(x):
+    ...     qml.RX(x, 0)
+    ...     return qml.expval(qml.PauliZ(0))
+    >>> with qml.Tracker(dev) as tracker:
+    ...     circuit(0.1)
+    ...     circuit(0.1)
+    >>> tracker.totals
+    {'cache_hits': 1, 'cache_misses': 1, 'batches': 1, 'simulations': 1, 'executions': 1}
+
+    Restarting Python and evaluating ``circuit(0.1)`` again reads the result from
+    ``results.db`` instead of executing the circuit.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        maxsize: Optional[int] = None,
+        timeout: float = 60.0,
+        namespace: str = "",
+    ):
+        self.path = os.fspath(path)
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self.namespace = namespace
+        self.device = None
+        self._connection = None
+        self._pid = None
+        self._inserts_before_check = 0
+        with self._connect() as connection:
+            connection.executescript(_SCHEMA)
+
+    def __getstate__(self):
+        # connections cannot be shared between processes, every process opens its own
+        state = self.__dict__.copy()
+        state["_connection"] = None
+        state["_pid"] = None
+        return state
+
+    def _connect(self) -> sqlite3.Connection:
+        """Returns the connection to the database of the current process."""
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = sqlite3.connect(self.path, timeout=self.timeout)
+            # write-ahead logging lets readers and a writer access the database concurrently
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._pid = os.getpid()
+        return self._connection
+
+    def for_device(
+        self, device, override_shots=False, kind="results"
+    ) -> Optional["PersistentCache"]:
+        """Returns a view of the cache for the results of executions on a device.
+
+        The view accesses the same database as the cache, under a namespace identifying the
+        device, its wires, shots and options, such as its seed, the kind of stored values and the
+        PennyLane version. Its hits and misses are reported to the tracker of the device.
+
+        The options of a device of the new device API are the attributes that are numbers, strings
+        or tuples of these. Devices with other options, such as a device seeded with a
+        ``numpy.random.Generator``, cannot be identified, and their results are not cached.
+
+        Args:
+            device (pennylane.devices.Device or pennylane.Device): the device executing the tapes
+            override_shots (int): the shots the tapes are executed with on a device of the old
+                device API, if they differ from the shots of the device
+            kind (str): the kind of values stored in the view, e.g. ``"results"`` or
+                ``"gradients"``
+
+        Returns:
+            PersistentCache or None: a view of the cache for the device, or ``None`` if the results
+            of the device cannot be cached
+        """
+        if isinstance(device, qml.Device):
+            shots = device.shots if override_shots is False else override_shots
+            signature = (type(device).__qualname__, device.short_name, device.num_wires, shots)
+        else:
+            options = _device_options(device)
+            if options is None:
+                warnings.warn(
+                    f"The options of the device {device.name} cannot be stored in the persistent "
+                    "cache, hence its results are not cached.",
+                    UserWarning,
+                )
+                return None
+            wires = None if device.wires is None else tuple(device.wires.tolist())
+            signature = (type(device).__qualname__, device.name, wires, device.shots, options)
+
+        view = self.__class__.__new__(self.__class__)
+        view.__dict__.update(self.__getstate__())
+        view.namespace = repr((self.namespace, kind, qml.version(), *signature))
+        view.device = device
+        return view
+
+    @property
+    def tracker(self):
+        """The tracker of the device of the cache, if any, to which the hits and misses are
+        reported."""
+        return getattr(self.device, "tracker", None)
+
+    def __getitem__(self, key):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key, default=None):
+        """Returns the result stored under a key, or ``default`` if there is none. The result is
+        read with a single query, hence it cannot be evicted by another process in between the
+        test of the key and the read of the value."""
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT value FROM results WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            ).fetchone()
+            if row is None:
+                return default
+            connection.execute(
+                "UPDATE results SET last_used = ? WHERE namespace = ? AND key = ?",
+                (time.time(), self.namespace, key),
+            )
+        return pickle.loads(row[0])
+
+    def __contains__(self, key):
+        row = (
+            self._connect()
+            .execute("SELECT 1 FROM results WHERE namespace = ? AND key = ?", (self.namespace, key))
+            .fetchone()
+        )
+        return row is not None
+
+    def __setitem__(self, key, value):
+        value = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                (self.namespace, key, value, time.time()),
+            )
+            if self.maxsize is not None:
+                self._evict(connection)
+
+    def _evict(self, connection):
+        """Counts the stored results every few insertions, and evicts the least recently used ones
+        such that the results inserted until the next count do not exceed ``maxsize``."""
+        self._inserts_before_check -= 1
+        if self._inserts_before_check > 0:
+            return
+        interval = max(1, min(self.maxsize // 16, _MAX_CHECK_INTERVAL))
+        self._inserts_before_check = interval
+        # counting scans the table, hence it is not done at every insertion
+        (size,) = connection.execute("SELECT COUNT(*) FROM results").fetchone()
+        excess = size - (self.maxsize - interval + 1)
+        if excess > 0:
+            connection.execute(
+                "DELETE FROM results WHERE rowid IN "
+                "(SELECT rowid FROM results ORDER BY last_used LIMIT ?)",
+                (excess,),
+            )
+
+    def __delitem__(self, key):
+        with self._connect() as connection:
+            deleted = connection.execute(
+                "DELETE FROM results WHERE namespace = ? AND key = ?", (self.namespace, key)
+            ).rowcount
+        if not deleted:
+            raise KeyError(key)
+
+    def __iter__(self):
+        rows = (
+            self._connect()
+            .execute("SELECT key FROM results WHERE namespace = ?", (self.namespace,))
+            .fetchall()
+        )
+        return iter(key for (key,) in rows)
+
+    def __len__(self):
+        (size,) = (
+            self._connect()
+            .execute("SELECT COUNT(*) FROM results WHERE namespace = ?", (self.namespace,))
+            .fetchone()
+        )
+        return size
+
+    def clear(self):
+        """Removes all the results of the namespace of the cache."""
+        with self._connect() as connection:
+            connection.execute("DELETE FROM results WHERE namespace = ?", (self.namespace,))
+
+    def close(self):
+        """Closes the connection of the current process to the database."""
+        if self._connection is not None and self._pid == os.getpid():
+            self._connection.close()
+        self._connection = None
+        self._pid = None
+
+    def __repr__(self):
+        return f"<PersistentCache: path={self.path!r}, maxsize={self.maxsize}>"
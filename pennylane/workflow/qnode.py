@@ -30,6 +30,7 @@ from pennylane.tape import QuantumTape, QuantumScript
 
 from .execution import INTERFACE_MAP, SUPPORTED_INTERFACES
 from .set_shots import set_shots
+from .tape_cache import TapeCache
 
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
@@ -196,6 +197,20 @@ class QNode:
             (classical) computational overhead during the backwards pass.
         device_vjp (bool): Whether or not to use the device-provided Vector Jacobian Product (VJP).
             A value of ``None`` indicates to use it if the device provides it, but use the full jacobian otherwise.
+        cache_tape (bool): Whether or not to trace the quantum function only once per argument
+            structure. If ``True``, the traced tape is cached, keyed by the nesting of the
+            arguments, the type, shape, dtype and trainability of the floating point arguments, the
+            values of all other arguments, and the shots. Later calls with the same argument
+            structure bind the new arguments to the cached tape instead of calling the quantum
+            function. This requires the circuit structure not to depend on the values of the
+            floating point arguments, and the gate parameters to be these arguments (or their
+            elements) or constants; this is verified by tracing the quantum function twice with
+            random arguments the first time an argument structure is seen, and argument structures
+            that do not satisfy it are always traced. Python control flow on NumPy and Autograd
+            arguments is always detected. The quantum function is traced three times for every new
+            argument structure, which repeats its side effects, and values it reads from closures
+            or global variables are frozen in the cached tapes.
+            See :class:`~.workflow.tape_cache.TapeCache`.
 
     Keyword Args:
         **kwargs: Any additional keyword arguments provided are passed to the differentiation
@@ -419,11 +434,12 @@ class QNode:
         cachesize=10000,
         max_diff=1,
         device_vjp=False,
+        cache_tape=False,
         **gradient_kwargs,
     ):
         if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
-                """Creating QNode(func=%s, device=%s, interface=%s, diff_method=%s, expansion_strategy=%s, max_expansion=%s, grad_on_execution=%s, cache=%s, cachesize=%s, max_diff=%s, gradient_kwargs=%s""",
+                """Creating QNode(func=%s, device=%s, interface=%s, diff_method=%s, expansion_strategy=%s, max_expansion=%s, grad_on_execution=%s, cache=%s, cachesize=%s, max_diff=%s, cache_tape=%s, gradient_kwargs=%s""",
                 (
                     func
                     if not (logger.isEnabledFor(qml.logging.TRACE) and inspect.isfunction(func))
@@ -438,6 +454,7 @@ class QNode:
                 cache,
                 cachesize,
                 max_diff,
+                cache_tape,
                 gradient_kwargs,
             )
 
@@ -505,6 +522,7 @@ class QNode:
         self.gradient_fn = None
         self.gradient_kwargs = {}
         self._tape_cached = False
+        self._tape_cache = TapeCache() if cache_tape else None
 
         self._update_gradient_fn()
         functools.update_wrapper(self, func)
@@ -521,6 +539,8 @@ class QNode:
             self.transform_program
         )  # pylint: disable=protected-access
         copied_qnode.gradient_kwargs = dict(self.gradient_kwargs)
+        if self._tape_cache is not None:
+            copied_qnode._tape_cache = TapeCache(self._tape_cache.maxsize)
         return copied_qnode
 
     def __repr__(self):
@@ -869,7 +889,7 @@ class QNode:
 
     qtape = tape  # for backwards compatibility
 
-    def construct(self, args, kwargs):  # pylint: disable=too-many-branches
+    def construct(self, args, kwargs):
         """Call the quantum function with a tape context, ensuring the operations get queued."""
         kwargs = copy.copy(kwargs)
         old_interface = self.interface
@@ -882,25 +902,54 @@ class QNode:
         if old_interface == "auto":
             self.interface = qml.math.get_interface(*args, *list(kwargs.values()))
 
+        cache_key = (
+            None if self._tape_cache is None else self._tape_cache.make_key(args, kwargs, shots)
+        )
+        cached = None if cache_key is None else self._tape_cache.get(*cache_key)
+
+        if cached is not None:
+            self._tape, self._qfunc_output = cached
+        else:
+            self._tape, self._qfunc_output = self._trace(args, kwargs, shots)
+            if cache_key is not None:
+                self._tape_cache.add(
+                    cache_key[0],
+                    self._tape,
+                    self._qfunc_output,
+                    args,
+                    kwargs,
+                    functools.partial(self._trace, shots=shots),
+                )
+
+        if old_interface == "auto":
+            self.interface = "auto"
+
+    def _trace(self, args, kwargs, shots):  # pylint: disable=too-many-branches
+        """Call the quantum function with a tape context, and validate and expand the resulting
+        tape.
+
+        Returns:
+            tuple[QuantumScript, Any]: the tape and the output of the quantum function
+        """
         with qml.queuing.AnnotatedQueue() as q:
-            self._qfunc_output = self.func(*args, **kwargs)
+            qfunc_output = self.func(*args, **kwargs)
 
-        self._tape = QuantumScript.from_queue(q, shots)
+        tape = QuantumScript.from_queue(q, shots)
 
-        params = self.tape.get_parameters(trainable_only=False)
-        self.tape.trainable_params = qml.math.get_trainable_indices(params)
+        params = tape.get_parameters(trainable_only=False)
+        tape.trainable_params = qml.math.get_trainable_indices(params)
 
-        if any(isinstance(m, CountsMP) for m in self.tape.measurements) and any(
+        if any(isinstance(m, CountsMP) for m in tape.measurements) and any(
             qml.math.is_abstract(a) for a in args
         ):
             raise qml.QuantumFunctionError("Can't JIT a quantum function that returns counts.")
 
-        if isinstance(self._qfunc_output, qml.numpy.ndarray):
-            measurement_processes = tuple(self.tape.measurements)
-        elif not isinstance(self._qfunc_output, Sequence):
-            measurement_processes = (self._qfunc_output,)
+        if isinstance(qfunc_output, qml.numpy.ndarray):
+            measurement_processes = tuple(tape.measurements)
+        elif not isinstance(qfunc_output, Sequence):
+            measurement_processes = (qfunc_output,)
         else:
-            measurement_processes = self._qfunc_output
+            measurement_processes = qfunc_output
 
         if not measurement_processes or not all(
             isinstance(m, qml.measurements.MeasurementProcess) for m in measurement_processes
@@ -910,17 +959,15 @@ class QNode:
                 "or a nonempty sequence of measurements."
             )
 
-        terminal_measurements = [
-            m for m in self.tape.measurements if not isinstance(m, MidMeasureMP)
-        ]
+        terminal_measurements = [m for m in tape.measurements if not isinstance(m, MidMeasureMP)]
 
         if any(ret is not m for ret, m in zip(measurement_processes, terminal_measurements)):
             raise qml.QuantumFunctionError(
                 "All measurements must be returned in the order they are measured."
             )
 
-        num_wires = len(self.tape.wires) if not self.device.wires else len(self.device.wires)
-        for obj in self.tape.operations + self.tape.observables:
+        num_wires = len(tape.wires) if not self.device.wires else len(self.device.wires)
+        for obj in tape.operations + tape.observables:
             if (
                 getattr(obj, "num_wires", None) is qml.operation.WiresEnum.AllWires
                 and obj.wires
@@ -941,28 +988,27 @@ class QNode:
         # Only apply transform with old device API as postselection with
         # broadcasting will split tapes.
         expand_mid_measure = (
-            any(isinstance(op, MidMeasureMP) for op in self.tape.operations)
+            any(isinstance(op, MidMeasureMP) for op in tape.operations)
             and not isinstance(self.device, qml.devices.Device)
             and not self.device.capabilities().get("supports_mid_measure", False)
         )
         if expand_mid_measure:
             # Assume that tapes are not split if old device is used since postselection is not supported.
-            tapes, _ = qml.defer_measurements(self._tape, device=self.device)
-            self._tape = tapes[0]
+            tapes, _ = qml.defer_measurements(tape, device=self.device)
+            tape = tapes[0]
 
         if self.expansion_strategy == "device":
             if isinstance(self.device, qml.devices.Device):
-                tape, _ = self.device.preprocess()[0]([self.tape])
-                if len(tape) != 1:
+                tapes, _ = self.device.preprocess()[0]([tape])
+                if len(tapes) != 1:
                     raise ValueError(
                         "Using 'device' for the `expansion_strategy` is not supported for batches of tapes"
                     )
-                self._tape = tape[0]
+                tape = tapes[0]
             else:
-                self._tape = self.device.expand_fn(self.tape, max_expansion=self.max_expansion)
+                tape = self.device.expand_fn(tape, max_expansion=self.max_expansion)
 
-        if old_interface == "auto":
-            self.interface = "auto"
+        return tape, qfunc_output
 
     def __call__(self, *args, **kwargs) -> qml.typing.Result:
         override_shots = False
@@ -0,0 +1,400 @@
+# Copyright 2018-2024 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+This module contains the :class:`~.TapeCache`, which allows a QNode to trace its quantum function
+once and rebind new parameters to the traced tape on later calls.
+"""
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+import pennylane as qml
+from pennylane.operation import Operator
+from pennylane.measurements import MeasurementProcess
+from pennylane.tape import QuantumScript
+from pennylane.wires import WireError, Wires
+
+_UNCACHEABLE = object()
+"""Marks argument structures for which the parameters of the tape are not the arguments."""
+
+_STATIC_TYPES = (bool, int, str, type(None), np.integer, np.bool_)
+_DYNAMIC_TYPES = (float, complex, np.floating, np.complexfloating)
+
+
+class _Uncacheable(Exception):
+    """Raised if the arguments of a QNode cannot be used as a cache key."""
+
+
+def _map_leaves(obj, fn):
+    """Rebuilds the nested lists, tuples and dicts ``obj`` with ``fn`` applied to the leaves.
+    Dictionaries are traversed in the order of their sorted keys."""
+    if isinstance(obj, list):
+        return [_map_leaves(o, fn) for o in obj]
+    if isinstance(obj, tuple):
+        items = [_map_leaves(o, fn) for o in obj]
+        return type(obj)(*items) if hasattr(obj, "_fields") else tuple(items)
+    if isinstance(obj, dict):
+        return {k: _map_leaves(obj[k], fn) for k in sorted(obj)}
+    return fn(obj)
+
+
+def _flatten(obj, key, leaves):
+    """Appends the cache key of the nested lists, tuples and dicts ``obj`` to ``key``, and the
+    leaves whose values are parameters that can be rebound to ``leaves``. The leaves are visited
+    in the same order as in :func:`~._map_leaves`."""
+    if isinstance(obj, list):
+        key.append((list, len(obj)))
+        for o in obj:
+            _flatten(o, key, leaves)
+    elif isinstance(obj, tuple):
+        key.append((type(obj), len(obj)))
+        for o in obj:
+            _flatten(o, key, leaves)
+    elif isinstance(obj, dict):
+        key.append((dict, tuple(sorted(obj))))
+        for k in sorted(obj):
+            _flatten(obj[k], key, leaves)
+    else:
+        leaf_key, dynamic = _leaf_key(obj)
+        key.append(leaf_key)
+        if dynamic:
+            leaves.append(obj)
+
+
+def _leaf_key(leaf):
+    """Returns the cache key of a leaf of the QNode arguments, and whether the values of the leaf
+    are parameters that can be rebound."""
+    if isinstance(leaf, _STATIC_TYPES):
+        return (type(leaf), leaf), False
+    if isinstance(leaf, _DYNAMIC_TYPES):
+        return (type(leaf),), True
+
+    if hasattr(leaf, "shape") and hasattr(leaf, "dtype"):
+        if qml.math.is_abstract(leaf):
+            raise _Uncacheable
+        interface = qml.math.get_interface(leaf)
+        shape = tuple(qml.math.shape(leaf))
+        dtype = qml.math.get_dtype_name(leaf)
+        if "float" in dtype or "complex" in dtype:
+            return (interface, shape, dtype, qml.math.requires_grad(leaf)), True
+        if dtype == "object":
+            raise _Uncacheable
+        return (interface, shape, dtype, qml.math.to_numpy(leaf).tobytes()), False
+
+    try:
+        hash(leaf)
+    except TypeError as e:
+        raise _Uncacheable from e
+    return (type(leaf), leaf), False
+
+
+class _ValueDependence(Exception):
+    """Raised if the quantum function converts the value of a :class:`~._ProbeTensor` to a Python
+    object."""
+
+
+def _as_probe(value):
+    """Views all the arrays in the output of a NumPy function as :class:`~._ProbeTensor`."""
+    if isinstance(value, tuple):
+        return tuple(_as_probe(v) for v in value)
+    if isinstance(value, np.ndarray) and not isinstance(value, _ProbeTensor):
+        return value.view(_ProbeTensor)
+    return value
+
+
+class _ProbeTensor(qml.numpy.tensor):
+    """A random NumPy argument for tracing the quantum function, which raises an error if its value,
+    or the value of an array computed from it, is converted to a Python object. This is the case
+    if the control flow of the quantum function depends on it, e.g. ``if x > 0.5:``."""
+
+    def __array_wrap__(self, obj):
+        return _as_probe(super().__array_wrap__(obj))
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        return _as_probe(super().__array_ufunc__(ufunc, method, *inputs, **kwargs))
+
+    def __getitem__(self, *args, **kwargs):
+        return _as_probe(super().__getitem__(*args, **kwargs))
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def unwrap(self):
+        return self.view(np.ndarray)
+
+    def _value_dependence(self, *args, **kwargs):
+        raise _ValueDependence
+
+    __bool__ = __float__ = __int__ = __index__ = __complex__ = _value_dependence
+    item = tolist = _value_dependence
+
+
+_PROBE_ERRORS = (
+    _ValueDependence,
+    TypeError,
+    ValueError,
+    IndexError,
+    ArithmeticError,
+    WireError,
+)
+"""Errors raised by quantum functions that cannot be traced with random arguments, e.g. because
+the arguments are used as wires or as normalized states. Other errors are raised to the user."""
+
+
+def _probe(leaf_key, rng):
+    """Returns a random value with the same type, shape and dtype as a dynamic leaf. NumPy,
+    Autograd and Python values are replaced by a :class:`~._ProbeTensor`."""
+    if len(leaf_key) == 1:
+        interface, shape, requires_grad = "numpy", (), False
+        dtype = np.result_type(leaf_key[0]).name
+    else:
+        interface, shape, dtype, requires_grad = leaf_key
+
+    value = rng.uniform(size=shape)
+    if "complex" in dtype:
+        value = value + 1j * rng.uniform(size=shape)
+    if interface in {"numpy", "autograd"}:
+        return _ProbeTensor(value, dtype=dtype, requires_grad=requires_grad)
+    return qml.math.cast(qml.math.asarray(value, like=interface), dtype)
+
+
+def _signature(obj):
+    """A hashable description of the structure of a tape, operator or measurement that does not
+    depend on the values of the operator parameters."""
+    if isinstance(obj, QuantumScript):
+        return (
+            tuple(_signature(op) for op in obj.operations),
+            tuple(_signature(m) for m in obj.measurements),
+            obj.shots,
+        )
+    if isinstance(obj, Operator):
+        shapes = tuple(qml.math.shape(d) for d in obj.data)
+        return (type(obj), obj.wires, shapes, _signature(obj.hyperparameters))
+    if isinstance(obj, MeasurementProcess):
+        mv = repr(obj.mv) if obj.mv is not None else None
+        return (type(obj), obj.wires, _signature(obj.obs), mv)
+    if isinstance(obj, (list, tuple)):
+        return tuple(_signature(o) for o in obj)
+    if isinstance(obj, dict):
+        return tuple((k, _signature(v)) for k, v in obj.items())
+    if isinstance(obj, Wires):
+        return obj
+    if hasattr(obj, "shape") and hasattr(obj, "dtype"):
+        return (tuple(qml.math.shape(obj)), _to_numpy(obj).tobytes())
+    return repr(obj)
+
+
+def _to_numpy(value):
+    """Converts a tape parameter of a trace with random arguments to a NumPy array."""
+    if isinstance(value, _ProbeTensor):
+        return np.array(value.unwrap())
+    return np.asarray(qml.math.to_numpy(value))
+
+
+def _locate(value, other_value, probe_leaves, other_probe_leaves):
+    """Finds the argument that a tape parameter was taken from, given the values of the tape
+    parameter and of the dynamic leaves in two traces with random arguments.
+
+    Returns:
+        tuple or None: ``(leaf_index, index)``, where the parameter is ``leaves[leaf_index]`` if
+        ``index`` is ``None`` and ``leaves[leaf_index][index]`` otherwise, or ``None`` if the
+        parameter is not an argument
+    """
+    for j, (leaf, other_leaf) in enumerate(zip(probe_leaves, other_probe_leaves)):
+        if leaf.shape == value.shape:
+            if np.array_equal(leaf, value) and np.array_equal(other_leaf, other_value):
+                return j, None
+        elif leaf.shape[1:] == value.shape:
+            # a row of an array argument, or an element of a one-dimensional array argument
+            for i, (row, other_row) in enumerate(zip(leaf, other_leaf)):
+                if np.array_equal(row, value) and np.array_equal(other_row, other_value):
+                    return j, (i,)
+        elif value.ndim == 0:
+            for i in np.flatnonzero(leaf == value):
+                index = tuple(int(k) for k in np.unravel_index(i, leaf.shape))
+                if other_leaf[index] == other_value:
+                    return j, index
+
+    return None
+
+
+class TapeCache:
+    """A cache of the tapes traced by a :class:`~.QNode`, keyed by the structure of the QNode
+    arguments.
+
+    The cache key consists of the nesting of the arguments, the type, shape, dtype and trainability
+    of every floating point argument, the values of all other arguments, and the shots. When a tape
+    is added, the quantum function is traced twice more with random floating point arguments. If
+    the structure of the circuit is the same for all three traces, and every parameter of the
+    tape is either a constant or one of the floating point arguments, or a single element of them,
+    later calls with the same argument structure obtain their tape with
+    :meth:`~.QuantumScript.bind_new_parameters` instead of calling the quantum function. Otherwise,
+    the argument structure is marked as uncacheable, and the quantum function is always traced.
+
+    The random NumPy and Autograd arguments raise an error if their values are converted to Python
+    objects, so that control flow depending on them, such as ``if x > 0.5:``, also marks the
+    argument structure as uncacheable, even if both random values take the same branch.
+
+    .. warning::
+
+        The quantum function is called three times for every new argument structure, so that its
+        side effects, such as printing or appending to a list, are repeated. Conversely, it is not
+        called at all for cached argument structures: values that the circuit reads from closures
+        or global variables are frozen at the first call, and changing them has no effect until
+        the cache is cleared.
+
+    Args:
+        maxsize (int): the maximum number of argument structures to cache tapes for
+    """
+
+    def __init__(self, maxsize: int = 16):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """Remove all the cached tapes."""
+        self._entries.clear()
+
+    @staticmethod
+    def make_key(args, kwargs, shots) -> Optional[Tuple]:
+        """Computes the cache key of the arguments of a call to the QNode.
+
+        Returns:
+            tuple or None: the cache key and the list of the floating point arguments, or ``None`` if
+            the arguments cannot be used as a key, e.g. because they are abstract JAX tracers
+        """
+        key = [shots]
+        leaves = []
+        try:
+            _flatten((args, kwargs), key, leaves)
+        except (_Uncacheable, TypeError):
+            return None
+
+        return tuple(key), leaves
+
+    def get(self, key: Tuple, leaves: list) -> Optional[Tuple[QuantumScript, object]]:
+        """Returns the tape and the output of the quantum function for the arguments with cache
+        key ``key``, or ``None`` if there is none.
+
+        Args:
+            key (tuple): the cache key computed by :meth:`~.make_key`
+            leaves (list): the floating point arguments returned by :meth:`~.make_key`
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry is _UNCACHEABLE:
+            return None
+
+        self._entries.move_to_end(key)
+        tape, qfunc_output, locations = entry
+        params = [
+            loc[1]
+            if loc[0] is None
+            else leaves[loc[0]]
+            if loc[1] is None
+            else leaves[loc[0]][loc[1]]
+            for loc in locations
+        ]
+        new_tape = tape.bind_new_parameters(params, list(range(len(params))))
+        new_tape.trainable_params = qml.math.get_trainable_indices(params)
+        return new_tape, qfunc_output
+
+    def add(
+        self,
+        key: Tuple,
+        tape: QuantumScript,
+        qfunc_output,
+        args,
+        kwargs,
+        trace: Callable,
+    ) -> bool:
+        """Adds the tape traced for the arguments with cache key ``key``.
+
+        Args:
+            key (tuple): the cache key computed by :meth:`~.make_key`
+            tape (QuantumScript): the traced tape
+            qfunc_output: the output of the quantum function
+            args (tuple): the positional arguments of the quantum function
+            kwargs (dict): the keyword arguments of the quantum function
+            trace (Callable): maps the arguments of the quantum function to the traced tape and the
+                output of the quantum function
+
+        Returns:
+            bool: whether or not later calls with the same argument structure can reuse ``tape``
+        """
+        if key in self._entries:
+            return self._entries[key] is not _UNCACHEABLE
+
+        locations = self._locate_parameters(tape, args, kwargs, trace)
+        self._entries[key] = _UNCACHEABLE if locations is None else (tape, qfunc_output, locations)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+        return locations is not None
+
+    @staticmethod
+    def _locate_parameters(tape, args, kwargs, trace):
+        """Traces the quantum function with random arguments to find where the tape parameters
+        come from. Returns ``None`` if the structure of the circuit or a parameter depends on the
+        arguments in any other way."""
+        rng = np.random.default_rng()
+
+        def make_probe(leaf):
+            leaf_key, dynamic = _leaf_key(leaf)
+            if not dynamic:
+                return leaf
+            probe = _probe(leaf_key, rng)
+            probe_leaves.append(_to_numpy(probe))
+            return probe
+
+        traces = []
+        try:
+            for _ in range(2):
+                probe_leaves = []
+                probe_args, probe_kwargs = _map_leaves((args, kwargs), make_probe)
+                probe_tape, _ = trace(tuple(probe_args), probe_kwargs)
+                traces.append((probe_tape, probe_leaves))
+
+            signature = _signature(tape)
+            if any(_signature(probe_tape) != signature for probe_tape, _ in traces):
+                return None
+        except _PROBE_ERRORS:
+            return None
+
+        (tape_1, leaves_1), (tape_2, leaves_2) = traces
+        params = tape.get_parameters(trainable_only=False)
+        params_1 = tape_1.get_parameters(trainable_only=False)
+        params_2 = tape_2.get_parameters(trainable_only=False)
+
+        locations = []
+        for param, value_1, value_2 in zip(params, params_1, params_2):
+            value_1, value_2 = _to_numpy(value_1), _to_numpy(value_2)
+            if np.array_equal(value_1, value_2):
+                locations.append((None, param))
+                continue
+
+            location = _locate(value_1, value_2, leaves_1, leaves_2)
+            if location is None:
+                return None
+            j, index = location
+            if index is not None and len(index) == leaves_1[j].ndim:
+                # indexing a single element after an ellipsis returns a zero-dimensional array,
+                # which is much faster than creating a scalar for PennyLane NumPy tensors
+                location = (j, (Ellipsis, *index))
+            locations.append(location)
+
+        return locations
@@ -163,14 +163,14 @@ def mock_device(monkeypatch):
 @pytest.fixture
 def tear_down_hermitian():
     yield None
-    qml.Hermitian._eigs = {}
+    qml.Hermitian._eigs.clear()
 
 
 # pylint: disable=protected-access
 @pytest.fixture
 def tear_down_thermitian():
     yield None
-    qml.THermitian._eigs = {}
+    qml.THermitian._eigs.clear()
 
 
 #######################################################################
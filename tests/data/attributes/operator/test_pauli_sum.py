@@ -0,0 +1,155 @@
+# Copyright 2018-2024 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Tests for the ``DatasetPauliSum`` attribute type.
+"""
+
+import numpy as np
+import pytest
+
+import pennylane as qml
+from pennylane.data.attributes import DatasetPauliSum
+from pennylane.data.base.attribute import match_obj_type
+from pennylane.data.base.typing_util import get_type_str
+from pennylane.pauli import PauliSentence, PauliWord
+
+pytestmark = pytest.mark.data
+
+hamiltonians = [
+    qml.Hamiltonian([], []),
+    qml.Hamiltonian([-0.8], [qml.PauliZ(0)]),
+    qml.Hamiltonian([0.6], [qml.PauliX(0) @ qml.PauliX(1)]),
+    qml.Hamiltonian([0.5, -1.6], [qml.PauliX("a"), qml.PauliY("b")]),
+    qml.Hamiltonian([1.5, 2.0, 0.3], [qml.PauliZ(0), qml.PauliY(2), qml.Identity(1)]),
+    qml.Hamiltonian([0.5, 1.2], [qml.PauliX(0), qml.PauliX(0) @ qml.PauliX(1)]),
+    qml.Hamiltonian([0.5, 0.5], [qml.PauliX(0), qml.PauliX(0)]),
+    qml.Hamiltonian([0.5 + 1.2j, 1.2 + 0.5j], [qml.PauliX(None), qml.PauliY(1) @ qml.Identity(2)]),
+]
+
+pauli_sentences = [
+    PauliSentence({}),
+    PauliSentence({PauliWord({}): 1.5}),
+    PauliSentence({PauliWord({0: "X", "a": "Y"}): 1.23, PauliWord({2: "Z", 0: "Y"}): -0.45j}),
+]
+
+sums = [
+    qml.sum(qml.PauliX(0), qml.PauliZ(1)),
+    qml.sum(qml.s_prod(0.5, qml.PauliX(0) @ qml.PauliY("b")), qml.s_prod(-0.2, qml.Identity(0))),
+    # sums whose Pauli representation has a single term
+    qml.sum(qml.PauliZ(1), qml.PauliZ(1)),
+    qml.sum(qml.s_prod(-0.7, qml.PauliX(0) @ qml.PauliY(1)), qml.PauliX(0) @ qml.PauliY(1)),
+]
+
+
+@pytest.mark.parametrize("value_in", [*hamiltonians, *pauli_sentences, *sums])
+class TestDatasetPauliSum:
+    """Test bind and value initialization for a ``DatasetPauliSum``."""
+
+    @staticmethod
+    def assert_equal(value_in, value_out):
+        """Checks that the deserialized value is equal to the serialized one."""
+        assert type(value_out) is type(value_in)  # pylint: disable=unidiomatic-typecheck
+        if isinstance(value_in, qml.Hamiltonian):
+            assert repr(value_out) == repr(value_in)
+            assert value_in.compare(value_out)
+        elif isinstance(value_in, qml.ops.Sum):
+            assert value_out.pauli_rep == value_in.pauli_rep
+        else:
+            assert value_out == value_in
+
+    def test_value_init(self, value_in):
+        """Test that a ``DatasetPauliSum`` can be value-initialized, and that the deserialized
+        value is equal to the serialized one."""
+        dset_ps = DatasetPauliSum(value_in)
+
+        assert dset_ps.info["type_id"] == "pauli_sum"
+        assert dset_ps.info["py_type"] == get_type_str(type(value_in))
+        assert dset_ps.pauli_sum_class is type(value_in)
+
+        self.assert_equal(value_in, dset_ps.get_value())
+
+    def test_bind_init(self, value_in):
+        """Test that a ``DatasetPauliSum`` is correctly bind-initialized."""
+        bind = DatasetPauliSum(value_in).bind
+
+        dset_ps = DatasetPauliSum(bind=bind)
+
+        assert dset_ps.info["type_id"] == "pauli_sum"
+        assert dset_ps.pauli_sum_class is type(value_in)
+
+        self.assert_equal(value_in, dset_ps.get_value())
+
+
+@pytest.mark.parametrize("value", [PauliSentence({}), qml.sum(qml.PauliX(0), qml.PauliY(0))])
+def test_default_attribute_type(value):
+    """Test that ``PauliSentence`` and ``Sum`` values are stored as a ``DatasetPauliSum``
+    by default."""
+    assert match_obj_type(value) is DatasetPauliSum
+
+
+def test_columnar_layout():
+    """Test that the terms are stored in a fixed number of datasets, independently of the number
+    of terms."""
+    H = qml.Hamiltonian(np.arange(100.0), [qml.PauliX(i) @ qml.PauliZ(i + 1) for i in range(100)])
+
+    dset_ps = DatasetPauliSum(H)
+
+    assert set(dset_ps.bind) == {"coeffs", "term_offsets", "wire_indices", "paulis", "wire_labels"}
+    assert dset_ps.num_terms == 100
+    assert dset_ps.wire_labels == list(range(101))
+    assert dset_ps.bind["paulis"].compression == "gzip"
+    assert np.array_equal(dset_ps.bind["term_offsets"][:], np.arange(0, 202, 2))
+
+
+@pytest.mark.parametrize(
+    "start, stop", [(None, None), (1, 3), (2, None), (None, 1), (3, 3), (5, 9)]
+)
+def test_get_pauli_sentence(start, stop):
+    """Test that a slice of the terms can be loaded as a ``PauliSentence``."""
+    coeffs = [0.5, -1.2, 0.3, 2.0]
+    ops = [qml.PauliX(0), qml.PauliY(1) @ qml.PauliZ("a"), qml.Identity(2), qml.PauliX(0)]
+    dset_ps = DatasetPauliSum(qml.Hamiltonian(coeffs, ops))
+
+    expected = PauliSentence()
+    for coeff, op in list(zip(coeffs, ops))[start:stop]:
+        expected += coeff * qml.pauli.pauli_sentence(op)
+
+    assert dset_ps.get_pauli_sentence(start, stop) == expected
+
+
+@pytest.mark.parametrize(
+    "value, match",
+    [
+        (
+            qml.Hamiltonian([1.0], [qml.Hermitian(np.eye(2), 0)]),
+            "Hamiltonian with observable 'Hermitian'",
+        ),
+        (qml.sum(qml.RX(1.1, 0), qml.PauliX(0)), "'Sum' as a sum of Pauli words"),
+    ],
+)
+def test_value_init_not_supported(value, match):
+    """Test that a TypeError is raised for operators which are not sums of Pauli words."""
+    with pytest.raises(TypeError, match=match):
+        DatasetPauliSum(value)
+
+
+def test_dataset_roundtrip(tmp_path):
+    """Test that a Hamiltonian written to a file is read back identically."""
+    H = qml.Hamiltonian([0.1, -0.2], [qml.PauliZ(0) @ qml.PauliZ(1), qml.PauliY("b")])
+    qml.data.Dataset(hamiltonian=DatasetPauliSum(H)).write(tmp_path / "ham.h5")
+
+    dataset = qml.data.Dataset.open(tmp_path / "ham.h5")
+
+    assert dataset.attr_info["hamiltonian"]["type_id"] == "pauli_sum"
+    assert H.compare(dataset.hamiltonian)
@@ -59,6 +59,29 @@ def test_debugger_attribute():
     assert dev._debugger is None
 
 
+def test_worker_pool_is_reused():
+    """Test that the worker processes are kept alive between executions."""
+    # pylint: disable=protected-access
+    qs = qml.tape.QuantumScript([qml.RX(0.5, 0)], [qml.expval(qml.PauliZ(0))])
+
+    with DefaultQubit(max_workers=2) as dev:
+        assert dev._worker_pool is None
+        _, config = dev.preprocess()
+        res1 = dev.execute((qs, qs), config)
+        pool = dev._worker_pool
+        assert pool.running
+        res2 = dev.execute((qs, qs), config)
+        assert dev._worker_pool is pool
+        assert qml.math.allclose(res1, res2)
+
+        new_config = ExecutionConfig(device_options={"max_workers": 1})
+        dev.execute((qs,), new_config)
+        assert dev._worker_pool.max_workers == 1
+        assert not pool.running
+
+    assert dev._worker_pool is None
+
+
 def test_snapshot_multiprocessing_qnode():
     """DefaultQubit cannot execute tapes with Snapshot if `max_workers` is not `None`"""
     dev = DefaultQubit(max_workers=2)
@@ -1501,6 +1524,27 @@ class TestHamiltonianSamples:
 
         assert np.allclose(res, expected, atol=0.002)
 
+    @pytest.mark.parametrize("max_workers", [None, 2])
+    @pytest.mark.parametrize("shot_allocation", ["weighted", "optimal"])
+    def test_shot_allocation(self, max_workers, shot_allocation):
+        """Test that the shot allocation of the device is used to measure Hamiltonians"""
+        ops = [qml.RX(0.4, wires=0), qml.RY(1.1, wires=1), qml.CNOT([0, 1])]
+        H = qml.Hamiltonian(
+            [2.0, -0.3, 0.8], [qml.PauliZ(0), qml.PauliX(0) @ qml.PauliX(1), qml.PauliY(1)]
+        )
+
+        dev = DefaultQubit(seed=100, max_workers=max_workers, shot_allocation=shot_allocation)
+        qs = qml.tape.QuantumScript(ops, [qml.expval(H)], shots=10000)
+        res = dev.execute(qs)
+
+        expected = dev.execute(qml.tape.QuantumScript(ops, [qml.expval(H)]))
+        assert np.allclose(res, expected, atol=0.05)
+
+    def test_unknown_shot_allocation(self):
+        """Test that an error is raised when creating a device with an unknown shot allocation"""
+        with pytest.raises(ValueError, match="Unknown shot allocation 'random'"):
+            DefaultQubit(shot_allocation="random")
+
 
 class TestClassicalShadows:
     """Test that classical shadow measurements works with the new device"""
@@ -1953,6 +1997,69 @@ class TestPostselection:
                     assert qml.math.all(qml.math.isnan(r))
 
 
+class TestTrajectories:
+    """Tests for simulating noisy circuits with quantum trajectories."""
+
+    @staticmethod
+    def noisy_circuit(dev):
+        """A noisy qnode with a mixture of unitaries and a general channel."""
+
+        @qml.qnode(dev)
+        def circuit(x):
+            qml.RX(x, 0)
+            qml.CNOT([0, 1])
+            qml.DepolarizingChannel(0.1, 0)
+            qml.AmplitudeDamping(0.3, 1)
+            return qml.expval(qml.PauliZ(0)), qml.probs(wires=1)
+
+        return circuit
+
+    @pytest.mark.parametrize("num_trajectories", [0, -3])
+    def test_invalid_num_trajectories(self, num_trajectories):
+        """Test that the number of trajectories must be positive."""
+        with pytest.raises(ValueError, match="number of trajectories must be a positive"):
+            DefaultQubit(num_trajectories=num_trajectories)
+
+    def test_channels_not_supported_without_trajectories(self):
+        """Test that channels are only supported with trajectories."""
+        with pytest.raises(qml.DeviceError, match="not supported on default.qubit"):
+            self.noisy_circuit(DefaultQubit())(0.5)
+
+    @pytest.mark.parametrize("max_workers", [None, 2])
+    def test_noisy_qnode(self, max_workers):
+        """Test that noisy qnodes are estimated close to their values in the mixed state."""
+        dev = DefaultQubit(num_trajectories=4000, seed=12, max_workers=max_workers)
+        results = self.noisy_circuit(dev)(0.5)
+        expected = self.noisy_circuit(qml.device("default.mixed", wires=2))(0.5)
+
+        assert np.isclose(results[0], expected[0], atol=0.05)
+        assert np.allclose(results[1], expected[1], atol=0.05)
+
+    def test_seeded(self):
+        """Test that the estimates are reproducible with a seeded device."""
+        results = [self.noisy_circuit(DefaultQubit(num_trajectories=50, seed=3))(0.5)]
+        results.append(self.noisy_circuit(DefaultQubit(num_trajectories=50, seed=3))(0.5))
+        assert results[0][0] == results[1][0]
+
+    def test_noiseless_circuit_is_exact(self):
+        """Test that circuits without channels are simulated exactly."""
+
+        @qml.qnode(DefaultQubit(num_trajectories=5))
+        def circuit(x):
+            qml.RX(x, 0)
+            return qml.expval(qml.PauliZ(0))
+
+        assert np.isclose(circuit(0.5), np.cos(0.5))
+
+    def test_broadcasting(self):
+        """Test that broadcasted noisy circuits are estimated for every parameter."""
+        dev = DefaultQubit(num_trajectories=1000, seed=4)
+        results = self.noisy_circuit(dev)(np.array([0.0, np.pi]))
+        assert qml.math.shape(results[0]) == (2,)
+        # only the depolarizing channel changes the expectation values
+        assert np.allclose(results[0], [1 - 2 * 0.1 / 1.5, -1 + 2 * 0.1 / 1.5], atol=0.1)
+
+
 class TestIntegration:
     """Various integration tests"""
 
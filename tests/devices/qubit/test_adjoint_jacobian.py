@@ -312,6 +312,43 @@ class TestAdjointJacobian:
         expected = [-np.sin(par)]
         assert np.allclose(grad_adjoint, expected)
 
+    @pytest.mark.parametrize(
+        "op",
+        [
+            qml.IsingXY(0.4, wires=[0, 1]),
+            qml.SingleExcitation(-0.3, wires=[1, 2]),
+            qml.ControlledPhaseShift(0.7, wires=[2, 0]),
+            qml.PauliRot(0.2, "XYZ", wires=[0, 1, 2]),
+            qml.ctrl(qml.RY(1.1, wires=2), control=[0, 1]),
+        ],
+    )
+    def test_generator_gradients(self, op, tol):
+        """Test that applying the generator matches the derivative of the operation matrix
+        for operations with Pauli and non-Pauli generators."""
+        ops = [qml.Hadamard(0), qml.RY(0.3, 1), qml.Hadamard(2), op, qml.CNOT([0, 2])]
+        obs = [qml.expval(qml.PauliZ(0) @ qml.PauliX(2)), qml.expval(qml.PauliY(1))]
+        qs = QuantumScript(ops, obs, trainable_params=[0, 1])
+
+        tapes, fn = qml.gradients.finite_diff(qs, h=1e-7, approx_order=2)
+        expected = fn(tuple(qml.devices.qubit.simulate(t) for t in tapes))
+
+        assert np.allclose(adjoint_jacobian(qs), expected, atol=tol, rtol=0)
+
+    def test_hamiltonian_observable(self, tol):
+        """Test the gradient of a Hamiltonian expectation value, which is applied to the
+        final state term by term."""
+        x, y = 0.4, -0.7
+        H = qml.Hamiltonian(
+            [0.5, -1.2, 0.3], [qml.PauliZ(0), qml.PauliX(0) @ qml.PauliX(1), qml.PauliY(1)]
+        )
+        ops = [qml.RX(x, 0), qml.RY(y, 1), qml.CNOT([0, 1])]
+        qs = QuantumScript(ops, [qml.expval(H)], trainable_params=[0, 1])
+
+        tapes, fn = qml.gradients.param_shift(qs)
+        expected = fn(tuple(qml.devices.qubit.simulate(t) for t in tapes))
+
+        assert np.allclose(adjoint_jacobian(qs), expected, atol=tol, rtol=0)
+
 
 class TestAdjointJacobianState:
     """Tests for differentiating a state vector."""
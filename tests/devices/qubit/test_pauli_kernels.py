@@ -0,0 +1,123 @@
+# Copyright 2018-2024 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for the matrix-free Pauli sentence kernels in devices/qubit."""
+import pytest
+
+import numpy as np
+from scipy.linalg import expm
+
+import pennylane as qml
+from pennylane.devices.qubit import apply_operation, measure
+from pennylane.devices.qubit.pauli_kernels import (
+    apply_exp_pauli_sentence,
+    apply_pauli_sentence,
+    expval_pauli_sentence,
+)
+from pennylane.pauli import PauliSentence, PauliWord
+
+
+def random_pauli_sentence(num_wires, num_words, seed=0):
+    """A Pauli sentence of random Pauli words with random coefficients."""
+    rng = np.random.default_rng(seed)
+    ps = PauliSentence()
+    for _ in range(num_words):
+        paulis = rng.choice(list("IXYZ"), size=num_wires)
+        word = PauliWord({w: p for w, p in enumerate(paulis) if p != "I"})
+        ps[word] = ps[word] + rng.normal()
+    return ps
+
+
+def random_state(num_wires, batch_size=None, seed=1):
+    """A random state of the given number of wires, with a leading batch dimension if needed."""
+    rng = np.random.default_rng(seed)
+    shape = (2,) * num_wires if batch_size is None else (batch_size,) + (2,) * num_wires
+    state = rng.normal(size=shape) + 1j * rng.normal(size=shape)
+    return state / np.linalg.norm(state)
+
+
+@pytest.mark.parametrize("num_wires", [1, 2, 5, 8])
+@pytest.mark.parametrize("batch_size", [None, 3])
+class TestPauliSentenceKernels:
+    """Tests that the kernels agree with the matrices of Pauli sentences."""
+
+    def test_apply(self, num_wires, batch_size):
+        """Test that a Pauli sentence is applied to a state."""
+        ps = random_pauli_sentence(num_wires, 20)
+        state = random_state(num_wires, batch_size)
+        matrix = ps.to_mat(wire_order=range(num_wires))
+
+        new_state = apply_pauli_sentence(ps, state, is_state_batched=batch_size is not None)
+        assert new_state.shape == state.shape
+        expected = np.reshape(state, (-1, 2**num_wires)) @ matrix.T
+        assert np.allclose(np.reshape(new_state, (-1, 2**num_wires)), expected)
+
+    def test_expval(self, num_wires, batch_size):
+        """Test the expectation value of a Pauli sentence."""
+        ps = random_pauli_sentence(num_wires, 20)
+        state = random_state(num_wires, batch_size)
+        matrix = ps.to_mat(wire_order=range(num_wires))
+
+        res = expval_pauli_sentence(ps, state, is_state_batched=batch_size is not None)
+        flat = np.reshape(state, (-1, 2**num_wires))
+        expected = np.real(np.einsum("bi,ij,bj->b", np.conj(flat), matrix, flat))
+        assert np.allclose(res, expected if batch_size else expected[0])
+        assert np.shape(res) == (() if batch_size is None else (batch_size,))
+
+    def test_apply_exp(self, num_wires, batch_size):
+        """Test that the exponential of a Pauli sentence is applied to a state."""
+        ps = random_pauli_sentence(num_wires, 20)
+        state = random_state(num_wires, batch_size)
+        matrix = expm(-0.4j * ps.to_mat(wire_order=range(num_wires)))
+
+        new_state = apply_exp_pauli_sentence(ps, -0.4j, state, batch_size is not None)
+        expected = np.reshape(state, (-1, 2**num_wires)) @ matrix.T
+        assert np.allclose(np.reshape(new_state, (-1, 2**num_wires)), expected)
+
+
+def test_blocks(monkeypatch):
+    """Test that the state is processed in blocks of fixed leading wires with the same results."""
+    ps = random_pauli_sentence(6, 30)
+    state = random_state(6, 2)
+    expected_state = apply_pauli_sentence(ps, state, is_state_batched=True)
+    expected_expval = expval_pauli_sentence(ps, state, is_state_batched=True)
+
+    monkeypatch.setattr("pennylane.devices.qubit.pauli_kernels._MAX_BLOCK_AMPLITUDES", 4)
+    assert np.allclose(apply_pauli_sentence(ps, state, is_state_batched=True), expected_state)
+    assert np.allclose(expval_pauli_sentence(ps, state, is_state_batched=True), expected_expval)
+
+
+def test_measure_uses_kernel(mocker):
+    """Test that Hamiltonian expectation values are measured without building their matrix."""
+    obs = qml.Hamiltonian([0.5, -1.2], [qml.PauliX(0) @ qml.PauliY(2), qml.PauliZ(1)])
+    state = random_state(3)
+    expected = np.vdot(state.flatten(), qml.matrix(obs, wire_order=range(3)) @ state.flatten())
+    spy = mocker.spy(qml.Hamiltonian, "sparse_matrix")
+
+    res = measure(qml.expval(obs), state)
+    assert np.allclose(res, np.real(expected))
+    spy.assert_not_called()
+
+
+def test_apply_exp_of_pauli_sum_on_many_wires(mocker):
+    """Test that exponentials of sums of Pauli words on many wires are applied without their
+    matrix."""
+    H = qml.sum(*[qml.PauliX(i) @ qml.PauliY(i + 1) for i in range(8)], qml.PauliZ(0))
+    op = qml.evolve(H, 0.3)
+    state = random_state(9)
+    spy = mocker.spy(qml.ops.Exp, "matrix")
+
+    new_state = apply_operation(op, state)
+    spy.assert_not_called()
+    expected = expm(-0.3j * qml.matrix(H, wire_order=range(9))) @ state.flatten()
+    assert np.allclose(new_state.flatten(), expected)
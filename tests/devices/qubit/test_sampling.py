@@ -21,8 +21,8 @@ import numpy as np
 import pennylane as qml
 from pennylane.devices.qubit import simulate
 from pennylane.devices.qubit.simulate import _FlexShots
-from pennylane.devices.qubit import sample_state, measure_with_samples
-from pennylane.devices.qubit.sampling import _sample_state_jax
+from pennylane.devices.qubit import sample_state, sample_basis_indices, measure_with_samples
+from pennylane.devices.qubit.sampling import _allocate_shots, _sample_state_jax
 from pennylane.measurements import Shots
 
 two_qubit_state = np.array([[0, 1j], [-1, 0]], dtype=np.complex128) / np.sqrt(2)
@@ -510,6 +510,88 @@ class TestMeasureSamples:
         assert result == -1.0
 
 
+basis_index_measurements = [
+    qml.sample(),
+    qml.sample(wires=[2, 0]),
+    qml.sample(qml.PauliZ(1)),
+    qml.sample(qml.Hermitian(np.diag([0.5, 1.0, -2.0, 3.0]), wires=[3, 1])),
+    qml.expval(qml.PauliZ(0) @ qml.PauliZ(2)),
+    qml.expval(qml.Hermitian(np.diag([0.5, 1.0, -2.0, 3.0]), wires=[3, 1])),
+    qml.var(qml.PauliZ(3)),
+    qml.var(qml.Hermitian(np.diag([0.5, 1.0, -2.0, 3.0]), wires=[2, 0])),
+    qml.probs(),
+    qml.probs(wires=[3, 1]),
+    qml.counts(),
+    qml.counts(wires=[1, 3], all_outcomes=True),
+    qml.counts(qml.PauliZ(0)),
+    qml.counts(qml.PauliZ(0) @ qml.PauliZ(1), all_outcomes=True),
+]
+
+
+class TestBasisIndices:
+    """Tests for measurements processed from the indices of the sampled basis states."""
+
+    @pytest.mark.parametrize("is_state_batched", [False, True])
+    def test_sample_basis_indices(self, is_state_batched):
+        """Test that the basis state indices are the samples of ``sample_state`` as integers."""
+        state = np.random.default_rng(0).normal(size=(2, 8)) + 0j
+        state = (state / np.linalg.norm(state, axis=1, keepdims=True)).reshape((2, 2, 2, 2))
+        if not is_state_batched:
+            state = state[0]
+
+        indices = sample_basis_indices(state, 20, is_state_batched=is_state_batched, rng=42)
+        samples = sample_state(state, 20, is_state_batched=is_state_batched, rng=42)
+
+        assert indices.shape == samples.shape[:-1]
+        assert np.array_equal(indices, samples @ [4, 2, 1])
+
+    @pytest.mark.parametrize("mp", basis_index_measurements)
+    @pytest.mark.parametrize("shots", [5, 1000])
+    @pytest.mark.parametrize("batch_size", [None, 3])
+    def test_same_as_process_samples(self, mp, shots, batch_size):
+        """Test that measurements computed from basis state indices are the same as measurements
+        computed from the samples."""
+        shape = (shots,) if batch_size is None else (batch_size, shots)
+        indices = np.random.default_rng(0).integers(16, size=shape)
+        samples = (indices[..., None] >> np.arange(3, -1, -1)) & 1
+        wire_order = qml.wires.Wires(range(4))
+
+        result = mp.process_basis_indices(indices, wire_order)
+        expected = mp.process_samples(samples, wire_order)
+
+        if isinstance(mp, qml.measurements.CountsMP):
+            assert result == expected
+        else:
+            assert np.allclose(qml.math.squeeze(result), qml.math.squeeze(expected))
+
+    @pytest.mark.parametrize("batch_size", [None, 2])
+    def test_variance_not_negative(self, batch_size):
+        """Test that the variance of samples of a single eigenvalue is zero, although the
+        difference of the moments rounds to a negative number."""
+        shape = (3,) if batch_size is None else (batch_size, 3)
+        indices = np.zeros(shape, dtype=int)
+        mp = qml.var(qml.s_prod(0.05, qml.PauliZ(0)))
+
+        result = mp.process_basis_indices(indices, qml.wires.Wires([0]))
+        assert np.all(result == 0.0)
+
+    def test_measurement_value_not_implemented(self):
+        """Test that measurements of mid-circuit measurement values are not computed from basis
+        state indices."""
+        mv = qml.measure(0)
+        with pytest.raises(NotImplementedError):
+            qml.counts(mv).process_basis_indices(np.zeros(5, dtype=int), qml.wires.Wires([0]))
+
+    def test_counts_many_wires(self):
+        """Test that the counts of basis states of many wires have the correct keys."""
+        state = np.zeros((2,) * 10, dtype=complex)
+        state[(1,) * 9 + (0,)] = 1.0
+
+        result = measure_with_samples([qml.counts()], state, shots=Shots(10))[0]
+
+        assert result == {"1111111110": 10}
+
+
 class TestInvalidStateSamples:
     """Tests for state vectors containing nan values or shot vectors with zero shots."""
 
@@ -1163,3 +1245,91 @@ class TestHamiltonianSamples:
         expected = simulate(qs_exp)
 
         assert np.allclose(res, expected, atol=0.001)
+
+    @pytest.mark.parametrize("shot_allocation", ["uniform", "weighted", "optimal"])
+    @pytest.mark.parametrize("shots", [10000, (10000, 10000)])
+    def test_shot_allocation(self, shot_allocation, shots):
+        """Test that Hamiltonian expectation values are correct for all shot allocations"""
+        ops = [qml.RX(0.4 + 0.3 * i, wires=i) for i in range(3)] + [qml.CNOT([0, 1])]
+        H = qml.Hamiltonian(
+            [3.0, -0.4, 1.2, 0.1, 0.7],
+            [
+                qml.PauliZ(0),
+                qml.PauliX(0) @ qml.PauliX(1),
+                qml.PauliZ(0) @ qml.PauliZ(2),
+                qml.PauliY(1),
+                qml.PauliY(1) @ qml.PauliX(2),
+            ],
+        )
+        expected = simulate(qml.tape.QuantumScript(ops, [qml.expval(H)]))
+
+        qs = qml.tape.QuantumScript(ops, [qml.expval(H)], shots=shots)
+        res = simulate(qs, rng=123, shot_allocation=shot_allocation)
+
+        res = res if isinstance(shots, tuple) else [res]
+        for r in res:
+            assert np.allclose(r, expected, atol=0.05)
+
+    @pytest.mark.parametrize("shot_allocation", ["uniform", "weighted", "optimal"])
+    def test_shot_allocation_broadcasting(self, shot_allocation):
+        """Test that Sum expectation values are correct for batched states"""
+        x = np.array([0.2, 1.3, 2.5])
+        ops = [qml.RX(x, wires=0), qml.CNOT([0, 1])]
+        obs = qml.sum(qml.PauliZ(0) @ qml.PauliZ(1), qml.s_prod(0.5, qml.PauliY(0)))
+
+        qs = qml.tape.QuantumScript(ops, [qml.expval(obs)], shots=10000)
+        res = simulate(qs, rng=123, shot_allocation=shot_allocation)
+
+        assert res.shape == (3,)
+        assert np.allclose(res, np.ones(3), atol=0.05)
+
+    def test_one_sample_per_group(self, mocker):
+        """Test that the state is sampled once per group of qubit-wise commuting terms, and that
+        the grouping of the Hamiltonian is used if it has one"""
+        spy = mocker.spy(qml.devices.qubit.sampling, "sample_basis_indices")
+        H = qml.Hamiltonian(
+            [1.0, 2.0, 3.0, 4.0],
+            [qml.PauliZ(0), qml.PauliZ(0) @ qml.PauliZ(1), qml.PauliX(1), qml.PauliX(0)],
+        )
+        qs = qml.tape.QuantumScript([qml.Hadamard(0)], [qml.expval(H)], shots=100)
+
+        simulate(qs, rng=123)
+        assert spy.call_count == 2
+
+        H.grouping_indices = [[0], [1], [2, 3]]
+        simulate(qs, rng=123)
+        assert spy.call_count == 5
+
+    def test_non_pauli_terms(self):
+        """Test that terms that are not Pauli words are measured separately"""
+        H = qml.Hamiltonian(
+            [0.5, 2.0, -1.0],
+            [qml.PauliZ(0), qml.Hermitian(np.diag([1.0, 3.0]), 1), qml.PauliX(1)],
+        )
+        ops = [qml.PauliX(0), qml.PauliX(1)]
+        qs = qml.tape.QuantumScript(ops, [qml.expval(H)], shots=1000)
+
+        res = simulate(qs, rng=123, shot_allocation="optimal")
+        assert np.allclose(res, -0.5 + 6.0 - 0.0, atol=0.15)
+
+    def test_unknown_shot_allocation(self):
+        """Test that an error is raised for an unknown shot allocation"""
+        H = qml.Hamiltonian([1.0], [qml.PauliZ(0)])
+        qs = qml.tape.QuantumScript([], [qml.expval(H)], shots=10)
+
+        with pytest.raises(ValueError, match="Unknown shot allocation 'random'"):
+            simulate(qs, shot_allocation="random")
+
+    @pytest.mark.parametrize(
+        "shots, weights, expected",
+        [
+            (10, [1.0, 1.0], [10, 10]),
+            (10, [3.0, 1.0], [15, 5]),
+            (10, [1.0, 0.0, 1.0], [15, 1, 15]),
+            (10, [0.0, 0.0], [10, 10]),
+            (1, [1.0, 1.0, 1.0], [1, 1, 1]),
+        ],
+    )
+    def test_allocate_shots(self, shots, weights, expected):
+        """Test that shots are distributed proportionally to the weights"""
+        assert _allocate_shots(shots, weights) == expected
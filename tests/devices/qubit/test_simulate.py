@@ -12,13 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Unit tests for simulate in devices/qubit."""
+import sys
 
 import pytest
 
 import numpy as np
 
 import pennylane as qml
-from pennylane.devices.qubit import simulate, get_final_state, measure_final_state
+from pennylane.devices.qubit import simulate, simulate_batch, get_final_state, measure_final_state
 
 
 class TestCurrentlyUnsupportedCases:
@@ -611,7 +612,7 @@ class TestSampleMeasurements:
 
         qs = qml.tape.QuantumScript(ops, mps, shots=100)
 
-        spy = mocker.spy(qml.devices.qubit.sampling, "sample_state")
+        spy = mocker.spy(qml.devices.qubit.sampling, "sample_basis_indices")
         result = simulate(qs)
 
         assert isinstance(result, tuple)
@@ -1150,3 +1151,91 @@ class TestQInfoMeasurements:
 
         grad5 = grad_tape.jacobian(results[5], phi)
         assert qml.math.allclose(grad5, expected_grads[5])
+
+
+def _layered_tape(wires, measurements):
+    """A layered ansatz with trainable rotations on ``wires``."""
+    ops = [qml.StatePrep(np.ones(8) / np.sqrt(8), wires=wires)]
+    for layer in range(2):
+        ops.extend(qml.RY(0.3 * layer + 0.1 * i, wires=w) for i, w in enumerate(wires))
+        ops.extend(qml.CNOT([wires[i], wires[i + 1]]) for i in range(len(wires) - 1))
+    return qml.tape.QuantumScript(ops, measurements(wires), trainable_params=list(range(1, 7)))
+
+
+class TestSimulateBatch:
+    """Tests for simulating batches of circuits with shared operations."""
+
+    @pytest.mark.parametrize("wires", [[0, 1, 2], [2, 0, 1], ["a", 2, "c"]])
+    @pytest.mark.parametrize("gradient", [qml.gradients.param_shift, qml.gradients.finite_diff])
+    def test_gradient_tapes(self, wires, gradient):
+        """Test that the results of the tapes of gradient transforms are the same as when the
+        tapes are simulated separately."""
+        measurements = lambda w: [qml.expval(qml.PauliZ(w[0])), qml.probs(wires=[w[2], 3])]
+        tape = _layered_tape(wires, measurements)
+        tapes, _ = gradient(tape)
+        tapes = (tape, *tapes, tape)
+
+        results = simulate_batch(tapes)
+
+        assert len(results) == len(tapes)
+        for res, t in zip(results, tapes):
+            expected = simulate(t)
+            assert all(np.allclose(r, e) for r, e in zip(res, expected))
+
+    def test_shared_operations_applied_once(self, mocker):
+        """Test that operations shared by several circuits are applied once."""
+        spy = mocker.spy(sys.modules["pennylane.devices.qubit.simulate"], "apply_operation")
+        tape = qml.tape.QuantumScript(
+            [qml.RX(0.1, 0), qml.RY(0.2, 1), qml.CNOT([0, 1]), qml.RZ(0.3, 1)],
+            [qml.expval(qml.PauliZ(1))],
+        )
+        tapes = [tape, tape.bind_new_parameters([0.5], [2]), tape.bind_new_parameters([0.7], [0])]
+
+        results = simulate_batch(tapes)
+
+        # 4 operations, 2 branching at the last one, and 4 branching at the first one
+        assert spy.call_count == 4 + 1 + 4
+        assert np.allclose(results, [simulate(t) for t in tapes])
+
+    def test_broadcasting(self):
+        """Test that circuits with broadcasted operations are simulated correctly."""
+        tape = qml.tape.QuantumScript(
+            [qml.RX(0.1, 0), qml.RY(np.array([0.2, 0.4]), 1), qml.CNOT([0, 1]), qml.RZ(0.3, 1)],
+            [qml.expval(qml.PauliZ(1)), qml.probs(wires=0)],
+        )
+        tapes = [tape, tape.bind_new_parameters([0.5], [0]), tape.bind_new_parameters([0.7], [2])]
+
+        for res, t in zip(simulate_batch(tapes), tapes):
+            expected = simulate(t)
+            assert all(np.allclose(r, e) for r, e in zip(res, expected))
+
+    def test_state_cache(self):
+        """Test that the final states are added to the state cache."""
+        tape = qml.tape.QuantumScript([qml.RX(0.1, 0), qml.RY(0.2, 0)], [qml.expval(qml.PauliZ(0))])
+        tapes = [tape, tape.bind_new_parameters([0.3], [1])]
+        state_cache = {}
+
+        simulate_batch(tapes, state_cache=state_cache)
+
+        for t in tapes:
+            assert np.allclose(state_cache[t.hash], get_final_state(t)[0])
+
+    def test_separate_circuits(self, mocker):
+        """Test that circuits with shots, postselection or on different wires are simulated
+        separately."""
+        spy = mocker.spy(sys.modules["pennylane.devices.qubit.simulate"], "simulate")
+        tape = qml.tape.QuantumScript([qml.Hadamard(0)], [qml.expval(qml.PauliZ(0))])
+        tapes = [
+            tape,
+            qml.tape.QuantumScript([qml.Hadamard(1)], [qml.expval(qml.PauliZ(1))]),
+            qml.tape.QuantumScript(tape.operations, tape.measurements, shots=10),
+            qml.tape.QuantumScript(
+                [qml.Hadamard(0), qml.Projector([0], 0)], [qml.expval(qml.PauliZ(0))]
+            ),
+            tape,
+        ]
+
+        results = simulate_batch(tapes, rng=123)
+
+        assert spy.call_count == 3
+        assert np.allclose(results[:2] + results[3:], [0, 0, 1, 0])
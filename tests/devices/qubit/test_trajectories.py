@@ -0,0 +1,173 @@
+# Copyright 2018-2024 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for simulate_trajectories in devices/qubit."""
+import pytest
+
+import numpy as np
+
+import pennylane as qml
+from pennylane.devices.qubit import simulate, simulate_trajectories
+from pennylane.devices.qubit.trajectories import _apply_kraus_branch, has_channels
+
+
+def noisy_ops():
+    """The operations of a noisy circuit with mixtures of unitaries and general channels."""
+    return [
+        qml.RX(0.4, 0),
+        qml.Hadamard(1),
+        qml.CNOT([0, 1]),
+        qml.DepolarizingChannel(0.2, 0),
+        qml.AmplitudeDamping(0.3, 1),
+        qml.RY(0.7, 1),
+        qml.PhaseDamping(0.4, 0),
+        qml.BitFlip(0.1, 1),
+    ]
+
+
+def test_has_channels():
+    """Test that circuits are recognized as noisy when they contain channels."""
+    assert has_channels(qml.tape.QuantumScript(noisy_ops()))
+    assert not has_channels(qml.tape.QuantumScript([qml.RX(0.4, 0), qml.CNOT([0, 1])]))
+
+
+class TestApplyKrausBranch:
+    """Tests for the application of sampled Kraus operators to trajectories."""
+
+    def test_deterministic_channel(self):
+        """Test that a channel with a single possible outcome is applied to every trajectory."""
+        state = np.zeros((3, 2, 2), dtype=complex)
+        state[:, 0, 0] = 1
+        new_state = _apply_kraus_branch(qml.BitFlip(1.0, 1), state, np.random.default_rng(0))
+        expected = np.zeros((3, 2, 2), dtype=complex)
+        expected[:, 0, 1] = 1
+        assert qml.math.allclose(new_state, expected)
+
+    def test_state_dependent_probabilities(self):
+        """Test that the Kraus operators of a general channel are sampled with the probabilities
+        of their outcomes, and that the resulting states are normalized."""
+        state = np.zeros((1000, 2), dtype=complex)
+        state[:, 0] = np.sqrt(0.5)
+        state[:, 1] = np.sqrt(0.5)
+        new_state = _apply_kraus_branch(
+            qml.AmplitudeDamping(0.4, 0), state, np.random.default_rng(12)
+        )
+        assert qml.math.allclose(np.linalg.norm(new_state, axis=1), 1)
+        # the decay to |0> happens with probability 0.5 * 0.4
+        decayed = np.isclose(np.abs(new_state[:, 0]), 1)
+        assert np.isclose(np.mean(decayed), 0.2, atol=0.04)
+
+    def test_identity_outcome_leaves_state(self):
+        """Test that the trajectories are unchanged if only Kraus operators proportional to the
+        identity are sampled."""
+        state = np.array([[0.6, 0.8j]] * 4)
+        new_state = _apply_kraus_branch(
+            qml.DepolarizingChannel(0.0, 0), state, np.random.default_rng(0)
+        )
+        assert new_state is state
+
+
+class TestSimulateTrajectories:
+    """Tests for the estimates of noisy circuits from trajectories."""
+
+    @pytest.mark.parametrize(
+        "mp",
+        [
+            qml.expval(qml.PauliZ(0) @ qml.PauliX(1)),
+            qml.var(qml.PauliY(1)),
+            qml.probs(wires=[0, 1]),
+            qml.density_matrix(wires=[1]),
+        ],
+    )
+    def test_results_match_density_matrix(self, mp):
+        """Test that the estimates are within a few standard errors of the exact results."""
+        qs = qml.tape.QuantumScript(noisy_ops(), [mp])
+        result, std_error = simulate_trajectories(qs, 4000, rng=3, return_std_errors=True)
+
+        expected = qml.device("default.mixed", wires=2).execute(
+            qml.tape.QuantumScript(noisy_ops(), [mp])
+        )
+        assert qml.math.shape(result) == qml.math.shape(expected)
+        assert np.all(np.abs(result - expected) <= 5 * std_error + 1e-10)
+
+    def test_multiple_measurements(self):
+        """Test that several measurements are estimated from the same trajectories."""
+        mps = [qml.expval(qml.PauliZ(0)), qml.probs(wires=[1])]
+        qs = qml.tape.QuantumScript(noisy_ops(), mps)
+        results, std_errors = simulate_trajectories(qs, 2000, rng=7, return_std_errors=True)
+
+        assert isinstance(results, tuple) and len(results) == 2
+        assert isinstance(std_errors, tuple) and len(std_errors) == 2
+        assert qml.math.shape(std_errors[1]) == (2,)
+        # the probabilities of every trajectory add up to one
+        assert np.isclose(np.sum(results[1]), 1)
+        assert np.isclose(std_errors[1][0], std_errors[1][1])
+
+    def test_seeded(self):
+        """Test that the results are reproducible with the same seed."""
+        qs = qml.tape.QuantumScript(noisy_ops(), [qml.expval(qml.PauliZ(1))])
+        assert simulate_trajectories(qs, 200, rng=5) == simulate_trajectories(qs, 200, rng=5)
+        assert simulate_trajectories(qs, 200, rng=5) != simulate_trajectories(qs, 200, rng=6)
+
+    def test_batches_of_trajectories(self, monkeypatch):
+        """Test that the trajectories are simulated in batches with the same estimates."""
+        qs = qml.tape.QuantumScript(noisy_ops(), [qml.expval(qml.PauliZ(1))])
+        result = simulate_trajectories(qs, 100, rng=5)
+        monkeypatch.setattr("pennylane.devices.qubit.trajectories._MAX_AMPLITUDES", 12)
+        result_batched, std_error = simulate_trajectories(qs, 100, rng=5, return_std_errors=True)
+        assert np.isclose(result_batched, result, atol=5 * std_error)
+
+    def test_noiseless_circuit_is_exact(self):
+        """Test that the estimates of circuits without noise have no errors."""
+        qs = qml.tape.QuantumScript([qml.RX(0.4, 0), qml.CNOT([0, 1])], [qml.expval(qml.PauliZ(1))])
+        result, std_error = simulate_trajectories(qs, 10, rng=1, return_std_errors=True)
+        assert np.isclose(result, np.cos(0.4))
+        assert np.isclose(std_error, 0)
+
+    def test_custom_wires(self):
+        """Test that circuits on arbitrary wire labels are simulated."""
+        ops = [qml.PauliX("a"), qml.BitFlip(1.0, "a"), qml.PauliX("b")]
+        qs = qml.tape.QuantumScript(ops, [qml.probs(wires=["b", "a"])])
+        assert qml.math.allclose(simulate_trajectories(qs, 5, rng=1), [0, 0, 1, 0])
+
+    def test_broadcasting(self):
+        """Test that broadcasted circuits are simulated for every parameter."""
+        ops = [qml.RX(np.array([0.0, np.pi]), 0), qml.AmplitudeDamping(0.5, 0)]
+        qs = qml.tape.QuantumScript(ops, [qml.expval(qml.PauliZ(0))])
+        results, std_errors = simulate_trajectories(qs, 2000, rng=1, return_std_errors=True)
+        assert qml.math.shape(results) == (2,)
+        assert np.allclose(results, [1, 0], atol=5 * np.max(std_errors) + 1e-10)
+
+    def test_simulate_routes_noisy_circuits(self):
+        """Test that simulate uses trajectories only for noisy circuits and when requested."""
+        qs = qml.tape.QuantumScript(
+            [qml.Hadamard(0), qml.AmplitudeDamping(0.2, wires=0)], [qml.expval(qml.PauliX(0))]
+        )
+        assert simulate(qs, rng=42, num_trajectories=10000) == simulate_trajectories(
+            qs, 10000, rng=42
+        )
+
+        noiseless = qml.tape.QuantumScript([qml.Hadamard(0)], [qml.expval(qml.PauliX(0))])
+        assert np.isclose(simulate(noiseless, num_trajectories=10), 1.0)
+
+    def test_shots_error(self):
+        """Test that finite shots are not supported."""
+        qs = qml.tape.QuantumScript(noisy_ops(), [qml.expval(qml.PauliZ(0))], shots=100)
+        with pytest.raises(qml.DeviceError, match="only be simulated analytically"):
+            simulate_trajectories(qs, 10)
+
+    def test_measurement_error(self):
+        """Test that measurements which cannot be averaged over trajectories are not supported."""
+        qs = qml.tape.QuantumScript(noisy_ops(), [qml.state()])
+        with pytest.raises(qml.DeviceError, match="is not supported for noisy circuits"):
+            simulate_trajectories(qs, 10)
@@ -0,0 +1,189 @@
+# Copyright 2018-2024 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for sampling states in devices/qutrit_mixed."""
+import pytest
+
+import numpy as np
+
+import pennylane as qml
+from pennylane.devices.qutrit_mixed import measure, measure_with_samples, sample_state
+from pennylane.devices.qutrit_mixed.sampling import sample_probs
+from pennylane.measurements import Shots
+
+SHOTS = 20000
+# the standard error of the estimates is of the order of 1 / sqrt(SHOTS)
+APPROX_ATOL = 0.03
+
+
+def basis_state(trits):
+    """The density matrix of a computational basis state."""
+    dim = 3 ** len(trits)
+    index = int("".join(map(str, trits)), 3)
+    state = np.zeros((dim, dim), dtype=complex)
+    state[index, index] = 1
+    return state.reshape((3,) * 2 * len(trits))
+
+
+class TestSampleProbs:
+    """Tests for drawing basis state indices from probabilities."""
+
+    def test_deterministic(self):
+        """Test that a single possible outcome is always drawn."""
+        res = sample_probs(np.array([0, 0, 1.0, 0]), 10, rng=1)
+        assert res.shape == (10,)
+        assert np.all(res == 2)
+
+    def test_batched(self):
+        """Test that every row of batched probabilities is sampled independently."""
+        probs = np.array([[1.0, 0, 0], [0, 0, 1.0], [0.5, 0.5, 0]])
+        res = sample_probs(probs, 1000, rng=1)
+        assert res.shape == (3, 1000)
+        assert np.all(res[0] == 0)
+        assert np.all(res[1] == 2)
+        assert set(np.unique(res[2])) == {0, 1}
+        assert np.isclose(np.mean(res[2]), 0.5, atol=0.05)
+
+    def test_frequencies(self):
+        """Test that the frequencies of the outcomes approximate their probabilities."""
+        probs = np.array([0.1, 0.6, 0.3])
+        res = sample_probs(probs, SHOTS, rng=1)
+        assert np.allclose(np.bincount(res, minlength=3) / SHOTS, probs, atol=APPROX_ATOL)
+
+    def test_nan_probabilities(self):
+        """Test that probabilities containing NaN raise an error."""
+        with pytest.raises(ValueError, match="probabilities contain NaN"):
+            sample_probs(np.array([np.nan, 0.5, 0.5]), 10)
+
+
+class TestSampleState:
+    """Tests for sampling qutrit density matrices in the computational basis."""
+
+    def test_basis_state(self):
+        """Test that a basis state is sampled as one trit per wire."""
+        samples = sample_state(basis_state([2, 0, 1]), 10, rng=1)
+        assert samples.shape == (10, 3)
+        assert np.all(samples == [2, 0, 1])
+
+    def test_wires(self):
+        """Test that a subset of the wires is sampled in the requested order."""
+        samples = sample_state(basis_state([2, 0, 1]), 10, wires=[2, 0], rng=1)
+        assert samples.shape == (10, 2)
+        assert np.all(samples == [1, 2])
+
+    def test_batched(self):
+        """Test that a batch of states is sampled."""
+        state = np.stack([basis_state([1, 2]), basis_state([0, 1])])
+        samples = sample_state(state, 10, is_state_batched=True, rng=1)
+        assert samples.shape == (2, 10, 2)
+        assert np.all(samples[0] == [1, 2])
+        assert np.all(samples[1] == [0, 1])
+
+    def test_seed(self):
+        """Test that the same seed gives the same samples."""
+        state = qml.devices.qutrit_mixed.apply_operation(qml.THadamard(0), basis_state([0]))
+        assert np.array_equal(sample_state(state, 50, rng=5), sample_state(state, 50, rng=5))
+
+
+class TestMeasureWithSamples:
+    """Tests for measuring qutrit density matrices with samples."""
+
+    def test_sample_and_counts(self):
+        """Test the samples and counts of a basis state."""
+        state = basis_state([2, 1])
+        mps = [qml.sample(), qml.sample(wires=1), qml.counts(), qml.counts(qml.GellMann(0, 3))]
+        samples, samples_1, counts, counts_obs = measure_with_samples(mps, state, Shots(10))
+        assert np.all(samples == [2, 1])
+        assert np.all(samples_1 == 1)
+        assert counts == {"21": 10}
+        assert counts_obs == {0: 10}
+
+    def test_counts_all_outcomes(self):
+        """Test that all outcomes are included in the counts if requested."""
+        mps = [
+            qml.counts(wires=0, all_outcomes=True),
+            qml.counts(qml.GellMann(0, 3), all_outcomes=True),
+        ]
+        counts, counts_obs = measure_with_samples(mps, basis_state([1]), Shots(10))
+        assert counts == {"0": 0, "1": 10, "2": 0}
+        assert counts_obs == {-1: 10, 0: 0, 1: 0}
+
+    @pytest.mark.parametrize(
+        "mp",
+        [
+            qml.expval(qml.GellMann(0, 1)),
+            qml.expval(qml.GellMann(1, 8)),
+            qml.expval(qml.GellMann(0, 5) @ qml.GellMann(2, 2)),
+            qml.expval(qml.THermitian(np.diag([1.0, 2.0, -3.0]), wires=1)),
+            qml.var(qml.GellMann(2, 4)),
+            qml.var(qml.GellMann(0, 3)),
+            qml.probs(wires=[0, 2]),
+            qml.probs(op=qml.GellMann(1, 6)),
+            qml.expval(qml.Hamiltonian([0.5, -1.2], [qml.GellMann(0, 2), qml.GellMann(1, 7)])),
+            qml.expval(qml.sum(qml.GellMann(1, 3), qml.s_prod(0.3, qml.GellMann(2, 1)))),
+        ],
+    )
+    def test_approximates_exact_results(self, mp, three_qutrit_state):
+        """Test that the estimates from samples approximate the exact results of ``measure``."""
+        res = measure_with_samples([mp], three_qutrit_state, Shots(SHOTS), rng=123)[0]
+        expected = measure(mp, three_qutrit_state)
+        assert np.shape(res) == np.shape(expected)
+        assert np.allclose(res, expected, atol=APPROX_ATOL)
+
+    def test_broadcasting(self, two_qutrit_batched_state):
+        """Test that every state of a batch is sampled."""
+        mps = [qml.expval(qml.GellMann(0, 1)), qml.probs(wires=1), qml.sample(), qml.counts()]
+        expval, probs, samples, counts = measure_with_samples(
+            mps, two_qutrit_batched_state, Shots(SHOTS), is_state_batched=True, rng=123
+        )
+        assert np.allclose(
+            expval, measure(mps[0], two_qutrit_batched_state, True), atol=APPROX_ATOL
+        )
+        assert np.allclose(probs, measure(mps[1], two_qutrit_batched_state, True), atol=APPROX_ATOL)
+        assert samples.shape == (2, SHOTS, 2)
+        assert isinstance(counts, list) and len(counts) == 2
+        assert all(sum(c.values()) == SHOTS for c in counts)
+
+    def test_shot_vector(self, two_qutrit_state):
+        """Test that a shot vector gives one result per shot vector entry."""
+        shots = Shots((100, (SHOTS, 2)))
+        mps = [qml.expval(qml.GellMann(0, 1)), qml.sample(wires=1), qml.counts()]
+        res = measure_with_samples(mps, two_qutrit_state, shots, rng=123)
+
+        assert len(res) == 3
+        for s, (_, samples, counts) in zip(shots, res):
+            assert samples.shape == (s,)
+            assert sum(counts.values()) == s
+        expected = measure(mps[0], two_qutrit_state)
+        assert np.allclose([r[0] for r in res[1:]], expected, atol=APPROX_ATOL)
+
+    def test_shot_vector_sum(self, two_qutrit_state):
+        """Test the expectation value of a sum with a shot vector."""
+        obs = qml.sum(qml.GellMann(0, 1), qml.GellMann(1, 8))
+        res = measure_with_samples([qml.expval(obs)], two_qutrit_state, Shots((SHOTS, SHOTS)))
+        assert len(res) == 2
+        expected = measure(qml.expval(obs), two_qutrit_state)
+        assert np.allclose([r[0] for r in res], expected, atol=APPROX_ATOL)
+
+    def test_results_are_ordered(self, two_qutrit_state):
+        """Test that the results are returned in the order of the measurements, although the
+        measurements in the computational basis are sampled together."""
+        mps = [
+            qml.probs(wires=0),
+            qml.expval(qml.GellMann(1, 1)),
+            qml.expval(qml.GellMann(1, 3)),
+            qml.var(qml.GellMann(0, 2)),
+        ]
+        res = measure_with_samples(mps, two_qutrit_state, Shots(SHOTS), rng=123)
+        for mp, r in zip(mps, res):
+            assert np.allclose(r, measure(mp, two_qutrit_state), atol=APPROX_ATOL)
@@ -304,19 +304,192 @@ def test_grad_error(circuit):
         dev_c.execute_and_compute_derivatives(tape_c, conf_c)
 
 
-def test_shot_error():
-    """Test if an NotImplementedError is raised when shots are requested."""
+def circuit_2():
+    """Circuit 2 with a state preparation and Clifford gates."""
+    qml.BasisState(np.array([1, 0, 1]), wires=range(3))
+    qml.Hadamard(wires=[0])
+    qml.CNOT(wires=[0, 1])
+    qml.S(wires=[1])
+    qml.ISWAP(wires=[1, 2])
+    qml.Hadamard(wires=[2])
+
+
+@pytest.mark.parametrize("circuit", [circuit_1, circuit_2])
+@pytest.mark.parametrize(
+    "meas_op",
+    [
+        qml.expval(qml.PauliY(1)),
+        qml.expval(qml.PauliZ(0) @ qml.PauliX(1)),
+        qml.expval(qml.Hamiltonian([0.42, -1.2], [qml.PauliZ(0) @ qml.PauliX(1), qml.PauliY(1)])),
+        qml.expval(qml.sum(qml.PauliZ(0), qml.s_prod(0.5, qml.PauliX(1)))),
+        qml.var(qml.PauliX(0) @ qml.PauliY(1)),
+        qml.var(qml.Hamiltonian([0.42, -1.2], [qml.PauliZ(0), qml.PauliZ(0) @ qml.PauliZ(1)])),
+        qml.probs(wires=[1, 0]),
+        qml.probs(op=qml.PauliX(0) @ qml.PauliY(1)),
+    ],
+)
+@pytest.mark.parametrize("shots", [20000, (10000, 20000)])
+def test_meas_shots_clifford(circuit, meas_op, shots):
+    """Test that measurements with shots on default.clifford agree with default.qubit."""
+    dev_c = qml.device("default.clifford", shots=shots, seed=42)
+    dev_q = qml.device("default.qubit")
+
+    def circuit_fn(meas_op):
+        circuit()
+        return qml.apply(meas_op)
+
+    if isinstance(meas_op, qml.measurements.VarianceMP):
+        # the variance is computed from expectation values, as default.qubit does not support
+        # the variance of Hamiltonians
+        obs = meas_op.obs
+        expected = qml.QNode(circuit_fn, dev_q)(qml.expval(qml.prod(obs, obs)))
+        expected -= qml.QNode(circuit_fn, dev_q)(qml.expval(obs)) ** 2
+    else:
+        expected = qml.QNode(circuit_fn, dev_q)(meas_op)
+
+    res = qml.QNode(circuit_fn, dev_c)(meas_op)
+    if isinstance(shots, tuple):
+        assert isinstance(res, tuple) and len(res) == 2
+    else:
+        res = (res,)
+    for r in res:
+        assert qml.math.shape(r) == qml.math.shape(expected)
+        assert np.allclose(r, expected, atol=0.05)
+
 
-    @qml.qnode(qml.device("default.clifford", shots=1024))
+@pytest.mark.parametrize("shots", [100, (50, 100)])
+def test_sample_shots_clifford(shots):
+    """Test that samples and counts with shots on default.clifford have the expected outcomes."""
+    dev_c = qml.device("default.clifford", wires=["a", "b", 5], shots=shots)
+
+    @qml.qnode(dev_c)
     def circuit_fn():
-        qml.BasisState(np.array([1, 1]), wires=range(2))
-        return qml.expval(qml.PauliZ(0))
+        qml.StatePrep(np.array([0, 1, 1, 0]) / np.sqrt(2), wires=["b", 5])
+        qml.Hadamard("a")
+        return (
+            qml.sample(),
+            qml.sample(qml.PauliZ("b") @ qml.PauliZ(5)),
+            qml.counts(qml.PauliX("a")),
+            qml.counts(wires=["b", 5], all_outcomes=True),
+        )
+
+    res = circuit_fn()
+    for (samples, eigvals, counts_a, counts_b), s in zip(
+        res if isinstance(shots, tuple) else [res], qml.measurements.Shots(shots)
+    ):
+        assert samples.shape == (s, 3)
+        assert np.all(samples[:, 1] != samples[:, 2])
+        assert np.all(eigvals == -1)
+        assert counts_a == {1: s}
+        assert counts_b["00"] == counts_b["11"] == 0
+        assert counts_b["01"] + counts_b["10"] == s
 
-    with pytest.raises(
-        NotImplementedError,
-        match="default.clifford currently doesn't support computation with shots.",
+
+@pytest.mark.parametrize("shots", [100, (50, 100)])
+def test_sample_scaled_word_shots_clifford(shots):
+    """Test that samples and counts of Pauli words with a coefficient are the scaled
+    eigenvalues of the words."""
+    dev_c = qml.device("default.clifford", wires=2, shots=shots)
+
+    @qml.qnode(dev_c)
+    def circuit_fn():
+        qml.PauliX(1)
+        qml.Hadamard(0)
+        return (
+            qml.sample(qml.s_prod(2.0, qml.PauliZ(1))),
+            qml.counts(qml.s_prod(-0.5, qml.prod(qml.PauliX(0), qml.PauliZ(1)))),
+            qml.sample(qml.s_prod(3.0, qml.PauliZ(0))),
+        )
+
+    res = circuit_fn()
+    for (samples, counts, samples_0), s in zip(
+        res if isinstance(shots, tuple) else [res], qml.measurements.Shots(shots)
     ):
-        circuit_fn()
+        assert samples.shape == (s,)
+        assert np.all(samples == -2.0)
+        assert counts == {0.5: s}
+        assert set(np.unique(samples_0)) <= {-3.0, 3.0}
+
+
+@pytest.mark.parametrize("max_workers", [None, 2])
+def test_seeded_shots_clifford(max_workers):
+    """Test that seeded executions with shots give the same samples."""
+    qscript = qml.tape.QuantumScript(
+        [qml.Hadamard(wires=[0]), qml.CNOT(wires=[0, 1]), qml.Hadamard(wires=[2])],
+        [qml.sample(wires=range(3)), qml.expval(qml.PauliX(2))],
+        shots=100,
+    )
+    results = []
+    for _ in range(2):
+        dev_c = qml.device("default.clifford", seed=123, max_workers=max_workers)
+        results.append(dev_c.execute((qscript, qscript)))
+        dev_c.close()
+
+    assert all(np.all(samples[:, 0] == samples[:, 1]) for samples, _ in results[0])
+    assert np.allclose(results[0][0][1], 1.0)
+    assert all(np.all(r0[0] == r1[0]) for r0, r1 in zip(*results))
+    # the tapes are sampled with different seeds
+    assert np.any(results[0][0][0] != results[0][1][0])
+
+
+def test_large_circuit_shots_clifford():
+    """Test that a large circuit can be sampled with many shots."""
+    num_wires = 200
+    ops = [qml.Hadamard(wires=[0])] + [qml.CNOT([i, i + 1]) for i in range(num_wires - 1)]
+    obs = qml.Hamiltonian(
+        [1.0] * (num_wires - 1) + [0.5],
+        [qml.PauliZ(i) @ qml.PauliZ(i + 1) for i in range(num_wires - 1)]
+        + [qml.operation.Tensor(*(qml.PauliX(i) for i in range(num_wires)))],
+    )
+    qscript = qml.tape.QuantumScript(
+        ops, [qml.expval(obs), qml.counts(wires=[0, num_wires - 1])], shots=10**5
+    )
+
+    expval, counts = qml.device("default.clifford").execute(qscript)
+    assert np.isclose(expval, num_wires - 0.5)
+    assert set(counts) == {"00", "11"} and sum(counts.values()) == 10**5
+
+
+def test_tracker_shots():
+    """Test that the tracker records the shots of executions on this device."""
+    dev_c = qml.device("default.clifford", shots=100)
+    qscript = qml.tape.QuantumScript(
+        [qml.Hadamard(wires=[0])],
+        [qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliX(0))],
+        shots=100,
+    )
+
+    with qml.Tracker(dev_c) as tracker:
+        dev_c.execute(qscript)
+
+    assert tracker.totals == {"batches": 1, "simulations": 1, "executions": 2, "shots": 200}
+
+
+def test_shots_error():
+    """Test that a NotImplementedError is raised for measurements not supported with shots."""
+
+    @qml.qnode(qml.device("default.clifford", shots=100))
+    def circuit_herm():
+        qml.Hadamard(wires=[0])
+        return qml.expval(qml.Hadamard(0))
+
+    with pytest.raises(NotImplementedError, match="measurements of Hadamard with shots"):
+        circuit_herm()
+
+    @qml.qnode(qml.device("default.clifford", shots=100))
+    def circuit_var():
+        qml.Hadamard(wires=[0])
+        return qml.var(qml.Hamiltonian([1.0, 1.0], [qml.PauliZ(0), qml.PauliX(0)]))
+
+    with pytest.raises(NotImplementedError, match="do not commute qubit-wise with shots"):
+        circuit_var()
+
+    @qml.qnode(qml.device("default.clifford", shots=100))
+    def circuit_sample():
+        return qml.sample(qml.Hamiltonian([1.0, 1.0], [qml.PauliZ(0), qml.PauliX(0)]))
+
+    with pytest.raises(NotImplementedError, match="linear combinations of Pauli words"):
+        circuit_sample()
 
 
 def test_meas_error():
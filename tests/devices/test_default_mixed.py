@@ -1076,6 +1076,111 @@ class TestApply:
         assert np.allclose(dev.state, target, atol=tol, rtol=0)
 
 
+class TestOperationFusion:
+    """Tests for the fusion of consecutive operations into blocks applied at once"""
+
+    ops = [
+        qml.RX(0.3, 0),
+        DepolarizingChannel(0.1, 0),
+        CNOT([0, 1]),
+        AmplitudeDamping(0.2, 1),
+        qml.RZ(0.4, 2),
+        qml.Snapshot(),
+        Hadamard(2),
+        qml.Toffoli([0, 1, 2]),
+        qml.CRY(0.5, [2, 1]),
+        PauliError("XY", 0.2, wires=[1, 2]),
+        Identity(0),
+        qml.SWAP([0, 2]),
+    ]
+
+    @pytest.mark.parametrize(
+        "max_fused_wires, expected",
+        [
+            (None, [[0], [1], [2], [3], [4], [5], [6], [7], [8], [9], [11]]),
+            (1, [[0, 1], [2], [3], [4], [5], [6], [7], [8], [9], [11]]),
+            (2, [[0, 1, 2, 3], [4], [5], [6], [7], [8, 9], [11]]),
+            (3, [[0, 1, 2, 3, 4], [5], [6, 7, 8, 9, 11]]),
+        ],
+    )
+    def test_fuse_operations(self, max_fused_wires, expected):
+        """Test that runs of operations acting on at most max_fused_wires wires are fused, and
+        that snapshots and identities are not."""
+        dev = qml.device("default.mixed", wires=3, max_fused_wires=max_fused_wires)
+        blocks = dev._fuse_operations(self.ops)
+
+        assert [[self.ops.index(op) for op in ops] for ops, _ in blocks] == expected
+        for ops, wires in blocks:
+            assert set(wires) == set(Wires.all_wires([op.wires for op in ops]))
+
+    @pytest.mark.parametrize("max_fused_wires", [1, 2, 3])
+    def test_fused_state(self, max_fused_wires, tol):
+        """Test that the state is the same with and without fusion."""
+        dev = qml.device("default.mixed", wires=3, max_fused_wires=None)
+        dev.apply(self.ops)
+        fused_dev = qml.device("default.mixed", wires=3, max_fused_wires=max_fused_wires)
+        fused_dev.apply(self.ops)
+
+        assert np.allclose(fused_dev.state, dev.state, atol=tol, rtol=0)
+
+    def test_fused_unitaries(self, mocker, tol):
+        """Test that a block of gates is applied as a single gate."""
+        dev = qml.device("default.mixed", wires=2)
+        spy_channel = mocker.spy(dev, "_apply_channel")
+        spy_superop = mocker.spy(dev, "_apply_superoperator")
+        dev.apply([Hadamard(0), CNOT([0, 1]), qml.RZ(0.2, 1)])
+
+        spy_channel.assert_called_once()
+        spy_superop.assert_not_called()
+        ket = np.array([np.exp(-0.1j), 0, 0, np.exp(0.1j)]) * INV_SQRT2
+        assert np.allclose(dev.state, np.outer(ket, np.conj(ket)), atol=tol, rtol=0)
+
+    def test_fused_channels(self, mocker, tol):
+        """Test that a block with channels is applied as a single superoperator."""
+        dev = qml.device("default.mixed", wires=2)
+        spy_channel = mocker.spy(dev, "_apply_channel")
+        spy_superop = mocker.spy(dev, "_apply_superoperator")
+        dev.apply([PauliX(1), AmplitudeDamping(0.25, 1), SWAP([0, 1]), AmplitudeDamping(0.5, 0)])
+
+        spy_channel.assert_not_called()
+        spy_superop.assert_called_once()
+        target = 0.375 * basis_state(2, 2) + 0.625 * basis_state(0, 2)
+        assert np.allclose(dev.state, target, atol=tol, rtol=0)
+
+    def test_fused_readout_error(self, tol):
+        """Test that circuits with readout errors are fused consistently."""
+
+        def circuit():
+            qml.RY(0.3, 0)
+            DepolarizingChannel(0.2, 0)
+            CNOT([0, 1])
+            return qml.expval(qml.PauliX(0)), qml.expval(qml.PauliZ(1))
+
+        results = [
+            qml.QNode(circuit, qml.device("default.mixed", wires=2, readout_prob=0.1, **kwargs))()
+            for kwargs in ({"max_fused_wires": None}, {})
+        ]
+        assert np.allclose(results[0], results[1], atol=tol, rtol=0)
+
+    def test_fused_gradient(self, tol):
+        """Test that the gradients of fused blocks are computed with backpropagation."""
+
+        def circuit(x):
+            qml.RX(x[0], 0)
+            AmplitudeDamping(x[1], 0)
+            CNOT([0, 1])
+            qml.RY(x[0], 1)
+            DepolarizingChannel(0.1, 1)
+            return qml.expval(qml.PauliZ(0) @ qml.PauliX(1))
+
+        x = qml.numpy.array([0.4, 0.3], requires_grad=True)
+        grads = [
+            qml.grad(qml.QNode(circuit, qml.device("default.mixed", wires=2, max_fused_wires=m)))(x)
+            for m in (None, 2)
+        ]
+        assert np.allclose(grads[0], grads[1], atol=tol, rtol=0)
+
+
 class TestReadoutError:
     """Tests for measurement readout error"""
 
@@ -15,6 +15,8 @@
 
 import pytest
 
+import numpy as np
+
 import pennylane as qml
 from pennylane.operation import Operation
 from pennylane.tape import QuantumScript
@@ -29,6 +31,7 @@ from pennylane.devices.preprocess import (
     validate_adjoint_trainable_params,
     _operator_decomposition_gen,
     decompose,
+    DecompositionCache,
     validate_observables,
     validate_measurements,
 )
@@ -56,6 +59,22 @@ class NoMatNoDecompOp(Operation):
         return False
 
 
+class SignDependentOp(Operation):
+    """Dummy operation whose decomposition depends on the sign of its parameter."""
+
+    num_wires = 1
+
+    # pylint: disable=arguments-renamed, invalid-overridden-method
+    @property
+    def has_matrix(self):
+        return False
+
+    def decomposition(self):
+        if self.data[0] > 0:
+            return [qml.RX(self.data[0], self.wires)]
+        return [qml.PauliX(self.wires), qml.RY(-self.data[0], self.wires)]
+
+
 class TestPrivateHelpers:
     """Test the private helpers for preprocessing."""
 
@@ -402,6 +421,208 @@ class TestDecomposeTransformations:
         assert new_tape[0] != prep_op
 
 
+def default_decomposer(op):
+    """The default decomposer of the decompose transform."""
+    return op.decomposition()
+
+
+def rotations_and_cnots(op):
+    """An acceptance function for decompositions into single-qubit rotations and CNOTs."""
+    return op.name in {"RX", "RY", "RZ", "Rot", "CNOT", "PauliX", "Hadamard", "SWAP"}
+
+
+class TestDecompositionCache:
+    """Tests for the cache of the decompositions of operators."""
+
+    def test_parameter_free_operator(self):
+        """Test that the decomposition of an operator without parameters is stored the first
+        time it is decomposed, and that the wires of the recipe are relabeled."""
+        cache = DecompositionCache()
+        op = qml.QFT(wires=[0, 1, 2])
+        ops = cache.decomposition(op, rotations_and_cnots)
+        assert cache.cache_info() == (0, 1, 1024, 1)
+        assert ops == list(_operator_decomposition_gen(op, rotations_and_cnots, default_decomposer))
+
+        op = qml.QFT(wires=["a", 3, "b"])
+        ops = cache.decomposition(op, rotations_and_cnots)
+        assert cache.cache_info() == (1, 1, 1024, 1)
+        assert ops == list(_operator_decomposition_gen(op, rotations_and_cnots, default_decomposer))
+
+    @pytest.mark.parametrize(
+        "op_type, shape",
+        [
+            (qml.StronglyEntanglingLayers, (2, 3, 3)),
+            (qml.BasicEntanglerLayers, (2, 3)),
+            (lambda weights, wires: qml.PauliRot(weights, "XYZ", wires=wires), ()),
+            (lambda weights, wires: qml.IsingXY(weights, wires=wires[:2]), ()),
+        ],
+    )
+    def test_parametrized_operator(self, op_type, shape):
+        """Test that the parameters of the decompositions are rebound from a recipe inferred the
+        second time an operator is decomposed."""
+        cache = DecompositionCache()
+        rng = np.random.default_rng(0)
+
+        for i, wires in enumerate([[0, 1, 2], [0, 1, 2], [2, "a", 0], [3, 4, 5]]):
+            op = op_type(rng.uniform(-2, 2, size=shape), wires=wires)
+            ops = cache.decomposition(op, rotations_and_cnots)
+            expected = list(
+                _operator_decomposition_gen(op, rotations_and_cnots, default_decomposer)
+            )
+            assert len(ops) == len(expected)
+            assert all(qml.equal(a, b) for a, b in zip(ops, expected))
+            assert cache.cache_info().hits == max(i - 1, 0)
+
+    def test_trainable_parameters(self):
+        """Test that the rebound parameters of a decomposition are differentiable."""
+        cache = DecompositionCache()
+
+        def cost(weights):
+            op = qml.StronglyEntanglingLayers(weights, wires=[0, 1])
+            tape = QuantumScript(
+                cache.decomposition(op, rotations_and_cnots), [qml.expval(qml.PauliZ(0))]
+            )
+            return qml.execute([tape], qml.device("default.qubit"), gradient_fn="backprop")[0]
+
+        weights = qml.numpy.array(np.linspace(0.1, 1.2, 12).reshape((2, 2, 3)), requires_grad=True)
+        expected = qml.grad(cost)(weights)
+        assert not np.allclose(expected, 0)
+        cost(weights + 0.5)
+        assert cache.cache_info().hits == 0
+        assert np.allclose(qml.grad(cost)(weights), expected)
+        assert cache.cache_info().hits == 1
+
+    def test_value_dependent_decomposition(self):
+        """Test that decompositions whose structure depends on the values of the parameters are
+        not stored."""
+        cache = DecompositionCache()
+        for x in [0.2, 0.3, -0.4]:
+            op = SignDependentOp(x, wires=0)
+            ops = cache.decomposition(op, rotations_and_cnots)
+            assert ops == op.decomposition()
+        assert cache.cache_info().hits == 0
+
+    @pytest.mark.parametrize(
+        "op", [qml.BasisState([0, 1], wires=[0, 1]), qml.DiagonalQubitUnitary([1j, 1], wires=0)]
+    )
+    def test_non_real_parameters(self, op):
+        """Test that operators with parameters that are not real numbers are always decomposed."""
+
+        def accepted(obj):
+            return obj.name in {"PauliX", "QubitUnitary", "RZ"}
+
+        cache = DecompositionCache()
+        for _ in range(3):
+            ops = cache.decomposition(op, accepted)
+            assert ops == list(_operator_decomposition_gen(op, accepted, default_decomposer))
+        assert cache.cache_info().hits == 0
+
+    def test_operators_in_hyperparameters(self):
+        """Test that the parameters of the operators stored in the hyperparameters of an operator
+        are part of the key of its recipe, unless they are parameters of the operator."""
+        cache = DecompositionCache()
+        for phi in [1.0, 2.0, 3.0, 2.0]:
+            op = qml.QuantumPhaseEstimation(qml.RZ(phi, wires=0), estimation_wires=[1, 2])
+            ops = cache.decomposition(op, rotations_and_cnots)
+            assert ops == list(
+                _operator_decomposition_gen(op, rotations_and_cnots, default_decomposer)
+            )
+        assert cache.cache_info().hits == 1
+
+        # RX(2 pi) = -RX(0), which makes a difference for the controlled operators
+        for phi in [0.0, 2 * np.pi]:
+            op = qml.QuantumPhaseEstimation(qml.RX(phi, wires=0), estimation_wires=[1, 2])
+            ops = cache.decomposition(op, rotations_and_cnots)
+            assert ops == list(
+                _operator_decomposition_gen(op, rotations_and_cnots, default_decomposer)
+            )
+        assert cache.cache_info().hits == 1
+
+        for phi in [1.0, 2.0, 3.0]:
+            op = qml.CRX(phi, wires=[0, 1])
+            ops = cache.decomposition(op, rotations_and_cnots)
+            assert ops == list(
+                _operator_decomposition_gen(op, rotations_and_cnots, default_decomposer)
+            )
+        assert cache.cache_info().hits == 2
+
+    @pytest.mark.parametrize(
+        "op",
+        [
+            qml.exp(qml.PauliX(0) @ qml.PauliZ(1), 0.3j),
+            qml.evolve(qml.PauliX("a") @ qml.PauliZ("b"), 0.3),
+        ],
+    )
+    def test_operators_with_tensor_base(self, op):
+        """Test that operators whose hyperparameters contain a ``Tensor``, whose name is a list,
+        are decomposed with the cache."""
+
+        def accepted(obj):
+            return obj.name in {"PauliRot", "RX", "RZ", "CNOT", "Hadamard"}
+
+        cache = DecompositionCache()
+        expected = list(_operator_decomposition_gen(op, accepted, default_decomposer))
+        for _ in range(3):
+            ops = cache.decomposition(op, accepted)
+            assert len(ops) == len(expected)
+            assert all(qml.equal(a, b) for a, b in zip(ops, expected))
+
+        (new_tape,), _ = decompose(QuantumScript([op]), accepted, cache=cache)
+        (expected_tape,), _ = decompose(QuantumScript([op]), accepted, cache=None)
+        assert qml.equal(new_tape, expected_tape)
+
+    def test_acceptance_function_and_max_expansion_are_keys(self):
+        """Test that the recipes are stored for each acceptance function and maximal depth."""
+        cache = DecompositionCache()
+        op = qml.QFT(wires=[0, 1])
+        cache.decomposition(op, rotations_and_cnots)
+        cache.decomposition(op, rotations_and_cnots, max_expansion=1)
+        cache.decomposition(op, lambda obj: obj.has_matrix)
+        assert cache.cache_info() == (0, 3, 1024, 3)
+
+    def test_maxsize_and_clear(self):
+        """Test that the least recently used recipes are discarded and that the cache can be
+        cleared."""
+        cache = DecompositionCache(maxsize=2)
+        for n in [1, 2, 3, 1]:
+            cache.decomposition(qml.QFT(wires=range(n)), rotations_and_cnots)
+        assert cache.cache_info() == (0, 4, 2, 2)
+
+        cache.maxsize = 1
+        assert len(cache) == 1
+        cache.decomposition(qml.QFT(wires=[0]), rotations_and_cnots)
+        assert cache.cache_info() == (1, 4, 1, 1)
+
+        cache.clear()
+        assert cache.cache_info() == (0, 0, 1, 0)
+
+    def test_decompose_transform(self):
+        """Test that the decompose transform uses the cache, unless it is disabled."""
+        cache = DecompositionCache()
+        tape = QuantumScript([qml.QFT(wires=[0, 1]), qml.RX(0.5, 0), qml.QFT(wires=[1, 0])])
+        (expected,), _ = decompose(tape, rotations_and_cnots, cache=None)
+        (new_tape,), _ = decompose(tape, rotations_and_cnots, cache=cache)
+        assert new_tape.operations == expected.operations
+        assert cache.cache_info() == (1, 1, 1024, 1)
+
+    @pytest.mark.parametrize("num_layers", [5, 20])
+    def test_benchmark_repeated_decomposition(self, benchmark, num_layers):
+        """Benchmark the decomposition of a template with new parameters at every step."""
+        rng = np.random.default_rng(0)
+        cache = DecompositionCache()
+
+        def workload():
+            weights = rng.uniform(size=(num_layers, 8, 3))
+            tape = QuantumScript([qml.StronglyEntanglingLayers(weights, wires=range(8))])
+            return decompose(tape, rotations_and_cnots, cache=cache)[0][0]
+
+        # the recipe is inferred the second time the template is decomposed
+        workload()
+        workload()
+        new_tape = benchmark(workload)
+        assert len(new_tape.operations) == 16 * num_layers
+
+
 def test_validate_multiprocessing_workers_None():
     """Test that validation does not fail when max_workers is None"""
     qs = QuantumScript(
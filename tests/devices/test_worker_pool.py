@@ -0,0 +1,94 @@
+# Copyright 2018-2024 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for the persistent worker pool used by the devices."""
+# pylint: disable=protected-access
+import copy
+import os
+
+import pytest
+
+from pennylane.devices.worker_pool import WorkerPool, threads_per_worker
+
+
+def _num_threads_env(_):
+    return os.environ["OMP_NUM_THREADS"]
+
+
+class TestWorkerPool:
+    """Tests for the WorkerPool class."""
+
+    def test_lazy_start(self):
+        """Test that the processes are only started when the pool is first used."""
+        pool = WorkerPool(2)
+        assert not pool.running
+        assert repr(pool) == "<WorkerPool: max_workers=2, running=False>"
+
+        assert pool.map(pow, [1, 2, 3], [2, 2, 2]) == [1, 4, 9]
+        assert pool.running
+        pool.close()
+        assert not pool.running
+
+    def test_processes_are_reused(self):
+        """Test that consecutive calls to map use the same executor."""
+        with WorkerPool(2) as pool:
+            pool.map(abs, [-1, -2])
+            executor = pool.executor
+            pool.map(abs, [-1, -2])
+            assert pool.executor is executor
+        assert not pool.running
+
+    def test_restart_after_close(self):
+        """Test that a closed pool can be used again."""
+        pool = WorkerPool(1)
+        pool.map(abs, [-1])
+        pool.close()
+        assert pool.map(abs, [-3]) == [3]
+        pool.close()
+
+    @pytest.mark.parametrize(
+        "num_tasks, max_workers, expected",
+        [(0, 2, 1), (3, 2, 1), (8, 2, 1), (9, 2, 2), (80, 2, 10)],
+    )
+    def test_chunksize(self, num_tasks, max_workers, expected):
+        """Test that every worker receives about four chunks of tasks."""
+        assert WorkerPool(max_workers).chunksize(num_tasks) == expected
+
+    def test_workers_are_pinned(self):
+        """Test that the worker processes are limited to the requested number of threads."""
+        with WorkerPool(1, num_threads=3) as pool:
+            assert pool.map(_num_threads_env, [None]) == ["3"]
+
+    def test_threads_per_worker_env_var(self, monkeypatch):
+        """Test that the thread environment variables take precedence."""
+        for var in ("MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+            monkeypatch.delenv(var, raising=False)
+        monkeypatch.setenv("OMP_NUM_THREADS", "5")
+        assert threads_per_worker(2) == 5
+        assert WorkerPool(2).num_threads == 5
+
+    def test_threads_per_worker_split(self, monkeypatch):
+        """Test that the cores are split between the workers by default."""
+        for var in ("MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS", "OMP_NUM_THREADS"):
+            monkeypatch.delenv(var, raising=False)
+        monkeypatch.setattr(os, "cpu_count", lambda: 8)
+        assert threads_per_worker(3) == 2
+        assert threads_per_worker(16) == 1
+
+    def test_copy_does_not_share_processes(self):
+        """Test that a copy of a running pool starts its own processes."""
+        with WorkerPool(1) as pool:
+            pool.map(abs, [-1])
+            new_pool = copy.deepcopy(pool)
+            assert not new_pool.running
+            assert new_pool.max_workers == 1
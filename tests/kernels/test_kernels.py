@@ -269,6 +269,163 @@ class TestKernelMatrix:
         assert qml.math.allclose(dK3, self.expected_dK3)
 
 
+def _angle_embedding(x):
+    """The embedding of the kernels of the tests of batched kernel matrices."""
+    qml.AngleEmbedding(x, wires=range(2))
+    qml.CNOT([0, 1])
+    qml.RY(0.3, wires=1)
+
+
+def _angle_kernel(x1, x2):
+    """The fidelity kernel of ``_angle_embedding``, computed with a single circuit."""
+
+    @qml.qnode(qml.device("default.qubit", wires=2))
+    def circuit():
+        _angle_embedding(x1)
+        qml.adjoint(_angle_embedding)(x2)
+        return qml.probs(wires=range(2))
+
+    return circuit()[..., 0]
+
+
+def _angle_kernel_matrix(X1, X2):
+    """The kernel matrix of ``_angle_kernel``, computed pair by pair."""
+    return np.array([[_angle_kernel(x, y) for y in X2] for x in X1])
+
+
+class TestBatchedKernelMatrix:
+    """Tests for the kernel matrices of embedding kernels and of kernels called on batches of
+    pairs of datapoints."""
+
+    X1 = np.random.default_rng(1).uniform(size=(5, 2))
+    X2 = np.random.default_rng(2).uniform(size=(3, 2))
+    expected_K1 = _angle_kernel_matrix(X1, X1)
+    expected_K2 = _angle_kernel_matrix(X1, X2)
+
+    def test_embedding_kernel(self):
+        """Test that the embedding kernel is the overlap of the states of the embedding."""
+        kernel = kern.EmbeddingKernel(_angle_embedding, wires=range(2))
+        assert qml.math.allclose(
+            kernel(self.X1[0], self.X2[1]), _angle_kernel(self.X1[0], self.X2[1])
+        )
+        assert qml.math.allclose(kernel(self.X1[0], self.X1[0]), 1)
+
+    @pytest.mark.parametrize("batch_size, simulations", [(None, 5), (1, 5), (2, 3), (10, 1)])
+    def test_embedding_kernel_matrix(self, batch_size, simulations):
+        """Test that the kernel matrices of an embedding kernel are computed from one state per
+        datapoint."""
+        dev = qml.device("default.qubit", wires=2)
+        kernel = kern.EmbeddingKernel(_angle_embedding, wires=range(2), device=dev)
+
+        with qml.Tracker(dev) as tracker:
+            K1 = kern.square_kernel_matrix(self.X1, kernel, batch_size=batch_size)
+        assert tracker.totals["simulations"] == simulations
+        assert qml.math.allclose(K1, self.expected_K1)
+
+        K2 = kern.kernel_matrix(self.X1, self.X2, kernel, batch_size=batch_size)
+        assert qml.math.allclose(K2, self.expected_K2)
+
+    def test_embedding_without_broadcasting(self):
+        """Test that an error is raised if the states of an embedding that does not support
+        parameter broadcasting are simulated in batches."""
+        kernel = kern.EmbeddingKernel(lambda x: qml.RX(qml.math.sum(x), wires=0), wires=[0])
+        with pytest.raises(ValueError, match="must support parameter broadcasting"):
+            kern.square_kernel_matrix(self.X1, kernel, batch_size=2)
+
+    @pytest.mark.parametrize("assume_normalized_kernel", [False, True])
+    @pytest.mark.parametrize("batch_size", [1, 4, 100])
+    def test_batched_kernel(self, assume_normalized_kernel, batch_size):
+        """Test that a broadcasting kernel is called on batches of pairs of datapoints, and only
+        on the upper triangle of a square kernel matrix."""
+        pairs = []
+
+        def kernel(x1, x2):
+            pairs.extend(zip(x1[:, 0], x2[:, 0]))
+            return _angle_kernel(x1, x2)
+
+        K1 = kern.square_kernel_matrix(self.X1, kernel, assume_normalized_kernel, batch_size)
+        assert qml.math.allclose(K1, self.expected_K1)
+        assert len(pairs) == (10 if assume_normalized_kernel else 15)
+
+        pairs.clear()
+        K2 = kern.kernel_matrix(self.X1, self.X2, kernel, batch_size=batch_size)
+        assert qml.math.allclose(K2, self.expected_K2)
+        assert len(pairs) == 15
+
+    def test_batched_kernel_error(self):
+        """Test that an error is raised if a kernel does not return one value per pair."""
+        with pytest.raises(ValueError, match="must support parameter broadcasting"):
+            kern.kernel_matrix(self.X1, self.X2, lambda x1, x2: 0.5, batch_size=2)
+
+    @pytest.mark.parametrize("block_size", [2, 256])
+    @pytest.mark.parametrize("batch_size", [None, 4])
+    @pytest.mark.parametrize("embedding", [False, True])
+    def test_out(self, tmp_path, monkeypatch, block_size, batch_size, embedding):
+        """Test that the kernel matrices are written to memory-mapped arrays."""
+        monkeypatch.setattr("pennylane.kernels.utils._BLOCK_SIZE", block_size)
+        if embedding:
+            kernel = kern.EmbeddingKernel(_angle_embedding, wires=range(2))
+        else:
+            kernel = _angle_kernel
+
+        out = np.lib.format.open_memmap(tmp_path / "K1.npy", mode="w+", shape=(5, 5))
+        assert kern.square_kernel_matrix(self.X1, kernel, batch_size=batch_size, out=out) is out
+        assert np.allclose(np.load(tmp_path / "K1.npy"), self.expected_K1)
+
+        out = np.lib.format.open_memmap(tmp_path / "K2.npy", mode="w+", shape=(5, 3))
+        assert kern.kernel_matrix(self.X1, self.X2, kernel, batch_size=batch_size, out=out) is out
+        assert np.allclose(np.load(tmp_path / "K2.npy"), self.expected_K2)
+
+    @pytest.mark.parametrize("batch_size", [None, 4])
+    def test_out_normalized(self, batch_size):
+        """Test that the diagonal of a normalized kernel matrix is written to the output."""
+        out = np.zeros((3, 3))
+        K = kern.square_kernel_matrix([0.1, 0.4, 0.2], _diffable_kernel, True, batch_size, out)
+        assert np.allclose(K, TestKernelMatrix.expected_K3)
+        out = np.zeros((1, 1))
+        assert np.allclose(kern.square_kernel_matrix([0.1], _diffable_kernel, True, out=out), 1)
+
+    @pytest.mark.autograd
+    def test_autograd(self):
+        """Test differentiability of the batched kernel matrices with Autograd."""
+        X1 = pnp.array(TestKernelMatrix.X1, requires_grad=True)
+        X2 = pnp.array(TestKernelMatrix.X2, requires_grad=True)
+
+        for normalized, expected in [(False, "expected_dK1"), (True, "expected_dK3")]:
+            dK = qml.jacobian(kern.square_kernel_matrix, argnum=0)(
+                X1, _diffable_kernel, normalized, 2
+            )
+            assert qml.math.allclose(dK, getattr(TestKernelMatrix, expected))
+        dK2 = qml.jacobian(kern.kernel_matrix, argnum=(0, 1))(X1, X2, _diffable_kernel, 2)
+        assert qml.math.allclose(dK2[0], TestKernelMatrix.expected_dK2[0])
+        assert qml.math.allclose(dK2[1], TestKernelMatrix.expected_dK2[1])
+
+    @pytest.mark.autograd
+    def test_autograd_embedding_kernel(self):
+        """Test that the kernel matrix of an embedding kernel is differentiable with respect to
+        the parameters of the embedding."""
+
+        def cost(weight):
+            def embedding(x):
+                _angle_embedding(x)
+                qml.RX(weight, wires=0)
+
+            kernel = kern.EmbeddingKernel(embedding, wires=range(2))
+            return qml.math.sum(kern.square_kernel_matrix(self.X1, kernel, batch_size=2))
+
+        weight = pnp.array(0.4, requires_grad=True)
+        expected = (cost(weight + 1e-5) - cost(weight - 1e-5)) / 2e-5
+        assert np.isclose(qml.grad(cost)(weight), expected, atol=1e-6)
+
+
+def test_benchmark_embedding_kernel_matrix(benchmark):
+    """Benchmark the kernel matrix of an embedding kernel on 200 datapoints."""
+    kernel = kern.EmbeddingKernel(lambda x: qml.IQPEmbedding(x, wires=range(4)), wires=range(4))
+    X = np.random.default_rng(0).uniform(size=(200, 4))
+    K = benchmark(kern.square_kernel_matrix, X, kernel, batch_size=50)
+    assert K.shape == (200, 200)
+
+
 class TestKernelPolarity:
     """Tests kernel methods to compute polarity."""
 
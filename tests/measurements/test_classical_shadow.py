@@ -14,8 +14,10 @@
 """Unit tests for the classical shadows measurement processes"""
 
 import copy
+import sys
 
 import autograd.numpy
+import numpy as onp
 import pytest
 
 import pennylane as qml
@@ -222,6 +224,124 @@ class TestProcessState:
         assert res1 == res2
 
 
+class TestProcessStateInChunks:
+    """Unit tests for the generation of classical shadows in chunks of snapshots"""
+
+    @staticmethod
+    def random_state(num_wires, seed=0):
+        """A random state vector of the given number of wires."""
+        rng = onp.random.default_rng(seed)
+        state = rng.normal(size=2**num_wires) + 1j * rng.normal(size=2**num_wires)
+        return onp.reshape(state / onp.linalg.norm(state), [2] * num_wires)
+
+    @pytest.mark.parametrize("unique_recipes", [False, True])
+    def test_chunks(self, unique_recipes):
+        """Test that the snapshots are generated in chunks with the recipes of the seed."""
+        mp = qml.classical_shadow(wires=[0, 1], seed=1)
+        wire_order = qml.wires.Wires([0, 1])
+        chunks = list(
+            mp.process_state_in_chunks(
+                self.random_state(2),
+                wire_order,
+                1000,
+                chunk_size=400,
+                unique_recipes=unique_recipes,
+            )
+        )
+
+        assert [bits.shape for bits, _ in chunks] == [(400, 2), (400, 2), (200, 2)]
+        assert all(bits.dtype == onp.int8 for bits, _ in chunks)
+        recipes = onp.concatenate([recipes for _, recipes in chunks])
+        assert onp.all(recipes == onp.random.RandomState(1).randint(0, 3, size=(1000, 2)))
+
+    def test_chunks_match_single_batch(self):
+        """Test that chunked snapshots are the snapshots of a single batch when it is large
+        enough, and that the default chunk size bounds the number of amplitudes."""
+        mp = qml.classical_shadow(wires=[2, 0], seed=3)
+        state, wire_order = self.random_state(3), qml.wires.Wires([0, 1, 2])
+
+        res = mp.process_state_with_shots(state, wire_order, shots=10, rng=5)
+        chunks = list(
+            mp.process_state_in_chunks(state, wire_order, 10, rng=5, unique_recipes=False)
+        )
+        assert len(chunks) == 1
+        assert onp.all(chunks[0][0] == res[0]) and onp.all(chunks[0][1] == res[1])
+
+    def test_default_chunk_size(self, monkeypatch):
+        """Test that the default chunks hold the snapshots that fit in the amplitude limit."""
+        module = sys.modules["pennylane.measurements.classical_shadow"]
+        monkeypatch.setattr(module, "_MAX_SNAPSHOT_AMPLITUDES", 8 * 5)
+        mp = qml.classical_shadow(wires=[0, 1, 2], seed=3)
+        chunks = mp.process_state_in_chunks(
+            self.random_state(3), qml.wires.Wires([0, 1, 2]), 12, unique_recipes=False
+        )
+        assert [len(bits) for bits, _ in chunks] == [5, 5, 2]
+
+    @pytest.mark.parametrize("shots, expected", [(10, False), (1000, True)])
+    def test_unique_recipes_default(self, shots, expected, mocker):
+        """Test that the distinct recipes are sampled at once if they are few."""
+        spy = mocker.spy(
+            sys.modules["pennylane.measurements.classical_shadow"], "_sample_unique_recipes"
+        )
+        mp = qml.classical_shadow(wires=[0, 1, 2], seed=3)
+        list(mp.process_state_in_chunks(self.random_state(3), qml.wires.Wires([0, 1, 2]), shots))
+        assert spy.call_count == int(expected)
+
+    def test_unique_recipes_distribution(self):
+        """Test that the outcomes of the distinct recipes are sampled from the same distribution
+        as the outcomes of the individual snapshots."""
+        mp = qml.classical_shadow(wires=[2, 0], seed=5)
+        state, wire_order = self.random_state(3), qml.wires.Wires([0, 1, 2])
+
+        results = []
+        for unique_recipes in [False, True]:
+            chunks = list(
+                mp.process_state_in_chunks(
+                    state, wire_order, 50000, rng=1, unique_recipes=unique_recipes
+                )
+            )
+            bits = onp.concatenate([bits for bits, _ in chunks])
+            recipes = onp.concatenate([recipes for _, recipes in chunks])
+            stats = []
+            for recipe in [(0, 0), (1, 2), (2, 1), (2, 2)]:
+                mask = onp.all(recipes == recipe, axis=1)
+                parity = onp.mean(bits[mask, 0] ^ bits[mask, 1])
+                stats.append(list(onp.mean(bits[mask], axis=0)) + [parity])
+            results.append(stats)
+
+        assert onp.allclose(results[0], results[1], atol=0.03)
+
+    def test_unique_recipes_basis_state(self):
+        """Test that the outcomes of the distinct recipes are deterministic in the eigenbasis."""
+        # |+> on wire 0 and |1> on wire 1
+        state = onp.array([[0, 1], [0, 1]]) / onp.sqrt(2)
+        mp = qml.classical_shadow(wires=[0, 1], seed=2)
+        ((bits, recipes),) = mp.process_state_in_chunks(
+            state, qml.wires.Wires([0, 1]), 200, unique_recipes=True
+        )
+
+        assert onp.all(bits[recipes[:, 0] == 0, 0] == 0)
+        assert onp.all(bits[recipes[:, 1] == 2, 1] == 1)
+        assert 0 < onp.mean(bits[recipes[:, 0] == 2, 0]) < 1
+
+    def test_shadow_expval_streams_chunks(self, mocker):
+        """Test that the expectation values of shadow_expval are estimated from the chunks of
+        snapshots as they are generated, and equal the ones of the stored shadow."""
+        spy = mocker.spy(qml.measurements.ClassicalShadowMP, "process_state_with_shots")
+        state, wire_order = self.random_state(3), qml.wires.Wires([0, 1, 2])
+        H = qml.Hamiltonian([0.5, 2.0], [qml.PauliZ(0) @ qml.PauliX(2), qml.PauliY(1)])
+
+        mp = qml.shadow_expval(H, k=3, seed=4)
+        res = mp.process_state_with_shots(state, wire_order, shots=1000, rng=2)
+        assert spy.call_count == 0
+
+        bits, recipes = qml.classical_shadow(wires=[0, 1, 2], seed=4).process_state_with_shots(
+            state, wire_order, shots=1000, rng=2
+        )
+        expected = qml.ClassicalShadow(bits, recipes).expval(H, k=3)
+        assert onp.allclose(res, expected)
+
+
 @pytest.mark.parametrize("wires", wires_list)
 class TestClassicalShadow:
     """Unit tests for classical_shadow measurement"""
@@ -132,6 +132,15 @@ class TestProcessSamples:
             np.logical_and(samples[:, 0] == 1, samples[:, 1] == 1)
         )
 
+    def test_counts_many_wires(self):
+        """Test that the counts keys are correct for basis states with indices that do not fit
+        into eight bits"""
+        samples = np.array([[1] * 9 + [0]] * 3 + [[0] * 9 + [1]])
+
+        result = qml.counts().process_samples(samples, wire_order=list(range(10)))
+
+        assert result == {"0000000001": 1, "1111111110": 3}
+
     def test_counts_with_nan_samples(self):
         """Test that the counts function disregards failed measurements (samples including
         NaN values) when totalling counts"""
@@ -179,7 +179,7 @@ class TestConstruction:
         eig_vecs = eig_decomp["eigvec"]
         eig_vals = eig_decomp["eigval"]
 
-        eigs_cache = diag_op._eigs[diag_op.hash]
+        eigs_cache = diag_op._eigs[("eigh" if diag_op.is_hermitian else "eig", diag_op.hash)]
         cached_vecs = eigs_cache["eigvec"]
         cached_vals = eigs_cache["eigval"]
 
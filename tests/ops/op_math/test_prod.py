@@ -285,7 +285,7 @@ class TestInitialization:  # pylint:disable=too-many-public-methods
         eig_vecs = eig_decomp["eigvec"]
         eig_vals = eig_decomp["eigval"]
 
-        eigs_cache = prod_op._eigs[prod_op.hash]
+        eigs_cache = prod_op._eigs[("eigh" if prod_op.is_hermitian else "eig", prod_op.hash)]
         cached_vecs = eigs_cache["eigvec"]
         cached_vals = eigs_cache["eigval"]
 
@@ -940,7 +940,8 @@ class TestProperties:
 
         eig_vecs = eig_decomp["eigvec"]
         eig_vals = eig_decomp["eigval"]
-        eigs_cache = diag_prod_op._eigs[diag_prod_op.hash]
+        key = ("eigh" if diag_prod_op.is_hermitian else "eig", diag_prod_op.hash)
+        eigs_cache = diag_prod_op._eigs[key]
         cached_vecs = eigs_cache["eigvec"]
         cached_vals = eigs_cache["eigval"]
 
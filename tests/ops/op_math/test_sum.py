@@ -267,7 +267,8 @@ class TestInitialization:
         eig_vecs = eig_decomp["eigvec"]
         eig_vals = eig_decomp["eigval"]
 
-        eigs_cache = diag_sum_op._eigs[diag_sum_op.hash]  # pylint: disable=protected-access
+        key = ("eigh" if diag_sum_op.is_hermitian else "eig", diag_sum_op.hash)
+        eigs_cache = diag_sum_op._eigs[key]  # pylint: disable=protected-access
         cached_vecs = eigs_cache["eigvec"]
         cached_vals = eigs_cache["eigval"]
 
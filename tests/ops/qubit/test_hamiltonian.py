@@ -1421,14 +1421,81 @@ class TestHamiltonianSparseMatrix:
 
         assert isinstance(sparse_matrix, scipy.sparse.csr_matrix)
 
-    def test_observable_error(self):
-        """Tests that an error is thrown if the observables are themselves constructed from multi-qubit
-        operations."""
-        with pytest.raises(ValueError, match="Can only sparsify Hamiltonians"):
-            H = qml.Hamiltonian(
-                [0.1], [qml.PauliZ("c") @ qml.Hermitian(np.eye(4), wires=["a", "b"])]
-            )
-            H.sparse_matrix(wire_order=["a", "c", "b"])
+    def test_wire_order_error(self):
+        """Tests that an error is raised if the wire order does not contain all the wires."""
+        H = qml.Hamiltonian([0.1], [qml.PauliZ("c") @ qml.PauliX("a")])
+        with pytest.raises(ValueError, match="does not contain all the Hamiltonian's wires"):
+            H.sparse_matrix(wire_order=["a", "b"])
+
+    def test_multi_qubit_observables(self):
+        """Tests the sparse matrix of Hamiltonians whose observables are constructed from
+        multi-qubit and non-Pauli operations."""
+        rng = np.random.default_rng(42)
+        mat = rng.normal(size=(4, 4)) + 1j * rng.normal(size=(4, 4))
+        obs = [
+            qml.PauliZ("c") @ qml.Hermitian(mat + mat.conj().T, wires=["a", "b"]),
+            qml.Hadamard("b") @ qml.PauliY("a"),
+            qml.Projector([1], wires="c"),
+        ]
+        H = qml.Hamiltonian([0.1, -0.3, 0.7], obs)
+        wire_order = ["a", "c", "b"]
+        expected = sum(c * qml.matrix(o, wire_order=wire_order) for c, o in zip(H.coeffs, H.ops))
+
+        assert np.allclose(H.sparse_matrix(wire_order=wire_order).toarray(), expected)
+
+    def test_many_terms(self):
+        """Tests the sparse matrix of a Hamiltonian with many terms, assembled in small blocks."""
+        rng = np.random.default_rng(42)
+        paulis = [qml.Identity, qml.PauliX, qml.PauliY, qml.PauliZ]
+        obs = [
+            qml.operation.Tensor(*(paulis[p](w) for w, p in enumerate(rng.integers(4, size=6))))
+            for _ in range(50)
+        ]
+        H = qml.Hamiltonian(rng.normal(size=50), obs)
+        expected = sum(c * qml.matrix(o, wire_order=range(6)) for c, o in zip(H.coeffs, H.ops))
+
+        sparse_matrix = H.sparse_matrix(wire_order=range(6), buffer_size=64)
+        assert sparse_matrix.has_sorted_indices
+        assert np.allclose(sparse_matrix.toarray(), expected)
+
+    @pytest.mark.parametrize("dtype", ["complex64", "float32", "float64"])
+    def test_dtype(self, dtype):
+        """Tests the sparse matrix of a real Hamiltonian with a given data type."""
+        H = qml.Hamiltonian(
+            [0.5, -1.2], [qml.PauliX(0) @ qml.PauliZ(1), qml.PauliY(0) @ qml.PauliY(1)]
+        )
+
+        sparse_matrix = H.sparse_matrix(dtype=dtype)
+        assert sparse_matrix.dtype == np.dtype(dtype)
+        assert np.allclose(sparse_matrix.toarray(), qml.matrix(H))
+
+    def test_real_dtype_error(self):
+        """Tests that an error is raised if a real data type is requested for complex entries."""
+        H = qml.Hamiltonian([0.5], [qml.PauliY(0)])
+        with pytest.raises(ValueError, match="has complex entries"):
+            H.sparse_matrix(dtype="float32")
+
+    def test_format(self):
+        """Tests that the sparse matrix is returned in the requested format."""
+        H = qml.Hamiltonian([0.5, -1.2], [qml.PauliX(0) @ qml.PauliZ(1), qml.PauliY(0)])
+        sparse_matrix = H.sparse_matrix(format="coo")
+        assert isinstance(sparse_matrix, scipy.sparse.coo_matrix)
+        assert np.allclose(sparse_matrix.toarray(), qml.matrix(H))
+
+    def test_linear_operator(self):
+        """Tests that the Hamiltonian is returned as a linear operator."""
+        H = qml.Hamiltonian(
+            [0.5, -1.2j, 0.3],
+            [qml.PauliX(0) @ qml.PauliZ(2), qml.PauliY(1) @ qml.PauliY(0), qml.PauliZ(1)],
+        )
+        matrix = qml.matrix(H, wire_order=range(3))
+        vectors = np.random.default_rng(42).normal(size=(8, 2))
+
+        operator = H.sparse_matrix(wire_order=range(3), format="linear_operator", buffer_size=32)
+        assert isinstance(operator, scipy.sparse.linalg.LinearOperator)
+        assert np.allclose(operator @ vectors[:, 0], matrix @ vectors[:, 0])
+        assert np.allclose(operator @ vectors, matrix @ vectors)
+        assert np.allclose(operator.H @ vectors, matrix.conj().T @ vectors)
 
 
 @pytest.mark.jax
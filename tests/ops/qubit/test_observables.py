@@ -20,12 +20,13 @@ import numpy as np
 
 from gate_data import I, X, Y, Z, H
 import pennylane as qml
+from pennylane.ops import matrix_fingerprint
 from pennylane.ops.qubit.observables import BasisStateProjector, StateVectorProjector
 
 
 @pytest.fixture(autouse=True)
 def run_before_tests():
-    qml.Hermitian._eigs = {}
+    qml.Hermitian._eigs.clear()
     yield
 
 
@@ -226,7 +227,7 @@ class TestHermitian:
         assert np.allclose(eigendecomp["eigval"], eigvals, atol=tol, rtol=0)
         assert np.allclose(eigendecomp["eigvec"], eigvecs, atol=tol, rtol=0)
 
-        key = tuple(observable.flatten().tolist())
+        key = ("eigh", matrix_fingerprint(observable))
         assert np.allclose(qml.Hermitian._eigs[key]["eigval"], eigvals, atol=tol, rtol=0)
         assert np.allclose(qml.Hermitian._eigs[key]["eigvec"], eigvecs, atol=tol, rtol=0)
 
@@ -243,7 +244,7 @@ class TestHermitian:
         assert np.allclose(eigendecomp["eigval"], eigvals, atol=tol, rtol=0)
         assert np.allclose(eigendecomp["eigvec"], eigvecs, atol=tol, rtol=0)
 
-        key = tuple(observable.flatten().tolist())
+        key = ("eigh", matrix_fingerprint(observable))
         assert np.allclose(qml.Hermitian._eigs[key]["eigval"], eigvals, atol=tol, rtol=0)
         assert np.allclose(qml.Hermitian._eigs[key]["eigvec"], eigvecs, atol=tol, rtol=0)
         assert len(qml.Hermitian._eigs) == 1
@@ -260,7 +261,7 @@ class TestHermitian:
         observable_1_eigvals = obs1[1]
         observable_1_eigvecs = obs1[2]
 
-        key = tuple(observable_1.flatten().tolist())
+        key = ("eigh", matrix_fingerprint(observable_1))
 
         qml.Hermitian(observable_1, 0).eigvals()
         assert np.allclose(
@@ -275,7 +276,7 @@ class TestHermitian:
         observable_2_eigvals = obs2[1]
         observable_2_eigvecs = obs2[2]
 
-        key_2 = tuple(observable_2.flatten().tolist())
+        key_2 = ("eigh", matrix_fingerprint(observable_2))
 
         qml.Hermitian(observable_2, 0).eigvals()
         assert np.allclose(
@@ -291,7 +292,7 @@ class TestHermitian:
         self, observable, eigvals, eigvecs, tol
     ):
         """Tests that the eigvals method of the Hermitian class keeps the same dictionary entries upon multiple calls."""
-        key = tuple(observable.flatten().tolist())
+        key = ("eigh", matrix_fingerprint(observable))
 
         qml.Hermitian(observable, 0).eigvals()
         assert np.allclose(qml.Hermitian._eigs[key]["eigval"], eigvals, atol=tol, rtol=0)
@@ -315,7 +316,7 @@ class TestHermitian:
 
         assert spy.call_count == 1
 
-        key = tuple(observable.flatten().tolist())
+        key = ("eigh", matrix_fingerprint(observable))
         assert np.allclose(qml.Hermitian._eigs[key]["eigval"], eigvals, atol=tol, rtol=0)
         assert np.allclose(qml.Hermitian._eigs[key]["eigvec"], eigvecs, atol=tol, rtol=0)
 
@@ -349,7 +350,7 @@ class TestHermitian:
 
         qubit_unitary = qml.Hermitian(observable_1, wires=[0]).diagonalizing_gates()
 
-        key = tuple(observable_1.flatten().tolist())
+        key = ("eigh", matrix_fingerprint(observable_1))
         assert np.allclose(
             qml.Hermitian._eigs[key]["eigval"], observable_1_eigvals, atol=tol, rtol=0
         )
@@ -366,7 +367,7 @@ class TestHermitian:
 
         qubit_unitary_2 = qml.Hermitian(observable_2, wires=[0]).diagonalizing_gates()
 
-        key = tuple(observable_2.flatten().tolist())
+        key = ("eigh", matrix_fingerprint(observable_2))
         assert np.allclose(
             qml.Hermitian._eigs[key]["eigval"], observable_2_eigvals, atol=tol, rtol=0
         )
@@ -384,7 +385,7 @@ class TestHermitian:
         """Tests that the diagonalizing_gates method of the Hermitian class keeps the same dictionary entries upon multiple calls."""
         qubit_unitary = qml.Hermitian(observable, wires=[0]).diagonalizing_gates()
 
-        key = tuple(observable.flatten().tolist())
+        key = ("eigh", matrix_fingerprint(observable))
         assert np.allclose(qml.Hermitian._eigs[key]["eigval"], eigvals, atol=tol, rtol=0)
         assert np.allclose(qml.Hermitian._eigs[key]["eigvec"], eigvecs, atol=tol, rtol=0)
 
@@ -393,7 +394,7 @@ class TestHermitian:
 
         qubit_unitary = qml.Hermitian(observable, wires=[0]).diagonalizing_gates()
 
-        key = tuple(observable.flatten().tolist())
+        key = ("eigh", matrix_fingerprint(observable))
         assert np.allclose(qml.Hermitian._eigs[key]["eigval"], eigvals, atol=tol, rtol=0)
         assert np.allclose(qml.Hermitian._eigs[key]["eigvec"], eigvecs, atol=tol, rtol=0)
 
@@ -13,12 +13,12 @@
 # limitations under the License.
 """Unit tests for qutrit observables."""
 import functools
-from unittest.mock import PropertyMock, patch
 import pytest
 import numpy as np
 from gate_data import GELL_MANN
 
 import pennylane as qml
+from pennylane.ops import matrix_fingerprint
 
 # pylint: disable=protected-access, unused-argument
 
@@ -72,15 +72,8 @@ class TestTHermitian:
     """Test the THermitian observable"""
 
     def setup_method(self):
-        """Patch the _eigs class attribute of the Hermitian class before every test."""
-        self.patched_eigs = patch(  # pylint: disable=attribute-defined-outside-init
-            "pennylane.ops.qutrit.observables.THermitian._eigs", PropertyMock(return_value={})
-        )
-        self.patched_eigs.start()
-
-    def tear_down_method(self):
-        """Stop patch after every test."""
-        self.patched_eigs.stop()
+        """Clear the eigendecompositions cached by the THermitian class before every test."""
+        qml.THermitian._eigs.clear()
 
     @pytest.mark.parametrize("observable, eigvals, eigvecs", EIGVALS_TEST_DATA)
     def test_thermitian_eigegendecomposition_single_wire(self, observable, eigvals, eigvecs, tol):
@@ -91,7 +84,7 @@ class TestTHermitian:
         assert np.allclose(eigendecomp["eigval"], eigvals, atol=tol, rtol=0)
         assert np.allclose(eigendecomp["eigvec"], eigvecs, atol=tol, rtol=0)
 
-        key = tuple(observable.flatten().tolist())
+        key = ("eigh", matrix_fingerprint(observable))
         assert np.allclose(qml.THermitian._eigs[key]["eigval"], eigvals, atol=tol, rtol=0)
         assert np.allclose(qml.THermitian._eigs[key]["eigvec"], eigvecs, atol=tol, rtol=0)
 
@@ -108,7 +101,7 @@ class TestTHermitian:
         assert np.allclose(eigendecomp["eigval"], eigvals, atol=tol, rtol=0)
         assert np.allclose(eigendecomp["eigvec"], eigvecs, atol=tol, rtol=0)
 
-        key = tuple(observable.flatten().tolist())
+        key = ("eigh", matrix_fingerprint(observable))
         assert np.allclose(qml.THermitian._eigs[key]["eigval"], eigvals, atol=tol, rtol=0)
         assert np.allclose(qml.THermitian._eigs[key]["eigvec"], eigvecs, atol=tol, rtol=0)
         assert len(qml.THermitian._eigs) == 1
@@ -125,7 +118,7 @@ class TestTHermitian:
         observable_1_eigvals = obs1[1]
         observable_1_eigvecs = obs1[2]
 
-        key = tuple(observable_1.flatten().tolist())
+        key = ("eigh", matrix_fingerprint(observable_1))
 
         qml.THermitian(observable_1, 0).eigvals()
         assert np.allclose(
@@ -140,7 +133,7 @@ class TestTHermitian:
         observable_2_eigvals = obs2[1]
         observable_2_eigvecs = obs2[2]
 
-        key_2 = tuple(observable_2.flatten().tolist())
+        key_2 = ("eigh", matrix_fingerprint(observable_2))
 
         qml.THermitian(observable_2, 0).eigvals()
         assert np.allclose(
@@ -156,7 +149,7 @@ class TestTHermitian:
         self, observable, eigvals, eigvecs, tol
     ):
         """Tests that the eigvals method of the THermitian class keeps the same dictionary entries upon multiple calls."""
-        key = tuple(observable.flatten().tolist())
+        key = ("eigh", matrix_fingerprint(observable))
 
         qml.THermitian(observable, 0).eigvals()
         assert np.allclose(qml.THermitian._eigs[key]["eigval"], eigvals, atol=tol, rtol=0)
@@ -173,7 +166,7 @@ class TestTHermitian:
         """Tests that the diagonalizing_gates method of the THermitian class returns the correct results."""
         qutrit_unitary = qml.THermitian(observable, wires=[0]).diagonalizing_gates()
 
-        key = tuple(observable.flatten().tolist())
+        key = ("eigh", matrix_fingerprint(observable))
         assert np.allclose(qml.THermitian._eigs[key]["eigval"], eigvals, atol=tol, rtol=0)
         assert np.allclose(qml.THermitian._eigs[key]["eigvec"], eigvecs, atol=tol, rtol=0)
 
@@ -208,7 +201,7 @@ class TestTHermitian:
 
         qutrit_unitary = qml.THermitian(observable_1, wires=[0]).diagonalizing_gates()
 
-        key = tuple(observable_1.flatten().tolist())
+        key = ("eigh", matrix_fingerprint(observable_1))
         assert np.allclose(
             qml.THermitian._eigs[key]["eigval"], observable_1_eigvals, atol=tol, rtol=0
         )
@@ -225,7 +218,7 @@ class TestTHermitian:
 
         qutrit_unitary_2 = qml.THermitian(observable_2, wires=[0]).diagonalizing_gates()
 
-        key = tuple(observable_2.flatten().tolist())
+        key = ("eigh", matrix_fingerprint(observable_2))
         assert np.allclose(
             qml.THermitian._eigs[key]["eigval"], observable_2_eigvals, atol=tol, rtol=0
         )
@@ -245,7 +238,7 @@ class TestTHermitian:
         """Tests that the diagonalizing_gates method of the THermitian class keeps the same dictionary entries upon multiple calls."""
         qutrit_unitary = qml.THermitian(observable, wires=[0]).diagonalizing_gates()
 
-        key = tuple(observable.flatten().tolist())
+        key = ("eigh", matrix_fingerprint(observable))
         assert np.allclose(qml.THermitian._eigs[key]["eigval"], eigvals, atol=tol, rtol=0)
         assert np.allclose(qml.THermitian._eigs[key]["eigvec"], eigvecs, atol=tol, rtol=0)
 
@@ -254,7 +247,7 @@ class TestTHermitian:
 
         qutrit_unitary = qml.THermitian(observable, wires=[0]).diagonalizing_gates()
 
-        key = tuple(observable.flatten().tolist())
+        key = ("eigh", matrix_fingerprint(observable))
         assert np.allclose(qml.THermitian._eigs[key]["eigval"], eigvals, atol=tol, rtol=0)
         assert np.allclose(qml.THermitian._eigs[key]["eigvec"], eigvecs, atol=tol, rtol=0)
 
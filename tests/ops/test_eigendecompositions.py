@@ -0,0 +1,192 @@
+# Copyright 2018-2024 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the bounded cache of eigendecompositions.
+"""
+# pylint: disable=protected-access
+import threading
+
+import pytest
+import numpy as np
+
+import pennylane as qml
+from pennylane.ops import EigenCache, matrix_fingerprint
+
+
+def eigh_of(matrix):
+    """Return a function computing the eigendecomposition of a matrix."""
+    return lambda: np.linalg.eigh(matrix)
+
+
+class TestMatrixFingerprint:
+    """Tests for the fingerprints of matrices."""
+
+    def test_equal_matrices(self):
+        """Test that equal matrices have the same fingerprint, also if not contiguous."""
+        matrix = np.arange(16.0).reshape(4, 4)
+        assert matrix_fingerprint(matrix) == matrix_fingerprint(matrix.copy())
+        assert matrix_fingerprint(matrix.T) == matrix_fingerprint(np.ascontiguousarray(matrix.T))
+
+    @pytest.mark.parametrize(
+        "other",
+        [
+            np.arange(16.0).reshape(2, 8),
+            np.arange(16).reshape(4, 4),
+            np.arange(16.0).reshape(4, 4) + 1e-15,
+        ],
+    )
+    def test_different_matrices(self, other):
+        """Test that the fingerprint depends on the shape, data type and entries of a matrix."""
+        assert matrix_fingerprint(np.arange(16.0).reshape(4, 4)) != matrix_fingerprint(other)
+
+    def test_size_is_constant(self):
+        """Test that the fingerprint does not grow with the matrix."""
+        fingerprint = matrix_fingerprint(np.eye(256))
+        assert len(fingerprint[2]) == 32
+        assert hash(fingerprint) == hash(matrix_fingerprint(np.eye(256)))
+
+
+class TestEigenCache:
+    """Tests for the EigenCache class."""
+
+    def test_lookup_hits_and_misses(self):
+        """Test that eigendecompositions are only computed on a miss."""
+        cache = EigenCache()
+        matrix = np.array([[1.0, 2.0], [2.0, -1.0]])
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return np.linalg.eigh(matrix)
+
+        first = cache.lookup("a", compute)
+        second = cache.lookup("a", compute)
+
+        assert first is second
+        assert len(calls) == 1
+        assert np.allclose(first["eigval"], np.linalg.eigvalsh(matrix))
+        info = cache.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+        assert info.nbytes == first["eigval"].nbytes + first["eigvec"].nbytes
+
+    def test_maxsize_evicts_least_recently_used(self):
+        """Test that the least recently used entries are discarded above maxsize."""
+        cache = EigenCache(maxsize=2)
+        for key in "abc":
+            cache.lookup(key, eigh_of(np.eye(2)))
+            if key == "b":
+                # using "a" makes "b" the least recently used entry
+                cache.lookup("a", eigh_of(np.eye(2)))
+
+        assert "a" in cache and "c" in cache and "b" not in cache
+        assert len(cache) == 2
+
+    def test_maxbytes_evicts_least_recently_used(self):
+        """Test that the least recently used entries are discarded above maxbytes."""
+        entry_bytes = 4 * 8 + 16 * 8
+        cache = EigenCache(maxbytes=2 * entry_bytes)
+        for key in "abc":
+            cache.lookup(key, eigh_of(np.eye(4)))
+
+        assert list(cache._entries) == ["b", "c"]
+        assert cache.nbytes == 2 * entry_bytes
+
+    def test_entry_larger_than_maxbytes(self):
+        """Test that an eigendecomposition larger than maxbytes is returned but not stored."""
+        cache = EigenCache(maxbytes=10)
+        result = cache.lookup("a", eigh_of(np.eye(2)))
+
+        assert np.allclose(result["eigvec"], np.eye(2))
+        assert len(cache) == 0 and cache.nbytes == 0
+
+    def test_lowering_limits_evicts(self):
+        """Test that lowering the limits discards entries immediately."""
+        cache = EigenCache()
+        for key in range(5):
+            cache.lookup(key, eigh_of(np.eye(2)))
+
+        cache.maxsize = 3
+        assert list(cache._entries) == [2, 3, 4]
+        cache.maxbytes = cache.nbytes // 3
+        assert list(cache._entries) == [4]
+        assert cache.cache_info().maxsize == 3
+
+    def test_clear(self):
+        """Test that clearing the cache discards its entries and statistics."""
+        cache = EigenCache()
+        cache.lookup("a", eigh_of(np.eye(2)))
+        cache.lookup("a", eigh_of(np.eye(2)))
+        cache.clear()
+
+        assert cache.cache_info() == (0, 0, 1024, 0, 2**28, 0)
+
+    def test_threads(self):
+        """Test that the cache stays consistent when used from several threads."""
+        cache = EigenCache(maxsize=8)
+
+        def work(offset):
+            for i in range(200):
+                cache.lookup((offset + i) % 12, eigh_of(np.eye(2)))
+
+        threads = [threading.Thread(target=work, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        info = cache.cache_info()
+        assert info.hits + info.misses == 800
+        assert info.currsize == 8
+        assert info.nbytes == sum(cache._sizes.values())
+
+
+@pytest.mark.xdist_group(name="hermitian_cache_group")
+@pytest.mark.usefixtures("tear_down_hermitian")
+class TestSharedCache:
+    """Tests for the cache shared by the eigendecompositions of observables."""
+
+    def test_shared_by_observables(self):
+        """Test that Hermitian, THermitian and composite operators use the shared cache."""
+        assert qml.Hermitian._eigs is qml.ops.eigen_cache
+        assert qml.THermitian._eigs is qml.ops.eigen_cache
+        assert qml.ops.Sum._eigs is qml.ops.eigen_cache
+
+    def test_observables_are_cached(self):
+        """Test that repeated eigendecompositions of observables are cache hits."""
+        qml.ops.eigen_cache.clear()
+        matrix = np.array([[1.0, 2.0], [2.0, -1.0]])
+        qml.Hermitian(matrix, wires=0).eigvals()
+        qml.Hermitian(matrix.copy(), wires=1).diagonalizing_gates()
+        op = qml.sum(qml.PauliX(0), qml.PauliZ(0))
+        op.eigvals()
+        qml.sum(qml.PauliX(0), qml.PauliZ(0)).diagonalizing_gates()
+
+        info = qml.ops.eigen_cache.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (2, 2, 2)
+        assert ("eigh", matrix_fingerprint(matrix)) in qml.ops.eigen_cache
+        assert ("eigh", op.hash) in qml.ops.eigen_cache
+
+    def test_bounded(self):
+        """Test that the number of cached eigendecompositions of observables is bounded."""
+        cache = qml.ops.eigen_cache
+        cache.clear()
+        maxsize = cache.maxsize
+        try:
+            cache.maxsize = 5
+            for i in range(20):
+                qml.Hermitian(np.diag([float(i), 0.0]), wires=0).eigvals()
+            assert len(cache) == 5
+            assert cache.cache_info().misses == 20
+        finally:
+            cache.maxsize = maxsize
@@ -363,6 +363,50 @@ class TestGroupObservables:
             for j, pauli in enumerate(partition):
                 assert are_identical_pauli_words(pauli, anticom_partitions_sol[i][j])
 
+    @pytest.mark.parametrize("method", ["lf", "rlf", "dsatur", "si", "greedy"])
+    @pytest.mark.parametrize("grouping_type", ["qwc", "commuting", "anticommuting"])
+    def test_partitioning_methods(self, method, grouping_type):
+        """Test that all colouring methods return valid partitions with the matching coefficients."""
+        observables = [
+            PauliX(0) @ PauliY(1),
+            PauliZ(0),
+            PauliY(0) @ PauliY(2),
+            PauliX(1),
+            PauliZ(1) @ PauliZ(2),
+            PauliX(0) @ PauliY(1),
+            PauliY(2),
+        ]
+        coefficients = [0.1, 0.2, -0.3, 0.4, 0.5, -0.6, 0.7]
+
+        partitions, coeffs = group_observables(observables, coefficients, grouping_type, method)
+
+        relations = {
+            "qwc": lambda a, b: qml.pauli.are_pauli_words_qwc([a, b]),
+            "commuting": qml.is_commuting,
+            "anticommuting": lambda a, b: not qml.is_commuting(a, b),
+        }
+        remaining = list(zip(observables, coefficients))
+        for partition, partition_coeffs in zip(partitions, coeffs):
+            for pauli, coeff in zip(partition, partition_coeffs):
+                match = next(
+                    i
+                    for i, (obs, c) in enumerate(remaining)
+                    if are_identical_pauli_words(obs, pauli) and c == coeff
+                )
+                remaining.pop(match)
+            for i, pauli_i in enumerate(partition):
+                for pauli_j in partition[i + 1 :]:
+                    assert relations[grouping_type](pauli_i, pauli_j)
+        assert not remaining
+
+    def test_sorted_insertion_uses_coefficients(self):
+        """Test that the sorted insertion method inserts the largest coefficients first."""
+        observables = [PauliZ(0), PauliX(0) @ PauliX(1), PauliZ(1), PauliX(1)]
+        coefficients = [0.1, 0.5, 0.3, 0.2]
+
+        _, coeffs = group_observables(observables, coefficients, "qwc", "si")
+        assert coeffs == [[0.5, 0.2], [0.3, 0.1]]
+
     def test_group_observables_exception(self):
         """Tests that the ``group_observables`` function raises an exception if
         the lengths of coefficients and observables do not agree."""
@@ -0,0 +1,176 @@
+# Copyright 2018-2024 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the sparse Pauli graph colouring functions in ``/pauli/grouping/sparse_colouring.py``.
+"""
+import pytest
+import numpy as np
+
+from pennylane.pauli.grouping.group_observables import PauliGroupingStrategy
+from pennylane.pauli.grouping.sparse_colouring import (
+    complement_adj_sparse,
+    dsatur,
+    greedy_insertion,
+    insertion_labels,
+    masked_parities,
+    pack_binary_observables,
+    packed_parity,
+    sorted_insertion,
+)
+
+
+def random_binary_observables(n_terms, n_qubits, seed=42):
+    """Random Pauli words in the binary vector representation, without repetitions."""
+    rng = np.random.default_rng(seed)
+    words = np.unique(rng.integers(0, 2, size=(n_terms, 2 * n_qubits)), axis=0)
+    return words[rng.permutation(len(words))]
+
+
+def verify_partitions(binary_observables, colouring, adj):
+    """Verifies that all Pauli words are coloured once and that no words of the same
+    colour are connected in the complement graph."""
+    lookup = {word.tobytes(): i for i, word in enumerate(binary_observables)}
+    coloured = [[lookup[word.tobytes()] for word in group] for group in colouring.values()]
+
+    assert sorted(sum(coloured, [])) == list(range(len(binary_observables)))
+    for group in coloured:
+        assert not adj[np.ix_(group, group)].any()
+
+
+class TestPacking:
+    """Tests for the packed representation of Pauli words."""
+
+    @pytest.mark.parametrize("n_qubits", [1, 3, 64, 70])
+    def test_pack_binary_observables(self, n_qubits):
+        """Test that the packed bits match the binary vector representation."""
+        binary_observables = random_binary_observables(10, n_qubits)
+        x, z = pack_binary_observables(binary_observables)
+
+        assert x.dtype == z.dtype == np.uint64
+        assert x.shape == z.shape == (len(binary_observables), -(-n_qubits // 64))
+
+        bits = np.unpackbits(x.view(np.uint8), axis=1, bitorder="little")[:, :n_qubits]
+        assert np.array_equal(bits, binary_observables[:, :n_qubits])
+        bits = np.unpackbits(z.view(np.uint8), axis=1, bitorder="little")[:, :n_qubits]
+        assert np.array_equal(bits, binary_observables[:, n_qubits:])
+
+    def test_packed_parity(self):
+        """Test the parities of packed integers, across an axis and elementwise."""
+        words = np.random.default_rng(0).integers(0, 2**63, size=(20, 3)).astype(np.uint64)
+        counts = np.array([[bin(int(w)).count("1") for w in row] for row in words])
+
+        assert np.array_equal(packed_parity(words), counts.sum(axis=1) % 2 == 1)
+        assert np.array_equal(packed_parity(words, axis=None), counts % 2 == 1)
+
+    def test_masked_parities(self, monkeypatch):
+        """Test the parities of values and masks computed in blocks."""
+        monkeypatch.setattr("pennylane.pauli.grouping.sparse_colouring._BLOCK_SIZE", 7)
+        values, masks = np.arange(16, dtype=np.uint64), np.array([0, 1, 5, 15], dtype=np.uint64)
+        expected = [[bin(int(v & m)).count("1") % 2 == 1 for v in values] for m in masks]
+
+        assert np.array_equal(masked_parities(values, masks), expected)
+
+    @pytest.mark.parametrize("grouping_type", ["qwc", "commuting", "anticommuting"])
+    @pytest.mark.parametrize("n_qubits", [2, 5, 67])
+    def test_complement_adj_sparse(self, grouping_type, n_qubits):
+        """Test that the sparse complement graph matches the dense one."""
+        binary_observables = random_binary_observables(40, n_qubits)
+        strategy = PauliGroupingStrategy([], grouping_type)
+        strategy.binary_observables = binary_observables
+
+        expected = strategy.complement_adj_matrix_for_operator()
+        adj = complement_adj_sparse(binary_observables, grouping_type)
+
+        assert np.array_equal(adj.toarray(), expected)
+
+
+class TestSparseColouring:
+    """Tests for the colouring heuristics."""
+
+    @pytest.mark.parametrize("grouping_type", ["qwc", "commuting", "anticommuting"])
+    def test_dsatur(self, grouping_type):
+        """Test that DSATUR returns a valid colouring."""
+        binary_observables = random_binary_observables(60, 4)
+        adj = complement_adj_sparse(binary_observables, grouping_type)
+        colouring = dsatur(binary_observables, adj)
+
+        assert list(colouring) == list(range(1, len(colouring) + 1))
+        verify_partitions(binary_observables, colouring, adj.toarray())
+
+    @pytest.mark.parametrize("n_terms", range(4))
+    def test_dsatur_trivial_graph(self, n_terms):
+        """Test DSATUR on a graph without edges."""
+        terms = np.reshape(list(range(n_terms)), (n_terms, 1))
+        colouring = dsatur(terms, np.zeros((n_terms, n_terms)))
+        assert len(colouring) == min(n_terms, 1)
+
+    @pytest.mark.parametrize("grouping_type", ["qwc", "commuting", "anticommuting"])
+    @pytest.mark.parametrize("n_qubits", [4, 66])
+    def test_greedy_insertion(self, grouping_type, n_qubits):
+        """Test that greedy insertion returns a valid colouring, where each Pauli word is
+        inserted in the first compatible partition."""
+        binary_observables = random_binary_observables(60, n_qubits)
+        adj = complement_adj_sparse(binary_observables, grouping_type).toarray()
+        colouring = greedy_insertion(binary_observables, grouping_type)
+
+        verify_partitions(binary_observables, colouring, adj)
+        assert np.array_equal(colouring[1][0], binary_observables[0])
+
+    def test_insertion_labels(self):
+        """Test that the labels of the insertion heuristic match its colouring."""
+        binary_observables = random_binary_observables(40, 3)
+        order = np.random.default_rng(1).permutation(len(binary_observables))
+        labels = insertion_labels(binary_observables, "qwc", order)
+        colouring = greedy_insertion(binary_observables, "qwc", order)
+
+        for colour, group in colouring.items():
+            assert np.array_equal(binary_observables[order][labels[order] == colour], group)
+
+    def test_sorted_insertion(self):
+        """Test that the Pauli words with the largest weights are inserted first."""
+        binary_observables = np.array([[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]])
+        weights = [0.1, -0.5, 0.2, 0.3]
+
+        colouring = sorted_insertion(binary_observables, "qwc", weights=weights)
+
+        expected = {1: [[0, 0, 1, 0], [0, 0, 0, 1]], 2: [[0, 1, 0, 0], [1, 0, 0, 0]]}
+        assert list(colouring) == list(expected)
+        for colour, group in expected.items():
+            assert np.array_equal(colouring[colour], group)
+
+    def test_sorted_insertion_without_weights(self):
+        """Test that sorted insertion falls back to the order of the Pauli words."""
+        binary_observables = random_binary_observables(30, 3)
+        colouring = sorted_insertion(binary_observables, "commuting")
+        expected = greedy_insertion(binary_observables, "commuting")
+
+        assert len(colouring) == len(expected)
+        for colour, group in expected.items():
+            assert np.array_equal(colouring[colour], group)
+
+
+@pytest.mark.parametrize("method", ["lf", "rlf", "dsatur", "si", "greedy"])
+@pytest.mark.parametrize("grouping_type", ["qwc", "commuting"])
+def test_benchmark_grouping(benchmark, method, grouping_type):
+    """Benchmark the colouring methods on random Pauli words."""
+    binary_observables = random_binary_observables(300, 8)
+
+    def workload():
+        strategy = PauliGroupingStrategy([], grouping_type, graph_colourer=method)
+        strategy.binary_observables = binary_observables
+        strategy._wire_map = {i: i for i in range(8)}  # pylint: disable=protected-access
+        return strategy.colour_pauli_graph()
+
+    groups = benchmark(workload)
+    assert sum(len(g) for g in groups) == len(binary_observables)
@@ -0,0 +1,273 @@
+# Copyright 2018-2024 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the NumPy integrators of parametrized evolutions.
+"""
+# pylint: disable=import-outside-toplevel,protected-access
+import numpy as np
+import pytest
+from scipy.integrate import solve_ivp
+from scipy.linalg import expm
+
+import pennylane as qml
+from pennylane.pulse.integrators import integrate
+
+
+def pwc_amplitude(p, t):
+    """Piecewise-constant amplitude with ``len(p)`` bins of equal duration in ``[0, 1)``."""
+    return p[min(int(len(p) * t), len(p) - 1)]
+
+
+def smooth_amplitude(p, t):
+    """Smooth amplitude."""
+    return p[0] * np.sin(p[1] * t) ** 2
+
+
+H_pwc = qml.PauliZ(0) @ qml.PauliZ(1) + pwc_amplitude * qml.PauliX(0) + 0.4 * qml.PauliY(1)
+params_pwc = [np.array([0.5, 1.0, -0.3, 1.0])]
+
+H_smooth = (
+    qml.PauliZ(0) @ qml.PauliZ(1)
+    + smooth_amplitude * qml.PauliX(0)
+    + qml.pulse.constant * qml.PauliY(1)
+)
+params_smooth = [np.array([1.2, 2.0]), 0.7]
+
+
+def initial_state(num_wires):
+    """A random initial state."""
+    rng = np.random.default_rng(42)
+    state = rng.normal(size=2**num_wires) + 1j * rng.normal(size=2**num_wires)
+    return state / np.linalg.norm(state)
+
+
+def exact_pwc_evolution(t1):
+    """The exact evolution of ``H_pwc`` from 0 to ``t1``, a multiple of the bin duration."""
+    U = np.eye(4)
+    for k in range(int(round(4 * t1))):
+        H = qml.matrix(H_pwc(params_pwc, t=(k + 0.5) / 4), wire_order=[0, 1])
+        U = expm(-0.25j * H) @ U
+    return U
+
+
+def reference_evolution(H, params, y0, t, wire_order):
+    """The evolution of a state computed with a tight tolerance by ``scipy.integrate``."""
+
+    def fun(t, y):
+        return -1j * qml.matrix(H(params, t=t), wire_order=wire_order) @ y
+
+    return solve_ivp(fun, (t[0], t[-1]), y0, t_eval=t, rtol=1e-10, atol=1e-10).y.T
+
+
+@pytest.mark.parametrize("dense", [True, False])
+class TestIntegrate:
+    """Tests for the ``integrate`` function."""
+
+    @pytest.mark.parametrize("num_steps", [4, 12])
+    def test_pwc_is_exact(self, dense, num_steps):
+        """Test that the pwc method is exact for coefficients that change at step boundaries."""
+        y = integrate(
+            H_pwc,
+            params_pwc,
+            np.eye(4),
+            [0, 1],
+            num_steps=num_steps,
+            dense=dense,
+            wire_order=[0, 1],
+        )
+        assert y.shape == (2, 4, 4)
+        assert np.allclose(y[0], np.eye(4))
+        assert np.allclose(y[1], exact_pwc_evolution(1))
+
+    def test_intermediate_times(self, dense):
+        """Test that the solutions at all the times are returned."""
+        y0 = initial_state(2)
+        t = [0, 0.25, 0.5, 1.0]
+        y = integrate(H_pwc, params_pwc, y0, t, num_steps=2, dense=dense, wire_order=[0, 1])
+        assert y.shape == (4, 4)
+        assert all(np.allclose(y[i], exact_pwc_evolution(t[i]) @ y0) for i in range(4))
+
+    @pytest.mark.parametrize("method, order", [("pwc", 2), ("magnus", 4)])
+    def test_order(self, dense, method, order):
+        """Test the order of convergence of the integrators for smooth coefficients."""
+        y0 = initial_state(2)
+        expected = reference_evolution(H_smooth, params_smooth, y0, [0, 2], [0, 1])[-1]
+        errors = []
+        for n in [10, 20]:
+            y = integrate(H_smooth, params_smooth, y0, [0, 2], method, n, dense, wire_order=[0, 1])
+            errors.append(np.linalg.norm(y[-1] - expected))
+        assert np.isclose(np.log2(errors[0] / errors[1]), order, atol=0.2)
+
+    def test_magnus_accuracy(self, dense):
+        """Test the accuracy of the Magnus integrator with the default number of steps."""
+        y0 = initial_state(3)
+        H = H_smooth + qml.pulse.constant * (qml.PauliZ(2) @ qml.PauliX(1))
+        params = params_smooth + [0.3]
+        t = [0, 0.5, 2]
+        y = integrate(H, params, y0, t, method="magnus", dense=dense, wire_order=[0, 1, 2])
+        assert np.allclose(y, reference_evolution(H, params, y0, t, [0, 1, 2]), atol=1e-7)
+
+    def test_hardware_hamiltonian(self, dense):
+        """Test that the parameters of hardware Hamiltonians are reordered."""
+        H = qml.pulse.transmon_interaction([1.0, 1.1], [(0, 1)], 0.05, wires=[0, 1])
+        H += qml.pulse.transmon_drive(smooth_amplitude, qml.pulse.constant, 0.5, wires=[0, 1])
+        params = [np.array([0.3, 1.5]), 0.4]
+        y0 = initial_state(2)
+        y = integrate(H, params, y0, [0, 1], method="magnus", dense=dense, wire_order=[0, 1])
+        assert np.allclose(y, reference_evolution(H, params, y0, [0, 1], [0, 1]), atol=1e-7)
+
+
+def test_eigendecompositions_are_reused(mocker):
+    """Test that the Hamiltonian is diagonalized once for all the steps with the same
+    coefficients, and that consecutive steps with the same coefficients are merged."""
+    spy_eigh = mocker.spy(np.linalg, "eigh")
+    spy_exp = mocker.spy(qml.pulse.integrators._Exponential, "__call__")
+    y = integrate(H_pwc, params_pwc, np.eye(4), [0, 1], num_steps=40, wire_order=[0, 1])
+
+    assert np.allclose(y[-1], exact_pwc_evolution(1))
+    assert spy_eigh.call_count == 3
+    assert spy_exp.call_count == 4
+
+
+@pytest.mark.parametrize("num_steps", [0, 1.5])
+def test_num_steps_error(num_steps):
+    """Test that the number of steps must be a positive integer."""
+    with pytest.raises(ValueError, match="number of steps must be a positive integer"):
+        integrate(H_pwc, params_pwc, np.eye(4), [0, 1], num_steps=num_steps)
+
+
+def test_method_error():
+    """Test that an error is raised for unsupported methods."""
+    with pytest.raises(ValueError, match="integration method rk4 is not supported"):
+        integrate(H_pwc, params_pwc, np.eye(4), [0, 1], method="rk4")
+
+
+class TestParametrizedEvolution:
+    """Tests for ParametrizedEvolution with the NumPy integrators."""
+
+    def test_method(self):
+        """Test that the method is a keyword argument stored with the ODE solver options."""
+        ev = qml.evolve(H_pwc)
+        assert ev.method == "odeint"
+        ev = qml.evolve(H_pwc, method="magnus", num_steps=10)
+        assert ev.method == "magnus"
+        assert ev(params_pwc, t=1).odeint_kwargs == {"method": "magnus", "num_steps": 10}
+        assert ev(params_pwc, t=1, method="pwc").method == "pwc"
+
+    def test_method_error(self):
+        """Test that an error is raised for unsupported methods."""
+        with pytest.raises(ValueError, match="integration method rk4 is not supported"):
+            qml.evolve(H_pwc, method="rk4")
+
+    def test_num_steps_odeint_error(self):
+        """Test that an error is raised if the number of steps is given to the odeint method,
+        which does not accept it."""
+        with pytest.raises(ValueError, match="num_steps is only supported by the integration"):
+            qml.evolve(H_pwc, num_steps=10)
+
+    @pytest.mark.parametrize("dense", [True, False])
+    @pytest.mark.parametrize("comp", [False, True])
+    def test_matrix(self, dense, comp):
+        """Test the matrices of the evolution at intermediate times."""
+        t = [0, 0.5, 1]
+        ev = qml.evolve(H_pwc)(
+            params_pwc,
+            t,
+            return_intermediate=True,
+            complementary=comp,
+            dense=dense,
+            method="pwc",
+            num_steps=2,
+        )
+        mats = ev.matrix()
+        expected = [exact_pwc_evolution(t_i) for t_i in t]
+        if comp:
+            expected = [expected[-1] @ U.conj().T for U in expected]
+        assert np.allclose(mats, expected)
+
+    @pytest.mark.parametrize("wires", [[0, 1], [0, 1, 2, 3]])
+    def test_execution(self, wires):
+        """Test that the evolution is executed on default.qubit, by evolving either the state or
+        the matrix depending on the number of wires."""
+        dev = qml.device("default.qubit")
+
+        @qml.qnode(dev)
+        def circuit(params):
+            for w in wires:
+                qml.Hadamard(w)
+            qml.evolve(H_pwc)(params, t=1.0, method="pwc", num_steps=4)
+            return qml.state()
+
+        state = circuit(params_pwc)
+        expected = np.kron(exact_pwc_evolution(1) @ np.ones(4) / 2, np.ones(2 ** (len(wires) - 2)))
+        assert np.allclose(state, expected / np.sqrt(2 ** (len(wires) - 2)))
+
+    def test_broadcasted_state(self):
+        """Test that a broadcasted state is evolved."""
+        state = np.stack([initial_state(3), np.eye(8)[2]]).reshape((2, 2, 2, 2))
+        ev = qml.evolve(H_pwc)(params_pwc, t=1.0, method="pwc", num_steps=4)
+        res = qml.devices.qubit.apply_operation(ev, state, is_state_batched=True)
+        expected = np.kron(exact_pwc_evolution(1), np.eye(2)) @ state.reshape((2, 8)).T
+        assert np.allclose(res.reshape((2, 8)), expected.T)
+
+
+@pytest.mark.jax
+class TestAgainstOdeint:
+    """Tests comparing the NumPy integrators with the jax ODE solver."""
+
+    @pytest.mark.parametrize("method", ["pwc", "magnus"])
+    def test_accuracy(self, method):
+        """Test that the NumPy integrators agree with the jax ODE solver."""
+        import jax
+
+        jax.config.update("jax_enable_x64", True)
+        H = qml.pulse.transmon_interaction([5.0, 5.1], [(0, 1)], 0.02, wires=[0, 1])
+        H += qml.pulse.drive(qml.pulse.pwc(1.0), np.pi / 4, wires=[0])
+        params = [np.array([0.5, 1.0, -0.3, 1.0])]
+        expected = qml.evolve(H)(params, t=1.0, atol=1e-10, rtol=1e-10).matrix()
+        num_steps = 4 if method == "pwc" else 100
+        res = qml.evolve(H)(params, t=1.0, method=method, num_steps=num_steps).matrix()
+        # the jax solver does not resolve the jumps of the coefficients exactly
+        assert np.allclose(res, expected, atol=1e-6)
+
+    @pytest.mark.parametrize("method", ["odeint", "pwc", "magnus"])
+    def test_benchmark(self, benchmark, method):
+        """Benchmark the evolution of a smooth pulse on five qubits."""
+        import jax
+
+        jax.config.update("jax_enable_x64", True)
+        H = qml.pulse.transmon_interaction(
+            [5.0] * 5, [(i, i + 1) for i in range(4)], 0.01, range(5)
+        )
+        H += qml.pulse.transmon_drive(qml.pulse.constant, 0.0, 5.0, wires=[0])
+        ev = qml.evolve(H)([0.2], t=[0, 2.0], method=method)
+        dev = qml.device("default.qubit")
+
+        @qml.qnode(dev)
+        def circuit():
+            qml.apply(ev)
+            return qml.expval(qml.PauliZ(0))
+
+        benchmark(circuit)
+
+
+def test_benchmark_pwc_evolution(benchmark):
+    """Benchmark the evolution of a piecewise-constant pulse with 50 bins on six qubits."""
+    H = sum(qml.PauliZ(i) @ qml.PauliZ(i + 1) + 0.5 * qml.PauliX(i) for i in range(5))
+    H += pwc_amplitude * qml.PauliX(0)
+    params = [np.random.default_rng(0).choice([0.0, 0.5, 1.0], size=50)]
+    y0 = initial_state(6)
+
+    y = benchmark(integrate, H, params, y0, [0, 1], num_steps=50, dense=True, wire_order=range(6))
+    assert np.isclose(np.linalg.norm(y[-1]), 1)
@@ -16,6 +16,10 @@ Unit tests for the ParametrizedEvolution class
 """
 # pylint: disable=unused-argument,too-few-public-methods,import-outside-toplevel,comparison-with-itself,protected-access
 from functools import reduce
+import os
+import subprocess
+import sys
+
 import numpy as np
 
 import pytest
@@ -476,6 +480,48 @@ class TestInitialization:
             op(params, 0.2)
 
 
+class TestHash:
+    """Tests for the hash of ParametrizedEvolution, which does not require jax."""
+
+    def test_hash_stable_across_processes(self):
+        """Test that the hash does not depend on the hash randomization of the interpreter."""
+        code = (
+            "import numpy as np;"
+            "import pennylane as qml;"
+            "H = qml.pulse.transmon_interaction([5.0, 5.1], [(0, 1)], 0.02, wires=[0, 1]);"
+            "H += qml.pulse.transmon_drive(qml.pulse.constant, lambda p, t: p * t, 0.3, [0]);"
+            "H += (lambda p, t: np.sin(p * t)) * qml.PauliX(1);"
+            "print(qml.evolve(H)([0.1, 0.2, 0.3], t=1.0, method='pwc').hash)"
+        )
+
+        hashes = {
+            subprocess.run(
+                [sys.executable, "-c", code],
+                env={**os.environ, "PYTHONHASHSEED": seed},
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout
+            for seed in ("1", "2")
+        }
+        assert len(hashes) == 1
+
+    def test_hash_coefficient_functions(self):
+        """Test that the hash depends on the code of the coefficient functions and on the values
+        they refer to, but not on the identity of the functions."""
+
+        def hamiltonian(freq):
+            return 0.2 * qml.PauliZ(0) + (lambda p, t: p * np.sin(freq * t)) * qml.PauliX(0)
+
+        def hash_of(H):
+            return ParametrizedEvolution(H, [0.4], 0.5, method="pwc").hash
+
+        H_cos = 0.2 * qml.PauliZ(0) + (lambda p, t: p * np.cos(1.0 * t)) * qml.PauliX(0)
+        assert hash_of(hamiltonian(1.0)) == hash_of(hamiltonian(1.0))
+        assert hash_of(hamiltonian(1.0)) != hash_of(hamiltonian(2.0))
+        assert hash_of(hamiltonian(1.0)) != hash_of(H_cos)
+
+
 @pytest.mark.jax
 class TestMatrix:
     """Test matrix method."""
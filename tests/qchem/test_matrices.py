@@ -15,6 +15,8 @@
 Unit tests for functions needed for computing matrices.
 """
 # pylint: disable=too-many-arguments,too-few-public-methods
+import itertools as it
+
 import pytest
 
 import pennylane as qml
@@ -574,6 +576,58 @@ class TestRepulsionMat:
         e = qchem.repulsion_tensor(mol.basis_set)()
         assert np.allclose(e, e_ref)
 
+    def test_repulsion_tensor_packed(self):
+        r"""Test that the packed repulsion integrals are the unique entries of the tensor."""
+        symbols = ["H", "H", "H"]
+        geometry = np.array(
+            [[0.0, 0.0, 0.0], [0.0, 0.0, 1.0], [0.0, 1.0, 0.0]], requires_grad=False
+        )
+        mol = qchem.Molecule(symbols, geometry, charge=1)
+        e = qchem.repulsion_tensor(mol.basis_set)()
+        e_packed = qchem.repulsion_tensor(mol.basis_set, packed=True)()
+
+        pairs = [(i, j) for i in range(3) for j in range(i + 1)]
+        expected = [e[i, j, k, l] for p, (i, j) in enumerate(pairs) for (k, l) in pairs[: p + 1]]
+
+        assert e_packed.shape == (21,)
+        assert np.allclose(e_packed, expected)
+        for i, j, k, l in it.product(range(3), repeat=4):
+            assert np.isclose(e[i, j, k, l], e[k, l, i, j])
+            assert np.isclose(e[i, j, k, l], e[j, i, l, k])
+
+    def test_repulsion_tensor_screening(self):
+        r"""Test that integrals below the Schwarz screening threshold are set to zero."""
+        symbols = ["H", "H"]
+        geometry = np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 20.0]], requires_grad=False)
+        mol = qchem.Molecule(symbols, geometry)
+        e = qchem.repulsion_tensor(mol.basis_set)()
+        e_screened = qchem.repulsion_tensor(mol.basis_set, screening=1e-8)()
+
+        assert not np.allclose(e[0, 1, 0, 0], 0.0, atol=0)
+        assert np.allclose(e_screened[0, 1, 0, 0], 0.0, atol=0)
+        assert np.allclose(e, e_screened, atol=1e-8)
+
+    @pytest.mark.jax
+    @pytest.mark.parametrize("screening", [None, 1e-8])
+    def test_repulsion_tensor_jax_gradient(self, screening):
+        r"""Test that the gradient of the repulsion tensor computed with JAX is correct, with and
+        without screening."""
+        import jax
+
+        symbols = ["H", "H"]
+        geometry = np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 1.0]], requires_grad=False)
+        alpha = np.array(
+            [[3.42525091, 0.62391373, 0.1688554], [3.42525091, 0.62391373, 0.1688554]],
+            requires_grad=True,
+        )
+        mol = qchem.Molecule(symbols, geometry, alpha=alpha)
+        repulsion = qchem.repulsion_tensor(mol.basis_set, screening=screening)
+
+        g_ref = qml.grad(lambda a: np.sum(repulsion(a)))(alpha)
+        g = jax.grad(lambda a: jax.numpy.sum(repulsion(a)))(jax.numpy.array(alpha))
+
+        assert np.allclose(g, g_ref)
+
 
 class TestCoreMat:
     """Tests for core matrix"""
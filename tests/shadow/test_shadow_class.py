@@ -20,7 +20,13 @@ import numpy as onp
 
 import pennylane as qml
 import pennylane.numpy as np
-from pennylane.shadows import ClassicalShadow, median_of_means, pauli_expval
+from pennylane.shadows import (
+    ClassicalShadow,
+    median_of_means,
+    pauli_expval,
+    pauli_expvals,
+    pauli_expvals_from_chunks,
+)
 
 np.random.seed(777)
 
@@ -339,6 +345,26 @@ class TestExpvalEstimation:
         assert actual.dtype == np.float64
         assert qml.math.allclose(actual, expected, atol=1e-1)
 
+    @pytest.mark.parametrize("k", [1, 3, 7])
+    def test_chunked_expval(self, k, monkeypatch):
+        """Test that the snapshots processed in chunks give the median of means of the values of
+        the individual snapshots."""
+        rng = onp.random.default_rng(1)
+        bits, recipes = rng.integers(0, 2, (1003, 4)), rng.integers(0, 3, (1003, 4))
+        shadow = ClassicalShadow(bits, recipes)
+        obs = [
+            qml.PauliX(0) @ qml.PauliZ(1),
+            qml.Hamiltonian([0.5, 2.0], [qml.PauliY(2), qml.PauliZ(3) @ qml.PauliZ(0)]),
+        ]
+
+        words = onp.array([[0, 2, -1, -1], [-1, -1, 1, -1], [2, -1, -1, 2]])
+        values = median_of_means(pauli_expval(bits, recipes, words), k, axis=0)
+        expected = [values[0], 0.5 * values[1] + 2.0 * values[2]]
+
+        assert qml.math.allclose(shadow.expval(obs, k=k), expected)
+        monkeypatch.setattr("pennylane.shadows.classical_shadow._MAX_CHUNK_ENTRIES", 50)
+        assert qml.math.allclose(shadow.expval(obs, k=k), expected)
+
     def test_non_pauli_error(self):
         """Test that an error is raised when a non-Pauli observable is passed"""
         circuit = hadamard_circuit(3)
@@ -393,6 +419,64 @@ class TestExpvalEstimationInterfaces:
         assert qml.math.allclose(actual, expected, atol=1e-1)
 
 
+class TestPauliExpvals:
+    """Test the bit-packed estimation of the expectation values of many Pauli words"""
+
+    @pytest.mark.parametrize("num_wires", [3, 70])
+    @pytest.mark.parametrize("k", [1, 4])
+    @pytest.mark.parametrize("block_size", [None, 7])
+    def test_matches_pauli_expval(self, num_wires, k, block_size):
+        """Test that the estimates are the medians of means of the values of the Pauli words in
+        the individual snapshots, also with several 64-bit integers per snapshot."""
+        rng = onp.random.default_rng(3)
+        bits, recipes = rng.integers(0, 2, (501, num_wires)), rng.integers(0, 3, (501, num_wires))
+        words = rng.integers(-1, 3, (20, num_wires))
+        # words of low weight that match some snapshots
+        words[:, 2:] = -1
+        words[0] = -1
+
+        expected = median_of_means(pauli_expval(bits, recipes, words), k, axis=0)
+        actual = pauli_expvals(bits, recipes, words, k=k, block_size=block_size)
+        assert actual.shape == (20,)
+        assert onp.allclose(actual, expected)
+
+    def test_chunks(self, monkeypatch):
+        """Test that the snapshots matched in chunks give the same estimates."""
+        rng = onp.random.default_rng(4)
+        bits, recipes = rng.integers(0, 2, (100, 4)), rng.integers(0, 3, (100, 4))
+        words = onp.array([[0, 2, -1, -1], [-1, 1, 1, -1], [-1, -1, -1, -1]])
+
+        expected = pauli_expvals(bits, recipes, words, k=3)
+        monkeypatch.setattr("pennylane.shadows.classical_shadow._MAX_CHUNK_ENTRIES", 5)
+        assert onp.allclose(pauli_expvals(bits, recipes, words, k=3), expected)
+
+    def test_output(self):
+        """Test the estimates of a few snapshots."""
+        bits = onp.array([[0, 1], [1, 1], [0, 0]])
+        recipes = onp.array([[2, 2], [2, 0], [2, 2]])
+        words = onp.array([[2, -1], [2, 2], [0, 2], [-1, -1]])
+
+        assert onp.allclose(pauli_expvals(bits, recipes, words), [1, 0, 0, 1])
+
+    @pytest.mark.parametrize("k", [1, 4])
+    def test_from_chunks(self, k):
+        """Test that the estimates from a stream of chunks of uneven sizes are the estimates of the
+        concatenated snapshots."""
+        rng = onp.random.default_rng(5)
+        bits, recipes = rng.integers(0, 2, (100, 3)), rng.integers(0, 3, (100, 3))
+        words = onp.array([[0, 2, -1], [-1, 1, 1], [2, -1, -1]])
+
+        chunks = ((bits[i:j], recipes[i:j]) for i, j in [(0, 7), (7, 60), (60, 61), (61, 100)])
+        expected = pauli_expvals(bits, recipes, words, k=k)
+        assert onp.allclose(pauli_expvals_from_chunks(chunks, words, 100, k=k), expected)
+
+    def test_from_chunks_snapshots_error(self):
+        """Test that an error is raised if the chunks do not hold the given number of snapshots."""
+        bits, recipes = onp.zeros((10, 2), dtype=int), onp.full((10, 2), 2)
+        with pytest.raises(ValueError, match="The chunks contain 10 snapshots, but 12"):
+            pauli_expvals_from_chunks([(bits, recipes)], onp.array([[2, 2]]), 12)
+
+
 def convert_to_interface(arr, interface):
     """Dispatch arrays for different interfaces"""
     import jax.numpy as jnp
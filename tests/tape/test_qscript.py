@@ -14,6 +14,10 @@
 """Unit tests for the QuantumScript"""
 from collections import defaultdict
 import copy
+import os
+import subprocess
+import sys
+
 import numpy as np
 import pytest
 
@@ -730,6 +734,42 @@ class TestHashing:
 
         assert qs1.hash != qs2.hash
 
+    def test_hash_stable_across_processes(self):
+        """Test that the hash of a quantum script does not depend on the hash randomization of
+        the interpreter."""
+        code = (
+            "import pennylane as qml;"
+            "H = qml.Hamiltonian([0.5, 0.2], [qml.PauliX('a') @ qml.PauliZ(1), qml.PauliY(1)]);"
+            "ops = [qml.RX(0.1, 'a'), qml.Rot(0.2, 0.3, 0.4, 1), qml.adjoint(qml.S(1))];"
+            "ms = [qml.expval(H), qml.probs(wires=1), qml.counts(qml.PauliZ('a'))];"
+            "print(qml.tape.QuantumScript(ops, ms, shots=(10, 20)).hash)"
+        )
+
+        hashes = {
+            subprocess.run(
+                [sys.executable, "-c", code],
+                env={**os.environ, "PYTHONHASHSEED": seed},
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout
+            for seed in ("1", "2")
+        }
+        assert len(hashes) == 1
+
+    def test_hash_shifted_tapes(self, mocker):
+        """Test that only the operators with new parameters are hashed again for tapes created with
+        ``bind_new_parameters``."""
+        ops = [qml.RX(0.1 * i, wires=i % 3) for i in range(10)] + [qml.CNOT([0, 1])]
+        qs = QuantumScript(ops, [qml.expval(qml.PauliZ(0))])
+        h = qs.hash
+
+        spy = mocker.spy(qml.operation, "_process_data")
+        shifted = qs.bind_new_parameters([0.35], [3])
+        assert shifted.hash != h
+        assert spy.call_count == 1
+        assert qs.bind_new_parameters([0.3], [3]).hash == h
+
 
 class TestQScriptDraw:
     """Test the script draw method."""
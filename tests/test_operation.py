@@ -313,6 +313,74 @@ class TestOperatorConstruction:
         assert hash(op2) == op2.hash
         assert hash(op1) == hash(op2)
 
+    def test_hash_memoized(self, mocker):
+        """Test that the hash of an operator is only recomputed when its data, wires or
+        hyperparameters are replaced."""
+        spy = mocker.spy(qml.operation, "_process_data")
+        op = qml.Rot(0.1, 0.2, 0.3, wires=0)
+
+        h = op.hash
+        assert op.hash == h
+        assert copy.copy(op).hash == h
+        assert spy.call_count == 1
+
+        op.data = (0.1, 0.2, 0.4)
+        assert op.hash != h
+        assert spy.call_count == 2
+
+        op.data = (0.1, 0.2, 0.3)
+        assert op.hash == h
+
+        op._wires = Wires(1)  # pylint: disable=protected-access
+        assert op.hash != h
+        assert copy.deepcopy(op).hash == op.hash
+
+    def test_hash_hyperparameters_replaced(self):
+        """Test that the hash of an operator is recomputed when a hyperparameter is replaced."""
+        op = qml.PauliRot(0.1, "XY", wires=[0, 1])
+        h = op.hash
+
+        op.hyperparameters["pauli_word"] = "YX"
+        assert op.hash != h
+
+    def test_hash_data_modified_in_place(self, mocker):
+        """Test that the hash of an operator is recomputed when a NumPy array among its data or
+        hyperparameters is modified in place."""
+        spy = mocker.spy(qml.operation, "_process_data")
+        U = np.eye(2)
+        op = qml.QubitUnitary(U, wires=0)
+        h = op.hash
+        assert op.hash == h
+        assert spy.call_count == 1
+
+        U[:] = [[0, 1], [1, 0]]
+        assert op.hash != h
+        assert op.hash == qml.QubitUnitary(np.array([[0.0, 1.0], [1.0, 0.0]]), wires=0).hash
+
+        class DummyOp(qml.operation.Operator):
+            # pylint: disable=too-few-public-methods
+            def __init__(self, values, wires):
+                super().__init__(wires=wires)
+                self.hyperparameters["values"] = values
+
+        values = np.array([1, 0])
+        op = DummyOp(values, wires=[0, 1])
+        h = op.hash
+        values[0] = 0
+        assert op.hash != h
+
+    def test_execution_cache_data_modified_in_place(self):
+        """Test that the execution cache does not return the results of a tape whose parameters
+        were modified in place since it was executed."""
+        U = np.eye(2)
+        tape = qml.tape.QuantumScript([qml.QubitUnitary(U, wires=0)], [qml.expval(qml.PauliZ(0))])
+        dev = qml.device("default.qubit")
+        cache = {}
+
+        assert qml.math.allclose(qml.execute([tape], dev, cache=cache), 1.0)
+        U[:] = [[0, 1], [1, 0]]
+        assert qml.math.allclose(qml.execute([tape], dev, cache=cache), -1.0)
+
     @pytest.mark.parametrize("data,batch_size,ndim_params", [(1.1, None, 0), ([1.1, 2.2], 2, 1)])
     def test_lazy_ndim_params_and_batch_size(self, data, batch_size, ndim_params):
         """Test that ndim_params and batch_size are lazy properties."""
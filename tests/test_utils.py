@@ -236,3 +236,45 @@ class TestExpandVector:
         """Test exception raised if incorrect sized vector provided."""
         with pytest.raises(ValueError, match="Vector parameter must be of length"):
             pu.expand_vector(TestExpandVector.VECTOR1, [0, 1], 4)
+
+
+class TestLRUCache:
+    """Tests for the LRUCache base of the caches of PennyLane."""
+
+    def test_eviction(self):
+        """Test that the least recently used entries are evicted when the cache is full or when
+        its size is reduced."""
+        cache = pu.LRUCache(maxsize=2)
+        cache["a"], cache["b"] = 1, 2
+        assert cache["a"] == 1
+        cache["c"] = 3
+
+        assert "b" not in cache and len(cache) == 2
+        cache.maxsize = 1
+        assert list(cache._entries) == ["c"]  # pylint: disable=protected-access
+        assert cache.cache_info() == (0, 0, 1, 1)
+
+    def test_subclass_limits(self):
+        """Test that subclasses can bound the entries further and are notified of the discarded
+        entries."""
+
+        class TotalCache(pu.LRUCache):
+            """Cache bounding the sum of its values."""
+
+            def __init__(self, maxtotal):
+                super().__init__()
+                self.maxtotal = maxtotal
+                self.discarded = []
+
+            def _exceeds_limits(self):
+                return super()._exceeds_limits() or sum(self._entries.values()) > self.maxtotal
+
+            def _discard(self, key):
+                self.discarded.append(key)
+
+        cache = TotalCache(maxtotal=5)
+        cache["a"], cache["b"], cache["c"] = 2, 3, 4
+
+        assert cache.discarded == ["a", "b"]
+        cache.clear()
+        assert len(cache) == 0 and cache.discarded == ["a", "b"]
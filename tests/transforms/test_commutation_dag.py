@@ -239,6 +239,75 @@ class TestCommutationDAG:
         for i, edge in enumerate(dag.get_edges()):
             assert edges[i] == edge
 
+    def test_lookback(self):
+        """Test that operations outside of the lookback window are assumed not to commute with
+        the new operations."""
+
+        def circuit():
+            qml.PauliZ(wires=0)
+            qml.RZ(0.1, wires=0)
+            qml.CNOT(wires=[0, 1])
+            qml.PauliZ(wires=1)
+            qml.PauliX(wires=1)
+
+        expected_edges = {
+            None: [(2, 3), (3, 4)],
+            4: [(2, 3), (3, 4)],
+            1: [(0, 2), (2, 3), (3, 4)],
+            0: [(0, 1), (1, 2), (2, 3), (3, 4)],
+        }
+        for lookback, expected in expected_edges.items():
+            dag = qml.transforms.commutation_dag(circuit, lookback=lookback)()
+            edges = [(node_in, node_out) for node_in, node_out, _ in dag.get_edges()]
+            assert sorted(edges) == expected
+
+        assert dag.get_node(4).predecessors == [0, 1, 2, 3]
+        assert dag.get_node(0).successors == [1, 2, 3, 4]
+
+    def test_lookback_error(self):
+        """Test that a negative lookback raises an error."""
+        tape = qml.tape.QuantumScript([qml.PauliX(0)])
+        with pytest.raises(ValueError, match="The lookback must be a non-negative integer"):
+            qml.transforms.CommutationDAG(tape, lookback=-1)
+
+    def test_commutation_is_memoized(self, mocker):
+        """Test that the commutation of operations which only differ by the labels of their
+        wires is only checked once."""
+        ops = [qml.CNOT(wires=[i, i + 1]) for i in range(5)]
+        ops += [qml.RZ(0.3, wires=i) for i in range(6)]
+        tape = qml.tape.QuantumScript(ops)
+        spy = mocker.spy(qml, "is_commuting")
+
+        dag = qml.transforms.CommutationDAG(tape)
+        # CNOT-CNOT on (control, target) and (target, control); CNOT-RZ on control and target
+        assert spy.call_count == 3
+        assert dag.direct_predecessors(1) == [0]
+        assert dag.direct_predecessors(5) == []
+        assert dag.direct_predecessors(6) == [0]
+        assert dag.direct_predecessors(10) == [4]
+
+    def test_add_node_after_construction(self):
+        """Test that the successors of the nodes are updated when adding a node to a DAG."""
+        tape = qml.tape.QuantumScript([qml.CNOT(wires=[0, 1]), qml.PauliZ(0), qml.PauliZ(1)])
+        dag = qml.transforms.CommutationDAG(tape)
+        assert dag.get_node(0).successors == [2]
+
+        dag.add_node(qml.PauliX(0))
+        assert dag.direct_predecessors(3) == [0, 1]
+        assert dag.get_node(3).predecessors == [0, 1]
+        assert dag.get_node(0).successors == [2, 3]
+        assert dag.get_node(1).successors == [3]
+        assert dag.successors(2) == []
+
+    def test_node_successors_and_predecessors(self):
+        """Test that the successors and predecessors of a node can be set as lists."""
+        node = qml.transforms.CommutationDAGNode(successors=[4, 1], predecessors=[0])
+        assert node.successors == [1, 4]
+        assert node.successor_bits == 0b10010
+        node.predecessors = [2, 3]
+        assert node.predecessors == [2, 3]
+        assert node.predecessor_bits == 0b1100
+
     @pytest.mark.autograd
     def test_dag_parameters_autograd(self):
         "Test a the DAG and its attributes for autograd parameters."
@@ -473,3 +542,17 @@ class TestCommutationDAG:
 
         for i, edge in enumerate(dag.get_edges()):
             assert edges[i] == edge
+
+
+@pytest.mark.parametrize("num_ops", [500, 2000])
+def test_benchmark_large_circuit(benchmark, num_ops):
+    """Benchmark the construction of the commutation DAG of large circuits."""
+    rng = np.random.default_rng(42)
+    ops = []
+    for _ in range(num_ops):
+        wires = rng.choice(10, size=2, replace=False).tolist()
+        ops.append(qml.CNOT(wires) if rng.random() < 0.5 else qml.RZ(rng.random(), wires[0]))
+    tape = qml.tape.QuantumScript(ops)
+
+    dag = benchmark(qml.transforms.CommutationDAG, tape)
+    assert dag.size == num_ops
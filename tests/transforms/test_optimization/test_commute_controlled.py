@@ -39,6 +39,17 @@ class TestCommuteControlled:
         with pytest.raises(ValueError, match="must be 'left' or 'right'"):
             qml.tape.make_qscript(transformed_qfunc)()
 
+    @pytest.mark.parametrize("direction", [("left"), ("right")])
+    def test_input_tape_unchanged(self, direction):
+        """Test that the operations of the input tape are not modified."""
+        ops = [qml.PauliX(wires=2), qml.CNOT(wires=[0, 2]), qml.RZ(0.2, wires=0)]
+        tape = qml.tape.QuantumScript(ops)
+
+        (new_tape,), _ = commute_controlled(tape, direction=direction)
+
+        assert tape.operations == ops
+        assert new_tape.operations != ops
+
     @pytest.mark.parametrize("direction", [("left"), ("right")])
     def test_gate_with_no_basis(self, direction):
         """Test that gates with no basis specified are ignored."""
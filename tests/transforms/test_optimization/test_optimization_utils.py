@@ -20,6 +20,7 @@ import pytest
 
 from utils import check_matrix_equivalence
 from pennylane.transforms.optimization.optimization_utils import (
+    LinkedCircuit,
     find_next_gate,
     _zyz_to_quat,
     _quaternion_product,
@@ -55,6 +56,136 @@ class TestFindNextGate:
         assert find_next_gate(qml.wires.Wires(wires), op_list) == next_gate_idx
 
 
+class TestLinkedCircuit:
+    """Tests for the circuit representation with operations linked on each of their wires."""
+
+    def test_operations(self):
+        """Test that the operations are returned in order."""
+        assert LinkedCircuit(sample_op_list).operations == sample_op_list
+        assert not LinkedCircuit([]).operations
+
+    @pytest.mark.parametrize(
+        ("wires,next_gate_idx"),
+        [("a", 1), ([], None)],
+    )
+    def test_next_gate(self, wires, next_gate_idx):
+        """Test that the next gate is found on any of the given wires, in agreement with
+        find_next_gate."""
+        circuit = LinkedCircuit(sample_op_list)
+        first = next(iter(circuit))
+        next_node = circuit.next_gate(first, qml.wires.Wires(wires))
+
+        if next_gate_idx is None:
+            assert next_node is None
+        else:
+            assert next_node.op is sample_op_list[next_gate_idx]
+
+    def test_next_and_previous_gate_on_several_wires(self):
+        """Test that the earliest next gate and the latest previous gate are found among the
+        gates on the wires of a node."""
+        ops = [qml.CNOT([0, 1]), qml.PauliX(1), qml.PauliZ(0), qml.CZ([0, 1])]
+        circuit = LinkedCircuit(ops)
+        nodes = list(circuit)
+
+        assert circuit.next_gate(nodes[0]) is nodes[1]
+        assert circuit.next_gate(nodes[0], [0]) is nodes[2]
+        assert circuit.previous_gate(nodes[3]) is nodes[2]
+        assert circuit.previous_gate(nodes[3], [1]) is nodes[1]
+        assert circuit.previous_gate(nodes[0]) is None
+
+    def test_remove_while_iterating(self):
+        """Test that nodes can be removed while iterating over the circuit, including the
+        current and the following nodes."""
+        ops = [qml.Hadamard(0), qml.Hadamard(0), qml.PauliX(1), qml.PauliX(1), qml.PauliY(0)]
+        circuit = LinkedCircuit(ops)
+
+        visited = []
+        for node in circuit:
+            visited.append(node.op)
+            next_node = circuit.next_gate(node)
+            if next_node is not None and next_node.op.name == node.op.name:
+                circuit.remove(node)
+                circuit.remove(next_node)
+
+        assert visited == [ops[0], ops[2], ops[4]]
+        assert circuit.operations == [ops[4]]
+        first = next(iter(circuit))
+        assert circuit.previous_gate(first) is None
+
+    def test_replace(self):
+        """Test that the operation of a node is replaced."""
+        circuit = LinkedCircuit([qml.RX(0.1, 0), qml.RX(0.2, 0)])
+        first = next(iter(circuit))
+        circuit.replace(first, qml.RX(0.3, 0))
+
+        assert circuit.operations[0].data == (0.3,)
+        assert circuit.next_gate(first).op.data == (0.2,)
+
+    def test_move(self):
+        """Test that nodes are moved along their wires."""
+        ops = [qml.PauliZ(0), qml.CNOT([0, 1]), qml.PauliX(2), qml.CZ([0, 2]), qml.S(0)]
+        circuit = LinkedCircuit(ops)
+        nodes = list(circuit)
+
+        circuit.move_after(nodes[0], nodes[3])
+        assert circuit.operations == [ops[1], ops[2], ops[3], ops[0], ops[4]]
+        assert circuit.next_gate(nodes[3], [0]) is nodes[0]
+        assert circuit.next_gate(nodes[0]) is nodes[4]
+        assert circuit.previous_gate(nodes[1]) is None
+
+        circuit.move_before(nodes[4], nodes[1])
+        assert circuit.operations == [ops[4], ops[1], ops[2], ops[3], ops[0]]
+        assert circuit.previous_gate(nodes[1], [0]) is nodes[4]
+        assert circuit.previous_gate(nodes[0]) is nodes[3]
+        assert [n.op for n in reversed(circuit)] == circuit.operations[::-1]
+
+    def test_relabel(self, monkeypatch):
+        """Test that the order of the nodes is kept when there is no gap left between their
+        labels."""
+        monkeypatch.setattr(LinkedCircuit, "_LABEL_GAP", 2)
+        ops = [qml.PauliZ(0), qml.CNOT([0, 1]), qml.CZ([0, 1]), qml.PauliY(1)]
+        circuit = LinkedCircuit(ops)
+        nodes = list(circuit)
+
+        circuit.move_after(nodes[0], nodes[1])
+        circuit.move_after(nodes[3], nodes[1])
+        assert circuit.operations == [ops[1], ops[3], ops[0], ops[2]]
+        labels = [node.label for node in circuit]
+        assert labels == sorted(labels)
+        assert circuit.next_gate(nodes[1]) is nodes[3]
+
+
+def deep_circuit(depth, num_wires=20, seed=42):
+    """A synthetic deep circuit of random gates on random wires."""
+    rng = np.random.default_rng(seed)
+    gates = [qml.Hadamard, qml.PauliX, qml.S, qml.RZ, qml.RX, qml.CNOT, qml.CZ, qml.CRY]
+    ops = []
+    for _ in range(depth):
+        gate = gates[rng.integers(len(gates))]
+        wires = [int(w) for w in rng.choice(num_wires, size=gate.num_wires, replace=False)]
+        params = rng.choice([0.3, -0.3], size=gate.num_params)
+        ops.append(gate(*params, wires=wires))
+    return qml.tape.QuantumScript(ops, [qml.expval(qml.PauliZ(0))])
+
+
+@pytest.mark.parametrize("depth", [250, 1000, 4000])
+@pytest.mark.parametrize(
+    "transform",
+    [
+        qml.transforms.cancel_inverses,
+        qml.transforms.merge_rotations,
+        qml.transforms.single_qubit_fusion,
+        qml.transforms.commute_controlled,
+    ],
+)
+def test_benchmark_deep_circuits(benchmark, transform, depth):
+    """Benchmark the optimization transforms on deep circuits, whose run time should grow
+    linearly with the depth."""
+    tape = deep_circuit(depth)
+    (new_tape,), _ = benchmark(transform, tape)
+    assert len(new_tape.operations) <= depth
+
+
 class TestRotGateFusion:
     """Test that utility functions for fusing two qml.Rot gates function as expected."""
 
@@ -0,0 +1,235 @@
+# Copyright 2018-2024 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Contains tests for the ``PersistentCache``.
+"""
+import multiprocessing
+import pickle
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+import pennylane as qml
+from pennylane.workflow import PersistentCache
+
+
+def circuit(x):
+    """A circuit measuring a single expectation value."""
+    qml.RX(x, 0)
+    qml.CNOT([0, 1])
+    return qml.expval(qml.PauliZ(1))
+
+
+def _write_results(path, start):
+    """Writes results to a cache from another process."""
+    cache = PersistentCache(path)
+    for key in range(start, start + 50):
+        cache[key] = np.array([key])
+
+
+class TestPersistentCache:
+    """Tests for the mapping interface of the ``PersistentCache``."""
+
+    def test_mapping(self, tmp_path):
+        """Test that values are stored, read and deleted."""
+        cache = PersistentCache(tmp_path / "cache.db")
+        cache[1] = (np.array([0.5, 0.5]), {"0": 3})
+        cache[-(2**63)] = 0.1
+
+        assert 1 in cache and 2 not in cache
+        assert len(cache) == 2
+        assert set(cache) == {1, -(2**63)}
+        assert np.allclose(cache[1][0], [0.5, 0.5]) and cache[1][1] == {"0": 3}
+
+        assert cache.get(-(2**63)) == 0.1
+        del cache[1]
+        assert 1 not in cache
+        assert cache.get(1) is None and cache.get(1, "default") == "default"
+        with pytest.raises(KeyError):
+            _ = cache[1]
+        with pytest.raises(KeyError):
+            del cache[1]
+
+    def test_persistent(self, tmp_path):
+        """Test that values are read back after the cache is closed and opened again."""
+        cache = PersistentCache(tmp_path / "cache.db")
+        cache[10] = np.arange(3)
+        cache.close()
+
+        assert np.array_equal(PersistentCache(tmp_path / "cache.db")[10], np.arange(3))
+
+    def test_maxsize(self, tmp_path):
+        """Test that the least recently used values are evicted."""
+        cache = PersistentCache(tmp_path / "cache.db", maxsize=2)
+        cache[0] = 0
+        cache[1] = 1
+        _ = cache[0]
+        cache[2] = 2
+
+        assert set(cache) == {0, 2}
+
+    def test_maxsize_counted_every_few_insertions(self, tmp_path):
+        """Test that the stored results are only counted every few insertions, and that enough
+        results are evicted for the cache not to exceed its maximal size in between."""
+        cache = PersistentCache(tmp_path / "cache.db", maxsize=64)
+        statements = []
+        cache._connect().set_trace_callback(statements.append)  # pylint: disable=protected-access
+
+        for key in range(100):
+            cache[key] = key
+            assert len(cache) <= 64
+
+        num_counts = sum(s == "SELECT COUNT(*) FROM results" for s in statements)
+        assert num_counts == 25
+        assert set(range(96, 100)) <= set(cache)
+
+    def test_namespaces(self, tmp_path):
+        """Test that caches with different namespaces do not share values."""
+        cache = PersistentCache(tmp_path / "cache.db")
+        other = PersistentCache(tmp_path / "cache.db", namespace="other")
+        cache[0] = "a"
+        other[0] = "b"
+
+        assert cache[0] == "a" and other[0] == "b"
+        other.clear()
+        assert len(other) == 0 and len(cache) == 1
+
+    def test_for_device(self, tmp_path):
+        """Test that devices with different wires or shots use different namespaces."""
+        cache = PersistentCache(tmp_path / "cache.db")
+        namespaces = {
+            cache.for_device(qml.device("default.qubit", wires=2)).namespace,
+            cache.for_device(qml.device("default.qubit", wires=3)).namespace,
+            cache.for_device(qml.device("default.qubit", wires=2, shots=10)).namespace,
+            cache.for_device(qml.device("default.qubit.legacy", wires=2)).namespace,
+            cache.for_device(qml.device("default.qubit.legacy", wires=2), 10).namespace,
+            cache.for_device(qml.device("default.qubit", wires=2), kind="gradients").namespace,
+        }
+        assert len(namespaces) == 6
+
+    def test_for_device_options(self, tmp_path):
+        """Test that devices with different options use different namespaces."""
+        cache = PersistentCache(tmp_path / "cache.db")
+        namespaces = [
+            cache.for_device(qml.device("default.qubit", **kwargs)).namespace
+            for kwargs in [
+                {},
+                {"max_workers": 2},
+                {"seed": 42},
+                {"shot_allocation": "weighted"},
+                {"num_trajectories": 100},
+            ]
+        ]
+        assert namespaces[0] == namespaces[1]
+        assert len(set(namespaces)) == 4
+
+        # the namespace does not depend on the state of the device after executions
+        dev = qml.device("default.qubit")
+        qml.QNode(circuit, dev)(0.1)
+        assert cache.for_device(dev).namespace == namespaces[0]
+
+    def test_for_device_unknown_options(self, tmp_path):
+        """Test that the results of devices whose options cannot be stored are not cached."""
+        cache = PersistentCache(tmp_path / "cache.db")
+        dev = qml.device("default.qubit", seed=np.random.default_rng(42))
+        with pytest.warns(UserWarning, match="results are not cached"):
+            assert cache.for_device(dev) is None
+
+        tape = qml.tape.QuantumScript([qml.RX(0.1, 0)], [qml.expval(qml.PauliZ(0))])
+        with pytest.warns(UserWarning, match="results are not cached"):
+            res = qml.execute([tape, tape], dev, gradient_fn=None, cache=cache)
+        assert np.allclose(res, np.cos(0.1))
+        assert len(cache) == 0
+
+    def test_pickle(self, tmp_path):
+        """Test that a pickled cache opens a new connection to the same file."""
+        cache = PersistentCache(tmp_path / "cache.db")
+        cache[0] = 1.5
+
+        unpickled = pickle.loads(pickle.dumps(cache))
+        assert unpickled[0] == 1.5
+
+    def test_concurrent_processes(self, tmp_path):
+        """Test that several processes can write to the same cache."""
+        path = str(tmp_path / "cache.db")
+        PersistentCache(path)
+
+        ctx = multiprocessing.get_context("spawn")
+        processes = [ctx.Process(target=_write_results, args=(path, 50 * i)) for i in range(4)]
+        for p in processes:
+            p.start()
+        for p in processes:
+            p.join()
+
+        assert all(p.exitcode == 0 for p in processes)
+        cache = PersistentCache(path)
+        assert set(cache) == set(range(200))
+        assert cache[123] == np.array([123])
+
+
+class TestExecution:
+    """Integration tests for executions with a ``PersistentCache``."""
+
+    @pytest.mark.parametrize("dev_name", ["default.qubit", "default.qubit.legacy"])
+    def test_tracker(self, tmp_path, dev_name):
+        """Test that the hits and misses are reported to the tracker of the device."""
+        dev = qml.device(dev_name, wires=2)
+        qnode = qml.QNode(circuit, dev, cache=PersistentCache(tmp_path / "cache.db"))
+
+        with qml.Tracker(dev) as tracker:
+            res = qnode(0.1)
+            assert np.isclose(qnode(0.1), res)
+            qnode(0.2)
+
+        assert np.isclose(res, np.cos(0.1))
+        assert tracker.totals["cache_hits"] == 1
+        assert tracker.totals["cache_misses"] == 2
+        assert tracker.totals["executions"] == 2
+
+    def test_gradient(self, tmp_path):
+        """Test that gradients are correct, and that the shifted tapes are cached."""
+        dev = qml.device("default.qubit", wires=2)
+        cache = PersistentCache(tmp_path / "cache.db")
+        qnode = qml.QNode(circuit, dev, cache=cache, diff_method="parameter-shift")
+
+        x = qml.numpy.array(0.3, requires_grad=True)
+        assert np.isclose(qml.grad(qnode)(x), -np.sin(0.3))
+
+        with qml.Tracker(dev) as tracker:
+            qml.grad(qnode)(x)
+        assert tracker.totals["cache_misses"] == 0
+        assert "executions" not in tracker.totals
+
+    def test_shared_between_processes(self, tmp_path):
+        """Test that results computed in another process are read from the cache."""
+        path = tmp_path / "cache.db"
+        code = (
+            "import pennylane as qml;"
+            "from pennylane.workflow import PersistentCache;"
+            "dev = qml.device('default.qubit', wires=2);"
+            f"cache = PersistentCache({str(path)!r});"
+            "qml.execute([qml.tape.QuantumScript([qml.RX(0.1, 0)], [qml.expval(qml.PauliZ(0))])],"
+            " dev, gradient_fn=None, cache=cache)"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+        dev = qml.device("default.qubit", wires=2)
+        tape = qml.tape.QuantumScript([qml.RX(0.1, 0)], [qml.expval(qml.PauliZ(0))])
+        with qml.Tracker(dev) as tracker:
+            res = qml.execute([tape], dev, gradient_fn=None, cache=PersistentCache(path))
+
+        assert np.isclose(res[0], np.cos(0.1))
+        assert tracker.totals == {"cache_hits": 1, "cache_misses": 0}
@@ -0,0 +1,260 @@
+# Copyright 2018-2024 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Contains tests for the ``TapeCache`` and QNodes created with ``cache_tape=True``.
+"""
+import copy
+
+import numpy as np
+import pytest
+
+import pennylane as qml
+from pennylane import numpy as pnp
+from pennylane.workflow.tape_cache import TapeCache
+
+
+def counting_qnode(func, **kwargs):
+    """Creates a QNode with a tape cache, and a list counting the calls of the quantum function."""
+    calls = []
+
+    def qfunc(*args, **kw):
+        calls.append(args)
+        return func(*args, **kw)
+
+    dev = qml.device("default.qubit", wires=3)
+    return qml.QNode(qfunc, dev, cache_tape=True, **kwargs), calls
+
+
+def assert_results_close(result, expected):
+    """Checks that the results of a QNode returning several measurements are close."""
+    assert len(result) == len(expected)
+    for res, exp in zip(result, expected):
+        assert np.allclose(res, exp)
+
+
+def circuit(x, y, layers=1):
+    """A circuit with array, scalar and constant parameters."""
+    for _ in range(layers):
+        qml.RX(x[0], 0)
+        qml.Rot(*x, wires=1)
+        qml.RY(y, 2)
+        qml.RZ(0.3, 0)
+        qml.CNOT([0, 1])
+    return qml.expval(qml.PauliZ(0) @ qml.PauliY(1)), qml.probs(wires=[1, 2])
+
+
+class TestTapeCache:
+    """Tests for the ``TapeCache``."""
+
+    @pytest.mark.parametrize(
+        "args, kwargs, other_args, other_kwargs",
+        [
+            ((np.array([0.1, 0.2]),), {}, (np.array([0.1, 0.2, 0.3]),), {}),
+            ((np.array([0.1, 0.2]),), {}, (np.array([0.1, 0.2], dtype="float32"),), {}),
+            ((pnp.array([0.1]),), {}, (pnp.array([0.1], requires_grad=False),), {}),
+            ((0.1, 2), {}, (0.1, 3), {}),
+            (([0.1, 0.2],), {}, ((0.1, 0.2),), {}),
+            ((0.1,), {"wires": [0]}, (0.1,), {"wires": [1]}),
+            ((np.array([0, 1]),), {}, (np.array([1, 1]),), {}),
+        ],
+    )
+    def test_make_key_structure(self, args, kwargs, other_args, other_kwargs):
+        """Test that the cache key distinguishes argument structures."""
+        key, _ = TapeCache.make_key(args, kwargs, shots=None)
+        other_key, _ = TapeCache.make_key(other_args, other_kwargs, shots=None)
+        assert key != other_key
+
+    def test_make_key_values(self):
+        """Test that the cache key does not depend on the values of floating point arguments,
+        which are returned as the leaves."""
+        x, other_x = pnp.array([0.1, 0.2]), pnp.array([0.3, 0.4])
+        key, leaves = TapeCache.make_key((x, 0.5), {"n": 2, "y": 0.1}, shots=10)
+        other_key, other_leaves = TapeCache.make_key((other_x, 0.6), {"y": 0.2, "n": 2}, shots=10)
+
+        assert key == other_key
+        assert leaves[0] is x and leaves[1:] == [0.5, 0.1]
+        assert other_leaves[0] is other_x and other_leaves[1:] == [0.6, 0.2]
+        assert key != TapeCache.make_key((x, 0.5), {"n": 2, "y": 0.1}, shots=20)[0]
+
+    def test_make_key_unhashable(self):
+        """Test that no key is returned for unhashable arguments."""
+        assert TapeCache.make_key(({0, 1},), {}, shots=None) is None
+        assert TapeCache.make_key((np.array([None]),), {}, shots=None) is None
+
+    def test_maxsize(self):
+        """Test that the least recently used argument structures are evicted."""
+        qnode, calls = counting_qnode(circuit)
+        qnode._tape_cache.maxsize = 2  # pylint: disable=protected-access
+
+        for layers in [1, 2, 3]:
+            qnode(np.array([0.1, 0.2, 0.3]), 0.4, layers=layers)
+
+        assert len(qnode._tape_cache) == 2  # pylint: disable=protected-access
+        calls.clear()
+        qnode(np.array([0.1, 0.2, 0.3]), 0.4, layers=1)
+        assert len(calls) == 3
+
+
+class TestQNodeTapeCache:
+    """Integration tests for QNodes with ``cache_tape=True``."""
+
+    def test_trace_once(self):
+        """Test that the quantum function is only traced when an argument structure is new,
+        and that the results are the same as without the cache."""
+        qnode, calls = counting_qnode(circuit)
+        reference = qml.QNode(circuit, qml.device("default.qubit", wires=3))
+
+        x, y = np.array([0.1, 0.2, 0.3]), 0.4
+        assert_results_close(qnode(x, y), reference(x, y))
+        # the first call traces once, and twice more to check the argument structure
+        assert len(calls) == 3
+
+        for x, y in [(np.array([0.5, -0.6, 0.7]), 0.8), (np.array([-0.9, 1.0, 1.1]), -1.2)]:
+            assert_results_close(qnode(x, y), reference(x, y))
+            assert qml.equal(qnode.tape, reference.tape)
+        assert len(calls) == 3
+
+        assert_results_close(qnode(x, y, layers=2), reference(x, y, layers=2))
+        assert len(calls) == 6
+
+    def test_gradient(self):
+        """Test that gradients are correct when the tape is obtained from the cache, including the
+        trainable parameters."""
+
+        def expval(x, y):
+            qml.RX(x[0], 0)
+            qml.Rot(*x, wires=1)
+            qml.RY(y, 2)
+            qml.CNOT([0, 1])
+            return qml.expval(qml.PauliZ(0) @ qml.PauliY(1))
+
+        qnode, calls = counting_qnode(expval, diff_method="parameter-shift")
+        reference = qml.QNode(expval, qml.device("default.qubit", wires=3))
+
+        x = pnp.array([0.1, 0.2, 0.3], requires_grad=True)
+        y = pnp.array(0.4, requires_grad=False)
+        qnode(x, y)
+
+        x = pnp.array([0.5, -0.6, 0.7], requires_grad=True)
+        grad = qml.grad(qnode)(x, y)
+        assert len(calls) == 3
+        assert qnode.tape.trainable_params == [0, 1, 2, 3]
+        assert np.allclose(grad, qml.grad(reference)(x, y))
+
+    def test_value_dependent_structure(self):
+        """Test that argument structures for which the circuit depends on the argument values are
+        never cached."""
+
+        def branching(x):
+            if x > 0.5:
+                qml.RX(x, 0)
+            else:
+                qml.RY(x, 0)
+            return qml.expval(qml.PauliZ(0))
+
+        qnode, calls = counting_qnode(branching)
+        assert np.isclose(qnode(0.2), np.cos(0.2))
+        assert np.isclose(qnode(0.9), np.cos(0.9))
+        assert isinstance(qnode.tape.operations[0], qml.RX)
+        # the control flow is detected by the first trace with random arguments, and the argument
+        # structure is then traced on every call
+        assert len(calls) == 3
+
+    def test_processed_parameters(self):
+        """Test that argument structures for which the parameters are not the arguments are never
+        cached."""
+
+        def processed(x):
+            qml.RX(2 * x[0], 0)
+            return qml.expval(qml.PauliZ(0))
+
+        qnode, calls = counting_qnode(processed)
+        assert np.isclose(qnode(np.array([0.1])), np.cos(0.2))
+        assert np.isclose(qnode(np.array([0.3])), np.cos(0.6))
+        assert len(calls) == 4
+
+    def test_broadcasting_and_rows(self):
+        """Test that parameters can be whole arguments and rows of arguments."""
+
+        def rows(x, U):
+            qml.RX(x, 0)
+            qml.RY(U[1], 1)
+            return qml.expval(qml.PauliZ(0) @ qml.PauliZ(1))
+
+        qnode, calls = counting_qnode(rows)
+        reference = qml.QNode(rows, qml.device("default.qubit", wires=3))
+        qnode(np.array([0.1, 0.2]), np.zeros((3, 2)))
+
+        x, U = np.array([0.3, 0.4]), np.arange(6.0).reshape(3, 2)
+        assert np.allclose(qnode(x, U), reference(x, U))
+        assert len(calls) == 3
+
+    def test_closure_values_are_frozen(self):
+        """Test that values read from a closure are frozen in the cached tape, and that the quantum
+        function is traced again once the cache is cleared."""
+        angles = {"z": 0.5}
+
+        def closure(x):
+            qml.RX(x, 0)
+            qml.RZ(angles["z"], 0)
+            return qml.expval(qml.PauliY(0))
+
+        qnode, calls = counting_qnode(closure)
+        qnode(0.1)
+        angles["z"] = 1.5
+        qnode(0.2)
+        assert len(calls) == 3
+        assert qnode.tape.operations[1].data[0] == 0.5
+
+        qnode._tape_cache.clear()  # pylint: disable=protected-access
+        qnode(0.2)
+        assert qnode.tape.operations[1].data[0] == 1.5
+
+    def test_probe_errors(self):
+        """Test that argument structures that cannot be traced with random arguments are never
+        cached, and that other errors are raised."""
+
+        def normalized(x):
+            qml.StatePrep(np.array([x, np.sqrt(1 - x**2)]), wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        qnode, calls = counting_qnode(normalized)
+        assert np.isclose(qnode(0.6), 0.36 - 0.64)
+        assert np.isclose(qnode(0.8), 0.64 - 0.36)
+        assert len(calls) == 3
+
+        def failing(x):
+            # the first trace succeeds and the traces with random arguments fail
+            if len(calls) > 1:
+                raise RuntimeError("probe failure")
+            qml.RX(x, 0)
+            return qml.expval(qml.PauliZ(0))
+
+        qnode, calls = counting_qnode(failing)
+        with pytest.raises(RuntimeError, match="probe failure"):
+            qnode(0.1)
+
+    def test_copy(self):
+        """Test that copies of a QNode do not share the tape cache."""
+        qnode, _ = counting_qnode(circuit)
+        qnode(np.array([0.1, 0.2, 0.3]), 0.4)
+
+        copied = copy.copy(qnode)
+        assert len(copied._tape_cache) == 0  # pylint: disable=protected-access
+        assert len(qnode._tape_cache) == 1  # pylint: disable=protected-access
+
+    def test_disabled_by_default(self):
+        """Test that QNodes do not cache tapes by default."""
+        qnode = qml.QNode(circuit, qml.device("default.qubit", wires=3))
+        assert qnode._tape_cache is None  # pylint: disable=protected-access